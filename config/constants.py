@@ -39,6 +39,14 @@ RECOMPENSA_PEDRA = 25  # Aspirador Espiritual (efetivo vs fantasmas)
 RECOMPENSA_PADRAO = 15  # Cruz e Estaca
 RECOMPENSA_VITORIA_BASE = 60
 
+# Loja (preços e efeitos; LojaManager e o simulador de batalhas usam esta tabela)
+ITENS_LOJA = (
+    {"nome": "Poção de Cura",   "preco": 30, "efeito": "cura_pequena"},
+    {"nome": "Buff Ofensivo",   "preco": 50, "efeito": "buff_ofensivo"},
+    {"nome": "Poção Grande",    "preco": 80, "efeito": "cura_grande"},
+)
+CURA_ITENS = {"cura_pequena": 30, "cura_grande": 60}  # HP recuperado por efeito
+
 # ===== CONFIGURAÇÕES DE ANIMAÇÃO =====
 VELOCIDADE_ENTRADA = 8
 VELOCIDADE_MENU = 15
@@ -66,6 +74,9 @@ FONTE_TEXTO_TAMANHO = 18
 FONTE_PEQUENA_TAMANHO = 10
 FONTE_BOLD_TAMANHO = 20
 
+# Fonte bitmap do Windows (lida pelo GlyphAtlas, não pelo pygame.font)
+FONTE_BITMAP_POKEMON = "PKMNRSEU.FON"
+
 # ===== TAMANHOS E POSIÇÕES DOS PERSONAGENS (LAYOUT VERTICAL) =====
 
 # --- TAMANHOS (Mantidos como antes) ---
@@ -131,6 +142,82 @@ SPRITE_FALLBACK_CONFIG = {
     'forma': 'retangulo'
 }
 
+# ===== CACHE DE SPRITES ESCALADOS =====
+CACHE_SPRITES_TAMANHO_MAX = 64  # Máximo de sprites escalados mantidos em memória (LRU)
+CACHE_SPRITES_GRANULARIDADE = 8  # Tamanhos são arredondados para múltiplos deste valor (px)
+
+# ===== CACHE DE TEXTOS RENDERIZADOS =====
+CACHE_TEXTOS_TAMANHO_MAX = 256  # Quantidade de textos renderizados mantidos em memória
+
+# ===== OVERLAYS E PAINÉIS =====
+CACHE_OVERLAYS_TAMANHO_MAX = 64  # Superfícies de overlay/painel mantidas em memória
+
+# ===== MOLDURAS NINE-SLICE =====
+CACHE_MOLDURAS_TAMANHO_MAX = 64  # Combinações (moldura, tamanho, estado, rótulo) mantidas em memória
+# Espessura (px) dos cantos/bordas que não são esticados; 0 escala a imagem inteira
+MOLDURAS_BORDAS = {
+    'itens': 6,  # hud_botao.png
+    'loja': 0,  # Loja-Sheet.png (textura sem borda)
+    'dinheiro': 0,  # coin_molder.png (já carregada em 120x40)
+}
+# Filtro (cor, alpha) aplicado sobre a moldura em cada estado
+ESTADOS_MOLDURA = {
+    'normal': None,
+    'hover': ((255, 255, 255), 30),
+    'desabilitado': ((0, 0, 0), 100),
+}
+
+# ===== ATLAS DE TEXTURAS (gerado por gerar_atlas.py) =====
+ATLAS_PASTA = "Assests/Atlas"
+ATLAS_MANIFESTO = "atlas.json"
+
+# ===== CACHE EM DISCO DE IMAGENS DECODIFICADAS =====
+CACHE_SUPERFICIES_ATIVO = True
+CACHE_SUPERFICIES_PASTA = ".jokenghost_cache"
+
+# ===== MIPMAPS DE SPRITES =====
+MIPMAP_LADO_MAX = 320  # Níveis maiores que isto são descartados após o carregamento
+MIPMAP_LADO_MIN = 16  # Menor lado permitido para o último nível da cadeia
+
+# ===== IMAGENS PRÉ-ESCALADAS =====
+# Tamanho em que cada imagem é desenhada; a cópia escalada é gerada uma vez no carregamento
+TAMANHOS_IMAGENS_ESCALADAS = {
+    'menu_background': (LARGURA, ALTURA),
+    'carta_intro': (300, 200),
+    'monstruario': (700, 500),
+}
+LIBERAR_IMAGENS_ORIGINAIS = True  # Descarta o original depois de gerar a cópia escalada
+
+# ===== CARREGAMENTO EM SEGUNDO PLANO =====
+CARREGAMENTO_THREADS = 4  # Threads que decodificam imagens enquanto o menu roda
+CARREGAMENTO_ITENS_POR_FRAME = 1  # Conversões de superfície feitas na thread principal por frame
+
+# ===== LOOP DE SIMULAÇÃO =====
+SIMULACAO_HZ = 120  # Passos fixos de atualização por segundo (independente do FPS de desenho)
+SIMULACAO_MAX_PASSOS = 8  # Máximo de passos recuperados por quadro; o atraso acima disso é descartado
+OCIOSO_TIMEOUT_MS = 500  # Telas paradas dormem em pygame.event.wait até um evento ou este tempo
+OCIOSO_QUADROS_MIN = 2  # Quadros parados seguidos antes de começar a dormir
+
+# ===== MEDIÇÃO DE DESEMPENHO (F3) =====
+PERFIL_AMOSTRAS = 240  # Quadros guardados por etapa nos buffers circulares (~4 s a 60 FPS)
+PERFIL_OVERLAY_INTERVALO = 30  # Quadros entre recálculos dos percentis do overlay
+# Etapas medidas em JokenGhostGame.atualizar e renderizar (ordem do overlay e das colunas do CSV)
+PERFIL_ETAPAS = (
+    'atualizar.animacoes', 'atualizar.toasts', 'atualizar.dano', 'atualizar.efeitos',
+    'atualizar.alvo', 'atualizar.estado',
+    'desenhar.fundo', 'desenhar.personagens', 'desenhar.barras_vida', 'desenhar.interface',
+    'desenhar.toasts', 'desenhar.monstruario', 'desenhar.apresentar',
+)
+# Captura de perfil por função (F4 ou --profile-frames N)
+PERFIL_CAPTURAS_PASTA = "perfis"  # Arquivos .pstats e .collapsed (flamegraph)
+PERFIL_CAPTURA_QUADROS = 300  # Quadros capturados pelo F4
+PERFIL_INTERVALO_AMOSTRAGEM = 0.002  # Segundos entre amostras de pilha
+
+# ===== LOG =====
+LOG_NIVEL = 'info'  # 'debug', 'info', 'aviso' ou 'erro' (--log-nivel)
+LOG_FILA_TAMANHO = 1024  # Mensagens pendentes antes de descartar
+LOG_INTERVALO_MIN = 1.0  # Segundos mínimos entre mensagens repetidas do mesmo ponto
+
 # ===== CONFIGURAÇÕES DE AUDIO =====
 # (Preparado para futuras implementações de som)
 VOLUME_MASTER = 0.7
@@ -0,0 +1,97 @@
+"""
+Carregador de recursos em segundo plano.
+Decodifica os arquivos em threads auxiliares e deixa para a thread principal
+apenas a etapa que depende da tela (convert/convert_alpha), um item por frame.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from config.constants import *
+
+
+class AsyncAssetLoader:
+    """Fila de tarefas de carregamento: decodificação em threads, finalização no loop do jogo."""
+
+    def __init__(self, max_threads=CARREGAMENTO_THREADS):
+        """
+        Inicializa o carregador.
+
+        Args:
+            max_threads: Número de threads que decodificam os arquivos
+        """
+        self.max_threads = max_threads
+        self.tarefas = []
+        self.pendentes = deque()
+        self.executor = None
+        self.concluidas = 0
+
+    def adicionar(self, descricao, decodificar, finalizar):
+        """
+        Registra uma tarefa. As tarefas são finalizadas na ordem em que foram adicionadas.
+
+        Args:
+            descricao: Nome exibido nos logs
+            decodificar: Função sem argumentos executada em uma thread auxiliar
+                (não pode usar a tela), ou None para tarefas só da thread principal
+            finalizar: Função executada na thread principal; recebe o retorno de decodificar
+        """
+        self.tarefas.append((descricao, decodificar, finalizar))
+
+    def iniciar(self):
+        """Envia todas as decodificações para as threads auxiliares."""
+        self.executor = ThreadPoolExecutor(max_workers=self.max_threads,
+                                           thread_name_prefix="jokenghost-carregamento")
+        for descricao, decodificar, finalizar in self.tarefas:
+            futuro = self.executor.submit(decodificar) if decodificar else None
+            self.pendentes.append((descricao, futuro, finalizar))
+        print(f"📦 Carregamento em segundo plano iniciado: {len(self.tarefas)} itens")
+
+    def processar(self, max_itens=CARREGAMENTO_ITENS_POR_FRAME):
+        """
+        Finaliza até max_itens tarefas já decodificadas, sem bloquear.
+
+        Returns:
+            int: Número de tarefas finalizadas nesta chamada
+        """
+        finalizadas = 0
+        while self.pendentes and finalizadas < max_itens:
+            futuro = self.pendentes[0][1]
+            if futuro is not None and not futuro.done():
+                break
+            self._finalizar(*self.pendentes.popleft())
+            finalizadas += 1
+
+        if not self.pendentes:
+            self._encerrar()
+        return finalizadas
+
+    def concluir(self):
+        """Finaliza todas as tarefas restantes, aguardando as decodificações em andamento."""
+        while self.pendentes:
+            self._finalizar(*self.pendentes.popleft())
+        self._encerrar()
+
+    def _finalizar(self, descricao, futuro, finalizar):
+        """Executa a etapa da thread principal de uma tarefa."""
+        try:
+            dados = futuro.result() if futuro is not None else None
+            finalizar(dados)
+        except Exception as e:
+            print(f"⚠️ Erro ao carregar {descricao}: {e}")
+        self.concluidas += 1
+
+    def _encerrar(self):
+        """Libera as threads auxiliares."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+
+    def progresso(self):
+        """Retorna a fração de tarefas concluídas (0.0 a 1.0)."""
+        if not self.tarefas:
+            return 1.0
+        return self.concluidas / len(self.tarefas)
+
+    def concluido(self):
+        """Retorna True quando todas as tarefas foram finalizadas."""
+        return self.concluidas >= len(self.tarefas)
@@ -0,0 +1,279 @@
+"""
+Motor de regras de combate do JokenGhost, sem pygame.
+Recebe dados (vidas, escolhas, alvo) e devolve dados: as vidas depois do
+turno e a lista de eventos que a interface anima (números de dano, shakes,
+toasts). Não desenha, não toca em relógio nem em print, e o sorteio vem de
+um random.Random injetado, então o mesmo turno pode ser repetido com a
+mesma semente em testes, simulações e balanceamento.
+"""
+
+import random
+from enum import Enum
+from config.constants import DANO_JOGADOR, DANO_INIMIGO, RECOMPENSA_VITORIA_BASE
+from config.enums import Escolha
+from core.economy_manager import EconomyManager
+
+class ResultadoCombate(Enum):
+    VITORIA = "vitoria"
+    DERROTA = "derrota"
+    EMPATE = "empate"
+
+ESCOLHAS = (Escolha.PEDRA, Escolha.PAPEL, Escolha.TESOURA)
+
+# Escolha -> escolha que ela vence
+VENCE = {
+    Escolha.PEDRA: Escolha.TESOURA,
+    Escolha.PAPEL: Escolha.PEDRA,
+    Escolha.TESOURA: Escolha.PAPEL
+}
+
+# Escolha -> arma usada no monstruário
+ARMAS = {
+    Escolha.PEDRA: 'Estaca',
+    Escolha.PAPEL: 'aspirador',
+    Escolha.TESOURA: 'Cruz'
+}
+
+# Tipo de inimigo -> armas que revelam uma fraqueza
+FRAQUEZAS = {
+    'fantasma': ('aspirador', 'Cruz', 'Estaca'),
+    'ghost': ('aspirador', 'Cruz', 'Estaca'),
+    'kastle': ('Cruz', 'Estaca'),
+    'esqueleto': ('Cruz', 'Estaca'),
+    'vampiro': ('Cruz', 'aspirador'),
+    'demonio': ('Cruz',),
+    'zumbi': ('Estaca', 'aspirador')
+}
+
+# Tipos que só são descobertos pela primeira vez com a Estaca
+SO_ESTACA = ('fantasma', 'ghost')
+
+REGRAS_PADRAO = {
+    'dano_jogador': DANO_JOGADOR,        # Dano no alvo quando o jogador vence
+    'dano_inimigo': DANO_INIMIGO,        # Dano no jogador quando o alvo vence
+    'area_base': 0.3,                    # Chance base de atingir outro inimigo
+    'area_bonus': 0.4,                   # Chance extra proporcional ao dano (0-100)
+    'area_max': 0.7,                     # Chance máxima de dano em área
+    'dano_secundario': (0.3, 0.6),       # Fração do dano aplicada em área
+    'dano_contra_ataque': (8, 15),       # Dano de cada contra-ataque bem-sucedido
+    'variacao_recompensa': (0.9, 1.1),   # Variação aleatória da recompensa
+    'bonus_area_por_inimigo': 5,         # Moedas por inimigo atingido em área
+    'recompensa_vitoria_base': RECOMPENSA_VITORIA_BASE,  # Por inimigo, ao limpar a batalha
+    'efetividade': EconomyManager().efetividade_fantasmas  # {Escolha: {'efetividade', 'bonus_base', ...}}
+}
+
+
+def resultado_duelo(escolha_jogador, escolha_inimigo):
+    """
+    Resolve pedra/papel/tesoura do ponto de vista do jogador.
+
+    Returns:
+        ResultadoCombate: VITORIA, DERROTA ou EMPATE
+    """
+    if escolha_jogador == escolha_inimigo:
+        return ResultadoCombate.EMPATE
+    if VENCE[escolha_jogador] == escolha_inimigo:
+        return ResultadoCombate.VITORIA
+    return ResultadoCombate.DERROTA
+
+
+class CombatEngine:
+    """Resolve turnos completos de combate como dados puros."""
+
+    def __init__(self, rng=None, regras=None):
+        """
+        Inicializa o motor.
+
+        Args:
+            rng: random.Random (ou compatível) usado em todos os sorteios; None cria um novo
+            regras: Dict com valores que substituem os de REGRAS_PADRAO
+        """
+        self.rng = rng if rng is not None else random.Random()
+        self.regras = dict(REGRAS_PADRAO)
+        if regras:
+            self.regras.update(regras)
+
+    def sortear_escolha(self):
+        """Sorteia a escolha de um inimigo."""
+        return self.rng.choice(ESCOLHAS)
+
+    def chance_area(self, poder_ataque):
+        """
+        Chance de cada outro inimigo vivo ser atingido pelo ataque.
+
+        Args:
+            poder_ataque: Força do ataque (0-100)
+
+        Returns:
+            float: Chance entre 0.0 e area_max
+        """
+        regras = self.regras
+        return min(regras['area_base'] + (poder_ataque / 100) * regras['area_bonus'], regras['area_max'])
+
+    def sortear_dano_secundario(self, dano_principal):
+        """Dano aplicado aos inimigos atingidos em área (fração sorteada do principal, mínimo 1)."""
+        minimo, maximo = self.regras['dano_secundario']
+        return max(1, int(dano_principal * self.rng.uniform(minimo, maximo)))
+
+    def sortear_recompensa(self, escolha_jogador, dano_causado):
+        """
+        Recompensa por vencer o duelo, pela efetividade da arma contra fantasmas.
+
+        Returns:
+            int: Moedas ganhas
+        """
+        dados = self.regras['efetividade'][escolha_jogador]
+        bonus_dano = max(0, (dano_causado - 20) * 0.5)
+        variacao = self.rng.uniform(*self.regras['variacao_recompensa'])
+        return int((dados['bonus_base'] + bonus_dano) * dados['efetividade'] * variacao)
+
+    def recompensa_area(self, escolha_jogador, quantidade):
+        """Bônus por inimigos atingidos em área."""
+        efetividade = self.regras['efetividade'][escolha_jogador]['efetividade']
+        return int(quantidade * self.regras['bonus_area_por_inimigo'] * efetividade)
+
+    @staticmethod
+    def fraqueza_descoberta(tipo_inimigo, escolha_jogador, descobertos):
+        """
+        Arma cuja fraqueza é revelada ao acertar este inimigo, ou None.
+
+        Args:
+            tipo_inimigo: Tipo do inimigo ('fantasma', 'vampiro'...)
+            escolha_jogador: Escolha que acertou
+            descobertos: {tipo: armas já conhecidas} do monstruário
+
+        Returns:
+            str ou None
+        """
+        tipo = (tipo_inimigo or '').lower()
+        arma = ARMAS[escolha_jogador]
+        if arma not in FRAQUEZAS.get(tipo, ()):
+            return None
+        if tipo not in descobertos:
+            if tipo in SO_ESTACA and arma != 'Estaca':
+                return None
+        elif arma in descobertos[tipo]:
+            return None
+        return arma
+
+    def resolver_turno(self, inimigos, vida_jogador, escolha_jogador, alvo,
+                       descobertos=None, escolha_inimigo=None):
+        """
+        Resolve um turno: duelo com o alvo, dano em área, contra-ataques,
+        recompensas e descobertas do monstruário.
+
+        Os inimigos não são alterados; as novas vidas voltam em 'vidas'.
+
+        Args:
+            inimigos: Lista de Enemy (ou dicts) com 'nome', 'tipo', 'vida_atual' e 'ativo'
+            vida_jogador: Vida atual do jogador
+            escolha_jogador: Escolha do jogador
+            alvo: Índice do inimigo atacado
+            descobertos: {tipo: armas já conhecidas}, ou None para não gerar descobertas
+            escolha_inimigo: Força a escolha do alvo (None sorteia)
+
+        Returns:
+            dict: 'resultado', 'escolha_inimigo', 'vidas', 'vida_jogador',
+                'recompensa' e 'eventos' (lista de dicts com 'tipo':
+                'dano_inimigo', 'inimigo_derrotado', 'dano_jogador',
+                'contra_ataque', 'recompensa', 'descoberta', 'vitoria_total',
+                'jogador_derrotado')
+
+        Raises:
+            ValueError: Se escolha_jogador não for pedra, papel ou tesoura
+        """
+        if escolha_jogador not in ESCOLHAS:
+            raise ValueError(f"Escolha do jogador inválida: {escolha_jogador!r}")
+        regras = self.regras
+        vidas = [inimigo['vida_atual'] for inimigo in inimigos]
+        vivos = [inimigo['ativo'] and vida > 0 for inimigo, vida in zip(inimigos, vidas)]
+        eventos = []
+        recompensa = 0
+
+        if escolha_inimigo is None:
+            escolha_inimigo = self.sortear_escolha()
+        resultado = resultado_duelo(escolha_jogador, escolha_inimigo)
+
+        if resultado == ResultadoCombate.VITORIA:
+            dano = regras['dano_jogador']
+            eventos.append(self._ferir(inimigos, vidas, alvo, dano, area=False))
+
+            if descobertos is not None:
+                arma = self.fraqueza_descoberta(inimigos[alvo].get('tipo'), escolha_jogador, descobertos)
+                if arma is not None:
+                    eventos.append({'tipo': 'descoberta', 'indice': alvo,
+                                    'inimigo': inimigos[alvo]['tipo'].lower(), 'arma': arma})
+
+            chance = self.chance_area(dano)
+            dano_secundario = self.sortear_dano_secundario(dano)
+            atingidos = 0
+            for i, vivo in enumerate(vivos):
+                if vivo and i != alvo and self.rng.random() < chance:
+                    eventos.append(self._ferir(inimigos, vidas, i, dano_secundario, area=True))
+                    atingidos += 1
+
+            valor = self.sortear_recompensa(escolha_jogador, dano)
+            eventos.append({'tipo': 'recompensa', 'motivo': 'acerto', 'valor': valor,
+                            'descricao': regras['efetividade'][escolha_jogador].get('descricao', '')})
+            recompensa += valor
+            if atingidos:
+                valor = self.recompensa_area(escolha_jogador, atingidos)
+                eventos.append({'tipo': 'recompensa', 'motivo': 'area', 'valor': valor})
+                recompensa += valor
+
+            for i, inimigo in enumerate(inimigos):
+                if vivos[i] and vidas[i] <= 0:
+                    eventos.append({'tipo': 'inimigo_derrotado', 'indice': i, 'nome': inimigo['nome'],
+                                    'inimigo': inimigo.get('tipo')})
+            if any(vivos) and not any(inimigo['ativo'] and vida > 0 for inimigo, vida in zip(inimigos, vidas)):
+                valor = len(inimigos) * regras['recompensa_vitoria_base']
+                eventos.append({'tipo': 'vitoria_total', 'valor': valor})
+                recompensa += valor
+        else:
+            if resultado == ResultadoCombate.DERROTA:
+                vida_jogador = max(0, vida_jogador - regras['dano_inimigo'])
+                eventos.append({'tipo': 'dano_jogador', 'indice': alvo, 'dano': regras['dano_inimigo'],
+                                'vida_depois': vida_jogador, 'contra_ataque': False})
+
+            # Os outros inimigos vivos contra-atacam na derrota e no empate
+            minimo, maximo = regras['dano_contra_ataque']
+            for i, vivo in enumerate(vivos):
+                if not vivo or i == alvo:
+                    continue
+                escolha = self.sortear_escolha()
+                contra = resultado_duelo(escolha_jogador, escolha)
+                eventos.append({'tipo': 'contra_ataque', 'indice': i, 'nome': inimigos[i]['nome'],
+                                'escolha': escolha, 'resultado': contra})
+                if contra == ResultadoCombate.DERROTA:
+                    dano = self.rng.randint(minimo, maximo)
+                    vida_jogador = max(0, vida_jogador - dano)
+                    eventos.append({'tipo': 'dano_jogador', 'indice': i, 'dano': dano,
+                                    'vida_depois': vida_jogador, 'contra_ataque': True})
+
+            if vida_jogador <= 0:
+                eventos.append({'tipo': 'jogador_derrotado'})
+
+        return {
+            'resultado': resultado,
+            'escolha_inimigo': escolha_inimigo,
+            'vidas': vidas,
+            'vida_jogador': vida_jogador,
+            'recompensa': recompensa,
+            'eventos': eventos
+        }
+
+    @staticmethod
+    def _ferir(inimigos, vidas, indice, dano, area):
+        """Tira vida de um inimigo (em vidas) e retorna o evento 'dano_inimigo'."""
+        vida_antes = vidas[indice]
+        vidas[indice] = max(0, vida_antes - dano)
+        return {
+            'tipo': 'dano_inimigo',
+            'indice': indice,
+            'nome': inimigos[indice]['nome'],
+            'vida_antes': vida_antes,
+            'vida_depois': vidas[indice],
+            'dano_real': vida_antes - vidas[indice],
+            'morreu': vidas[indice] <= 0,
+            'area': area
+        }
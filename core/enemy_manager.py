@@ -5,27 +5,292 @@ Responsável por criar, posicionar e controlar múltiplos inimigos.
 
 import random
 from config.constants import * # <--- 1. IMPORTAÇÃO ADICIONADA
+from core.log import obter_log
+from core.entity_store import CAMPOS_INIMIGO, CAMPOS_SHAKE
+
+log = obter_log()
+
+class Shake:
+    """Estado do tremor de um inimigo (aceita também acesso por chave, como o dict antigo)."""
+
+    __slots__ = CAMPOS_SHAKE + ('_store', '_indice')
+
+    def __init__(self, ativo=False, intensidade=0, duracao=0, tempo_inicio=0, offset_x=0, offset_y=0):
+        self._store = None
+        self._indice = None
+        self.ativo = ativo
+        self.intensidade = intensidade
+        self.duracao = duracao
+        self.tempo_inicio = tempo_inicio
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+    def iniciar(self, intensidade, duracao, tempo_inicio):
+        """Liga o tremor a partir de tempo_inicio (ms)."""
+        self.ativo = True
+        self.intensidade = intensidade
+        self.duracao = duracao
+        self.tempo_inicio = tempo_inicio
+        self.offset_x = 0
+        self.offset_y = 0
+
+    def parar(self):
+        """Desliga o tremor e zera os offsets."""
+        self.ativo = False
+        self.intensidade = 0
+        self.duracao = 0
+        self.tempo_inicio = 0
+        self.offset_x = 0
+        self.offset_y = 0
+
+    # === Compatibilidade com o dict antigo ===
+    def __getitem__(self, chave):
+        if chave not in CAMPOS_SHAKE:
+            raise KeyError(chave)
+        return getattr(self, chave)
+
+    def __setitem__(self, chave, valor):
+        if chave not in CAMPOS_SHAKE:
+            raise KeyError(chave)
+        setattr(self, chave, valor)
+
+    def get(self, chave, padrao=None):
+        return getattr(self, chave) if chave in CAMPOS_SHAKE else padrao
+
+    def __repr__(self):
+        return f"Shake(ativo={self.ativo}, intensidade={self.intensidade}, offset=({self.offset_x}, {self.offset_y}))"
+
+
+# Campos fixos: sempre presentes
+_CAMPOS_FIXOS = (
+    'nome', 'tipo', 'sprite_tipo',
+    'pos_x', 'pos_y', 'largura', 'altura', 'z_order', 'pos_original', 'pos_atual',
+    'vida_atual', 'vida_max', 'vida_visual', 'ativo',
+    'sprites', 'frame_atual', 'tempo_animacao', 'shake'
+)
+# Campos de animação: None = ausente (no dict antigo a chave não existia)
+_CAMPOS_OPCIONAIS = (
+    'pos_visual', 'pos_x_inicial', 'pos_x_destino',
+    'animando_saida', 'animando_entrada', 'animando_rotacao'
+)
+_FIXOS = frozenset(_CAMPOS_FIXOS)
+_OPCIONAIS = frozenset(_CAMPOS_OPCIONAIS)
+
 
 class Enemy:
-    """Classe simples de inimigo para compatibilidade."""
-    
-    # --- 2. CLASSE ENEMY CORRIGIDA ---
-    def __init__(self, data_dict):
-        """Inicializa um inimigo a partir de um dicionário."""
-        self.nome = data_dict.get('nome', 'Unknown')
-        self.vida = data_dict.get('vida_atual', 100)
-        self.vida_maxima = data_dict.get('vida_maxima', 100)
-        self.recompensa = data_dict.get('recompensa', 15)
-        self.data = data_dict  # Mantém referência ao dicionário original
-        
+    """
+    Inimigo em batalha, com campos fixos em __slots__ (sem dict por instância).
+
+    O código novo usa atributos (inimigo.vida_atual). Enquanto o resto do jogo
+    migra, o inimigo também aceita o acesso do dict antigo: inimigo['pos_x'],
+    inimigo.get(...), 'chave' in inimigo e pop() dos campos de animação.
+    Chaves que não são campos ficam em 'extras'.
+
+    Carregado em um EntityStore vetorizado (vincular), o inimigo e o Shake
+    trocam de classe para _EnemyVinculado/_ShakeVinculado e os campos de
+    CAMPOS_INIMIGO passam a ficar nas colunas NumPy do armazenamento,
+    atualizadas em lote a cada passo; o acesso por atributo continua igual.
+    Fora disso (e com poucos inimigos o armazenamento não vincula) os campos
+    são slots simples, sem custo extra de leitura.
+    """
+
+    __slots__ = _CAMPOS_FIXOS + _CAMPOS_OPCIONAIS + ('extras', '_store', '_indice')
+
+    def __init__(self, nome, tipo, vida, posicao, indice_posicao=0, sprite_tipo=None, sprites=None):
+        """
+        Inicializa o inimigo em uma posição da formação.
+
+        Args:
+            nome: Nome exibido ('GHOST')
+            tipo: Tipo usado no monstruário ('fantasma')
+            vida: Vida inicial e máxima
+            posicao: [x, y, largura, altura, z_order] da posição na formação
+            indice_posicao: Índice da posição na formação
+            sprite_tipo: Pasta de sprites ('ghost', 'kastle', 'ballons'), ou None
+            sprites: Sprites já carregados, ou None
+        """
+        self._store = None
+        self._indice = None
+        self.nome = nome
+        self.tipo = tipo
+        self.sprite_tipo = sprite_tipo
+        self.pos_x, self.pos_y, self.largura, self.altura, self.z_order = posicao[:5]
+        self.pos_original = indice_posicao
+        self.pos_atual = indice_posicao
+        self.vida_atual = vida
+        self.vida_max = vida
+        self.vida_visual = float(vida)
+        self.ativo = True
+        self.sprites = sprites
+        self.frame_atual = 0
+        self.tempo_animacao = 0
+        self.shake = Shake()
+        self.pos_visual = None
+        self.pos_x_inicial = None
+        self.pos_x_destino = None
+        self.animando_saida = None
+        self.animando_entrada = None
+        self.animando_rotacao = None
+        self.extras = None
+
+    @classmethod
+    def de_dict(cls, dados):
+        """Converte um inimigo no formato de dict antigo."""
+        inimigo = cls(dados.get('nome', 'Unknown'), dados.get('tipo'), dados.get('vida_max', dados.get('vida_atual', 100)),
+                      [dados.get('pos_x', 0), dados.get('pos_y', 0), dados.get('largura', 0),
+                       dados.get('altura', 0), dados.get('z_order', 0)],
+                      dados.get('pos_original', 0), dados.get('sprite_tipo'), dados.get('sprites'))
+        for chave, valor in dados.items():
+            inimigo[chave] = valor
+        if 'vida_visual' not in dados:
+            inimigo.vida_visual = float(inimigo.vida_atual)
+        return inimigo
+
+    def vincular(self, store, indice):
+        """Passa a usar a linha 'indice' do EntityStore (que já tem os valores do inimigo)."""
+        self._store = self.shake._store = store
+        self._indice = self.shake._indice = indice
+        self.__class__ = _EnemyVinculado
+        self.shake.__class__ = _ShakeVinculado
+
+    def desvincular(self):
+        """Traz de volta para os slots os valores guardados no EntityStore."""
+        if self._store is None:
+            return
+        valores = [getattr(self, campo) for campo in CAMPOS_INIMIGO]
+        valores_shake = [getattr(self.shake, campo) for campo in CAMPOS_SHAKE]
+        self.__class__ = Enemy
+        self.shake.__class__ = Shake
+        self._store = self.shake._store = None
+        self._indice = self.shake._indice = None
+        for campo, valor in zip(CAMPOS_INIMIGO, valores):
+            setattr(self, campo, valor)
+        for campo, valor in zip(CAMPOS_SHAKE, valores_shake):
+            setattr(self.shake, campo, valor)
+
+    @property
+    def vivo(self):
+        """Ativo e com vida."""
+        return self.ativo and self.vida_atual > 0
+
     def receber_dano(self, dano):
-        """Aplica dano ao inimigo."""
-        self.vida -= dano
-        self.data['vida_atual'] = self.vida
-        if self.vida <= 0:
-            self.vida = 0
-            self.data['vida_atual'] = 0
-            self.data['ativo'] = False
+        """Aplica dano; com a vida zerada o inimigo fica inativo."""
+        self.vida_atual = max(0, self.vida_atual - dano)
+        if self.vida_atual <= 0:
+            self.ativo = False
+
+    # === Compatibilidade com o dict antigo ===
+    def __getitem__(self, chave):
+        if chave in _FIXOS:
+            return getattr(self, chave)
+        if chave in _OPCIONAIS:
+            valor = getattr(self, chave)
+            if valor is None:
+                raise KeyError(chave)
+            return valor
+        if self.extras is None:
+            raise KeyError(chave)
+        return self.extras[chave]
+
+    def __setitem__(self, chave, valor):
+        if chave == 'shake':
+            # Copia para o Shake atual (que pode estar no EntityStore)
+            for campo in CAMPOS_SHAKE:
+                self.shake[campo] = valor.get(campo, 0)
+            return
+        if chave in _FIXOS or chave in _OPCIONAIS:
+            setattr(self, chave, valor)
+        else:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[chave] = valor
+
+    def __contains__(self, chave):
+        if chave in _FIXOS:
+            return True
+        if chave in _OPCIONAIS:
+            return getattr(self, chave) is not None
+        return self.extras is not None and chave in self.extras
+
+    def get(self, chave, padrao=None):
+        try:
+            return self[chave]
+        except KeyError:
+            return padrao
+
+    def setdefault(self, chave, padrao=None):
+        if chave not in self:
+            self[chave] = padrao
+        return self[chave]
+
+    def pop(self, chave, *padrao):
+        """Remove um campo de animação ou extra (campos fixos não podem ser removidos)."""
+        if chave in _FIXOS:
+            raise KeyError(f"{chave} é um campo fixo do inimigo")
+        if chave in self:
+            valor = self[chave]
+            if chave in _OPCIONAIS:
+                setattr(self, chave, None)
+            else:
+                del self.extras[chave]
+            return valor
+        if padrao:
+            return padrao[0]
+        raise KeyError(chave)
+
+    def __repr__(self):
+        return f"Enemy({self.nome!r}, vida={self.vida_atual}/{self.vida_max}, ativo={self.ativo}, z={self.z_order})"
+
+
+class _Coluna:
+    """Atributo lido e escrito na coluna '<prefixo><nome>' da linha do objeto no EntityStore."""
+
+    __slots__ = ('prefixo', 'coluna')
+
+    def __init__(self, prefixo=''):
+        self.prefixo = prefixo
+
+    def __set_name__(self, dono, nome):
+        self.coluna = self.prefixo + nome
+
+    def __get__(self, objeto, dono=None):
+        if objeto is None:
+            return self
+        return objeto._store.colunas[self.coluna].item(objeto._indice)
+
+    def __set__(self, objeto, valor):
+        objeto._store.colunas[self.coluna][objeto._indice] = valor
+
+
+class _ShakeVinculado(Shake):
+    """Shake de um inimigo carregado em um EntityStore vetorizado (campos nas colunas 'shake_*')."""
+
+    __slots__ = ()
+
+    ativo = _Coluna('shake_')
+    intensidade = _Coluna('shake_')
+    duracao = _Coluna('shake_')
+    tempo_inicio = _Coluna('shake_')
+    offset_x = _Coluna('shake_')
+    offset_y = _Coluna('shake_')
+
+
+class _EnemyVinculado(Enemy):
+    """Enemy carregado em um EntityStore vetorizado (campos de CAMPOS_INIMIGO nas colunas)."""
+
+    __slots__ = ()
+
+    pos_x = _Coluna()
+    pos_y = _Coluna()
+    largura = _Coluna()
+    altura = _Coluna()
+    z_order = _Coluna()
+    vida_atual = _Coluna()
+    vida_visual = _Coluna()
+    ativo = _Coluna()
+    frame_atual = _Coluna()
+    tempo_animacao = _Coluna()
+
 
 class EnemyManager:
     """Gerenciador de inimigos do jogo."""
@@ -95,26 +360,8 @@ class EnemyManager:
             else:
                 sprites_inimigo_tipo = 'ghost'  # Default
             
-            inimigo = {
-                'nome': tipo_escolhido['nome'],
-                'tipo': tipo_escolhido['tipo'],
-                'sprite_tipo': sprites_inimigo_tipo,  # Novo campo
-                'pos_x': pos_config[0],
-                'pos_y': pos_config[1], 
-                'largura': pos_config[2],
-                'altura': pos_config[3],
-                'z_order': pos_config[4],
-                'pos_original': pos_index,
-                'pos_atual': pos_index,
-                'vida_atual': tipo_escolhido['vida'],
-                'vida_max': tipo_escolhido['vida'],
-                'vida_visual': float(tipo_escolhido['vida']),
-                'sprites': None,  # Será carregado dinamicamente
-                'ativo': True,
-                'frame_atual': 0,
-                'tempo_animacao': 0,
-                'shake': {'ativo': False, 'intensidade': 0, 'tempo': 0, 'offset_x': 0, 'offset_y': 0}
-            }
+            inimigo = Enemy(tipo_escolhido['nome'], tipo_escolhido['tipo'], tipo_escolhido['vida'],
+                            pos_config, pos_index, sprite_tipo=sprites_inimigo_tipo)
             self.inimigos.append(inimigo)
         
         # Define o primeiro inimigo como ativo (na frente)
@@ -122,8 +369,8 @@ class EnemyManager:
         self.animacao_rotacao_ativa = False
         self.progresso_rotacao = 0.0
         
-        print(f"🎲 Spawned {num_inimigos} inimigo(s) aleatoriamente!")
-        print(f"👁️ Inimigo da frente: {self.inimigos[0]['nome'] if self.inimigos else 'Nenhum'}")
+        log.info("🎲 Spawned %s inimigo(s) aleatoriamente!", num_inimigos)
+        log.debug("👁️ Inimigo da frente: %s", self.inimigos[0].nome if self.inimigos else 'Nenhum')
         return num_inimigos
         
     def iniciar_rotacao_inimigo(self):
@@ -135,7 +382,7 @@ class EnemyManager:
         self.animacao_rotacao_ativa = True
         self.tempo_espera_inimigo = pygame.time.get_ticks()
         self.progresso_rotacao = 0.0
-        print("🔄 Iniciando rotação de posições...")
+        log.debug("🔄 Iniciando rotação de posições...")
         
     def atualizar_rotacao_inimigo(self):
         """Atualiza a animação de rotação entre posições dos inimigos."""
@@ -154,25 +401,25 @@ class EnemyManager:
         
         # Interpola posições de todos os inimigos ativos
         for inimigo in self.inimigos:
-            if not inimigo['ativo'] or inimigo['vida_atual'] <= 0:
+            if not inimigo.vivo:
                 continue
                 
-            pos_atual = inimigo['pos_atual']
+            pos_atual = inimigo.pos_atual
             pos_destino = (pos_atual + 1) % len(self.posicoes_profundidade)
             
             # Se há apenas 2 inimigos, usar apenas as 2 primeiras posições
-            if len([i for i in self.inimigos if i['ativo'] and i['vida_atual'] > 0]) == 2:
+            if len([i for i in self.inimigos if i.vivo]) == 2:
                 pos_destino = (pos_atual + 1) % 2
             
             # Interpolação entre posição atual e destino
             config_atual = self.posicoes_profundidade[pos_atual]
             config_destino = self.posicoes_profundidade[pos_destino]
             
-            inimigo['pos_x'] = self._lerp(config_atual[0], config_destino[0], progress_smooth)
-            inimigo['pos_y'] = self._lerp(config_atual[1], config_destino[1], progress_smooth)
-            inimigo['largura'] = int(self._lerp(config_atual[2], config_destino[2], progress_smooth))
-            inimigo['altura'] = int(self._lerp(config_atual[3], config_destino[3], progress_smooth))
-            inimigo['z_order'] = config_destino[4] if progress_smooth > 0.5 else config_atual[4]
+            inimigo.pos_x = self._lerp(config_atual[0], config_destino[0], progress_smooth)
+            inimigo.pos_y = self._lerp(config_atual[1], config_destino[1], progress_smooth)
+            inimigo.largura = int(self._lerp(config_atual[2], config_destino[2], progress_smooth))
+            inimigo.altura = int(self._lerp(config_atual[3], config_destino[3], progress_smooth))
+            inimigo.z_order = config_destino[4] if progress_smooth > 0.5 else config_atual[4]
         
         # Finaliza a rotação
         if self.progresso_rotacao >= 1.0:
@@ -184,35 +431,31 @@ class EnemyManager:
         self.progresso_rotacao = 0.0
         
         # Conta inimigos vivos
-        inimigos_vivos = [i for i in self.inimigos if i['ativo'] and i['vida_atual'] > 0]
+        inimigos_vivos = self.obter_inimigos_vivos()
         
         # Atualiza índices de posição e configurações
         for inimigo in inimigos_vivos:
             # Calcula nova posição
             if len(inimigos_vivos) == 2:
-                inimigo['pos_atual'] = (inimigo['pos_atual'] + 1) % 2
+                inimigo.pos_atual = (inimigo.pos_atual + 1) % 2
             else:
-                inimigo['pos_atual'] = (inimigo['pos_atual'] + 1) % len(self.posicoes_profundidade)
+                inimigo.pos_atual = (inimigo.pos_atual + 1) % len(self.posicoes_profundidade)
             
             # Aplica a nova configuração
-            config = self.posicoes_profundidade[inimigo['pos_atual']]
-            inimigo['pos_x'] = config[0]
-            inimigo['pos_y'] = config[1]
-            inimigo['largura'] = config[2]
-            inimigo['altura'] = config[3]
-            inimigo['z_order'] = config[4]
+            config = self.posicoes_profundidade[inimigo.pos_atual]
+            inimigo.pos_x, inimigo.pos_y, inimigo.largura, inimigo.altura, inimigo.z_order = config
         
         # Atualiza o índice do inimigo atual
         self.atualizar_inimigo_atual()
         
         inimigo_frente = self.get_inimigo_na_frente()
-        nome_frente = inimigo_frente['nome'] if inimigo_frente else "Nenhum"
-        print(f"✅ Rotação finalizada. Inimigo da frente: {nome_frente}")
+        nome_frente = inimigo_frente.nome if inimigo_frente else "Nenhum"
+        log.debug("✅ Rotação finalizada. Inimigo da frente: %s", nome_frente)
         
     def get_inimigo_na_frente(self):
         """Retorna o inimigo que está na posição da frente."""
         for inimigo in self.inimigos:
-            if inimigo['ativo'] and inimigo['vida_atual'] > 0 and inimigo['z_order'] == 3:
+            if inimigo.vivo and inimigo.z_order == 3:
                 return inimigo
         return None
         
@@ -224,26 +467,23 @@ class EnemyManager:
             
     def obter_inimigos_ativos(self):
         """Retorna lista de inimigos ativos."""
-        return [inimigo for inimigo in self.inimigos if inimigo['ativo']]
+        return [inimigo for inimigo in self.inimigos if inimigo.ativo]
         
     def obter_inimigos_vivos(self):
         """Retorna lista de inimigos vivos."""
-        return [inimigo for inimigo in self.inimigos if inimigo['ativo'] and inimigo['vida_atual'] > 0]
+        return [inimigo for inimigo in self.inimigos if inimigo.vivo]
         
     def aplicar_dano_inimigo_atual(self, dano):
         """Aplica dano ao inimigo da frente."""
         inimigo_atual = self.get_inimigo_na_frente()
         if inimigo_atual:
-            inimigo_atual['vida_atual'] -= dano
-            if inimigo_atual['vida_atual'] <= 0:
-                inimigo_atual['vida_atual'] = 0
-                inimigo_atual['ativo'] = False
-                
+            inimigo_atual.receber_dano(dano)
+            if not inimigo_atual.ativo:
                 # Verifica se há inimigos restantes
                 inimigos_restantes = self.obter_inimigos_vivos()
                 if len(inimigos_restantes) > 0:
                     self.inimigo_atual_index = self.inimigos.index(inimigos_restantes[0])
-                    print(f"👁️ Novo inimigo da frente: {inimigos_restantes[0]['nome']}")
+                    log.debug("👁️ Novo inimigo da frente: %s", inimigos_restantes[0].nome)
             return inimigo_atual
         return None
         
@@ -254,7 +494,7 @@ class EnemyManager:
     def atualizar_sprites(self, sprites_inimigo):
         """Atualiza os sprites de todos os inimigos."""
         for inimigo in self.inimigos:
-            inimigo['sprites'] = sprites_inimigo
+            inimigo.sprites = sprites_inimigo
             
     def _lerp(self, start, end, t):
         """Interpolação linear entre dois valores."""
@@ -267,7 +507,4 @@ class EnemyManager:
     def gerar_inimigo_aleatorio(self):
         """Gera um único inimigo aleatório."""
         self.gerar_inimigos_aleatorios()
-        inimigo_data = self.get_inimigo_na_frente()
-        if inimigo_data:
-            return Enemy(inimigo_data)
-        return None
\ No newline at end of file
+        return self.get_inimigo_na_frente()
\ No newline at end of file
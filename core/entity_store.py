@@ -0,0 +1,237 @@
+"""
+Armazenamento struct-of-arrays dos inimigos em batalha.
+Posição, tamanho, z_order, vida, vida visual, frame, timer de animação e
+tremor de todos os inimigos ficam em colunas NumPy (uma linha por inimigo).
+Cada Enemy carregado passa a ler e escrever esses campos na sua linha, e o
+passo do jogo atualiza todas as linhas de uma vez: suavização da barra de
+vida, avanço dos frames e sorteio do tremor são poucas operações
+vetorizadas, com custo quase constante de 3 a centenas de inimigos.
+
+Com poucos inimigos (menos de LIMIAR_VETORIZACAO, o caso normal do jogo) o
+custo fixo das chamadas NumPy passa do trabalho em si: aí os inimigos ficam
+com os campos nos próprios slots e o passo é um laço Python simples. O NumPy
+só é necessário para o caminho vetorizado; sem ele, o laço é usado sempre.
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:  # Opcional: sem NumPy o armazenamento fica no caminho escalar
+    np = None
+
+# Abaixo disso o laço nos objetos é mais rápido que as colunas (~1 µs contra ~14 µs por passo
+# com 3 inimigos); os dois empatam entre 48 e 64 inimigos
+LIMIAR_VETORIZACAO = 64
+
+# Campos do Enemy guardados em colunas (coluna = nome do campo)
+CAMPOS_INIMIGO = (
+    'pos_x', 'pos_y', 'largura', 'altura', 'z_order',
+    'vida_atual', 'vida_visual', 'ativo', 'frame_atual', 'tempo_animacao'
+)
+# Campos do Shake guardados em colunas (coluna = 'shake_' + nome do campo)
+CAMPOS_SHAKE = ('ativo', 'intensidade', 'duracao', 'tempo_inicio', 'offset_x', 'offset_y')
+
+TIPOS_COLUNAS = {
+    'pos_x': 'float64',
+    'pos_y': 'float64',
+    'largura': 'int64',
+    'altura': 'int64',
+    'z_order': 'int64',
+    'vida_atual': 'int64',
+    'vida_visual': 'float64',
+    'ativo': 'bool',
+    'frame_atual': 'int64',
+    'tempo_animacao': 'float64',
+    'total_frames': 'int64',       # Frames da animação (1 = estático)
+    'intervalo_frame': 'float64',  # Tempo entre frames, na unidade do delta de avancar_animacoes
+    'shake_ativo': 'bool',
+    'shake_intensidade': 'int64',
+    'shake_duracao': 'float64',
+    'shake_tempo_inicio': 'float64',
+    'shake_offset_x': 'int64',
+    'shake_offset_y': 'int64',
+}
+
+
+def _colunas_vazias(n):
+    """Colunas zeradas para n inimigos."""
+    return {nome: np.zeros(n, dtype=tipo) for nome, tipo in TIPOS_COLUNAS.items()}
+
+
+class EntityStore:
+    """Estado por quadro dos inimigos carregados: colunas NumPy ou, com poucos inimigos, os próprios objetos."""
+
+    def __init__(self, seed=None, limiar_vetorizacao=LIMIAR_VETORIZACAO):
+        """
+        Inicializa o armazenamento vazio.
+
+        Args:
+            seed: Semente do sorteio do tremor (None = aleatória)
+            limiar_vetorizacao: Quantidade mínima de inimigos para usar as colunas NumPy
+        """
+        self.entidades = []
+        self.colunas = {}
+        self.vetorizado = False
+        self.limiar_vetorizacao = limiar_vetorizacao
+        self.total_frames = []     # Caminho escalar: frames da animação de cada inimigo
+        self.intervalo_frame = []  # Caminho escalar: tempo entre frames de cada inimigo
+        self.rng = np.random.default_rng(seed) if np is not None else None
+        self.rng_escalar = random.Random(seed)
+
+    def __len__(self):
+        return len(self.entidades)
+
+    def carregar(self, entidades, total_frames=None, intervalo_frame=0.1):
+        """
+        Passa a guardar os campos dos inimigos dados (solta os carregados antes).
+
+        Args:
+            entidades: Lista de Enemy; a posição na lista é a linha
+            total_frames: Lista com os frames da animação de cada inimigo (None = 1, estático)
+            intervalo_frame: Tempo entre frames (número ou lista por inimigo)
+        """
+        self.liberar()
+        for entidade in entidades:
+            entidade.desvincular()  # Pode estar em outro armazenamento
+
+        n = len(entidades)
+        self.entidades = list(entidades)
+        self.vetorizado = np is not None and n >= self.limiar_vetorizacao
+        if not self.vetorizado:
+            # Os campos continuam nos slots de cada inimigo, lidos direto pelo laço escalar
+            self.total_frames = [1] * n if total_frames is None else list(total_frames)
+            self.intervalo_frame = (list(intervalo_frame) if isinstance(intervalo_frame, (list, tuple))
+                                    else [intervalo_frame] * n)
+            return
+
+        colunas = _colunas_vazias(n)
+        for campo in CAMPOS_INIMIGO:
+            colunas[campo][:] = [getattr(entidade, campo) for entidade in entidades]
+        for campo in CAMPOS_SHAKE:
+            colunas['shake_' + campo][:] = [getattr(entidade.shake, campo) for entidade in entidades]
+        colunas['total_frames'][:] = 1 if total_frames is None else total_frames
+        colunas['intervalo_frame'][:] = intervalo_frame
+
+        self.colunas = colunas
+        for indice, entidade in enumerate(self.entidades):
+            entidade.vincular(self, indice)
+
+    def liberar(self):
+        """Devolve os valores para os inimigos carregados e esvazia o armazenamento."""
+        for entidade in self.entidades:
+            entidade.desvincular()
+        self.entidades = []
+        self.colunas = {}
+        self.vetorizado = False
+        self.total_frames = []
+        self.intervalo_frame = []
+
+    def suavizar_vidas(self, passo):
+        """
+        Aproxima a vida visual da vida atual (barra de vida animada).
+
+        Args:
+            passo: Quanto a vida visual anda neste passo, no máximo
+        """
+        if not self.vetorizado:
+            for entidade in self.entidades:
+                if entidade.ativo:
+                    diferenca = entidade.vida_atual - entidade.vida_visual
+                    if diferenca:
+                        entidade.vida_visual += max(-passo, min(passo, diferenca))
+            return
+        c = self.colunas
+        ativos = c['ativo']
+        vida_visual = c['vida_visual']
+        diferenca = c['vida_atual'][ativos] - vida_visual[ativos]
+        vida_visual[ativos] += np.clip(diferenca, -passo, passo)
+
+    def avancar_animacoes(self, delta):
+        """
+        Avança o timer de animação dos inimigos ativos e troca o frame de quem passou do intervalo.
+
+        Args:
+            delta: Duração do passo (mesma unidade de intervalo_frame)
+        """
+        if not self.vetorizado:
+            for entidade, total, intervalo in zip(self.entidades, self.total_frames, self.intervalo_frame):
+                if not entidade.ativo:
+                    continue
+                tempo = entidade.tempo_animacao + delta
+                if tempo >= intervalo:
+                    tempo = 0
+                    if total > 1:
+                        entidade.frame_atual = (entidade.frame_atual + 1) % total
+                entidade.tempo_animacao = tempo
+            return
+        c = self.colunas
+        ativos = c['ativo']
+        tempo = c['tempo_animacao']
+        tempo[ativos] += delta
+        troca = ativos & (tempo >= c['intervalo_frame'])
+        tempo[troca] = 0
+        total = c['total_frames']
+        anima = troca & (total > 1)
+        frame = c['frame_atual']
+        frame[anima] = (frame[anima] + 1) % total[anima]
+
+    def atualizar_shakes(self, tempo_atual):
+        """
+        Sorteia o deslocamento dos tremores ativos e desliga os que acabaram.
+
+        Args:
+            tempo_atual: Tempo do jogo em ms (mesma base de Shake.tempo_inicio)
+        """
+        if not self.vetorizado:
+            for entidade in self.entidades:
+                shake = entidade.shake
+                if not shake.ativo:
+                    continue
+                if tempo_atual - shake.tempo_inicio < shake.duracao:
+                    intensidade = shake.intensidade
+                    shake.offset_x = self.rng_escalar.randint(-intensidade, intensidade)
+                    shake.offset_y = self.rng_escalar.randint(-intensidade, intensidade)
+                else:
+                    shake.parar()
+            return
+        c = self.colunas
+        ativos = c['shake_ativo']
+        if not ativos.any():
+            return
+        em_curso = ativos & (tempo_atual - c['shake_tempo_inicio'] < c['shake_duracao'])
+        intensidade = c['shake_intensidade'][em_curso]
+        c['shake_offset_x'][em_curso] = self.rng.integers(-intensidade, intensidade + 1)
+        c['shake_offset_y'][em_curso] = self.rng.integers(-intensidade, intensidade + 1)
+
+        acabou = ativos & ~em_curso
+        for nome in ('shake_ativo', 'shake_intensidade', 'shake_duracao',
+                     'shake_tempo_inicio', 'shake_offset_x', 'shake_offset_y'):
+            c[nome][acabou] = 0
+
+    def atualizar(self, delta, tempo_atual, passo_vida=None):
+        """
+        Passo completo: animação, tremor e (opcionalmente) barra de vida.
+
+        Args:
+            delta: Duração do passo (unidade de intervalo_frame)
+            tempo_atual: Tempo do jogo em ms, para os tremores
+            passo_vida: Passo da vida visual, ou None para não suavizar
+        """
+        self.avancar_animacoes(delta)
+        self.atualizar_shakes(tempo_atual)
+        if passo_vida is not None:
+            self.suavizar_vidas(passo_vida)
+
+    def algum_shake_ativo(self):
+        """Há algum inimigo tremendo?"""
+        if not self.vetorizado:
+            return any(entidade.shake.ativo for entidade in self.entidades)
+        return bool(self.colunas['shake_ativo'].any())
+
+    def vidas_em_transicao(self):
+        """Há alguma barra de vida de inimigo ativo ainda animando?"""
+        if not self.vetorizado:
+            return any(entidade.ativo and entidade.vida_visual != entidade.vida_atual for entidade in self.entidades)
+        c = self.colunas
+        return bool((c['ativo'] & (c['vida_visual'] != c['vida_atual'])).any())
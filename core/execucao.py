@@ -0,0 +1,241 @@
+"""
+Opções de execução por linha de comando do JokenGhost.
+O modo headless usa os drivers dummy do SDL (sem janela e sem placa de som),
+desenha em uma superfície fora da tela e troca o relógio real por um relógio
+simulado, para o jogo completo rodar em servidores de CI em testes longos e
+benchmarks. Um roteiro JSON pode injetar teclas e cliques em quadros fixos.
+"""
+
+import os
+import json
+import argparse
+import pygame
+from config.constants import FPS, LOG_NIVEL
+from core.log import NIVEIS
+
+class OpcoesExecucao:
+    """Configuração de execução (janela normal ou headless) passada para as classes do jogo."""
+
+    def __init__(self, headless=False, fps=None, velocidade=1.0, roteiro=None, quadros=None,
+                 perfil_csv=None, profile_frames=None, log_nivel=LOG_NIVEL):
+        """
+        Inicializa as opções.
+
+        Args:
+            headless: True roda sem janela e sem áudio, desenhando fora da tela
+            fps: Limite real de quadros por segundo; None usa FPS (janela) ou 0 (headless); 0 = sem limite
+            velocidade: Tempo de jogo por quadro, em quadros de FPS (2.0 = jogo duas vezes mais rápido)
+            roteiro: Caminho de um roteiro JSON de entradas, ou None
+            quadros: Encerra o jogo depois desta quantidade de quadros, ou None
+            perfil_csv: Caminho do CSV com o tempo de cada etapa por quadro, ou None
+            profile_frames: Captura um perfil por função dos primeiros N quadros, ou None
+            log_nivel: Nível mínimo das mensagens no terminal ('debug', 'info', 'aviso', 'erro')
+        """
+        self.headless = headless
+        self.fps = fps if fps is not None else (0 if headless else FPS)
+        self.velocidade = velocidade
+        self.roteiro = roteiro
+        self.quadros = quadros
+        self.perfil_csv = perfil_csv
+        self.profile_frames = profile_frames
+        self.log_nivel = log_nivel
+
+    def preparar_ambiente(self):
+        """Seleciona os drivers dummy do SDL (chamar antes de criar a tela)."""
+        if not self.headless:
+            return
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+        # pygame.init() pode já ter rodado no import: reabre vídeo e áudio com os drivers dummy
+        if pygame.display.get_init():
+            pygame.display.quit()
+        pygame.display.init()
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+            pygame.mixer.init()
+        print("🖥️ Modo headless: drivers de vídeo e áudio dummy")
+
+    def criar_tela(self, tamanho):
+        """
+        Cria a superfície principal do jogo.
+
+        Args:
+            tamanho: (largura, altura)
+
+        Returns:
+            pygame.Surface: Janela, ou superfície fora da tela no modo headless
+        """
+        if not self.headless:
+            return pygame.display.set_mode(tamanho)
+        # Janela mínima só para convert()/convert_alpha() terem um formato de pixel
+        pygame.display.set_mode((1, 1))
+        return pygame.Surface(tamanho).convert()
+
+    def criar_relogio(self):
+        """Retorna o relógio do loop: pygame.time.Clock na janela, VirtualClock no headless."""
+        if not self.headless:
+            return pygame.time.Clock()
+        relogio = VirtualClock(self.velocidade, self.fps)
+        relogio.instalar()
+        return relogio
+
+    def criar_roteiro(self):
+        """
+        Retorna o injetor de entradas do roteiro (e do limite de quadros), ou None.
+
+        Returns:
+            ScriptedInput ou None
+        """
+        if self.roteiro is None and self.quadros is None:
+            return None
+        eventos = ScriptedInput.ler_arquivo(self.roteiro) if self.roteiro else []
+        return ScriptedInput(eventos, self.quadros)
+
+
+class VirtualClock:
+    """Relógio com a interface de pygame.time.Clock que conta tempo de jogo simulado."""
+
+    def __init__(self, velocidade=1.0, fps_limite=0):
+        """
+        Inicializa o relógio.
+
+        Args:
+            velocidade: Quadros de FPS simulados a cada quadro desenhado
+            fps_limite: Limite real de quadros por segundo (0 = o mais rápido possível)
+        """
+        self.passo_ms = (1000.0 / FPS) * velocidade
+        self.fps_limite = fps_limite
+        self.ticks = 0.0  # Tempo de jogo (ms)
+        self.ultimo_ms = 0.0
+        self.quadros = 0
+        self._relogio_real = pygame.time.Clock()
+
+    def instalar(self):
+        """Faz pygame.time.get_ticks() devolver o tempo simulado (timers dos sistemas do jogo)."""
+        self.ticks = float(pygame.time.get_ticks())
+        pygame.time.get_ticks = self.get_ticks
+
+    def tick(self, framerate=0):
+        """
+        Avança o tempo de jogo de um quadro; respeita só o limite real configurado.
+
+        Args:
+            framerate: Ignorado (mantido pela compatibilidade com pygame.time.Clock)
+
+        Returns:
+            float: Milissegundos de jogo do quadro
+        """
+        self._relogio_real.tick(self.fps_limite)
+        self.ticks += self.passo_ms
+        self.ultimo_ms = self.passo_ms
+        self.quadros += 1
+        return self.ultimo_ms
+
+    def get_time(self):
+        """Milissegundos de jogo do último tick()."""
+        return self.ultimo_ms
+
+    def get_ticks(self):
+        """Tempo de jogo acumulado (ms)."""
+        return int(self.ticks)
+
+    def get_fps(self):
+        """Quadros reais por segundo."""
+        return self._relogio_real.get_fps()
+
+
+class ScriptedInput:
+    """Injeta na fila do pygame os eventos de um roteiro, cada um no seu quadro."""
+
+    def __init__(self, eventos, quadros_max=None):
+        """
+        Inicializa o injetor.
+
+        Args:
+            eventos: Lista de dicts {'quadro': N, ...} com uma ação cada:
+                'tecla': nome da tecla (ex.: "space", "1", "escape")
+                'clique': [x, y] (botão esquerdo)
+                'mover': [x, y]
+                'sair': true
+            quadros_max: Envia QUIT ao chegar neste quadro, ou None
+        """
+        self.eventos = sorted(eventos, key=lambda evento: evento.get('quadro', 0))
+        self.quadros_max = quadros_max
+        self.indice = 0
+
+    @staticmethod
+    def ler_arquivo(caminho):
+        """Lê a lista de eventos de um arquivo JSON."""
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+
+    def injetar(self, quadro):
+        """
+        Coloca na fila os eventos previstos até este quadro.
+
+        Args:
+            quadro: Número do quadro atual (0 = primeiro)
+        """
+        while self.indice < len(self.eventos) and self.eventos[self.indice].get('quadro', 0) <= quadro:
+            for evento in self.criar_eventos(self.eventos[self.indice]):
+                pygame.event.post(evento)
+            self.indice += 1
+        if self.quadros_max is not None and quadro >= self.quadros_max:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+    @staticmethod
+    def criar_eventos(acao):
+        """
+        Converte uma ação do roteiro em eventos do pygame.
+
+        Returns:
+            list: Eventos a postar, na ordem
+        """
+        if 'tecla' in acao:
+            tecla = pygame.key.key_code(str(acao['tecla']))
+            return [pygame.event.Event(pygame.KEYDOWN, key=tecla, mod=0, unicode='', scancode=0),
+                    pygame.event.Event(pygame.KEYUP, key=tecla, mod=0, unicode='', scancode=0)]
+        if 'clique' in acao:
+            posicao = tuple(acao['clique'])
+            return [pygame.event.Event(pygame.MOUSEMOTION, pos=posicao, rel=(0, 0), buttons=(0, 0, 0)),
+                    pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=posicao, button=1),
+                    pygame.event.Event(pygame.MOUSEBUTTONUP, pos=posicao, button=1)]
+        if 'mover' in acao:
+            return [pygame.event.Event(pygame.MOUSEMOTION, pos=tuple(acao['mover']), rel=(0, 0), buttons=(0, 0, 0))]
+        if acao.get('sair'):
+            return [pygame.event.Event(pygame.QUIT)]
+        print(f"⚠️ Ação de roteiro desconhecida: {acao}")
+        return []
+
+
+def analisar_argumentos(argv=None):
+    """
+    Lê as opções de execução da linha de comando.
+
+    Args:
+        argv: Lista de argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        OpcoesExecucao: Opções prontas para passar ao jogo
+    """
+    parser = argparse.ArgumentParser(description="JokenGhost - Caçada em Turnos")
+    parser.add_argument("--headless", action="store_true",
+                        help="roda sem janela e sem áudio (drivers dummy do SDL)")
+    parser.add_argument("--fps", type=int, default=None,
+                        help="limite real de quadros por segundo (0 = sem limite; padrão no headless)")
+    parser.add_argument("--velocidade", type=float, default=1.0,
+                        help="tempo de jogo por quadro no headless, em quadros de 60 FPS")
+    parser.add_argument("--roteiro", default=None,
+                        help="arquivo JSON com teclas/cliques a injetar por quadro")
+    parser.add_argument("--quadros", type=int, default=None,
+                        help="encerra o jogo depois de N quadros")
+    parser.add_argument("--perfil-csv", default=None,
+                        help="grava o tempo de cada etapa do quadro (ms) neste CSV")
+    parser.add_argument("--profile-frames", type=int, default=None, metavar="N",
+                        help="grava cProfile (.pstats) e pilhas (.collapsed) dos primeiros N quadros")
+    parser.add_argument("--log-nivel", choices=list(NIVEIS), default=LOG_NIVEL,
+                        help="nível mínimo das mensagens no terminal")
+    args = parser.parse_args(argv)
+    return OpcoesExecucao(headless=args.headless, fps=args.fps, velocidade=args.velocidade,
+                          roteiro=args.roteiro, quadros=args.quadros, perfil_csv=args.perfil_csv,
+                          profile_frames=args.profile_frames, log_nivel=args.log_nivel)
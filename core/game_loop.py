@@ -0,0 +1,187 @@
+"""
+Loop de simulação com passo fixo do JokenGhost.
+A lógica do jogo avança sempre em passos do mesmo tamanho (SIMULACAO_HZ),
+não importa quantos quadros são desenhados. Quando um quadro demora, os
+passos atrasados são recuperados (até SIMULACAO_MAX_PASSOS); o desenho
+interpola entre os dois últimos passos para o movimento continuar suave.
+Telas paradas (menu, intro, resultado, monstruário sem animações) deixam de
+girar o loop e dormem até chegar um evento.
+"""
+
+import pygame
+from config.constants import (FPS, SIMULACAO_HZ, SIMULACAO_MAX_PASSOS,
+                              OCIOSO_TIMEOUT_MS, OCIOSO_QUADROS_MIN)
+
+class FixedTimestep:
+    """Acumulador de tempo que converte o tempo real em passos fixos de simulação."""
+
+    def __init__(self, hz=SIMULACAO_HZ, max_passos=SIMULACAO_MAX_PASSOS):
+        """
+        Inicializa o acumulador.
+
+        Args:
+            hz: Passos de simulação por segundo
+            max_passos: Máximo de passos executados em um único quadro
+        """
+        self.passo_ms = 1000.0 / hz
+        self.max_passos = max(1, max_passos)
+        self.acumulador = 0.0
+
+        # Estatísticas
+        self.passos_totais = 0
+        self.tempo_descartado = 0.0  # ms perdidos por excesso de atraso
+
+    @property
+    def fator_quadro(self):
+        """Fração de um quadro de FPS que cada passo representa (velocidades 'por frame')."""
+        return self.passo_ms / (1000.0 / FPS)
+
+    @property
+    def alpha(self):
+        """Posição (0.0-1.0) do quadro atual entre o último passo e o próximo."""
+        return min(self.acumulador / self.passo_ms, 1.0)
+
+    def avancar(self, delta_ms):
+        """
+        Acumula o tempo do quadro e retorna quantos passos devem ser executados.
+
+        Args:
+            delta_ms: Tempo real desde o quadro anterior (milissegundos)
+
+        Returns:
+            int: Número de passos de simulação a executar agora
+        """
+        self.acumulador += max(0.0, delta_ms)
+        passos = int(self.acumulador // self.passo_ms)
+        if passos > self.max_passos:
+            # Quadro muito lento (janela arrastada, breakpoint...): não tenta recuperar tudo
+            excesso = (passos - self.max_passos) * self.passo_ms
+            self.tempo_descartado += excesso
+            self.acumulador -= excesso
+            passos = self.max_passos
+        self.acumulador -= passos * self.passo_ms
+        self.passos_totais += passos
+        return passos
+
+    def reiniciar(self):
+        """Zera o tempo acumulado (ex.: depois de uma tela de carregamento)."""
+        self.acumulador = 0.0
+
+    def obter_estatisticas(self):
+        """Retorna as estatísticas do loop."""
+        return {
+            'passo_ms': self.passo_ms,
+            'passos_totais': self.passos_totais,
+            'tempo_descartado': self.tempo_descartado,
+            'alpha': self.alpha
+        }
+
+
+class RenderInterpolator:
+    """Guarda valores do passo anterior e desenha com a mistura entre ele e o atual."""
+
+    def __init__(self, alvo, atributos):
+        """
+        Inicializa o interpolador.
+
+        Args:
+            alvo: Objeto cujos atributos numéricos são interpolados
+            atributos: {nome_atributo: salto_max}; saltos maiores que salto_max em
+                um passo (teletransporte, reinício de animação) não são interpolados
+        """
+        self.alvo = alvo
+        self.atributos = atributos
+        self.anteriores = {}
+        self._originais = None
+
+    def capturar(self):
+        """Guarda os valores atuais; chame antes de cada passo de simulação."""
+        for nome in self.atributos:
+            valor = getattr(self.alvo, nome, None)
+            if isinstance(valor, (int, float)):
+                self.anteriores[nome] = valor
+
+    def aplicar(self, alpha):
+        """
+        Troca os atributos pelos valores interpolados para o desenho.
+
+        Args:
+            alpha: Fração (0.0-1.0) entre o passo anterior e o atual
+        """
+        self._originais = {}
+        for nome, salto_max in self.atributos.items():
+            anterior = self.anteriores.get(nome)
+            atual = getattr(self.alvo, nome, None)
+            if anterior is None or not isinstance(atual, (int, float)):
+                continue
+            if anterior == atual or abs(atual - anterior) > salto_max:
+                continue
+            valor = anterior + (atual - anterior) * alpha
+            self._originais[nome] = atual
+            # Atributos inteiros continuam inteiros (usados em Rects e tamanhos de Surface)
+            setattr(self.alvo, nome, round(valor) if isinstance(atual, int) else valor)
+
+    def restaurar(self):
+        """Devolve os valores reais da simulação depois do desenho."""
+        if self._originais:
+            for nome, valor in self._originais.items():
+                setattr(self.alvo, nome, valor)
+        self._originais = None
+
+
+class IdleWaiter:
+    """Troca o giro a 60 FPS por pygame.event.wait enquanto nada está animando."""
+
+    def __init__(self, timeout_ms=OCIOSO_TIMEOUT_MS, quadros_min=OCIOSO_QUADROS_MIN, ativo=True):
+        """
+        Inicializa o esperador.
+
+        Args:
+            timeout_ms: Tempo máximo dormindo sem eventos (a tela é redesenhada depois)
+            quadros_min: Quadros parados seguidos antes de dormir, para o último estado ser desenhado
+            ativo: False nunca dorme (headless: não há entrada real para acordar o loop)
+        """
+        self.ativo = ativo
+        self.timeout_ms = timeout_ms
+        self.quadros_min = max(1, quadros_min)
+        self.quadros_ociosos = 0
+
+        # Estatísticas
+        self.esperas = 0
+        self.tempo_dormindo = 0
+
+    def esperar(self, ocioso):
+        """
+        Dorme até o próximo evento (entrada, timers como USEREVENT + 1) se a tela estiver parada.
+
+        Os eventos que acordaram o loop voltam para a fila, na mesma ordem, para
+        o processar_eventos normal tratá-los.
+
+        Args:
+            ocioso: True se nada está animando neste quadro
+
+        Returns:
+            bool: True se o loop dormiu (o tempo parado não deve virar passos de simulação)
+        """
+        if not ocioso or not self.ativo:
+            self.quadros_ociosos = 0
+            return False
+        self.quadros_ociosos += 1
+        if self.quadros_ociosos < self.quadros_min:
+            return False
+
+        inicio = pygame.time.get_ticks()
+        evento = pygame.event.wait(self.timeout_ms)
+        if evento.type != pygame.NOEVENT:
+            for pendente in [evento] + pygame.event.get():
+                pygame.event.post(pendente)
+        self.esperas += 1
+        self.tempo_dormindo += pygame.time.get_ticks() - inicio
+        return True
+
+    def obter_estatisticas(self):
+        """Retorna as estatísticas de espera."""
+        return {
+            'esperas': self.esperas,
+            'tempo_dormindo': self.tempo_dormindo
+        }
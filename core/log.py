@@ -0,0 +1,156 @@
+"""
+Registro de mensagens do JokenGhost com níveis, limite por ponto de chamada
+e escrita em segundo plano.
+O jogo só coloca a mensagem em uma fila limitada; uma thread escreve no
+terminal. Se a fila encher (terminal lento, log redirecionado), mensagens são
+descartadas e contadas em vez de travar o quadro. Mensagens repetidas do
+mesmo ponto (mesmo texto-modelo) respeitam um intervalo mínimo, e as
+suprimidas aparecem como "(+N suprimidas)" na próxima.
+
+Pontos de debug em caminhos quentes ficam dentro de `if __debug__:`; com
+`python -O` o Python remove esses blocos na compilação.
+"""
+
+import sys
+import time
+import queue
+import atexit
+import threading
+from config.constants import LOG_NIVEL, LOG_FILA_TAMANHO, LOG_INTERVALO_MIN
+
+DEBUG = 10
+INFO = 20
+AVISO = 30
+ERRO = 40
+
+NIVEIS = {'debug': DEBUG, 'info': INFO, 'aviso': AVISO, 'erro': ERRO}
+
+
+class GameLogger:
+    """Fachada de log com níveis, limite de repetição e escritor assíncrono."""
+
+    def __init__(self, nivel=LOG_NIVEL, tamanho_fila=LOG_FILA_TAMANHO,
+                 intervalo_min=LOG_INTERVALO_MIN, saida=None):
+        """
+        Inicializa o registro.
+
+        Args:
+            nivel: Nome do nível mínimo ('debug', 'info', 'aviso', 'erro')
+            tamanho_fila: Mensagens pendentes antes de começar a descartar
+            intervalo_min: Segundos mínimos entre mensagens do mesmo ponto com limite
+            saida: Stream de saída (padrão: sys.stdout no momento da escrita)
+        """
+        self.nivel = NIVEIS.get(nivel, INFO)
+        self.intervalo_min = intervalo_min
+        self.saida = saida
+        self._fila = queue.Queue(maxsize=max(1, tamanho_fila))
+        self._ultimos = {}  # modelo -> instante da última mensagem emitida
+        self._suprimidas = {}  # modelo -> mensagens suprimidas desde a última emitida
+        self._escritor = None
+
+        # Estatísticas
+        self.descartadas = 0
+
+    def definir_nivel(self, nivel):
+        """Muda o nível mínimo ('debug', 'info', 'aviso', 'erro')."""
+        self.nivel = NIVEIS.get(nivel, self.nivel)
+
+    def ativo(self, nivel):
+        """Retorna True se mensagens deste nível serão registradas."""
+        return nivel >= self.nivel
+
+    def registrar(self, nivel, modelo, *args, limitar=False):
+        """
+        Registra uma mensagem sem bloquear.
+
+        Args:
+            nivel: DEBUG, INFO, AVISO ou ERRO
+            modelo: Texto com marcadores %; formatado só se a mensagem for emitida
+            *args: Valores dos marcadores
+            limitar: True aplica o intervalo mínimo por ponto de chamada (usa o modelo como chave)
+        """
+        if nivel < self.nivel:
+            return
+        sufixo = ""
+        if limitar:
+            agora = time.monotonic()
+            if agora - self._ultimos.get(modelo, -self.intervalo_min) < self.intervalo_min:
+                self._suprimidas[modelo] = self._suprimidas.get(modelo, 0) + 1
+                return
+            self._ultimos[modelo] = agora
+            suprimidas = self._suprimidas.pop(modelo, 0)
+            if suprimidas:
+                sufixo = f" (+{suprimidas} suprimidas)"
+        try:
+            mensagem = (modelo % args if args else modelo) + sufixo
+        except (TypeError, ValueError):
+            mensagem = f"{modelo} {args}{sufixo}"
+        self._enfileirar(mensagem)
+
+    def debug(self, modelo, *args, limitar=False):
+        """Mensagem de depuração (oculta no nível padrão)."""
+        self.registrar(DEBUG, modelo, *args, limitar=limitar)
+
+    def info(self, modelo, *args, limitar=False):
+        """Mensagem informativa."""
+        self.registrar(INFO, modelo, *args, limitar=limitar)
+
+    def aviso(self, modelo, *args, limitar=False):
+        """Aviso (algo inesperado, o jogo continua)."""
+        self.registrar(AVISO, modelo, *args, limitar=limitar)
+
+    def erro(self, modelo, *args, limitar=False):
+        """Erro."""
+        self.registrar(ERRO, modelo, *args, limitar=limitar)
+
+    def _enfileirar(self, mensagem):
+        """Coloca a mensagem na fila do escritor; descarta se a fila estiver cheia."""
+        if self._escritor is None:
+            self._iniciar_escritor()
+        try:
+            self._fila.put_nowait(mensagem)
+        except queue.Full:
+            self.descartadas += 1
+
+    def _iniciar_escritor(self):
+        """Cria a thread que escreve as mensagens (na primeira mensagem)."""
+        self._escritor = threading.Thread(target=self._escrever, name="escritor-log", daemon=True)
+        self._escritor.start()
+        atexit.register(self.encerrar)
+
+    def _escrever(self):
+        """Thread do escritor: tira mensagens da fila e escreve na saída."""
+        while True:
+            mensagem = self._fila.get()
+            if mensagem is None:
+                break
+            saida = self.saida or sys.stdout
+            try:
+                saida.write(mensagem + "\n")
+                if self._fila.empty():
+                    saida.flush()
+            except (OSError, ValueError):
+                pass
+
+    def encerrar(self):
+        """Escreve as mensagens pendentes e para o escritor (chamado na saída do programa)."""
+        if self._escritor is None:
+            return
+        escritor, self._escritor = self._escritor, None
+        try:
+            self._fila.put(None, timeout=1.0)
+        except queue.Full:
+            return
+        escritor.join(timeout=2.0)
+        if self.descartadas:
+            print(f"⚠️ Log: {self.descartadas} mensagens descartadas com a fila cheia")
+
+
+_log_compartilhado = None
+
+def obter_log():
+    """Retorna o registro de mensagens compartilhado por todos os módulos."""
+    global _log_compartilhado
+    if _log_compartilhado is None:
+        _log_compartilhado = GameLogger()
+    return _log_compartilhado
@@ -0,0 +1,276 @@
+"""
+Medição do tempo de cada etapa do quadro.
+As etapas são marcadas em sequência (partida -> marcar -> marcar...): cada
+marca soma ao nome dado o tempo desde a marca anterior. No fim do quadro as
+somas vão para buffers circulares de tamanho fixo, de onde saem os
+percentis do overlay, e opcionalmente para uma linha de CSV.
+Desligado, cada marca custa só uma verificação de atributo.
+
+Para achar a função culpada, ProfileCapture grava um cProfile (.pstats) e
+as pilhas amostradas no formato "collapsed" (flamegraph.pl, speedscope) de
+uma quantidade fixa de quadros.
+"""
+
+import os
+import sys
+import csv
+import time
+import cProfile
+import threading
+from array import array
+from collections import Counter
+from config.constants import (PERFIL_AMOSTRAS, PERFIL_ETAPAS, PERFIL_CAPTURAS_PASTA,
+                              PERFIL_CAPTURA_QUADROS, PERFIL_INTERVALO_AMOSTRAGEM)
+
+class RingBuffer:
+    """Buffer circular de amostras (float) com capacidade fixa."""
+
+    def __init__(self, capacidade=PERFIL_AMOSTRAS):
+        """
+        Inicializa o buffer.
+
+        Args:
+            capacidade: Quantidade máxima de amostras guardadas
+        """
+        self.capacidade = max(1, capacidade)
+        self.valores = array('d', bytes(8 * self.capacidade))
+        self.indice = 0
+        self.quantidade = 0
+
+    def adicionar(self, valor):
+        """Guarda uma amostra, sobrescrevendo a mais antiga quando cheio."""
+        self.valores[self.indice] = valor
+        self.indice = (self.indice + 1) % self.capacidade
+        if self.quantidade < self.capacidade:
+            self.quantidade += 1
+
+    def percentis(self, percentis):
+        """
+        Calcula percentis (nearest-rank) das amostras guardadas.
+
+        Args:
+            percentis: Sequência de valores entre 0 e 100
+
+        Returns:
+            list: Um valor por percentil (0.0 se o buffer estiver vazio)
+        """
+        if not self.quantidade:
+            return [0.0 for _ in percentis]
+        ordenados = sorted(self.valores[:self.quantidade])
+        ultimo = self.quantidade - 1
+        return [ordenados[min(ultimo, int(round(p / 100.0 * ultimo)))] for p in percentis]
+
+
+class FrameProfiler:
+    """Sondas de tempo por etapa do quadro, com buffers circulares e exportação CSV."""
+
+    def __init__(self, etapas=PERFIL_ETAPAS, capacidade=PERFIL_AMOSTRAS, arquivo_csv=None):
+        """
+        Inicializa o medidor.
+
+        Args:
+            etapas: Nomes das etapas, na ordem do overlay e das colunas do CSV
+            capacidade: Amostras guardadas por etapa
+            arquivo_csv: Caminho do CSV com uma linha por quadro, ou None
+        """
+        self.etapas = list(etapas)
+        self.buffers = {etapa: RingBuffer(capacidade) for etapa in self.etapas + ['quadro']}
+        self.somas = {}
+        self.quadro = 0
+        self._inicio_quadro = 0.0
+        self._ultima_marca = 0.0
+
+        self.arquivo_csv = None
+        self.escritor_csv = None
+        if arquivo_csv:
+            try:
+                self.arquivo_csv = open(arquivo_csv, "w", newline="", encoding="utf-8")
+                self.escritor_csv = csv.writer(self.arquivo_csv)
+                self.escritor_csv.writerow(['quadro', 'total_ms'] + [f"{etapa}_ms" for etapa in self.etapas])
+                print(f"📊 Gravando tempos por quadro em {arquivo_csv}")
+            except OSError as e:
+                print(f"⚠️ Não foi possível abrir o CSV de perfil {arquivo_csv}: {e}")
+                self.arquivo_csv = None
+
+        self.overlay_visivel = False
+        self.ativo = self.escritor_csv is not None
+
+    def alternar_overlay(self):
+        """Mostra/esconde o overlay; as sondas só medem com overlay ou CSV ligados."""
+        self.overlay_visivel = not self.overlay_visivel
+        self.ativo = self.overlay_visivel or self.escritor_csv is not None
+        print(f"📊 Overlay de desempenho {'ligado' if self.overlay_visivel else 'desligado'}")
+
+    def iniciar_quadro(self):
+        """Marca o início de um quadro."""
+        if not self.ativo:
+            return
+        self._inicio_quadro = self._ultima_marca = time.perf_counter()
+
+    def partida(self):
+        """Reinicia o cronômetro; o trecho até a próxima marca não é atribuído a nenhuma etapa."""
+        if not self.ativo:
+            return
+        self._ultima_marca = time.perf_counter()
+
+    def marcar(self, etapa):
+        """
+        Atribui à etapa o tempo desde a marca anterior.
+
+        Args:
+            etapa: Nome da etapa (uma das etapas configuradas)
+        """
+        if not self.ativo:
+            return
+        agora = time.perf_counter()
+        self.somas[etapa] = self.somas.get(etapa, 0.0) + (agora - self._ultima_marca)
+        self._ultima_marca = agora
+
+    def finalizar_quadro(self):
+        """Envia as somas do quadro para os buffers (e para o CSV) e prepara o próximo."""
+        if not self.ativo:
+            return
+        total_ms = (time.perf_counter() - self._inicio_quadro) * 1000.0
+        self.buffers['quadro'].adicionar(total_ms)
+        for etapa, segundos in self.somas.items():
+            buffer = self.buffers.get(etapa)
+            if buffer is not None:
+                buffer.adicionar(segundos * 1000.0)
+
+        if self.escritor_csv is not None:
+            linha = [self.quadro, f"{total_ms:.4f}"]
+            for etapa in self.etapas:
+                segundos = self.somas.get(etapa)
+                linha.append(f"{segundos * 1000.0:.4f}" if segundos is not None else "")
+            self.escritor_csv.writerow(linha)
+
+        self.somas.clear()
+        self.quadro += 1
+
+    def resumo(self, percentis=(50, 95, 99)):
+        """
+        Monta as linhas do overlay: p50/p95/p99 (ms) de cada etapa com amostras.
+
+        Returns:
+            list: Linhas de texto
+        """
+        linhas = [f"{'etapa':<22}" + "".join(f"{'p' + str(p):>8}" for p in percentis)]
+        for etapa in self.etapas + ['quadro']:
+            buffer = self.buffers[etapa]
+            if not buffer.quantidade:
+                continue
+            valores = buffer.percentis(percentis)
+            linhas.append(f"{etapa:<22}" + "".join(f"{valor:>8.2f}" for valor in valores))
+        return linhas
+
+    def fechar(self):
+        """Fecha o arquivo CSV, se houver."""
+        if self.arquivo_csv is not None:
+            self.arquivo_csv.close()
+            self.arquivo_csv = None
+            self.escritor_csv = None
+            self.ativo = self.overlay_visivel
+
+
+class ProfileCapture:
+    """Captura cProfile + pilhas amostradas da thread principal durante N quadros."""
+
+    def __init__(self, pasta=PERFIL_CAPTURAS_PASTA, intervalo=PERFIL_INTERVALO_AMOSTRAGEM):
+        """
+        Inicializa a captura.
+
+        Args:
+            pasta: Diretório onde os arquivos .pstats e .collapsed são gravados
+            intervalo: Segundos entre amostras de pilha
+        """
+        self.pasta = pasta
+        self.intervalo = intervalo
+        self.quadros_restantes = 0
+        self._perfil = None
+        self._pilhas = Counter()
+        self._parar = threading.Event()
+        self._amostrador = None
+        self._id_thread = None
+
+    @property
+    def capturando(self):
+        """True enquanto uma captura está em andamento."""
+        return self._perfil is not None
+
+    def iniciar(self, quadros=PERFIL_CAPTURA_QUADROS):
+        """
+        Começa a capturar (chamar da thread principal, a que roda o loop).
+
+        Args:
+            quadros: Quantidade de quadros a capturar
+        """
+        if self.capturando:
+            print("⚠️ Captura de perfil já em andamento")
+            return
+        self.quadros_restantes = max(1, quadros)
+        self._pilhas = Counter()
+        self._id_thread = threading.get_ident()
+        self._parar.clear()
+        self._amostrador = threading.Thread(target=self._amostrar, name="amostrador-perfil", daemon=True)
+        self._amostrador.start()
+        self._perfil = cProfile.Profile()
+        self._perfil.enable()
+        print(f"🔬 Capturando perfil de {self.quadros_restantes} quadros...")
+
+    def quadro_concluido(self):
+        """Conta um quadro; encerra e grava a captura no último."""
+        if self._perfil is None:
+            return
+        self.quadros_restantes -= 1
+        if self.quadros_restantes <= 0:
+            self.finalizar()
+
+    def finalizar(self):
+        """
+        Encerra a captura e grava os arquivos.
+
+        Returns:
+            str: Caminho base dos arquivos gravados (sem extensão), ou None
+        """
+        if self._perfil is None:
+            return None
+        self._perfil.disable()
+        self._parar.set()
+        self._amostrador.join()
+        perfil, self._perfil = self._perfil, None
+
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+            base = self._caminho_livre()
+            perfil.dump_stats(base + ".pstats")
+            with open(base + ".collapsed", "w", encoding="utf-8") as arquivo:
+                for pilha, quantidade in sorted(self._pilhas.items()):
+                    arquivo.write(f"{pilha} {quantidade}\n")
+        except OSError as e:
+            print(f"⚠️ Não foi possível gravar o perfil em {self.pasta}: {e}")
+            return None
+        print(f"🔬 Perfil gravado: {base}.pstats e {base}.collapsed ({sum(self._pilhas.values())} amostras)")
+        return base
+
+    def _caminho_livre(self):
+        """Caminho base (sem extensão) de uma captura nova: data, hora e milissegundos, com contador se já existir."""
+        agora = time.time()
+        nome = time.strftime("perfil_%Y%m%d_%H%M%S", time.localtime(agora)) + f"_{int(agora * 1000) % 1000:03d}"
+        base = os.path.join(self.pasta, nome)
+        contador = 1
+        while os.path.exists(base + ".pstats") or os.path.exists(base + ".collapsed"):
+            base = os.path.join(self.pasta, f"{nome}_{contador}")
+            contador += 1
+        return base
+
+    def _amostrar(self):
+        """Thread que guarda a pilha atual da thread principal a cada intervalo."""
+        while not self._parar.wait(self.intervalo):
+            quadro = sys._current_frames().get(self._id_thread)
+            pilha = []
+            while quadro is not None:
+                codigo = quadro.f_code
+                pilha.append(f"{os.path.basename(codigo.co_filename)}:{codigo.co_name}")
+                quadro = quadro.f_back
+            if pilha:
+                self._pilhas[";".join(reversed(pilha))] += 1
@@ -5,7 +5,15 @@ Responsável por carregar e gerenciar sprites, fontes, imagens e molduras.
 
 import pygame
 import os
+import json
 from config.constants import *
+from core.surface_cache import SurfaceDiskCache
+from core.async_loader import AsyncAssetLoader
+from graphics.text_cache import TextRenderCache
+from graphics.glyph_atlas import GlyphAtlas
+from graphics.overlays import obter_fabrica_overlays
+from graphics.nine_slice import obter_renderizador_molduras
+from graphics.mipmap import gerar_cadeia_mip, escolher_nivel, montar_sheet, escalar_suave
 
 class ResourceManager:
     """Gerenciador centralizado de recursos do jogo."""
@@ -16,6 +24,17 @@ class ResourceManager:
         self.imagens = {}
         self.molduras = {}
         self.sprites = {}
+        self.atlas = None  # Carregado sob demanda por carregar_atlas()
+        self.cache_disco = SurfaceDiskCache()
+        self.carregador = None  # AsyncAssetLoader enquanto há recursos em segundo plano
+        self._superficies_prontas = {}  # (caminho, tamanho, alpha) -> Surface já convertida
+        self._sprites_prontos = {}  # (caminho, frames_fixos) ou ('atlas', personagem, animacao) -> sprite_data convertido
+        self.cache_textos = TextRenderCache()
+        self.atlas_glifos = {}  # Font (ou ('pokemon', escala)) -> GlyphAtlas
+        self.overlays = obter_fabrica_overlays()
+        self.molduras_prontas = obter_renderizador_molduras()
+        self.tamanhos_escalados = dict(TAMANHOS_IMAGENS_ESCALADAS)  # nome -> (largura, altura) de desenho
+        self.imagens_escaladas = {}  # (nome, tamanho) -> Surface já escalada
         
     def carregar_todos_recursos(self):
         """Carrega todos os recursos do jogo."""
@@ -24,6 +43,295 @@ class ResourceManager:
         self.carregar_molduras()
         self.carregar_sprites()
         
+    def carregar_recursos_menu(self):
+        """Carrega de forma síncrona apenas o necessário para desenhar o menu principal."""
+        self.carregar_fontes()
+        try:
+            menu_bg_path = os.path.join("Assests", "Sprites", "Scenes", "menu_background.png")
+            if os.path.exists(menu_bg_path):
+                self.guardar_imagem('menu_background', self.cache_disco.carregar(menu_bg_path))
+                print("✅ Fundo do menu principal carregado!")
+                
+            moldura_path = os.path.join("Assests", "Sprites", "molders", "hud_botao.png")
+            if os.path.exists(moldura_path):
+                self.molduras['itens'] = self.cache_disco.carregar(moldura_path)
+        except Exception as e:
+            print(f"⚠️ Erro ao carregar recursos do menu: {e}")
+            
+    def iniciar_carregamento_em_segundo_plano(self):
+        """
+        Inicia o carregamento dos recursos de batalha enquanto o menu e a intro rodam.
+        
+        As imagens são decodificadas em threads, e as sprite sheets também são
+        fatiadas e ganham os mipmaps lá. processar_carregamento() faz a conversão
+        de um item por frame, e no fim carregar_imagens/molduras/sprites só montam
+        os dicionários com as superfícies já convertidas.
+        """
+        carregador = AsyncAssetLoader()
+        
+        def agendar(caminho, tamanho=None, alpha=True):
+            chave = (caminho, tamanho, alpha)
+            decodificar = lambda: self.cache_disco.decodificar(caminho, tamanho, alpha)
+            finalizar = lambda pendente: self._superficies_prontas.__setitem__(
+                chave, self.cache_disco.finalizar(pendente))
+            carregador.adicionar(os.path.basename(caminho), decodificar, finalizar)
+            
+        def agendar_sprite(caminho, frames_fixos=None):
+            decodificar = lambda: self._preparar_sprite_sheet(caminho, frames_fixos)
+            finalizar = lambda sprite_data: self._sprites_prontos.__setitem__(
+                (caminho, frames_fixos), self._converter_sprite_sheet(sprite_data))
+            carregador.adicionar(os.path.basename(caminho), decodificar, finalizar)
+            
+        def agendar_pagina_atlas(manifesto, indice):
+            caminho = os.path.join(ATLAS_PASTA, manifesto['paginas'][indice])
+            decodificar = lambda: self._preparar_pagina_atlas(manifesto, indice)
+            finalizar = lambda preparada: self._converter_pagina_atlas(caminho, preparada)
+            carregador.adicionar(os.path.basename(caminho), decodificar, finalizar)
+            
+        for caminho, tamanho, alpha in self._listar_imagens_batalha():
+            if os.path.exists(caminho):
+                agendar(caminho, tamanho, alpha)
+        manifesto = self._ler_manifesto_atlas()
+        if manifesto is not None:
+            for indice in range(len(manifesto['paginas'])):
+                agendar_pagina_atlas(manifesto, indice)
+        else:
+            for caminho in self._listar_sprite_sheets():
+                agendar_sprite(caminho)
+        ghost_path = os.path.join("Assests", "Sprites", "Ghost", GHOST_SPRITE_CONFIG['arquivo'])
+        if os.path.exists(ghost_path) and 'ghost' not in (manifesto or {}).get('personagens', {}):
+            agendar_sprite(ghost_path, GHOST_SPRITE_CONFIG['frames'])
+            
+        # Etapas finais na thread principal, depois de todas as conversões
+        carregador.adicionar("imagens", None, lambda _: self.carregar_imagens())
+        carregador.adicionar("molduras", None, lambda _: self.carregar_molduras())
+        carregador.adicionar("sprites", None, lambda _: self.carregar_sprites())
+        carregador.adicionar("limpeza", None, lambda _: self._limpar_prontos())
+        
+        self.carregador = carregador
+        carregador.iniciar()
+        
+    def _listar_imagens_batalha(self):
+        """Retorna (caminho, tamanho, alpha) das imagens carregadas por carregar_imagens e carregar_molduras."""
+        scenes = os.path.join("Assests", "Sprites", "Scenes")
+        molders = os.path.join("Assests", "Sprites", "molders")
+        return [
+            (os.path.join(scenes, "Caminho Encantado na Floresta.png"), (LARGURA, ALTURA), False),
+            (os.path.join(scenes, "card_inicial.png"), None, True),
+            (os.path.join(molders, "Monstruario.png"), None, True),
+            (os.path.join(molders, "Loja-Sheet.png"), None, True),
+            (os.path.join(molders, "coin_molder.png"), (120, 40), True),
+        ]
+        
+    def _ler_manifesto_atlas(self):
+        """Retorna o manifesto do atlas de texturas, ou None se não houver atlas válido."""
+        manifesto_path = os.path.join(ATLAS_PASTA, ATLAS_MANIFESTO)
+        if not os.path.exists(manifesto_path):
+            return None
+        try:
+            with open(manifesto_path, "r", encoding="utf-8") as arquivo:
+                manifesto = json.load(arquivo)
+            if 'paginas' not in manifesto:
+                raise KeyError('paginas')
+            return manifesto
+        except Exception as e:
+            print(f"⚠️ Manifesto do atlas inválido: {e}")
+            return None
+            
+    def _listar_sprite_sheets(self):
+        """Retorna as sprite sheets soltas que carregar_sprites vai ler (sem atlas)."""
+        caminhos = []
+        sprites_path = os.path.join("Assests", "Sprites")
+        if os.path.exists(sprites_path):
+            for personagem in os.listdir(sprites_path):
+                personagem_path = os.path.join(sprites_path, personagem)
+                if not os.path.isdir(personagem_path):
+                    continue
+                for arquivo in os.listdir(personagem_path):
+                    if os.path.splitext(arquivo)[1].lower() in [".png", ".jpg", ".jpeg", ".bmp"]:
+                        caminhos.append(os.path.join(personagem_path, arquivo))
+        return caminhos
+        
+    def processar_carregamento(self):
+        """
+        Avança o carregamento em segundo plano (chamar uma vez por frame).
+        
+        Returns:
+            bool: True se o carregamento terminou nesta chamada
+        """
+        if self.carregador is None:
+            return False
+        self.carregador.processar()
+        if self.carregador.concluido():
+            self.carregador = None
+            print("✅ Recursos de batalha carregados em segundo plano!")
+            return True
+        return False
+        
+    def concluir_carregamento(self):
+        """
+        Termina imediatamente o carregamento em segundo plano, aguardando as threads.
+        
+        Returns:
+            bool: True se havia carregamento pendente
+        """
+        if self.carregador is None:
+            return False
+        self.carregador.concluir()
+        self.carregador = None
+        print("✅ Recursos de batalha carregados!")
+        return True
+        
+    def carregando(self):
+        """Retorna True enquanto há recursos sendo carregados em segundo plano."""
+        return self.carregador is not None
+        
+    def progresso_carregamento(self):
+        """Retorna o progresso do carregamento em segundo plano (0.0 a 1.0)."""
+        if self.carregador is None:
+            return 1.0
+        return self.carregador.progresso()
+        
+    def _carregar_imagem(self, caminho, tamanho=None, alpha=True):
+        """Retorna a imagem já convertida em segundo plano, ou carrega pelo cache em disco."""
+        superficie = self._superficies_prontas.get((caminho, tamanho, alpha))
+        if superficie is not None:
+            return superficie
+        return self.cache_disco.carregar(caminho, tamanho, alpha)
+        
+    def _carregar_sprite_sheet(self, caminho):
+        """Retorna a sprite sheet já convertida em segundo plano, ou carrega do arquivo."""
+        superficie = self._superficies_prontas.get((caminho, None, True))
+        if superficie is not None:
+            return superficie
+        return pygame.image.load(caminho).convert_alpha()
+        
+    def _obter_sprite_sheet(self, caminho, frames_fixos=None):
+        """Retorna a sprite sheet já fatiada e convertida em segundo plano, ou prepara agora."""
+        sprite_data = self._sprites_prontos.get((caminho, frames_fixos))
+        if sprite_data is not None:
+            return dict(sprite_data)
+        return self._converter_sprite_sheet(self._preparar_sprite_sheet(caminho, frames_fixos))
+        
+    @staticmethod
+    def _decodificar_sheet(caminho):
+        """Lê uma imagem em RGBA de 32 bits sem usar a tela (pode rodar em uma thread auxiliar)."""
+        sprite_sheet = pygame.image.load(caminho)
+        if sprite_sheet.get_bitsize() != 32 or not sprite_sheet.get_flags() & pygame.SRCALPHA:
+            sprite_sheet = sprite_sheet.convert(32, pygame.SRCALPHA)
+        return sprite_sheet
+        
+    def _preparar_sprite_sheet(self, caminho, frames_fixos=None):
+        """
+        Etapa de uma sprite sheet que pode rodar fora da thread principal.
+        
+        Decodifica o arquivo, detecta os frames, fatia a sheet e gera os mipmaps
+        sem usar a tela; _converter_sprite_sheet() faz o convert_alpha depois.
+        
+        Args:
+            caminho: Arquivo da sprite sheet
+            frames_fixos: Quantidade de frames já conhecida (Ghost garantido), ou None para detectar
+        
+        Returns:
+            dict: sprite_data com superfícies ainda sem conversão
+        """
+        sprite_sheet = self._decodificar_sheet(caminho)
+        sheet_width, sheet_height = sprite_sheet.get_size()
+        
+        if frames_fixos is None:
+            # === NOVO === Detecção Inteligente de Frames
+            frame_width, frame_height, total_frames, _ = self.detectar_layout_frames(sheet_width, sheet_height)
+        elif sheet_width > sheet_height:
+            # Calcula frame automaticamente baseado na largura total
+            frame_width, frame_height, total_frames = sheet_width // frames_fixos, sheet_height, frames_fixos
+        else:
+            # Fallback para sprite única
+            frame_width, frame_height, total_frames = sheet_width, sheet_height, 1
+        
+        sprite_data = {
+            'sheet': sprite_sheet,
+            'frame_width': frame_width,
+            'frame_height': frame_height,
+            'total_frames': total_frames,
+            'tabela_frames': self.fatiar_frames(sprite_sheet, frame_width, frame_height, total_frames)
+        }
+        self.aplicar_mipmaps(sprite_data)
+        return sprite_data
+        
+    def _converter_sprite_sheet(self, sprite_data, convertidas=None):
+        """
+        Etapa da thread principal: convert_alpha da sheet e dos níveis de mipmap.
+        
+        Os frames voltam a ser subsurfaces da sheet convertida, nas mesmas posições.
+        
+        Args:
+            sprite_data: Retorno de _preparar_sprite_sheet (é alterado)
+            convertidas: id(Surface) -> Surface convertida, para sheets compartilhadas (páginas do atlas)
+        
+        Returns:
+            dict: O próprio sprite_data, com as superfícies convertidas
+        """
+        convertidas = {} if convertidas is None else convertidas
+        sheet = sprite_data['sheet']
+        if id(sheet) not in convertidas:
+            convertidas[id(sheet)] = sheet.convert_alpha()
+        sheet = convertidas[id(sheet)]
+        
+        tabela = tuple(sheet.subsurface((frame.get_abs_offset(), frame.get_size()))
+                       for frame in sprite_data['tabela_frames'])
+        sprite_data['sheet'] = sheet
+        sprite_data['tabela_frames'] = tabela
+        if 'mipmaps' in sprite_data:
+            # O nível 0 é o próprio frame; os menores são superfícies soltas
+            sprite_data['mipmaps'] = tuple((frame,) + tuple(nivel.convert_alpha() for nivel in cadeia[1:])
+                                           for frame, cadeia in zip(tabela, sprite_data['mipmaps']))
+        return sprite_data
+        
+    def _fatiar_animacao_atlas(self, pagina, info):
+        """Monta o sprite_data de uma animação do atlas (frames da página) com os mipmaps."""
+        frame_width = info['frame_width']
+        frame_height = info['frame_height']
+        tabela = tuple(pagina.subsurface((x, y, frame_width, frame_height)) for x, y in info['frames'])
+        
+        sprite_data = {
+            'sheet': pagina,
+            'frame_width': frame_width,
+            'frame_height': frame_height,
+            'total_frames': len(tabela),
+            'tabela_frames': tabela
+        }
+        self.aplicar_mipmaps(sprite_data)
+        return sprite_data
+        
+    def _preparar_pagina_atlas(self, manifesto, indice):
+        """
+        Etapa de uma página do atlas que pode rodar fora da thread principal.
+        
+        Returns:
+            dict: 'pagina' sem conversão e 'animacoes' ((personagem, animacao) -> sprite_data) da página
+        """
+        pagina = self._decodificar_sheet(os.path.join(ATLAS_PASTA, manifesto['paginas'][indice]))
+        animacoes = {}
+        for personagem, dados in manifesto.get('personagens', {}).items():
+            for animacao, chave in dados['animacoes'].items():
+                info = dados['arquivos'][chave]
+                if info['pagina'] == indice:
+                    animacoes[(personagem, animacao)] = self._fatiar_animacao_atlas(pagina, info)
+        return {'pagina': pagina, 'animacoes': animacoes}
+        
+    def _converter_pagina_atlas(self, caminho, preparada):
+        """Etapa da thread principal de uma página do atlas: converte a página uma vez e as animações dela."""
+        pagina = preparada['pagina']
+        convertidas = {id(pagina): pagina.convert_alpha()}
+        self._superficies_prontas[(caminho, None, True)] = convertidas[id(pagina)]
+        for (personagem, animacao), sprite_data in preparada['animacoes'].items():
+            self._sprites_prontos[('atlas', personagem, animacao)] = self._converter_sprite_sheet(sprite_data, convertidas)
+        
+    def _limpar_prontos(self):
+        """Descarta as superfícies preparadas em segundo plano (já estão nos dicionários)."""
+        self._superficies_prontas.clear()
+        self._sprites_prontos.clear()
+        
     def carregar_fontes(self):
         """Carrega e configura as fontes do jogo."""
         try:
@@ -63,18 +371,19 @@ class ResourceManager:
             # Fundo de batalha
             fundo_path = os.path.join("Assests", "Sprites", "Scenes", "Caminho Encantado na Floresta.png")
             if os.path.exists(fundo_path):
-                fundo = pygame.image.load(fundo_path).convert()
-                self.imagens['cenario'] = pygame.transform.scale(fundo, (LARGURA, ALTURA))
+                self.imagens['cenario'] = self._carregar_imagem(fundo_path, (LARGURA, ALTURA), alpha=False)
                 print("✅ Cenário de batalha carregado!")
                 
             # Carta da intro
             carta_path = os.path.join("Assests", "Sprites", "Scenes", "card_inicial.png")
             if os.path.exists(carta_path):
-                self.imagens['carta_intro'] = pygame.image.load(carta_path).convert_alpha()
+                self.guardar_imagem('carta_intro', self._carregar_imagem(carta_path))
                 print("✅ Carta da intro carregada!")
             menu_bg_path = os.path.join("Assests", "Sprites", "Scenes", "menu_background.png") # <<< ADICIONADO (Verifique o nome do arquivo)
-            if os.path.exists(menu_bg_path): # <<< ADICIONADO
-                          self.imagens['menu_background'] = pygame.image.load(menu_bg_path).convert_alpha() # <<< ADICIONADO
+            if self.obter_imagem('menu_background') is not None:
+                pass  # Já carregado por carregar_recursos_menu
+            elif os.path.exists(menu_bg_path): # <<< ADICIONADO
+                          self.guardar_imagem('menu_background', self._carregar_imagem(menu_bg_path)) # <<< ADICIONADO
                           print("✅ Fundo do menu principal carregado!") # <<< ADICIONADO
             else: # <<< ADICIONADO
                           print("⚠️ Fundo do menu (menu_background.png) não encontrado na pasta Scenes") # <<< ADICIONADO
@@ -82,7 +391,7 @@ class ResourceManager:
             # Monstruário (NOVO)
             monstruario_path = os.path.join("Assests", "Sprites", "molders", "Monstruario.png")
             if os.path.exists(monstruario_path):
-                self.imagens['monstruario'] = pygame.image.load(monstruario_path).convert_alpha()
+                self.guardar_imagem('monstruario', self._carregar_imagem(monstruario_path))
                 print("✅ Sprite do monstruário carregada!")
                 
         except Exception as e:
@@ -91,24 +400,26 @@ class ResourceManager:
     def carregar_molduras(self):
         """Carrega as molduras para interface."""
         try:
+            if self.carregar_atlas() and self._carregar_molduras_atlas():
+                return
+                
             # Moldura de itens/botões
             moldura_path = os.path.join("Assests", "Sprites", "molders", "hud_botao.png")
             if os.path.exists(moldura_path):
-                self.molduras['itens'] = pygame.image.load(moldura_path).convert_alpha()
+                self.molduras['itens'] = self._carregar_imagem(moldura_path)
                 print("✅ Moldura de itens carregada!")
                 
             # Moldura da loja
             loja_path = os.path.join("Assests", "Sprites", "molders", "Loja-Sheet.png")
             if os.path.exists(loja_path):
-                self.molduras['loja'] = pygame.image.load(loja_path).convert_alpha()
+                self.molduras['loja'] = self._carregar_imagem(loja_path)
                 print("✅ Moldura da loja carregada!")
                 
             # Moldura de dinheiro (coin molder específica)
             moldura_dinheiro_path = os.path.join("Assests", "Sprites", "molders", "coin_molder.png")
             if os.path.exists(moldura_dinheiro_path):
-                self.molduras['dinheiro'] = pygame.image.load(moldura_dinheiro_path).convert_alpha()
                 # Escala para um tamanho adequado (aproximadamente 120x40 pixels)
-                self.molduras['dinheiro'] = pygame.transform.scale(self.molduras['dinheiro'], (120, 40))
+                self.molduras['dinheiro'] = self._carregar_imagem(moldura_dinheiro_path, (120, 40))
                 print("✅ Moldura de dinheiro (coin molder) carregada!")
             else:
                 # Fallback para moldura de itens
@@ -118,9 +429,105 @@ class ResourceManager:
         except Exception as e:
             print(f"⚠️ Erro ao carregar molduras: {e}")
             
+    def _carregar_molduras_atlas(self):
+        """Obtém as molduras como subsurfaces das páginas do atlas."""
+        molduras = self.atlas['manifesto'].get('molduras', {})
+        for tipo, info in molduras.items():
+            self.molduras[tipo] = self.atlas['paginas'][info['pagina']].subsurface(info['rect'])
+            
+        if not self.molduras:
+            return False
+            
+        if 'dinheiro' in self.molduras:
+            # Escala para um tamanho adequado (aproximadamente 120x40 pixels)
+            self.molduras['dinheiro'] = pygame.transform.scale(self.molduras['dinheiro'], (120, 40))
+        else:
+            self.molduras['dinheiro'] = self.molduras.get('itens')
+        print(f"✅ Molduras carregadas do atlas: {list(self.molduras.keys())}")
+        return True
+        
+    @staticmethod
+    def detectar_layout_frames(sheet_width, sheet_height):
+        """
+        Detecta o layout de frames de uma sprite sheet pelas proporções.
+        
+        Args:
+            sheet_width, sheet_height: Tamanho da sprite sheet
+            
+        Returns:
+            tuple: (frame_width, frame_height, total_frames, descricao)
+        """
+        # Detecta se é sprite sheet horizontal, vertical ou única
+        if sheet_width > sheet_height:
+            # Sprite sheet horizontal - detecta frames quadrados
+            if sheet_width >= sheet_height * 2:
+                frame_height = sheet_height
+                frame_width = frame_height  # Frames quadrados
+                total_frames = sheet_width // frame_width
+                descricao = "🎬 Sprite horizontal"
+            else:
+                # Apenas 2 frames lado a lado
+                frame_width = sheet_width // 2
+                frame_height = sheet_height
+                total_frames = 2
+                descricao = "🎬 Sprite dupla"
+        elif sheet_height > sheet_width:
+            # Sprite sheet vertical
+            if sheet_height >= sheet_width * 2:
+                frame_width = sheet_width
+                frame_height = frame_width  # Frames quadrados
+                total_frames = sheet_height // frame_height
+                descricao = "🎬 Sprite vertical"
+            else:
+                # Apenas 2 frames empilhados
+                frame_width = sheet_width
+                frame_height = sheet_height // 2
+                total_frames = 2
+                descricao = "🎬 Sprite dupla vertical"
+        else:
+            # Sprite única (quadrada)
+            frame_width = sheet_width
+            frame_height = sheet_height
+            total_frames = 1
+            descricao = "🎬 Sprite única"
+        
+        # === NOVO === Detecção automática baseada em proporções padrão
+        # Se a largura é múltiplo exato da altura, pode ser múltiplos frames
+        if total_frames == 1 and sheet_width > sheet_height:
+            # Tenta detectar múltiplos frames baseado em proporções comuns
+            proporcoes_comuns = [2, 3, 4, 5, 6, 8, 10, 12]
+            for frames in proporcoes_comuns:
+                if sheet_width % frames == 0:
+                    test_frame_width = sheet_width // frames
+                    if abs(test_frame_width - sheet_height) <= 5:  # Tolerância para frames quase quadrados
+                        frame_width = test_frame_width
+                        frame_height = sheet_height
+                        total_frames = frames
+                        descricao = "🎯 Auto-detectado"
+                        break
+                        
+        return frame_width, frame_height, total_frames, descricao
+        
+    @staticmethod
+    def classificar_animacao(nome):
+        """Determina o tipo de animação ('idle', 'ataque' ou 'defesa') pelo nome do arquivo."""
+        nome_limpo = nome.lower().replace('_sheet', '').replace('-sheet', '')
+        if 'idle' in nome_limpo or 'stopped' in nome_limpo:
+            return 'idle'
+        elif 'attack' in nome_limpo or 'ataque' in nome_limpo or 'atack' in nome_limpo:
+            return 'ataque'
+        elif 'defend' in nome_limpo or 'defesa' in nome_limpo:
+            return 'defesa'
+        # Se não identifica, assume como idle
+        return 'idle'
+        
     def carregar_sprites(self):
         """Carrega sprites organizadas por personagem - sistema baseado no original"""
         try:
+            # Atlas pré-empacotado (gerar_atlas.py) tem prioridade sobre a varredura de pastas
+            if self.carregar_atlas() and self._carregar_sprites_atlas():
+                return
+                
             # PRIMEIRO: Configuração garantida para Ghost
             print("👻 Iniciando configuração garantida do Ghost...")
             self.carregar_ghost_sprite_garantido()
@@ -148,79 +555,13 @@ class ResourceManager:
                         if extensao.lower() in [".png", ".jpg", ".jpeg", ".bmp"]:
                             try:
                                 sprite_path = os.path.join(personagem_path, arquivo)
-                                sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-                                
-                                # === NOVO === Detecção Inteligente de Frames
-                                sheet_width = sprite_sheet.get_width()
-                                sheet_height = sprite_sheet.get_height()
-                                
-                                # Detecta se é sprite sheet horizontal, vertical ou única
-                                if sheet_width > sheet_height:
-                                    # Sprite sheet horizontal - detecta frames quadrados
-                                    if sheet_width >= sheet_height * 2:
-                                        frame_height = sheet_height
-                                        frame_width = frame_height  # Frames quadrados
-                                        total_frames = sheet_width // frame_width
-                                        print(f"    🎬 Sprite horizontal: {total_frames} frames de {frame_width}x{frame_height}")
-                                    else:
-                                        # Apenas 2 frames lado a lado
-                                        frame_width = sheet_width // 2
-                                        frame_height = sheet_height
-                                        total_frames = 2
-                                        print(f"    🎬 Sprite dupla: {total_frames} frames de {frame_width}x{frame_height}")
-                                elif sheet_height > sheet_width:
-                                    # Sprite sheet vertical
-                                    if sheet_height >= sheet_width * 2:
-                                        frame_width = sheet_width
-                                        frame_height = frame_width  # Frames quadrados
-                                        total_frames = sheet_height // frame_height
-                                        print(f"    🎬 Sprite vertical: {total_frames} frames de {frame_width}x{frame_height}")
-                                    else:
-                                        # Apenas 2 frames empilhados
-                                        frame_width = sheet_width
-                                        frame_height = sheet_height // 2
-                                        total_frames = 2
-                                        print(f"    🎬 Sprite dupla vertical: {total_frames} frames de {frame_width}x{frame_height}")
-                                else:
-                                    # Sprite única (quadrada)
-                                    frame_width = sheet_width
-                                    frame_height = sheet_height
-                                    total_frames = 1
-                                    print(f"    🎬 Sprite única: {frame_width}x{frame_height}")
-                                
-                                # === NOVO === Detecção automática baseada em proporções padrão
-                                # Se a largura é múltiplo exato da altura, pode ser múltiplos frames
-                                if total_frames == 1 and sheet_width > sheet_height:
-                                    # Tenta detectar múltiplos frames baseado em proporções comuns
-                                    proporcoes_comuns = [2, 3, 4, 5, 6, 8, 10, 12]
-                                    for frames in proporcoes_comuns:
-                                        if sheet_width % frames == 0:
-                                            test_frame_width = sheet_width // frames
-                                            if abs(test_frame_width - sheet_height) <= 5:  # Tolerância para frames quase quadrados
-                                                frame_width = test_frame_width
-                                                frame_height = sheet_height
-                                                total_frames = frames
-                                                print(f"    🎯 Auto-detectado: {total_frames} frames de {frame_width}x{frame_height}")
-                                                break
-                                
-                                sprite_data = {
-                                    'sheet': sprite_sheet,
-                                    'frame_width': frame_width,
-                                    'frame_height': frame_height,
-                                    'total_frames': total_frames
-                                }
+                                # Fatiada e com mipmaps (em segundo plano, se o carregamento já passou por ela)
+                                sprite_data = self._obter_sprite_sheet(sprite_path)
+                                print(f"    🎬 {arquivo}: {sprite_data['total_frames']} frames de "
+                                      f"{sprite_data['frame_width']}x{sprite_data['frame_height']}")
                                 
                                 # Determina o tipo de animação pelo nome
-                                nome_limpo = nome.lower().replace('_sheet', '').replace('-sheet', '')
-                                if 'idle' in nome_limpo or 'stopped' in nome_limpo:
-                                    sprites_personagem['idle'] = sprite_data
-                                elif 'attack' in nome_limpo or 'ataque' in nome_limpo or 'atack' in nome_limpo:
-                                    sprites_personagem['ataque'] = sprite_data
-                                elif 'defend' in nome_limpo or 'defesa' in nome_limpo:
-                                    sprites_personagem['defesa'] = sprite_data
-                                else:
-                                    # Se não identifica, assume como idle
-                                    sprites_personagem['idle'] = sprite_data
+                                sprites_personagem[self.classificar_animacao(nome)] = sprite_data
                                 
                             except Exception as e:
                                 print(f"  ⚠️ Erro ao carregar {arquivo}: {e}")
@@ -228,37 +569,7 @@ class ResourceManager:
                     if sprites_personagem:
                         self.sprites_personagens[personagem.lower()] = sprites_personagem
                 
-                # Atribui sprites aos jogadores (Skeleton = Jogador, Kastle = Inimigo)
-                personagens_carregados = list(self.sprites_personagens.keys())
-                personagens_carregados.sort()  # Garante ordem: Kastle, Skeleton
-                
-                # Encontra Skeleton, Kastle e Ghost especificamente
-                skeleton_encontrado = None
-                kastle_encontrado = None
-                ghost_encontrado = None
-                personagem_encontrado = None
-                
-                for personagem in personagens_carregados:
-                    if 'skeleton' in personagem.lower():
-                        skeleton_encontrado = personagem
-                    elif 'kastle' in personagem.lower():
-                        kastle_encontrado = personagem
-                    elif 'ghost' in personagem.lower():
-                        ghost_encontrado = personagem
-                    elif 'personagem' in personagem.lower():
-                        personagem_encontrado = personagem
-                
-                # Prioridade: personagem > skeleton para o jogador
-                # Ghost como inimigo principal
-                if personagem_encontrado:
-                    self.sprites_jogador = self.sprites_personagens[personagem_encontrado]
-                elif skeleton_encontrado:
-                    self.sprites_jogador = self.sprites_personagens[skeleton_encontrado]
-                
-                if ghost_encontrado:
-                    self.sprites_inimigo = self.sprites_personagens[ghost_encontrado]
-                elif kastle_encontrado:
-                    self.sprites_inimigo = self.sprites_personagens[kastle_encontrado]
+                self._atribuir_sprites_jogador_inimigo()
                 
                 print(f"✅ Sprites carregados: {list(self.sprites_personagens.keys())}")
                 
@@ -271,6 +582,105 @@ class ResourceManager:
         except Exception as e:
             print(f"❌ Erro ao carregar sprites: {e}")
             
+    def _atribuir_sprites_jogador_inimigo(self):
+        """Escolhe as sprites do jogador e do inimigo entre os personagens carregados."""
+        # Atribui sprites aos jogadores (Skeleton = Jogador, Kastle = Inimigo)
+        personagens_carregados = list(self.sprites_personagens.keys())
+        personagens_carregados.sort()  # Garante ordem: Kastle, Skeleton
+        
+        # Encontra Skeleton, Kastle e Ghost especificamente
+        skeleton_encontrado = None
+        kastle_encontrado = None
+        ghost_encontrado = None
+        personagem_encontrado = None
+        
+        for personagem in personagens_carregados:
+            if 'skeleton' in personagem.lower():
+                skeleton_encontrado = personagem
+            elif 'kastle' in personagem.lower():
+                kastle_encontrado = personagem
+            elif 'ghost' in personagem.lower():
+                ghost_encontrado = personagem
+            elif 'personagem' in personagem.lower():
+                personagem_encontrado = personagem
+        
+        # Prioridade: personagem > skeleton para o jogador
+        # Ghost como inimigo principal
+        if personagem_encontrado:
+            self.sprites_jogador = self.sprites_personagens[personagem_encontrado]
+        elif skeleton_encontrado:
+            self.sprites_jogador = self.sprites_personagens[skeleton_encontrado]
+        
+        if ghost_encontrado:
+            self.sprites_inimigo = self.sprites_personagens[ghost_encontrado]
+        elif kastle_encontrado:
+            self.sprites_inimigo = self.sprites_personagens[kastle_encontrado]
+            
+    def carregar_atlas(self):
+        """
+        Carrega o manifesto e as páginas do atlas de texturas, uma única vez.
+        
+        Returns:
+            bool: True se o atlas está disponível
+        """
+        if self.atlas is not None:
+            return bool(self.atlas)
+            
+        self.atlas = {}
+        manifesto_path = os.path.join(ATLAS_PASTA, ATLAS_MANIFESTO)
+        if not os.path.exists(manifesto_path):
+            return False
+            
+        try:
+            with open(manifesto_path, "r", encoding="utf-8") as arquivo:
+                manifesto = json.load(arquivo)
+            paginas = [self._carregar_sprite_sheet(os.path.join(ATLAS_PASTA, pagina))
+                       for pagina in manifesto['paginas']]
+            self.atlas = {'manifesto': manifesto, 'paginas': paginas}
+            print(f"✅ Atlas carregado: {len(paginas)} página(s)")
+            return True
+        except Exception as e:
+            print(f"⚠️ Erro ao carregar atlas, usando arquivos soltos: {e}")
+            self.atlas = {}
+            return False
+            
+    def _carregar_sprites_atlas(self):
+        """Monta as sprites dos personagens a partir do atlas (sem detecção de frames)."""
+        manifesto = self.atlas['manifesto']
+        paginas = self.atlas['paginas']
+        self.sprites_personagens = {}
+        
+        for personagem, dados in manifesto.get('personagens', {}).items():
+            sprites_personagem = {}
+            for animacao, chave in dados['animacoes'].items():
+                sprite_data = self._sprites_prontos.get(('atlas', personagem, animacao))
+                if sprite_data is None:
+                    info = dados['arquivos'][chave]
+                    sprite_data = self._fatiar_animacao_atlas(paginas[info['pagina']], info)
+                sprites_personagem[animacao] = sprite_data
+                
+            if sprites_personagem:
+                self.sprites_personagens[personagem] = sprites_personagem
+                
+        if not self.sprites_personagens:
+            return False
+            
+        # Ghost garantido a partir do atlas; se não estiver empacotado, carrega do arquivo
+        ghost_idle = self.sprites_personagens.get('ghost', {}).get('idle')
+        if ghost_idle:
+            ghost_config = GHOST_SPRITE_CONFIG.copy()
+            ghost_config.update(ghost_idle)
+            ghost_config['frames'] = ghost_idle['total_frames']
+            self.sprites['ghost'] = ghost_config
+            self.sprites['fantasma'] = ghost_config
+        else:
+            self.carregar_ghost_sprite_garantido()
+            
+        self._atribuir_sprites_jogador_inimigo()
+        print(f"✅ Sprites carregados do atlas: {list(self.sprites_personagens.keys())}")
+        self._carregar_sprites_compatibilidade()
+        return True
+        
     def _carregar_sprites_compatibilidade(self):
         """Carrega sprites no formato antigo para compatibilidade."""
         # Sprites para compatibilidade
@@ -282,7 +692,9 @@ class ResourceManager:
                     'sprite_sheet': idle_data.get('sheet'),
                     'frame_width': idle_data.get('frame_width', 64),
                     'frame_height': idle_data.get('frame_height', 64),
-                    'total_frames': idle_data.get('total_frames', 1)
+                    'total_frames': idle_data.get('total_frames', 1),
+                    'tabela_frames': idle_data.get('tabela_frames'),
+                    'mipmaps': idle_data.get('mipmaps')
                 }
         
         if hasattr(self, 'sprites_inimigo') and self.sprites_inimigo:
@@ -293,7 +705,9 @@ class ResourceManager:
                     'sprite_sheet': idle_data.get('sheet'),
                     'frame_width': idle_data.get('frame_width', 64),
                     'frame_height': idle_data.get('frame_height', 64),
-                    'total_frames': idle_data.get('total_frames', 1)
+                    'total_frames': idle_data.get('total_frames', 1),
+                    'tabela_frames': idle_data.get('tabela_frames'),
+                    'mipmaps': idle_data.get('mipmaps')
                 }
                 self.sprites['kastle'] = sprite_compatibilidade
                 self.sprites['fantasma'] = sprite_compatibilidade
@@ -307,7 +721,9 @@ class ResourceManager:
                     'sprite_sheet': ballons_data.get('sheet'),
                     'frame_width': ballons_data.get('frame_width', 64),
                     'frame_height': ballons_data.get('frame_height', 64),
-                    'total_frames': ballons_data.get('total_frames', 1)
+                    'total_frames': ballons_data.get('total_frames', 1),
+                    'tabela_frames': ballons_data.get('tabela_frames'),
+                    'mipmaps': ballons_data.get('mipmaps')
                 }
                 
     def _processar_sprite_sheet(self, sprite_sheet, nome):
@@ -336,53 +752,259 @@ class ResourceManager:
             'sprite_sheet': sprite_sheet,
             'frame_width': frame_width,
             'frame_height': frame_height,
-            'total_frames': max(1, total_frames)
+            'total_frames': max(1, total_frames),
+            'tabela_frames': self.fatiar_frames(sprite_sheet, frame_width, frame_height, max(1, total_frames))
         }
         
-    def extrair_sprite(self, sprite_data, frame_index):
-        """Extrai um frame específico de uma sprite sheet."""
-        if not sprite_data:
-            return None
-            
-        sprite_sheet = sprite_data.get('sheet') or sprite_data.get('sprite_sheet')
-        frame_width = sprite_data['frame_width']
-        frame_height = sprite_data['frame_height']
-        total_frames = sprite_data['total_frames']
+    def fatiar_frames(self, sprite_sheet, frame_width, frame_height, total_frames):
+        """
+        Fatia uma sprite sheet uma única vez em uma tabela imutável de frames.
         
-        # Garante que o frame_index está dentro dos limites
-        frame_index = frame_index % total_frames
+        Os frames são subsurfaces da sheet original, então não há cópia de pixels
+        nem alocação de superfícies novas durante a renderização.
         
-        # Calcula a posição do frame
+        Args:
+            sprite_sheet: Surface com a sprite sheet completa
+            frame_width, frame_height: Tamanho de cada frame
+            total_frames: Quantidade de frames declarada
+            
+        Returns:
+            tuple: Frames (subsurfaces) na ordem da animação
+        """
         sheet_width = sprite_sheet.get_width()
         sheet_height = sprite_sheet.get_height()
+        frame_width = max(1, min(frame_width, sheet_width))
+        frame_height = max(1, min(frame_height, sheet_height))
         
         if sheet_width > sheet_height:
             # Sprite sheet horizontal
-            x = frame_index * frame_width
-            y = 0
+            cabem = sheet_width // frame_width
+            posicoes = [(i * frame_width, 0) for i in range(min(total_frames, cabem))]
         else:
             # Sprite sheet vertical ou único
-            x = 0
-            y = frame_index * frame_height
+            cabem = sheet_height // frame_height
+            posicoes = [(0, i * frame_height) for i in range(min(total_frames, cabem))]
+            
+        if not posicoes:
+            posicoes = [(0, 0)]
+            
+        return tuple(sprite_sheet.subsurface((x, y, frame_width, frame_height)) for x, y in posicoes)
+        
+    def obter_tabela_frames(self, sprite_data):
+        """Retorna a tabela de frames da sprite, fatiando na primeira vez se necessário."""
+        tabela = sprite_data.get('tabela_frames')
+        if tabela is None:
+            sprite_sheet = sprite_data.get('sheet') or sprite_data.get('sprite_sheet')
+            if not sprite_sheet:
+                return None
+            total_frames = sprite_data.get('total_frames', sprite_data.get('frames', 1))
+            tabela = self.fatiar_frames(sprite_sheet, sprite_data['frame_width'],
+                                        sprite_data['frame_height'], total_frames)
+            sprite_data['tabela_frames'] = tabela
+        return tabela
+        
+    def aplicar_mipmaps(self, sprite_data):
+        """
+        Gera a cadeia de mipmaps de cada frame e descarta a resolução original.
+        
+        Se o frame original for maior que MIPMAP_LADO_MAX, a sheet é remontada
+        com o maior nível mantido e 'sheet', 'frame_width', 'frame_height' e
+        'tabela_frames' passam a apontar para ela, liberando a sheet original.
+        """
+        tabela = self.obter_tabela_frames(sprite_data)
+        if not tabela:
+            return
+            
+        cadeias = [gerar_cadeia_mip(frame) for frame in tabela]
+        topo = [cadeia[0] for cadeia in cadeias]
+        
+        if topo[0].get_size() != tabela[0].get_size():
+            sprite_sheet = sprite_data.get('sheet') or sprite_data.get('sprite_sheet')
+            horizontal = sprite_sheet.get_width() > sprite_sheet.get_height()
+            nova_sheet, posicoes = montar_sheet(topo, horizontal)
+            frame_width, frame_height = topo[0].get_size()
+            tabela = tuple(nova_sheet.subsurface((x, y, frame_width, frame_height)) for x, y in posicoes)
+            cadeias = [(frame,) + cadeia[1:] for frame, cadeia in zip(tabela, cadeias)]
+            
+            sprite_data['sheet' if 'sheet' in sprite_data else 'sprite_sheet'] = nova_sheet
+            sprite_data['frame_width'] = frame_width
+            sprite_data['frame_height'] = frame_height
+            sprite_data['tabela_frames'] = tabela
+            
+        sprite_data['mipmaps'] = tuple(cadeias)
+        
+    def extrair_sprite_mip(self, sprite_data, frame_index, largura, altura):
+        """Retorna o nível de mipmap do frame mais adequado para o tamanho de desenho."""
+        if not sprite_data:
+            return None
             
-        # Cria uma nova superfície para o frame
-        frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-        frame_surface.blit(sprite_sheet, (0, 0), (x, y, frame_width, frame_height))
+        mipmaps = sprite_data.get('mipmaps')
+        if not mipmaps:
+            return self.extrair_sprite(sprite_data, frame_index)
+            
+        return escolher_nivel(mipmaps[frame_index % len(mipmaps)], largura, altura)
         
-        return frame_surface
+    def extrair_sprite(self, sprite_data, frame_index):
+        """Retorna um frame específico da tabela pré-fatiada da sprite sheet."""
+        if not sprite_data:
+            return None
+            
+        tabela = self.obter_tabela_frames(sprite_data)
+        if not tabela:
+            return None
+            
+        # Garante que o frame_index está dentro dos limites
+        return tabela[frame_index % len(tabela)]
         
     def obter_fonte(self, tipo):
         """Retorna uma fonte específica."""
         return self.fontes.get(tipo, self.fontes.get('texto'))
         
+    def renderizar_texto(self, fonte, texto, cor, antialias=True, alpha=None):
+        """
+        Renderiza um texto usando o cache compartilhado de textos.
+        
+        Args:
+            fonte: Tipo da fonte ('pequena', 'texto'...) ou um pygame.font.Font
+            texto: Texto a renderizar
+            cor: Cor do texto
+            antialias: Suavização das bordas
+            alpha: Transparência (0-255) ou None para opaco
+            
+        Returns:
+            pygame.Surface: Texto renderizado (compartilhado, não desenhe nele)
+        """
+        if isinstance(fonte, str):
+            fonte = self.obter_fonte(fonte)
+        return self.cache_textos.renderizar(fonte, texto, cor, antialias, alpha)
+        
+    def obter_atlas_glifos(self, fonte, escala=1):
+        """
+        Retorna o atlas de glifos de uma fonte, rasterizado na primeira chamada.
+        
+        Usado para textos que mudam a todo frame (dano, vida, dinheiro), que
+        não se beneficiam do cache de textos.
+        
+        Args:
+            fonte: Tipo da fonte ('pequena', 'texto'...), um pygame.font.Font,
+                ou 'pokemon' para a fonte bitmap PKMNRSEU.FON
+            escala: Ampliação inteira da fonte bitmap (só para 'pokemon')
+            
+        Returns:
+            GlyphAtlas: Atlas pronto para desenhar
+        """
+        if fonte == 'pokemon':
+            chave = ('pokemon', escala)
+            if chave not in self.atlas_glifos:
+                try:
+                    self.atlas_glifos[chave] = GlyphAtlas.de_fon(FONTE_BITMAP_POKEMON, escala)
+                except Exception as e:
+                    print(f"⚠️ Erro ao ler fonte bitmap {FONTE_BITMAP_POKEMON}: {e}")
+                    self.atlas_glifos[chave] = GlyphAtlas.de_fonte(self.obter_fonte('texto'))
+            return self.atlas_glifos[chave]
+            
+        if isinstance(fonte, str):
+            fonte = self.obter_fonte(fonte)
+        atlas = self.atlas_glifos.get(fonte)
+        if atlas is None:
+            atlas = GlyphAtlas.de_fonte(fonte)
+            self.atlas_glifos[fonte] = atlas
+        return atlas
+        
+    def registrar_tamanho(self, nome, tamanho):
+        """
+        Registra o tamanho em que uma imagem será desenhada.
+        
+        Se a imagem já estiver carregada, a cópia escalada é gerada imediatamente.
+        
+        Args:
+            nome: Chave da imagem em self.imagens
+            tamanho: (largura, altura) de desenho
+        """
+        tamanho = tuple(tamanho)
+        self.tamanhos_escalados[nome] = tamanho
+        original = self.imagens.get(nome)
+        if original is not None:
+            self.imagens_escaladas[(nome, tamanho)] = escalar_suave(original, tamanho)
+            
+    def guardar_imagem(self, nome, superficie):
+        """
+        Guarda uma imagem carregada, gerando a cópia no tamanho registrado.
+        
+        Com LIBERAR_IMAGENS_ORIGINAIS, o original é descartado e apenas a
+        cópia escalada fica em memória.
+        
+        Args:
+            nome: Chave da imagem
+            superficie: Superfície original já convertida
+        """
+        tamanho = self.tamanhos_escalados.get(nome)
+        if tamanho is None:
+            self.imagens[nome] = superficie
+            return
+        self.imagens_escaladas[(nome, tamanho)] = escalar_suave(superficie, tamanho)
+        if LIBERAR_IMAGENS_ORIGINAIS:
+            self.imagens.pop(nome, None)
+        else:
+            self.imagens[nome] = superficie
+            
+    def obter_imagem_escalada(self, nome, tamanho=None):
+        """
+        Retorna a cópia pré-escalada de uma imagem.
+        
+        Args:
+            nome: Chave da imagem
+            tamanho: (largura, altura) desejado, ou None para o tamanho registrado
+            
+        Returns:
+            pygame.Surface: Imagem no tamanho pedido, ou None se não carregada
+        """
+        tamanho = tuple(tamanho) if tamanho else self.tamanhos_escalados.get(nome)
+        if tamanho is None:
+            return self.imagens.get(nome, None)
+        escalada = self.imagens_escaladas.get((nome, tamanho))
+        if escalada is None and nome in self.imagens:
+            # Tamanho ainda não registrado: escala uma única vez e guarda
+            escalada = escalar_suave(self.imagens[nome], tamanho)
+            self.imagens_escaladas[(nome, tamanho)] = escalada
+        return escalada
+        
     def obter_imagem(self, nome):
-        """Retorna uma imagem específica."""
-        return self.imagens.get(nome, None)
+        """Retorna uma imagem específica (a cópia escalada, se o original foi liberado)."""
+        imagem = self.imagens.get(nome, None)
+        if imagem is None and nome in self.tamanhos_escalados:
+            return self.obter_imagem_escalada(nome)
+        return imagem
         
     def obter_moldura(self, tipo):
         """Retorna uma moldura específica."""
         return self.molduras.get(tipo, None)
         
+    def obter_moldura_pronta(self, tipo, tamanho, estado='normal', rotulo=None, fonte='texto',
+                             cor_rotulo=BRANCO, filtro=None):
+        """
+        Retorna a moldura montada (nine-slice) no tamanho e estado pedidos, com o rótulo.
+        
+        Args:
+            tipo: Tipo da moldura ('itens', 'loja', 'dinheiro')
+            tamanho: (largura, altura) final
+            estado: 'normal', 'hover' ou 'desabilitado'
+            rotulo: Texto centralizado, ou None
+            fonte: Tipo da fonte do rótulo ou um pygame.font.Font
+            cor_rotulo: Cor do rótulo
+            filtro: (cor, alpha) que substitui o filtro padrão do estado
+            
+        Returns:
+            pygame.Surface: Moldura pronta (compartilhada), ou None se a moldura não existe
+        """
+        moldura = self.molduras.get(tipo)
+        if moldura is None:
+            return None
+        if isinstance(fonte, str):
+            fonte = self.obter_fonte(fonte)
+        return self.molduras_prontas.obter(moldura, tamanho, estado, MOLDURAS_BORDAS.get(tipo, 0),
+                                           rotulo, fonte, cor_rotulo, filtro)
+        
     # Métodos de compatibilidade para sprites
     def obter_frame_jogador(self, frame_index):
         """Retorna frame específico do jogador."""
@@ -406,6 +1028,10 @@ class ResourceManager:
         if 'ghost' in self.sprites:
             return self.extrair_sprite(self.sprites['ghost'], 0)
         
+        # Ainda carregando em segundo plano: o jogo atualiza os inimigos ao terminar
+        if self.carregando():
+            return None
+            
         # Terceira tentativa: recarregar Ghost se necessário
         print("⚠️ Ghost sprite não encontrada, recarregando...")
         if self.carregar_ghost_sprite_garantido():
@@ -439,33 +1065,16 @@ class ResourceManager:
         
         try:
             if os.path.exists(ghost_path):
-                # Carrega a sprite sheet
-                sprite_sheet = pygame.image.load(ghost_path).convert_alpha()
+                # Sprite sheet fatiada com a quantidade de frames da configuração (e mipmaps)
+                sprite_data = self._obter_sprite_sheet(ghost_path, GHOST_SPRITE_CONFIG['frames'])
                 print(f"✅ Ghost sprite carregada: {ghost_path}")
                 
-                # Usa configuração pré-definida para garantir funcionamento
+                # Usa configuração pré-definida, atualizada com os valores detectados
                 ghost_config = GHOST_SPRITE_CONFIG.copy()
-                ghost_config['sheet'] = sprite_sheet
-                
-                # Detecta automaticamente se a configuração está correta
-                sheet_width = sprite_sheet.get_width()
-                sheet_height = sprite_sheet.get_height()
-                
-                # Calcula frame automaticamente baseado na largura total
-                if sheet_width > sheet_height:
-                    frame_width = sheet_width // ghost_config['frames']
-                    frame_height = sheet_height
-                    print(f"👻 Ghost detectado: {ghost_config['frames']} frames de {frame_width}x{frame_height}")
-                else:
-                    # Fallback para sprite única
-                    frame_width = sheet_width
-                    frame_height = sheet_height
-                    ghost_config['frames'] = 1
-                    print(f"👻 Ghost detectado: sprite única {frame_width}x{frame_height}")
-                
-                # Atualiza configuração com valores detectados
-                ghost_config['frame_width'] = frame_width
-                ghost_config['frame_height'] = frame_height
+                ghost_config.update(sprite_data)
+                ghost_config['frames'] = sprite_data['total_frames']
+                print(f"👻 Ghost detectado: {ghost_config['frames']} frame(s) de "
+                      f"{sprite_data['frame_width']}x{sprite_data['frame_height']}")
                 
                 # Garante que sempre haverá uma sprite do Ghost disponível
                 self.sprites['ghost'] = ghost_config
@@ -498,7 +1107,8 @@ class ResourceManager:
             'frame_width': SPRITE_FALLBACK_CONFIG['largura'],
             'frame_height': SPRITE_FALLBACK_CONFIG['altura'],
             'total_frames': 1,
-            'frames': 1
+            'frames': 1,
+            'tabela_frames': (fallback_surface,)
         }
         
         self.sprites['ghost'] = fallback_config
@@ -0,0 +1,250 @@
+"""
+Simulador Monte Carlo de batalhas do JokenGhost para balanceamento.
+Roda N batalhas ao mesmo tempo como arrays NumPy (uma linha por batalha,
+uma coluna por inimigo), com as mesmas regras do CombatEngine: duelo com o
+inimigo da frente, dano em área, contra-ataques, recompensa por efetividade
+e bônus de vitória total. Cada turno é um punhado de operações vetorizadas
+sobre as batalhas ainda em andamento, então um milhão de batalhas leva
+segundos, sem pygame.
+
+Requer NumPy (pip install numpy ou pip install .[simulacao]).
+"""
+
+import time
+
+try:
+    import numpy as np
+except ImportError as e:  # Só as ferramentas de balanceamento precisam de NumPy
+    raise ImportError("O simulador de batalhas precisa do NumPy: pip install numpy") from e
+
+from config.constants import VIDA_INICIAL_JOGADOR, ITENS_LOJA, CURA_ITENS
+from config.enums import Escolha
+from core.combat_engine import REGRAS_PADRAO, ESCOLHAS
+
+SIMULACAO_PADRAO = {
+    'vida_jogador': VIDA_INICIAL_JOGADOR,
+    'vidas_inimigos': (80, 100, 120),           # Fantasma fraco, normal e forte
+    'distribuicao_inimigos': (0.25, 0.5, 0.25),  # Chance de 1, 2 ou 3 inimigos
+    'max_turnos': 200,                           # Batalhas mais longas contam como inacabadas
+    'loja': ITENS_LOJA,                          # Itens à venda ({'preco', 'efeito'})
+    'limiar_compra': None                        # Vida abaixo da qual compra a maior cura possível (None = não compra)
+}
+
+class BattleSimulator:
+    """Executa lotes de batalhas vetorizadas e resume os resultados."""
+
+    def __init__(self, regras=None, seed=None):
+        """
+        Inicializa o simulador.
+
+        Args:
+            regras: Dict que substitui valores de REGRAS_PADRAO e SIMULACAO_PADRAO
+            seed: Semente do gerador (None = aleatória)
+        """
+        self.regras = dict(REGRAS_PADRAO)
+        self.regras.update(SIMULACAO_PADRAO)
+        if regras:
+            self.regras.update(regras)
+        self.rng = np.random.default_rng(seed)
+
+        # Curas da loja, da maior para a menor: [(preco, cura)]
+        self.curas = sorted(((item['preco'], CURA_ITENS[item['efeito']]) for item in self.regras['loja']
+                             if item['efeito'] in CURA_ITENS), key=lambda item: -item[1])
+
+        # Tabela de efetividade indexada pela escolha (0 = pedra, 1 = papel, 2 = tesoura)
+        efetividade = self.regras['efetividade']
+        self.efetividade = np.array([efetividade[e]['efetividade'] for e in ESCOLHAS], dtype=np.float64)
+        self.bonus_base = np.array([efetividade[e]['bonus_base'] for e in ESCOLHAS], dtype=np.float64)
+
+    def simular(self, batalhas, escolha=None):
+        """
+        Simula batalhas completas (até o jogador ou todos os inimigos caírem).
+
+        Args:
+            batalhas: Quantidade de batalhas (pelo menos 1)
+            escolha: Escolha fixa do jogador, ou None para sortear a cada turno
+
+        Returns:
+            dict: Arrays por batalha: 'vitoria', 'derrota', 'turnos', 'ouro' (ganho),
+                'ouro_gasto', 'itens', 'vida_jogador', 'vida_inimigos' (soma restante) e 'inimigos'
+
+        Raises:
+            ValueError: Se batalhas for menor que 1
+        """
+        regras = self.regras
+        rng = self.rng
+        n = int(batalhas)
+        if n < 1:
+            raise ValueError(f"batalhas deve ser pelo menos 1 (recebido: {batalhas})")
+        max_inimigos = len(regras['distribuicao_inimigos'])
+
+        # === Geração dos inimigos (como EnemyManager.gerar_inimigos_aleatorios) ===
+        quantidade = rng.choice(np.arange(1, max_inimigos + 1), size=n, p=regras['distribuicao_inimigos'])
+        vidas = rng.choice(np.asarray(regras['vidas_inimigos'], dtype=np.int64), size=(n, max_inimigos))
+        colunas = np.arange(max_inimigos)
+        vidas[colunas[None, :] >= quantidade[:, None]] = 0
+
+        vida_jogador = np.full(n, regras['vida_jogador'], dtype=np.int64)
+        ouro = np.zeros(n, dtype=np.int64)
+        turnos = np.zeros(n, dtype=np.int64)
+        ouro_gasto = np.zeros(n, dtype=np.int64)
+        itens = np.zeros(n, dtype=np.int64)
+        limiar_compra = regras['limiar_compra']
+
+        dano_jogador = regras['dano_jogador']
+        chance_area = min(regras['area_base'] + (dano_jogador / 100) * regras['area_bonus'], regras['area_max'])
+        secundario_min, secundario_max = regras['dano_secundario']
+        variacao_min, variacao_max = regras['variacao_recompensa']
+        contra_min, contra_max = regras['dano_contra_ataque']
+        bonus_dano = max(0, (dano_jogador - 20) * 0.5)
+        bonus_vitoria = quantidade * regras['recompensa_vitoria_base']
+
+        em_andamento = np.arange(n)
+        for _ in range(regras['max_turnos']):
+            if em_andamento.size == 0:
+                break
+            m = em_andamento.size
+            linhas = np.arange(m)
+
+            # === Loja: com pouca vida, compra a maior cura que o saldo paga (uma por turno) ===
+            if limiar_compra is not None and self.curas:
+                vida = vida_jogador[em_andamento]
+                saldo = ouro[em_andamento] - ouro_gasto[em_andamento]
+                precisa = vida < limiar_compra
+                cura = np.zeros(m, dtype=np.int64)
+                gasto = np.zeros(m, dtype=np.int64)
+                for preco, valor in self.curas:
+                    compra = precisa & (saldo >= preco)
+                    cura[compra] = valor
+                    gasto[compra] = preco
+                    precisa &= ~compra
+                vida_jogador[em_andamento] = np.minimum(regras['vida_jogador'], vida + cura)
+                ouro_gasto[em_andamento] += gasto
+                itens[em_andamento] += gasto > 0
+
+            hp = vidas[em_andamento]
+            vivos = hp > 0
+            alvo = np.argmax(vivos, axis=1)  # Inimigo da frente: primeiro vivo
+
+            # Escolhas como 0/1/2 na ordem de ESCOLHAS; (j - i) % 3: 0 empate, 1 vitória, 2 derrota
+            if escolha is None:
+                jogador = rng.integers(0, 3, size=m)
+            else:
+                jogador = np.full(m, ESCOLHAS.index(Escolha(escolha)), dtype=np.int64)
+            duelo = (jogador - rng.integers(0, 3, size=m)) % 3
+            venceu = duelo == 1
+            perdeu = duelo == 2
+
+            # === Vitória: dano no alvo, dano em área e recompensa ===
+            dano = np.where(venceu, dano_jogador, 0)
+            hp[linhas, alvo] -= dano
+            outros = vivos.copy()
+            outros[linhas, alvo] = False
+            secundario = np.maximum(1, (dano_jogador * rng.uniform(secundario_min, secundario_max, size=m)).astype(np.int64))
+            atingidos = outros & venceu[:, None] & (rng.random((m, max_inimigos)) < chance_area)
+            hp -= atingidos * secundario[:, None]
+            np.maximum(hp, 0, out=hp)
+
+            variacao = rng.uniform(variacao_min, variacao_max, size=m)
+            recompensa = ((self.bonus_base[jogador] + bonus_dano) * self.efetividade[jogador] * variacao).astype(np.int64)
+            recompensa += (atingidos.sum(axis=1) * regras['bonus_area_por_inimigo'] * self.efetividade[jogador]).astype(np.int64)
+            limpou = venceu & ~(hp > 0).any(axis=1)
+            ganho = np.where(venceu, recompensa, 0) + np.where(limpou, bonus_vitoria[em_andamento], 0)
+
+            # === Derrota/empate: dano do alvo e contra-ataques dos outros vivos ===
+            contra = (jogador[:, None] - rng.integers(0, 3, size=(m, max_inimigos))) % 3 == 2
+            acertos = outros & ~venceu[:, None] & contra
+            dano_sofrido = np.where(perdeu, regras['dano_inimigo'], 0)
+            dano_sofrido += (acertos * rng.integers(contra_min, contra_max + 1, size=(m, max_inimigos))).sum(axis=1)
+
+            vidas[em_andamento] = hp
+            vida_jogador[em_andamento] = np.maximum(0, vida_jogador[em_andamento] - dano_sofrido)
+            ouro[em_andamento] += ganho
+            turnos[em_andamento] += 1
+
+            continua = (vida_jogador[em_andamento] > 0) & (hp > 0).any(axis=1)
+            em_andamento = em_andamento[continua]
+
+        restante = vidas.sum(axis=1)
+        return {
+            'vitoria': restante == 0,
+            'derrota': vida_jogador == 0,
+            'turnos': turnos,
+            'ouro': ouro,
+            'ouro_gasto': ouro_gasto,
+            'itens': itens,
+            'vida_jogador': vida_jogador,
+            'vida_inimigos': restante,
+            'inimigos': quantidade
+        }
+
+    def relatorio(self, batalhas, escolha=None, percentis=(5, 50, 95)):
+        """
+        Simula e resume as batalhas.
+
+        Args:
+            batalhas: Quantidade de batalhas (pelo menos 1)
+            escolha: Escolha fixa do jogador, ou None para sortear
+            percentis: Percentis calculados para turnos e vidas
+
+        Returns:
+            dict: Taxas, médias, percentis e o tempo gasto
+
+        Raises:
+            ValueError: Se batalhas for menor que 1
+        """
+        inicio = time.perf_counter()
+        r = self.simular(batalhas, escolha)
+        tempo = time.perf_counter() - inicio
+        vitorias = r['vitoria']
+        turnos_vitoria = r['turnos'][vitorias]
+
+        def _percentis(valores):
+            if valores.size == 0:
+                return [0.0 for _ in percentis]
+            return [float(v) for v in np.percentile(valores, percentis)]
+
+        return {
+            'batalhas': int(batalhas),
+            'tempo_s': tempo,
+            'taxa_vitoria': float(vitorias.mean()),
+            'taxa_derrota': float(r['derrota'].mean()),
+            'taxa_inacabada': float((~vitorias & ~r['derrota']).mean()),
+            'turnos_media': float(r['turnos'].mean()),
+            'turnos_vitoria': _percentis(turnos_vitoria),
+            'ouro_media': float(r['ouro'].mean()),
+            'ouro_por_turno': float(r['ouro'].sum() / max(1, r['turnos'].sum())),
+            'ouro_gasto_media': float(r['ouro_gasto'].mean()),
+            'itens_media': float(r['itens'].mean()),
+            'vida_jogador': _percentis(r['vida_jogador']),
+            'vida_jogador_vitoria': _percentis(r['vida_jogador'][vitorias]),
+            'vida_inimigos_derrota': _percentis(r['vida_inimigos'][r['derrota']]),
+            'taxa_vitoria_por_inimigos': {
+                int(k): float(vitorias[r['inimigos'] == k].mean())
+                for k in np.unique(r['inimigos'])
+            },
+            'percentis': list(percentis)
+        }
+
+
+def formatar_relatorio(relatorio):
+    """
+    Monta as linhas de texto de um relatório.
+
+    Returns:
+        list: Linhas prontas para imprimir
+    """
+    p = "/".join(f"p{v}" for v in relatorio['percentis'])
+    fmt = lambda valores: " / ".join(f"{v:.0f}" for v in valores)
+    linhas = [
+        f"⚔️ {relatorio['batalhas']} batalhas em {relatorio['tempo_s']:.2f}s",
+        f"🏆 Vitória: {relatorio['taxa_vitoria']:.1%} | 💀 Derrota: {relatorio['taxa_derrota']:.1%} | ⏳ Inacabadas: {relatorio['taxa_inacabada']:.1%}",
+        f"🔁 Turnos (média): {relatorio['turnos_media']:.2f} | Turnos até vencer ({p}): {fmt(relatorio['turnos_vitoria'])}",
+        f"💰 Ouro por batalha: {relatorio['ouro_media']:.1f} | Ouro por turno: {relatorio['ouro_por_turno']:.2f}",
+        f"🛒 Gasto na loja por batalha: {relatorio['ouro_gasto_media']:.1f} ({relatorio['itens_media']:.2f} itens)",
+        f"❤️ Vida final do jogador ({p}): {fmt(relatorio['vida_jogador'])} | nas vitórias: {fmt(relatorio['vida_jogador_vitoria'])}",
+        f"👻 Vida restante dos inimigos nas derrotas ({p}): {fmt(relatorio['vida_inimigos_derrota'])}",
+    ]
+    for quantidade, taxa in relatorio['taxa_vitoria_por_inimigos'].items():
+        linhas.append(f"   {quantidade} inimigo(s): {taxa:.1%} de vitória")
+    return linhas
@@ -0,0 +1,166 @@
+"""
+Cache persistente em disco de superfícies já decodificadas.
+Guarda os pixels finais (após convert e escala) para que as próximas
+inicializações não precisem decodificar os PNGs grandes novamente.
+"""
+
+import pygame
+import os
+import struct
+import hashlib
+from config.constants import *
+
+# Cabeçalho: assinatura, versão, largura, altura, formato de pixel (4 bytes)
+_ASSINATURA = b'JGSC'
+_VERSAO = 1
+_CABECALHO = struct.Struct('<4sHII4s')
+
+_tobytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+
+
+class SurfaceDiskCache:
+    """Cache em disco de superfícies decodificadas, convertidas e escaladas."""
+
+    def __init__(self, pasta=CACHE_SUPERFICIES_PASTA, ativo=CACHE_SUPERFICIES_ATIVO):
+        """
+        Inicializa o cache.
+
+        Args:
+            pasta: Diretório onde os buffers de pixels são gravados
+            ativo: Se False, sempre decodifica o arquivo original
+        """
+        self.pasta = pasta
+        self.ativo = ativo
+        self.acertos = 0
+        self.falhas = 0
+
+    def _chaves(self, caminho, tamanho, formato):
+        """Retorna (prefixo, nome_arquivo) da entrada para a imagem e o tamanho alvo."""
+        info = os.stat(caminho)
+        origem = f"{os.path.abspath(caminho)}|{tamanho}|{formato}"
+        versao = f"{origem}|{info.st_mtime_ns}|{info.st_size}"
+        prefixo = hashlib.sha1(origem.encode("utf-8")).hexdigest()[:16]
+        sufixo = hashlib.sha1(versao.encode("utf-8")).hexdigest()[:16]
+        return prefixo, f"{prefixo}_{sufixo}.surf"
+
+    def carregar(self, caminho, tamanho=None, alpha=True):
+        """
+        Carrega uma imagem usando o cache quando possível.
+
+        Args:
+            caminho: Caminho do arquivo de imagem original
+            tamanho: (largura, altura) final, ou None para manter o original
+            alpha: True usa convert_alpha(), False usa convert()
+
+        Returns:
+            pygame.Surface: Superfície pronta para uso
+        """
+        return self.finalizar(self.decodificar(caminho, tamanho, alpha))
+
+    def decodificar(self, caminho, tamanho=None, alpha=True):
+        """
+        Etapa que pode rodar fora da thread principal: lê o cache ou decodifica o PNG.
+
+        Não usa convert(), então não depende da tela. O resultado deve ser passado
+        para finalizar() na thread principal.
+
+        Returns:
+            dict: Dados pendentes da imagem (superfície ainda sem conversão)
+        """
+        pendente = {'caminho': caminho, 'tamanho': tamanho, 'alpha': alpha,
+                    'formato': "RGBA" if alpha else "RGB", 'arquivo_cache': None,
+                    'prefixo': None, 'do_cache': False}
+        if self.ativo:
+            try:
+                prefixo, nome = self._chaves(caminho, tamanho, pendente['formato'])
+                pendente['prefixo'] = prefixo
+                pendente['arquivo_cache'] = os.path.join(self.pasta, nome)
+                if os.path.exists(pendente['arquivo_cache']):
+                    lido = self._ler(pendente['arquivo_cache'], pendente['formato'])
+                    if lido is not None:
+                        # A superfície aponta para o buffer lido: ele fica vivo até finalizar()
+                        pendente['superficie'], pendente['buffer'] = lido
+                        pendente['do_cache'] = True
+                        return pendente
+            except Exception as e:
+                print(f"⚠️ Cache de imagens indisponível para {caminho}: {e}")
+                pendente['arquivo_cache'] = None
+
+        pendente['superficie'] = pygame.image.load(caminho)
+        return pendente
+
+    def finalizar(self, pendente):
+        """
+        Etapa da thread principal: converte para o formato da tela, escala e grava o cache.
+
+        Args:
+            pendente: Resultado de decodificar()
+
+        Returns:
+            pygame.Surface: Superfície pronta para uso
+        """
+        superficie = pendente['superficie']
+        superficie = superficie.convert_alpha() if pendente['alpha'] else superficie.convert()
+        pendente.pop('buffer', None)  # A conversão já copiou os pixels
+        if pendente['do_cache']:
+            self.acertos += 1
+            return superficie
+
+        tamanho = pendente['tamanho']
+        if tamanho and superficie.get_size() != tuple(tamanho):
+            superficie = pygame.transform.scale(superficie, tamanho)
+
+        if pendente['arquivo_cache']:
+            self.falhas += 1
+            try:
+                self._gravar(pendente['arquivo_cache'], pendente['prefixo'], superficie, pendente['formato'])
+            except Exception as e:
+                print(f"⚠️ Não foi possível gravar cache de {pendente['caminho']}: {e}")
+        return superficie
+
+    def _ler(self, arquivo_cache, formato):
+        """
+        Lê uma entrada do cache (sem decodificar PNG) com uma única cópia: do arquivo para o buffer.
+
+        Returns:
+            tuple ou None: (superfície que usa os pixels do buffer, buffer), ou None se a entrada
+                for inválida. O buffer precisa continuar vivo até a superfície ser convertida.
+        """
+        with open(arquivo_cache, "rb") as arquivo:
+            dados = bytearray(os.fstat(arquivo.fileno()).st_size)
+            if arquivo.readinto(dados) != len(dados) or len(dados) < _CABECALHO.size:
+                return None
+
+        assinatura, versao, largura, altura, fmt = _CABECALHO.unpack_from(dados, 0)
+        if (assinatura != _ASSINATURA or versao != _VERSAO
+                or fmt.rstrip(b' ').decode("ascii") != formato):
+            return None
+        tamanho_dados = largura * altura * len(formato)
+        if len(dados) - _CABECALHO.size != tamanho_dados:
+            return None
+
+        # frombuffer não copia: a superfície lê direto do bytearray até o convert()
+        pixels = memoryview(dados)[_CABECALHO.size:]
+        return pygame.image.frombuffer(pixels, (largura, altura), formato), dados
+
+    def _gravar(self, arquivo_cache, prefixo, superficie, formato):
+        """Grava os pixels da superfície e remove versões antigas da mesma imagem."""
+        os.makedirs(self.pasta, exist_ok=True)
+        for antigo in os.listdir(self.pasta):
+            if antigo.startswith(prefixo + "_"):
+                os.remove(os.path.join(self.pasta, antigo))
+
+        largura, altura = superficie.get_size()
+        cabecalho = _CABECALHO.pack(_ASSINATURA, _VERSAO, largura, altura, formato.ljust(4).encode("ascii"))
+        temporario = arquivo_cache + ".tmp"
+        with open(temporario, "wb") as arquivo:
+            arquivo.write(cabecalho)
+            arquivo.write(_tobytes(superficie, formato))
+        os.replace(temporario, arquivo_cache)
+
+    def limpar(self):
+        """Remove todas as entradas do cache em disco."""
+        if os.path.isdir(self.pasta):
+            for nome in os.listdir(self.pasta):
+                if nome.endswith(".surf"):
+                    os.remove(os.path.join(self.pasta, nome))
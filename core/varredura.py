@@ -0,0 +1,269 @@
+"""
+Varredura de parâmetros de balanceamento do JokenGhost.
+Monta a grade (produto cartesiano) dos valores pedidos, divide os pontos em
+lotes e roda cada lote em um processo do ProcessPoolExecutor com o
+BattleSimulator. Cada ponto usa a semente (seed, índice do ponto), então o
+resultado não depende de quantos processos rodaram nem da ordem. Cada ponto
+concluído vira uma linha JSON no arquivo de saída, gravada assim que o lote
+termina; rodar de novo com o mesmo arquivo continua de onde parou.
+"""
+
+import os
+import json
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config.constants import CURA_ITENS
+from config.enums import Escolha
+from core.combat_engine import REGRAS_PADRAO
+from core.simulacao import BattleSimulator, SIMULACAO_PADRAO
+
+NOMES_ESCOLHAS = {'pedra': Escolha.PEDRA, 'papel': Escolha.PAPEL, 'tesoura': Escolha.TESOURA}
+
+# Itens cujo preço muda a simulação: só as curas são compradas pelo BattleSimulator
+EFEITOS_SIMULADOS = tuple(item['efeito'] for item in SIMULACAO_PADRAO['loja'] if item['efeito'] in CURA_ITENS)
+
+# Parâmetros aceitos -> (conversão de cada valor, descrição)
+PARAMETROS = {
+    'dano_jogador': (int, "dano do jogador ao vencer o duelo"),
+    'dano_inimigo': (int, "dano do inimigo ao vencer o duelo"),
+    'area_base': (float, "chance base de dano em área"),
+    'area_bonus': (float, "chance extra de área proporcional ao dano"),
+    'area_max': (float, "chance máxima de dano em área"),
+    'bonus_<arma>': (float, "bonus_base da efetividade (pedra, papel, tesoura)"),
+    'efetividade_<arma>': (float, "multiplicador de efetividade (pedra, papel, tesoura)"),
+    'preco_<efeito>': (int, "preço do item de cura da loja (cura_pequena, cura_grande); exige limiar_compra"),
+    'vidas_inimigos': (lambda texto: tuple(int(v) for v in texto.split('/')), "faixas de vida, ex.: 80/100/120"),
+    'limiar_compra': (int, "vida abaixo da qual o jogador compra cura"),
+    'recompensa_vitoria_base': (int, "bônus por inimigo ao limpar a batalha"),
+}
+
+
+def _conversor(nome):
+    """Retorna a função que converte um valor do parâmetro (ValueError se o nome for desconhecido)."""
+    if nome in PARAMETROS:
+        return PARAMETROS[nome][0]
+    prefixo, _, sufixo = nome.partition('_')
+    if prefixo == 'preco' and sufixo:
+        if sufixo not in EFEITOS_SIMULADOS:
+            raise ValueError(f"{nome}: só os preços de cura são simulados ({', '.join(EFEITOS_SIMULADOS)})")
+        return PARAMETROS['preco_<efeito>'][0]
+    if prefixo in ('bonus', 'efetividade') and sufixo in NOMES_ESCOLHAS:
+        return PARAMETROS[f'{prefixo}_<arma>'][0]
+    raise ValueError(f"Parâmetro desconhecido: {nome}")
+
+
+def ler_parametro(texto):
+    """
+    Lê uma especificação "nome=v1,v2,v3".
+
+    Returns:
+        tuple: (nome, [valores convertidos])
+    """
+    nome, separador, valores = texto.partition('=')
+    nome = nome.strip()
+    if not separador or not valores:
+        raise ValueError(f"Use nome=v1,v2,...: {texto}")
+    converter = _conversor(nome)
+    return nome, [converter(valor.strip()) for valor in valores.split(',')]
+
+
+def montar_grade(parametros):
+    """
+    Lista os pontos da grade, na ordem do produto cartesiano.
+
+    Args:
+        parametros: Lista de (nome, valores)
+
+    Returns:
+        list: Dicts {nome: valor}; o índice na lista identifica o ponto
+    """
+    nomes = [nome for nome, _ in parametros]
+    return [dict(zip(nomes, combinacao)) for combinacao in itertools.product(*(valores for _, valores in parametros))]
+
+
+def regras_do_ponto(ponto):
+    """
+    Converte um ponto da grade nas regras do BattleSimulator.
+
+    Args:
+        ponto: {nome_parametro: valor}
+
+    Returns:
+        dict: Substituições para REGRAS_PADRAO/SIMULACAO_PADRAO
+
+    Raises:
+        ValueError: Se um preco_<efeito> não for de um item de cura da loja
+    """
+    regras = {}
+    efetividade = None
+    loja = None
+    for nome, valor in ponto.items():
+        prefixo, _, sufixo = nome.partition('_')
+        if prefixo in ('bonus', 'efetividade') and sufixo in NOMES_ESCOLHAS:
+            if efetividade is None:
+                efetividade = {escolha: dict(dados) for escolha, dados in REGRAS_PADRAO['efetividade'].items()}
+            chave = 'bonus_base' if prefixo == 'bonus' else 'efetividade'
+            efetividade[NOMES_ESCOLHAS[sufixo]][chave] = valor
+        elif prefixo == 'preco' and nome not in PARAMETROS:
+            if sufixo not in EFEITOS_SIMULADOS:
+                raise ValueError(f"{nome}: só os preços de cura são simulados ({', '.join(EFEITOS_SIMULADOS)})")
+            if loja is None:
+                loja = [dict(item) for item in SIMULACAO_PADRAO['loja']]
+            for item in loja:
+                if item['efeito'] == sufixo:
+                    item['preco'] = valor
+        else:
+            regras[nome] = valor
+    if efetividade is not None:
+        regras['efetividade'] = efetividade
+    if loja is not None:
+        regras['loja'] = loja
+    return regras
+
+
+def simular_pontos(pontos, batalhas, seed, escolha=None):
+    """
+    Simula um lote de pontos da grade (executado nos processos trabalhadores).
+
+    Args:
+        pontos: Lista de (indice, {nome: valor})
+        batalhas: Batalhas por ponto
+        seed: Semente da varredura
+        escolha: Nome da escolha fixa do jogador, ou None para sortear
+
+    Returns:
+        list: Um dict por ponto: 'indice', 'parametros', 'seed', 'batalhas' e 'relatorio'
+    """
+    resultados = []
+    for indice, ponto in pontos:
+        simulador = BattleSimulator(regras_do_ponto(ponto), seed=[seed, indice])
+        relatorio = simulador.relatorio(batalhas, NOMES_ESCOLHAS.get(escolha))
+        resultados.append({
+            'indice': indice,
+            'parametros': ponto,
+            'seed': seed,
+            'batalhas': batalhas,
+            'relatorio': relatorio
+        })
+    return resultados
+
+
+def ler_resultados(caminho):
+    """
+    Lê os pontos já gravados em um arquivo de varredura (linhas incompletas são ignoradas).
+
+    Returns:
+        dict: {indice: resultado}
+    """
+    resultados = {}
+    if not os.path.exists(caminho):
+        return resultados
+    with open(caminho, "r", encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            try:
+                resultado = json.loads(linha)
+            except ValueError:
+                continue  # Linha cortada por uma interrupção
+            resultados[resultado['indice']] = resultado
+    return resultados
+
+
+class ParameterSweep:
+    """Varredura de uma grade de parâmetros em vários processos, com retomada."""
+
+    def __init__(self, parametros, batalhas=20000, seed=0, escolha=None, processos=None, lote=4):
+        """
+        Inicializa a varredura.
+
+        Args:
+            parametros: Lista de (nome, valores)
+            batalhas: Batalhas simuladas por ponto
+            seed: Semente da varredura (cada ponto usa (seed, índice))
+            escolha: Nome da escolha fixa do jogador, ou None para sortear
+            processos: Processos trabalhadores (None = um por núcleo)
+            lote: Pontos enviados de uma vez para cada processo
+
+        Raises:
+            ValueError: Se batalhas for menor que 1, ou se houver preco_<efeito> sem limiar_compra
+                (sem limiar o simulador nunca compra, e todos os preços dariam o mesmo resultado)
+        """
+        if batalhas < 1:
+            raise ValueError(f"batalhas deve ser pelo menos 1 (recebido: {batalhas})")
+        nomes = [nome for nome, _ in parametros]
+        precos = [nome for nome in nomes if nome.startswith('preco_')]
+        if precos and 'limiar_compra' not in nomes:
+            raise ValueError(f"{', '.join(precos)} só muda o resultado com compras: varra também limiar_compra")
+        self.pontos = montar_grade(parametros)
+        self.batalhas = batalhas
+        self.seed = seed
+        self.escolha = escolha
+        self.processos = processos or os.cpu_count() or 1
+        self.lote = max(1, lote)
+
+    def executar(self, caminho, progresso=None):
+        """
+        Roda os pontos que ainda não estão no arquivo e grava cada lote ao terminar.
+
+        Args:
+            caminho: Arquivo JSONL de resultados (criado ou continuado)
+            progresso: Função (feitos, total) chamada após cada lote, ou None
+
+        Returns:
+            dict: {indice: resultado} de todos os pontos da grade
+        """
+        feitos = ler_resultados(caminho)
+        # Compara como JSON (tuplas voltam do arquivo como listas)
+        gravados = json.loads(json.dumps(self.pontos))
+        for indice, resultado in feitos.items():
+            if (indice >= len(self.pontos) or resultado['parametros'] != gravados[indice]
+                    or resultado['seed'] != self.seed or resultado['batalhas'] != self.batalhas):
+                raise ValueError(f"{caminho} é de outra varredura (grade, seed ou batalhas diferentes)")
+
+        pendentes = [(i, ponto) for i, ponto in enumerate(self.pontos) if i not in feitos]
+        lotes = [pendentes[i:i + self.lote] for i in range(0, len(pendentes), self.lote)]
+        if not lotes:
+            return feitos
+
+        # Interrupção no meio de uma linha: começa a próxima em uma linha nova
+        precisa_quebra = os.path.exists(caminho) and os.path.getsize(caminho) > 0
+        if precisa_quebra:
+            with open(caminho, "rb") as arquivo:
+                arquivo.seek(-1, os.SEEK_END)
+                precisa_quebra = arquivo.read(1) != b"\n"
+
+        with open(caminho, "a", encoding="utf-8") as arquivo, \
+                ProcessPoolExecutor(max_workers=self.processos) as executor:
+            if precisa_quebra:
+                arquivo.write("\n")
+            tarefas = [executor.submit(simular_pontos, lote, self.batalhas, self.seed, self.escolha)
+                       for lote in lotes]
+            for tarefa in as_completed(tarefas):
+                for resultado in tarefa.result():
+                    linha = json.dumps(resultado, ensure_ascii=False)
+                    arquivo.write(linha + "\n")
+                    feitos[resultado['indice']] = json.loads(linha)  # Mesmo formato dos já gravados
+                arquivo.flush()
+                if progresso is not None:
+                    progresso(len(feitos), len(self.pontos))
+        return feitos
+
+
+def melhores(resultados, metrica='taxa_vitoria', alvo=None, quantidade=10):
+    """
+    Ordena os pontos por uma métrica do relatório.
+
+    Args:
+        resultados: {indice: resultado}
+        metrica: Chave numérica do relatório (taxa_vitoria, ouro_por_turno...)
+        alvo: Valor desejado (ordena pela distância até ele), ou None para o maior primeiro
+        quantidade: Quantos pontos retornar
+
+    Returns:
+        list: Resultados ordenados
+    """
+    if alvo is None:
+        chave = lambda resultado: -resultado['relatorio'][metrica]
+    else:
+        chave = lambda resultado: abs(resultado['relatorio'][metrica] - alvo)
+    return sorted(resultados.values(), key=chave)[:quantidade]
@@ -22,12 +22,8 @@ class LojaManager:
         """Inicializa o gerenciador da loja."""
         self.resource_manager = resource_manager
         
-        # Itens IDÊNTICOS ao jogo original
-        self.itens_loja = [
-            {"nome": "Poção de Cura",   "preco": 30, "efeito": "cura_pequena"},
-            {"nome": "Buff Ofensivo",   "preco": 50, "efeito": "buff_ofensivo"},
-            {"nome": "Poção Grande",    "preco": 80, "efeito": "cura_grande"},
-        ]
+        # Itens IDÊNTICOS ao jogo original (tabela em config.constants)
+        self.itens_loja = [dict(item) for item in ITENS_LOJA]
         
     def obter_itens_disponiveis(self):
         """Retorna os itens disponíveis convertidos para LojaItem."""
@@ -66,12 +62,12 @@ class LojaManager:
         """Aplica o efeito do item no jogador."""
         if item.efeito == "cura_pequena":
             vida_antes = jogador_stats['vida_atual']
-            jogador_stats['vida_atual'] = min(100, jogador_stats['vida_atual'] + 30)
+            jogador_stats['vida_atual'] = min(100, jogador_stats['vida_atual'] + CURA_ITENS["cura_pequena"])
             vida_curada = jogador_stats['vida_atual'] - vida_antes
             return f"Você recuperou {vida_curada} HP!"
         elif item.efeito == "cura_grande":
             vida_antes = jogador_stats['vida_atual']
-            jogador_stats['vida_atual'] = min(100, jogador_stats['vida_atual'] + 60)
+            jogador_stats['vida_atual'] = min(100, jogador_stats['vida_atual'] + CURA_ITENS["cura_grande"])
             vida_curada = jogador_stats['vida_atual'] - vida_antes
             return f"Você recuperou {vida_curada} HP!"
         elif item.efeito == "buff_ofensivo":
@@ -214,18 +214,11 @@ class MonstruarioManager:
         hover = slot_rect.collidepoint(mouse_pos)
         
         # Moldura do slot
-        moldura_itens = self.resource_manager.obter_moldura('itens')
-        if moldura_itens:
-            moldura_escalada = pygame.transform.scale(moldura_itens, (largura, altura))
-            
-            if hover and fantasma.descoberto:
-                # Efeito de hover apenas para fantasmas descobertos
-                overlay = pygame.Surface((largura, altura))
-                overlay.fill(BRANCO)
-                overlay.set_alpha(30)
-                moldura_escalada.blit(overlay, (0, 0))
-                
-            tela.blit(moldura_escalada, slot_rect)
+        # Efeito de hover apenas para fantasmas descobertos
+        estado = 'hover' if hover and fantasma.descoberto else 'normal'
+        moldura_slot = self.resource_manager.obter_moldura_pronta('itens', (largura, altura), estado)
+        if moldura_slot:
+            tela.blit(moldura_slot, slot_rect)
         else:
             # Fallback
             cor_fundo = ROXO_ESCURO if fantasma.descoberto else PRETO
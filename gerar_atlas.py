@@ -0,0 +1,220 @@
+"""
+Gerador do atlas de texturas do JokenGhost (ferramenta de build).
+==================================================================
+
+Empacota os frames dos personagens (Assests/Sprites/[PERSONAGEM]), os ícones
+de Ballons e as molduras da interface em poucas páginas PNG, e grava um
+manifesto JSON com o retângulo de cada frame e o nome de cada animação.
+
+Em tempo de execução o ResourceManager carrega as páginas uma única vez e
+entrega subsurfaces, sem varrer pastas nem adivinhar o layout dos frames.
+
+Uso:
+    python gerar_atlas.py [--pagina 2048] [--espaco 1]
+
+Rode novamente sempre que adicionar ou alterar sprites.
+"""
+
+import os
+import sys
+import json
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config.constants import ATLAS_PASTA, ATLAS_MANIFESTO
+from core.resource_manager import ResourceManager
+from graphics.mipmap import gerar_cadeia_mip
+
+SPRITES_PATH = os.path.join("Assests", "Sprites")
+
+# Pastas que não são personagens (ilustrações grandes carregadas por carregar_imagens)
+PASTAS_IGNORADAS = ["scenes", "itens", "molders"]
+
+# Molduras da interface (chave usada em ResourceManager.molduras -> arquivo em molders/)
+MOLDURAS = {
+    'itens': "hud_botao.png",
+    'loja': "Loja-Sheet.png",
+    'dinheiro': "coin_molder.png",
+}
+
+EXTENSOES = [".png", ".jpg", ".jpeg", ".bmp"]
+
+
+def coletar_personagens():
+    """
+    Lê as sprite sheets dos personagens e fatia os frames.
+
+    Returns:
+        dict: {personagem: {chave_arquivo: {'arquivo', 'animacao', 'frames': [Surface]}}}
+    """
+    personagens = {}
+    for pasta in sorted(os.listdir(SPRITES_PATH)):
+        pasta_path = os.path.join(SPRITES_PATH, pasta)
+        if not os.path.isdir(pasta_path) or pasta.lower() in PASTAS_IGNORADAS:
+            continue
+
+        arquivos = {}
+        for arquivo in sorted(os.listdir(pasta_path)):
+            nome, extensao = os.path.splitext(arquivo)
+            if extensao.lower() not in EXTENSOES:
+                continue
+
+            sheet = pygame.image.load(os.path.join(pasta_path, arquivo))
+            frame_width, frame_height, total_frames, descricao = ResourceManager.detectar_layout_frames(
+                sheet.get_width(), sheet.get_height())
+            print(f"  {pasta}/{arquivo}: {descricao} - {total_frames} frames de {frame_width}x{frame_height}")
+
+            horizontal = sheet.get_width() > sheet.get_height()
+            frames = []
+            for i in range(total_frames):
+                x, y = (i * frame_width, 0) if horizontal else (0, i * frame_height)
+                frame = sheet.subsurface((x, y, frame_width, frame_height))
+                # Frames maiores que o necessário entram já reduzidos (maior nível do mipmap)
+                frames.append(gerar_cadeia_mip(frame)[0])
+
+            arquivos[nome.lower()] = {
+                'arquivo': f"{pasta}/{arquivo}",
+                'animacao': ResourceManager.classificar_animacao(nome),
+                'frames': frames,
+            }
+
+        if arquivos:
+            personagens[pasta.lower()] = arquivos
+    return personagens
+
+
+def coletar_molduras():
+    """Lê as molduras da interface."""
+    molduras = {}
+    for tipo, arquivo in MOLDURAS.items():
+        caminho = os.path.join(SPRITES_PATH, "molders", arquivo)
+        if os.path.exists(caminho):
+            molduras[tipo] = {'arquivo': f"molders/{arquivo}", 'superficie': pygame.image.load(caminho)}
+        else:
+            print(f"⚠️ Moldura não encontrada: {caminho}")
+    return molduras
+
+
+def empacotar(tamanhos, lado_pagina, espaco):
+    """
+    Empacota retângulos em páginas usando prateleiras (shelf packing).
+
+    Args:
+        tamanhos: Lista de (largura, altura)
+        lado_pagina: Largura/altura de cada página
+        espaco: Espaço (px) entre retângulos
+
+    Returns:
+        list: (pagina, x, y) para cada retângulo, na mesma ordem de entrada
+    """
+    ordem = sorted(range(len(tamanhos)), key=lambda i: (-tamanhos[i][1], -tamanhos[i][0]))
+    posicoes = [None] * len(tamanhos)
+    pagina, x, y, altura_prateleira = 0, 0, 0, 0
+
+    for i in ordem:
+        largura, altura = tamanhos[i]
+        if largura > lado_pagina or altura > lado_pagina:
+            raise ValueError(f"Frame {largura}x{altura} não cabe em uma página de {lado_pagina}px")
+
+        if x + largura > lado_pagina:
+            # Nova prateleira
+            x = 0
+            y += altura_prateleira + espaco
+            altura_prateleira = 0
+        if y + altura > lado_pagina:
+            # Nova página
+            pagina += 1
+            x, y, altura_prateleira = 0, 0, 0
+
+        posicoes[i] = (pagina, x, y)
+        x += largura + espaco
+        altura_prateleira = max(altura_prateleira, altura)
+
+    return posicoes
+
+
+def gerar_atlas(lado_pagina=2048, espaco=1):
+    """Gera as páginas do atlas e o manifesto em ATLAS_PASTA."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print("📦 Coletando sprites...")
+    personagens = coletar_personagens()
+    molduras = coletar_molduras()
+
+    # Lista plana de superfícies a empacotar
+    itens = []
+    for personagem, arquivos in personagens.items():
+        for chave, dados in arquivos.items():
+            for frame in dados['frames']:
+                itens.append(frame)
+    for dados in molduras.values():
+        itens.append(dados['superficie'])
+
+    posicoes = empacotar([item.get_size() for item in itens], lado_pagina, espaco)
+    total_paginas = max(pagina for pagina, _, _ in posicoes) + 1
+    paginas = [pygame.Surface((lado_pagina, lado_pagina), pygame.SRCALPHA) for _ in range(total_paginas)]
+
+    # BLEND_RGBA_MAX sobre fundo zerado copia os pixels sem pré-multiplicar o alpha
+    for item, (pagina, x, y) in zip(itens, posicoes):
+        paginas[pagina].blit(item, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+
+    # Manifesto
+    manifesto = {'versao': 1, 'paginas': [], 'personagens': {}, 'molduras': {}}
+    indice = 0
+    for personagem, arquivos in personagens.items():
+        entrada = {'arquivos': {}, 'animacoes': {}}
+        for chave, dados in arquivos.items():
+            frames = dados['frames']
+            quadros = posicoes[indice:indice + len(frames)]
+            indice += len(frames)
+            entrada['arquivos'][chave] = {
+                'arquivo': dados['arquivo'],
+                'animacao': dados['animacao'],
+                'pagina': quadros[0][0],
+                'frame_width': frames[0].get_width(),
+                'frame_height': frames[0].get_height(),
+                'frames': [[x, y] for _, x, y in quadros],
+            }
+            # Em ordem alfabética, o último arquivo de cada animação vence (como na varredura)
+            entrada['animacoes'][dados['animacao']] = chave
+        manifesto['personagens'][personagem] = entrada
+
+    for tipo, dados in molduras.items():
+        pagina, x, y = posicoes[indice]
+        indice += 1
+        largura, altura = dados['superficie'].get_size()
+        manifesto['molduras'][tipo] = {'arquivo': dados['arquivo'], 'pagina': pagina, 'rect': [x, y, largura, altura]}
+
+    os.makedirs(ATLAS_PASTA, exist_ok=True)
+    for i, pagina in enumerate(paginas):
+        nome = f"atlas_{i}.png"
+        pygame.image.save(pagina, os.path.join(ATLAS_PASTA, nome))
+        manifesto['paginas'].append(nome)
+
+    with open(os.path.join(ATLAS_PASTA, ATLAS_MANIFESTO), "w", encoding="utf-8") as arquivo:
+        json.dump(manifesto, arquivo, indent=2, ensure_ascii=False)
+
+    print(f"✅ Atlas gerado: {len(itens)} imagens em {total_paginas} página(s) de {lado_pagina}x{lado_pagina}")
+    print(f"📝 Manifesto: {os.path.join(ATLAS_PASTA, ATLAS_MANIFESTO)}")
+    pygame.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera o atlas de texturas do JokenGhost")
+    parser.add_argument("--pagina", type=int, default=2048, help="Lado de cada página do atlas (px)")
+    parser.add_argument("--espaco", type=int, default=1, help="Espaço entre frames (px)")
+    args = parser.parse_args()
+
+    try:
+        gerar_atlas(args.pagina, args.espaco)
+    except Exception as e:
+        print(f"❌ Erro ao gerar atlas: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
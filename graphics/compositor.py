@@ -0,0 +1,74 @@
+"""
+Compositor de camadas da cena de batalha.
+A camada estática (cenário + moldura do HUD + barra de informações + botões)
+é pré-composta em uma única superfície e só é redesenhada quando seus dados
+mudam; sprites, efeitos e toasts são desenhados por cima a cada frame.
+"""
+
+import pygame
+
+
+class LayerCompositor:
+    """Guarda camadas estáticas pré-compostas, reconstruídas apenas quando a chave muda."""
+    
+    def __init__(self, tamanho):
+        """
+        Inicializa o compositor.
+        
+        Args:
+            tamanho: (largura, altura) das camadas, normalmente o tamanho da tela
+        """
+        self.tamanho = tuple(tamanho)
+        self.camadas = {}  # nome -> {'chave': ..., 'superficie': Surface}
+        
+        # Estatísticas
+        self.reconstrucoes = 0
+        self.reutilizacoes = 0
+        
+    def obter_camada(self, nome, chave, desenhar):
+        """
+        Retorna a superfície pré-composta da camada, reconstruindo se necessário.
+        
+        Args:
+            nome: Identificador da camada
+            chave: Valor comparável com tudo que a camada mostra (textos, dinheiro,
+                estado dos botões...); quando muda, a camada é redesenhada
+            desenhar: Função que recebe a superfície da camada e desenha nela
+            
+        Returns:
+            pygame.Surface: Camada pronta para um único blit
+        """
+        entrada = self.camadas.get(nome)
+        if entrada is not None and entrada['chave'] == chave:
+            self.reutilizacoes += 1
+            return entrada['superficie']
+            
+        if entrada is not None:
+            superficie = entrada['superficie']
+        else:
+            superficie = pygame.Surface(self.tamanho).convert()
+        desenhar(superficie)
+        self.camadas[nome] = {'chave': chave, 'superficie': superficie}
+        self.reconstrucoes += 1
+        return superficie
+        
+    def desenhar_camada(self, tela, nome, chave, desenhar, posicao=(0, 0)):
+        """Desenha a camada estática na tela com um único blit."""
+        tela.blit(self.obter_camada(nome, chave, desenhar), posicao)
+        
+    def invalidar(self, nome=None):
+        """Descarta uma camada (ou todas), forçando a reconstrução no próximo uso."""
+        if nome is None:
+            self.camadas.clear()
+        else:
+            self.camadas.pop(nome, None)
+            
+    def obter_estatisticas(self):
+        """Retorna estatísticas de uso das camadas."""
+        total = self.reconstrucoes + self.reutilizacoes
+        return {
+            'camadas': len(self.camadas),
+            'reconstrucoes': self.reconstrucoes,
+            'reutilizacoes': self.reutilizacoes,
+            'taxa_reutilizacao': self.reutilizacoes / total if total else 0.0
+        }
@@ -0,0 +1,108 @@
+"""
+Atualização parcial da tela (dirty rectangles).
+Em vez de pygame.display.flip() a cada frame, envia para a janela apenas as
+áreas onde algum elemento mudou, e recorre à tela cheia quando um efeito
+ocupa a tela inteira (fade de transição, tremor, troca de cena).
+"""
+
+import pygame
+
+# Eventos em que o sistema de janelas pode ter apagado o conteúdo da janela
+_EVENTOS_REDESENHO = tuple(getattr(pygame, nome) for nome in
+                           ("VIDEOEXPOSE", "VIDEORESIZE", "WINDOWEXPOSED", "WINDOWRESTORED",
+                            "WINDOWSIZECHANGED", "WINDOWSHOWN")
+                           if hasattr(pygame, nome))
+
+
+class DirtyRectTracker:
+    """Registra os retângulos desenhados a cada frame e atualiza só o que mudou."""
+    
+    def __init__(self, tela, fora_da_tela=False):
+        """
+        Inicializa o rastreador.
+        
+        Args:
+            tela: Superfície da janela (retornada por pygame.display.set_mode)
+            fora_da_tela: True se a tela é uma superfície offscreen (headless); nada é enviado à janela
+        """
+        self.area_tela = tela.get_rect()
+        self.fora_da_tela = fora_da_tela
+        self.anteriores = {}  # chave -> Rect desenhado no frame anterior
+        self.atuais = {}  # chave -> Rect desenhado neste frame
+        self.cena = None
+        self.tela_cheia = True  # O primeiro frame sempre envia a tela inteira
+        
+        # Estatísticas
+        self.quadros_parciais = 0
+        self.quadros_cheios = 0
+        self.pixels_enviados = 0
+        
+    def registrar(self, chave, rect):
+        """
+        Registra um elemento que pode ter mudado neste frame.
+        
+        Args:
+            chave: Identificador estável do elemento entre frames
+            rect: Área ocupada pelo elemento agora
+        """
+        if rect is not None:
+            self.atuais[chave] = pygame.Rect(rect)
+            
+    def definir_cena(self, cena):
+        """Força uma atualização completa quando a cena (estado do jogo) muda."""
+        if cena != self.cena:
+            self.cena = cena
+            self.forcar_tela_cheia()
+            
+    def forcar_tela_cheia(self):
+        """Faz o próximo apresentar() usar pygame.display.flip()."""
+        self.tela_cheia = True
+        
+    def tratar_evento(self, evento):
+        """Força tela cheia quando a janela precisa ser redesenhada pelo sistema."""
+        if evento.type in _EVENTOS_REDESENHO:
+            self.forcar_tela_cheia()
+            
+    def calcular_retangulos(self):
+        """
+        Retorna as áreas a atualizar: tudo que foi desenhado agora e a posição
+        anterior dos elementos que se moveram ou sumiram.
+        """
+        retangulos = list(self.atuais.values())
+        for chave, rect in self.anteriores.items():
+            if self.atuais.get(chave) != rect:
+                retangulos.append(rect)
+                
+        visiveis = []
+        for rect in retangulos:
+            rect = rect.clip(self.area_tela)
+            if rect.width > 0 and rect.height > 0:
+                visiveis.append(rect)
+        return visiveis
+        
+    def apresentar(self):
+        """Envia o frame para a janela (parcial ou completo) e prepara o próximo."""
+        if self.tela_cheia:
+            if not self.fora_da_tela:
+                pygame.display.flip()
+            self.quadros_cheios += 1
+            self.pixels_enviados += self.area_tela.width * self.area_tela.height
+        else:
+            retangulos = self.calcular_retangulos()
+            if retangulos and not self.fora_da_tela:
+                pygame.display.update(retangulos)
+            self.quadros_parciais += 1
+            self.pixels_enviados += sum(rect.width * rect.height for rect in retangulos)
+            
+        self.anteriores = self.atuais
+        self.atuais = {}
+        self.tela_cheia = False
+        
+    def obter_estatisticas(self):
+        """Retorna estatísticas de uso (quadros parciais/cheios e média de pixels por quadro)."""
+        quadros = self.quadros_parciais + self.quadros_cheios
+        return {
+            'quadros_parciais': self.quadros_parciais,
+            'quadros_cheios': self.quadros_cheios,
+            'pixels_por_quadro': self.pixels_enviados / quadros if quadros else 0
+        }
@@ -0,0 +1,195 @@
+"""
+Renderizador de texto por atlas de glifos.
+Cada fonte é rasterizada uma única vez (por tamanho) em uma superfície com
+todos os caracteres; os textos que mudam a todo frame (dano, moedas, vida,
+dinheiro) são montados com um único Surface.blits, sem passar pelo FreeType.
+
+Também lê fontes bitmap do Windows (.FON, como o PKMNRSEU.FON do projeto)
+diretamente, sem depender do suporte do pygame a esse formato.
+"""
+
+import struct
+import pygame
+
+# Caracteres rasterizados por padrão: ASCII imprimível + acentos do português
+CARACTERES_PADRAO = "".join(chr(c) for c in range(32, 127)) + "ÁÉÍÓÚÂÊÔÃÕÀÇáéíóúâêôãõàç"
+
+# Tipo de recurso RT_FONT em executáveis NE
+_RT_FONT = 0x8008
+
+
+def ler_fontes_fnt(caminho):
+    """
+    Lê os recursos de fonte bitmap de um arquivo .FON (executável NE).
+    
+    Returns:
+        list: bytes de cada recurso FNT encontrado
+    """
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+        
+    inicio_ne = struct.unpack_from('<I', dados, 0x3C)[0]
+    if dados[inicio_ne:inicio_ne + 2] != b'NE':
+        raise ValueError(f"{caminho} não é um arquivo .FON (NE) válido")
+        
+    tabela = inicio_ne + struct.unpack_from('<H', dados, inicio_ne + 0x24)[0]
+    deslocamento = struct.unpack_from('<H', dados, tabela)[0]
+    pos = tabela + 2
+    fontes = []
+    while True:
+        tipo, quantidade = struct.unpack_from('<HH', dados, pos)
+        pos += 8
+        if tipo == 0:
+            break
+        for _ in range(quantidade):
+            inicio, tamanho = struct.unpack_from('<HH', dados, pos)
+            pos += 12
+            if tipo == _RT_FONT:
+                inicio <<= deslocamento
+                fontes.append(dados[inicio:inicio + (tamanho << deslocamento)])
+    return fontes
+
+
+def decodificar_fnt(recurso):
+    """
+    Converte um recurso FNT (versões 2 e 3) em superfícies brancas por caractere.
+    
+    Returns:
+        tuple: ({caractere: Surface}, altura)
+    """
+    versao = struct.unpack_from('<H', recurso, 0)[0]
+    altura = struct.unpack_from('<H', recurso, 0x58)[0]
+    primeiro, ultimo = recurso[0x5F], recurso[0x60]
+    inicio_tabela, tamanho_entrada, formato = (0x76, 4, '<HH') if versao == 0x200 else (0x94, 6, '<HI')
+    
+    glifos = {}
+    for codigo in range(primeiro, ultimo + 1):
+        largura, inicio = struct.unpack_from(formato, recurso, inicio_tabela + (codigo - primeiro) * tamanho_entrada)
+        superficie = pygame.Surface((max(1, largura), altura), pygame.SRCALPHA)
+        # Bitmap em colunas de 8 pixels, cada coluna com 'altura' bytes
+        for coluna in range((largura + 7) // 8):
+            for y in range(altura):
+                byte = recurso[inicio + coluna * altura + y]
+                for bit in range(8):
+                    x = coluna * 8 + bit
+                    if x < largura and byte & (0x80 >> bit):
+                        superficie.set_at((x, y), (255, 255, 255, 255))
+        glifos[bytes([codigo]).decode("cp1252", errors="replace")] = (superficie, largura)
+    return glifos, altura
+
+
+class GlyphAtlas:
+    """Atlas com todos os glifos de uma fonte em um tamanho, desenhados com Surface.blits."""
+    
+    def __init__(self, glifos, altura, substituto="?", max_cores=16):
+        """
+        Monta o atlas a partir de glifos já rasterizados em branco.
+        
+        Args:
+            glifos: {caractere: (Surface branca, avanço em px)}
+            altura: Altura da linha
+            substituto: Caractere usado quando o texto tem um glifo ausente
+            max_cores: Quantidade de cópias coloridas do atlas mantidas
+        """
+        self.altura = altura
+        self.substituto = substituto
+        self.max_cores = max(1, max_cores)
+        
+        largura_total = sum(superficie.get_width() for superficie, _ in glifos.values()) or 1
+        self.atlas = pygame.Surface((largura_total, altura), pygame.SRCALPHA)
+        self.glifos = {}  # caractere -> (Rect no atlas, avanço)
+        x = 0
+        for caractere, (superficie, avanco) in glifos.items():
+            self.atlas.blit(superficie, (x, 0))
+            self.glifos[caractere] = (pygame.Rect(x, 0, superficie.get_width(), altura), avanco)
+            x += superficie.get_width()
+        self._coloridos = {}
+        
+    @classmethod
+    def de_fonte(cls, fonte, caracteres=CARACTERES_PADRAO, antialias=True):
+        """Rasteriza uma pygame.font.Font (TTF/OTF) uma única vez."""
+        glifos = {}
+        for caractere in caracteres:
+            try:
+                glifos[caractere] = (fonte.render(caractere, antialias, (255, 255, 255)), fonte.size(caractere)[0])
+            except pygame.error:
+                continue
+        # A superfície de render() inclui o espaçamento de linha, maior que get_height()
+        altura = max([superficie.get_height() for superficie, _ in glifos.values()] + [fonte.get_height()])
+        return cls(glifos, altura)
+        
+    @classmethod
+    def de_fon(cls, caminho, escala=1):
+        """
+        Lê uma fonte bitmap do Windows (.FON) e, se pedido, amplia os glifos.
+        
+        Args:
+            caminho: Arquivo .FON
+            escala: Fator inteiro de ampliação (pixels continuam nítidos)
+        """
+        glifos, altura = decodificar_fnt(ler_fontes_fnt(caminho)[0])
+        if escala != 1:
+            glifos = {caractere: (pygame.transform.scale(superficie, (superficie.get_width() * escala, altura * escala)),
+                                  avanco * escala)
+                      for caractere, (superficie, avanco) in glifos.items()}
+            altura *= escala
+        return cls(glifos, altura)
+        
+    def _atlas_colorido(self, cor):
+        """Retorna (criando uma vez) a cópia do atlas na cor pedida."""
+        cor = tuple(cor)
+        superficie = self._coloridos.get(cor)
+        if superficie is None:
+            if len(self._coloridos) >= self.max_cores:
+                self._coloridos.pop(next(iter(self._coloridos)))
+            superficie = self.atlas.copy()
+            superficie.fill(cor[:3] + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+            self._coloridos[cor] = superficie
+        return superficie
+        
+    def largura(self, texto):
+        """Largura em pixels do texto."""
+        glifos = self.glifos
+        padrao = glifos.get(self.substituto, (None, 0))
+        return sum(glifos.get(caractere, padrao)[1] for caractere in texto)
+        
+    def tamanho(self, texto):
+        """Retorna (largura, altura) do texto, como Font.size."""
+        return self.largura(texto), self.altura
+        
+    def desenhar(self, tela, texto, posicao, cor=(255, 255, 255), alpha=None, centro=False):
+        """
+        Desenha o texto diretamente na tela com um único Surface.blits.
+        
+        Args:
+            tela: Superfície de destino
+            texto: Texto a desenhar
+            posicao: (x, y) do canto superior esquerdo, ou do centro se centro=True
+            cor: Cor do texto
+            alpha: Transparência (0-255) ou None para opaco
+            centro: Se True, centraliza o texto na posição
+            
+        Returns:
+            pygame.Rect: Área ocupada pelo texto
+        """
+        atlas = self._atlas_colorido(cor)
+        atlas.set_alpha(alpha if alpha is not None else 255)  # None desligaria o alpha por pixel
+        
+        x, y = int(posicao[0]), int(posicao[1])
+        if centro:
+            x -= self.largura(texto) // 2
+            y -= self.altura // 2
+            
+        glifos = self.glifos
+        padrao = glifos.get(self.substituto)
+        sequencia = []
+        cursor = x
+        for caractere in texto:
+            glifo = glifos.get(caractere, padrao)
+            if glifo is None:
+                continue
+            area, avanco = glifo
+            sequencia.append((atlas, (cursor, y), area))
+            cursor += avanco
+        tela.blits(sequencia, doreturn=False)
+        return pygame.Rect(x, y, cursor - x, self.altura)
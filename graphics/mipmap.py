@@ -0,0 +1,72 @@
+"""
+Cadeias de mipmaps para sprites.
+Gera, no carregamento, versões pré-reduzidas (metade do tamanho a cada nível)
+para que a renderização escale a partir de uma fonte pequena.
+"""
+
+import pygame
+from config.constants import MIPMAP_LADO_MAX, MIPMAP_LADO_MIN
+
+def escalar_suave(superficie, tamanho):
+    """Escala uma superfície com smoothscale, caindo para scale se o formato não suportar."""
+    try:
+        return pygame.transform.smoothscale(superficie, tamanho)
+    except ValueError:
+        return pygame.transform.scale(superficie, tamanho)
+
+def gerar_cadeia_mip(frame, lado_max=MIPMAP_LADO_MAX, lado_min=MIPMAP_LADO_MIN):
+    """
+    Gera a cadeia de mipmaps de um frame.
+    
+    Args:
+        frame: Surface do frame em resolução original
+        lado_max: Níveis com lado maior que isto são descartados
+        lado_min: Não gera níveis com lado menor que isto
+        
+    Returns:
+        tuple: Níveis do maior para o menor (o primeiro pode ser o próprio frame)
+    """
+    niveis = []
+    atual = frame
+    while True:
+        largura, altura = atual.get_size()
+        if max(largura, altura) <= lado_max:
+            niveis.append(atual)
+        if min(largura, altura) // 2 < lado_min:
+            break
+        atual = escalar_suave(atual, (largura // 2, altura // 2))
+        
+    if not niveis:
+        niveis.append(atual)
+    return tuple(niveis)
+
+def escolher_nivel(cadeia, largura, altura):
+    """
+    Escolhe o menor nível que ainda cobre o tamanho pedido.
+    
+    Args:
+        cadeia: Níveis do maior para o menor
+        largura, altura: Tamanho em que o sprite será desenhado
+        
+    Returns:
+        pygame.Surface: Nível mais adequado (o maior, se nenhum cobrir)
+    """
+    for nivel in reversed(cadeia):
+        if nivel.get_width() >= largura and nivel.get_height() >= altura:
+            return nivel
+    return cadeia[0]
+
+def montar_sheet(frames, horizontal=True):
+    """Monta uma sprite sheet compacta com frames de mesmo tamanho."""
+    largura, altura = frames[0].get_size()
+    if horizontal:
+        sheet = pygame.Surface((largura * len(frames), altura), pygame.SRCALPHA)
+        posicoes = [(i * largura, 0) for i in range(len(frames))]
+    else:
+        sheet = pygame.Surface((largura, altura * len(frames)), pygame.SRCALPHA)
+        posicoes = [(0, i * altura) for i in range(len(frames))]
+        
+    # BLEND_RGBA_MAX sobre fundo zerado copia os pixels sem pré-multiplicar o alpha
+    for frame, pos in zip(frames, posicoes):
+        sheet.blit(frame, pos, special_flags=pygame.BLEND_RGBA_MAX)
+    return sheet, posicoes
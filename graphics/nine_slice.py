@@ -0,0 +1,142 @@
+"""
+Renderizador nine-slice de molduras e botões.
+Monta cada combinação (moldura, tamanho, estado, rótulo) uma única vez: os
+cantos da moldura são copiados sem escala, as bordas são esticadas em uma
+direção e o miolo nas duas. Os filtros de hover/desabilitado e o texto do
+botão já vêm aplicados, então desenhar um botão custa um único blit.
+"""
+
+import pygame
+from collections import OrderedDict
+from config.constants import CACHE_MOLDURAS_TAMANHO_MAX, ESTADOS_MOLDURA, BRANCO
+
+class NineSliceRenderer:
+    """Cache LRU de molduras fatiadas e pré-montadas por estado."""
+
+    def __init__(self, tamanho_max=CACHE_MOLDURAS_TAMANHO_MAX):
+        """
+        Inicializa o renderizador.
+
+        Args:
+            tamanho_max: Quantidade máxima de molduras montadas guardadas
+        """
+        self.tamanho_max = max(1, tamanho_max)
+        self._entradas = OrderedDict()
+
+        # Estatísticas
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, moldura, tamanho, estado='normal', bordas=0, rotulo=None, fonte=None,
+              cor_rotulo=BRANCO, filtro=None):
+        """
+        Retorna a moldura montada no tamanho e estado pedidos.
+
+        A superfície é compartilhada: não desenhe nela.
+
+        Args:
+            moldura: Superfície original da moldura
+            tamanho: (largura, altura) final
+            estado: Chave de ESTADOS_MOLDURA ('normal', 'hover', 'desabilitado', ...)
+            bordas: Espessura (px) dos cantos/bordas que não são esticados; 0 escala a imagem inteira
+            rotulo: Texto centralizado no botão, ou None
+            fonte: pygame.font.Font do rótulo
+            cor_rotulo: Cor do rótulo
+            filtro: (cor, alpha) aplicado sobre a moldura; padrão: o do estado
+
+        Returns:
+            pygame.Surface: Moldura pronta para blit
+        """
+        largura, altura = int(tamanho[0]), int(tamanho[1])
+        if filtro is None:
+            filtro = ESTADOS_MOLDURA.get(estado)
+        chave = (moldura, largura, altura, bordas, filtro,
+                 rotulo if fonte is not None else None, fonte, tuple(cor_rotulo))
+
+        superficie = self._entradas.get(chave)
+        if superficie is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return superficie
+
+        self.falhas += 1
+        superficie = self.fatiar(moldura, (largura, altura), bordas)
+        if filtro:
+            cor, alpha = filtro
+            overlay = pygame.Surface((largura, altura))
+            overlay.fill(cor)
+            overlay.set_alpha(alpha)
+            superficie.blit(overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        if rotulo and fonte is not None:
+            texto = fonte.render(rotulo, True, cor_rotulo)
+            superficie.blit(texto, texto.get_rect(center=(largura // 2, altura // 2)))
+
+        self._entradas[chave] = superficie
+        while len(self._entradas) > self.tamanho_max:
+            self._entradas.popitem(last=False)
+        return superficie
+
+    @staticmethod
+    def fatiar(moldura, tamanho, bordas):
+        """
+        Monta a moldura no tamanho pedido preservando cantos e espessura das bordas.
+
+        Args:
+            moldura: Superfície original
+            tamanho: (largura, altura) final
+            bordas: Espessura (px) das bordas fixas
+
+        Returns:
+            pygame.Surface: Nova superfície (sempre uma cópia)
+        """
+        largura, altura = max(1, tamanho[0]), max(1, tamanho[1])
+        origem_largura, origem_altura = moldura.get_size()
+        b = bordas
+        if (b <= 0 or 2 * b >= min(origem_largura, origem_altura)
+                or 2 * b >= min(largura, altura)):
+            return pygame.transform.scale(moldura, (largura, altura))
+
+        destino = pygame.Surface((largura, altura), pygame.SRCALPHA)
+        # Colunas e linhas: (início na origem, tamanho na origem, início no destino, tamanho no destino)
+        colunas = [(0, b, 0, b),
+                   (b, origem_largura - 2 * b, b, largura - 2 * b),
+                   (origem_largura - b, b, largura - b, b)]
+        linhas = [(0, b, 0, b),
+                  (b, origem_altura - 2 * b, b, altura - 2 * b),
+                  (origem_altura - b, b, altura - b, b)]
+        for ox, ol, dx, dl in colunas:
+            for oy, oa, dy, da in linhas:
+                pedaco = moldura.subsurface((ox, oy, ol, oa))
+                if (ol, oa) != (dl, da):
+                    pedaco = pygame.transform.scale(pedaco, (dl, da))
+                # BLEND_RGBA_MAX sobre fundo zerado copia os pixels sem pré-multiplicar o alpha
+                destino.blit(pedaco, (dx, dy), special_flags=pygame.BLEND_RGBA_MAX)
+        return destino
+
+    def desenhar(self, tela, posicao, moldura, tamanho, **opcoes):
+        """Desenha a moldura montada na posição pedida (atalho para obter + blit)."""
+        tela.blit(self.obter(moldura, tamanho, **opcoes), posicao)
+
+    def limpar(self):
+        """Remove todas as molduras montadas."""
+        self._entradas.clear()
+
+    def obter_estatisticas(self):
+        """Retorna as estatísticas de uso do renderizador."""
+        total = self.acertos + self.falhas
+        return {
+            'entradas': len(self._entradas),
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': (self.acertos / total) if total else 0.0
+        }
+
+
+_renderizador_compartilhado = None
+
+def obter_renderizador_molduras():
+    """Retorna o renderizador de molduras compartilhado por todos os módulos de interface."""
+    global _renderizador_compartilhado
+    if _renderizador_compartilhado is None:
+        _renderizador_compartilhado = NineSliceRenderer()
+    return _renderizador_compartilhado
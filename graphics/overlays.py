@@ -0,0 +1,114 @@
+"""
+Fábrica compartilhada de overlays e painéis de cor sólida.
+Guarda as superfícies já preenchidas por (tamanho, cor, raio, borda) para que
+telas como o monstruário, a transição e os toasts não aloquem uma superfície
+nova a cada frame. A transparência é aplicada com set_alpha na superfície
+guardada.
+"""
+
+import pygame
+from collections import OrderedDict
+from config.constants import CACHE_OVERLAYS_TAMANHO_MAX
+
+class OverlayFactory:
+    """Cache LRU de superfícies de overlay/painel preenchidas."""
+    
+    def __init__(self, tamanho_max=CACHE_OVERLAYS_TAMANHO_MAX):
+        """
+        Inicializa a fábrica.
+        
+        Args:
+            tamanho_max: Quantidade máxima de superfícies guardadas
+        """
+        self.tamanho_max = max(1, tamanho_max)
+        self._entradas = OrderedDict()
+        
+        # Estatísticas
+        self.acertos = 0
+        self.falhas = 0
+        
+    def obter(self, tamanho, cor, alpha=None, raio=0, borda=0, cor_borda=None, raio_borda=None):
+        """
+        Retorna um overlay/painel pronto para blit.
+        
+        A superfície é compartilhada: não desenhe nela. O alpha é aplicado a
+        cada chamada, então pode mudar de frame a frame (fades).
+        
+        Args:
+            tamanho: (largura, altura)
+            cor: Cor de preenchimento
+            alpha: Transparência (0-255) ou None para opaco
+            raio: Raio dos cantos do preenchimento (0 = retângulo cheio)
+            borda: Espessura da borda (0 = sem borda)
+            cor_borda: Cor da borda
+            raio_borda: Raio dos cantos da borda (padrão: igual a raio)
+            
+        Returns:
+            pygame.Surface: Overlay com o alpha pedido
+        """
+        largura, altura = int(tamanho[0]), int(tamanho[1])
+        raio_borda = raio if raio_borda is None else raio_borda
+        chave = (largura, altura, tuple(cor), raio, borda, tuple(cor_borda) if cor_borda else None, raio_borda)
+        
+        superficie = self._entradas.get(chave)
+        if superficie is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+        else:
+            self.falhas += 1
+            superficie = self._criar(largura, altura, cor, raio, borda, cor_borda, raio_borda)
+            self._entradas[chave] = superficie
+            while len(self._entradas) > self.tamanho_max:
+                self._entradas.popitem(last=False)
+                
+        if alpha is not None and alpha < 255:
+            superficie.set_alpha(alpha)
+        else:
+            # Painéis arredondados têm alpha por pixel: None desligaria a mistura dos cantos
+            superficie.set_alpha(255 if superficie.get_flags() & pygame.SRCALPHA else None)
+        return superficie
+        
+    def _criar(self, largura, altura, cor, raio, borda, cor_borda, raio_borda):
+        """Cria e preenche a superfície do overlay."""
+        largura, altura = max(1, largura), max(1, altura)
+        if raio > 0:
+            # Cantos arredondados precisam de alpha por pixel
+            superficie = pygame.Surface((largura, altura), pygame.SRCALPHA)
+            pygame.draw.rect(superficie, cor, superficie.get_rect(), border_radius=raio)
+        else:
+            superficie = pygame.Surface((largura, altura))
+            if pygame.display.get_surface() is not None:
+                superficie = superficie.convert()
+            superficie.fill(cor)
+            
+        if borda > 0 and cor_borda is not None:
+            pygame.draw.rect(superficie, cor_borda, superficie.get_rect(), borda, border_radius=raio_borda)
+        return superficie
+        
+    def desenhar(self, tela, posicao, tamanho, cor, alpha=None, **opcoes):
+        """Desenha o overlay na posição pedida (atalho para obter + blit)."""
+        tela.blit(self.obter(tamanho, cor, alpha, **opcoes), posicao)
+        
+    def limpar(self):
+        """Remove todas as superfícies guardadas."""
+        self._entradas.clear()
+        
+    def obter_estatisticas(self):
+        """Retorna as estatísticas de uso da fábrica."""
+        total = self.acertos + self.falhas
+        return {
+            'entradas': len(self._entradas),
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': (self.acertos / total) if total else 0.0
+        }
+
+
+_fabrica_compartilhada = None
+
+def obter_fabrica_overlays():
+    """Retorna a fábrica de overlays compartilhada por todos os módulos de interface."""
+    global _fabrica_compartilhada
+    if _fabrica_compartilhada is None:
+        _fabrica_compartilhada = OverlayFactory()
+    return _fabrica_compartilhada
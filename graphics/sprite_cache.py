@@ -0,0 +1,96 @@
+"""
+Cache de sprites escalados do jogo.
+Evita chamar pygame.transform.scale/flip a cada frame para o mesmo sprite.
+"""
+
+import pygame
+from collections import OrderedDict
+from config.constants import CACHE_SPRITES_TAMANHO_MAX, CACHE_SPRITES_GRANULARIDADE
+
+class ScaledSpriteCache:
+    """Cache LRU de frames escalados, com tamanhos quantizados em faixas."""
+    
+    def __init__(self, tamanho_max=CACHE_SPRITES_TAMANHO_MAX, granularidade=CACHE_SPRITES_GRANULARIDADE):
+        """
+        Inicializa o cache.
+        
+        Args:
+            tamanho_max: Quantidade máxima de sprites escalados guardados
+            granularidade: Tamanho (px) da faixa de quantização; 1 = tamanho exato
+        """
+        self.tamanho_max = max(1, tamanho_max)
+        self.granularidade = max(1, granularidade)
+        self._entradas = OrderedDict()
+        
+        # Estatísticas
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+        
+    def quantizar(self, valor):
+        """Arredonda um tamanho para a faixa de quantização mais próxima."""
+        g = self.granularidade
+        return max(g, int(round(valor / g)) * g) if g > 1 else max(1, int(valor))
+        
+    def obter(self, frame, largura, altura, espelhar=False):
+        """
+        Retorna o frame escalado (e espelhado) para o tamanho pedido.
+        
+        Args:
+            frame: Surface do frame original (da tabela pré-fatiada)
+            largura, altura: Tamanho desejado
+            espelhar: Se True, espelha horizontalmente
+            
+        Returns:
+            pygame.Surface: Sprite escalado com tamanho quantizado
+        """
+        largura_q = self.quantizar(largura)
+        altura_q = self.quantizar(altura)
+        chave = (id(frame), largura_q, altura_q, bool(espelhar))
+        
+        entrada = self._entradas.get(chave)
+        if entrada is not None and entrada[0] is frame:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return entrada[1]
+            
+        self.falhas += 1
+        escalado = pygame.transform.scale(frame, (largura_q, altura_q))
+        if espelhar:
+            escalado = pygame.transform.flip(escalado, True, False)
+            
+        # Guarda o frame original junto para que o id() da chave não seja reutilizado
+        self._entradas[chave] = (frame, escalado)
+        self._entradas.move_to_end(chave)
+        while len(self._entradas) > self.tamanho_max:
+            self._entradas.popitem(last=False)
+            self.remocoes += 1
+            
+        return escalado
+        
+    def desenhar(self, tela, frame, x, y, largura, altura, espelhar=False):
+        """Desenha o frame escalado centralizado no retângulo pedido."""
+        escalado = self.obter(frame, largura, altura, espelhar)
+        pos_x = x + (largura - escalado.get_width()) // 2
+        pos_y = y + (altura - escalado.get_height()) // 2
+        tela.blit(escalado, (pos_x, pos_y))
+        
+    def limpar(self):
+        """Remove todos os sprites escalados do cache."""
+        self._entradas.clear()
+        
+    def obter_estatisticas(self):
+        """
+        Retorna as estatísticas de uso do cache.
+        
+        Returns:
+            dict: entradas, acertos, falhas, remocoes e taxa_acerto
+        """
+        total = self.acertos + self.falhas
+        return {
+            'entradas': len(self._entradas),
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'remocoes': self.remocoes,
+            'taxa_acerto': (self.acertos / total) if total else 0.0
+        }
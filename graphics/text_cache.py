@@ -0,0 +1,81 @@
+"""
+Cache de textos renderizados do jogo.
+Evita chamar Font.render a cada frame para rótulos que não mudam.
+"""
+
+import pygame
+from collections import OrderedDict
+from config.constants import CACHE_TEXTOS_TAMANHO_MAX
+
+class TextRenderCache:
+    """Cache LRU de superfícies de texto, por (fonte, texto, cor, antialias)."""
+    
+    def __init__(self, tamanho_max=CACHE_TEXTOS_TAMANHO_MAX):
+        """
+        Inicializa o cache.
+        
+        Args:
+            tamanho_max: Quantidade máxima de textos guardados
+        """
+        self.tamanho_max = max(1, tamanho_max)
+        self._entradas = OrderedDict()
+        
+        # Estatísticas
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+        
+    def renderizar(self, fonte, texto, cor, antialias=True, alpha=None):
+        """
+        Retorna o texto renderizado, reaproveitando a superfície quando possível.
+        
+        A superfície é compartilhada entre todos que pedem o mesmo texto: não
+        desenhe nela. Para transparência use o parâmetro alpha, que é aplicado
+        a cada chamada.
+        
+        Args:
+            fonte: pygame.font.Font usada para renderizar
+            texto: Texto a renderizar
+            cor: Cor do texto
+            antialias: Suavização das bordas
+            alpha: Transparência (0-255) ou None para opaco
+            
+        Returns:
+            pygame.Surface: Texto renderizado
+        """
+        chave = (fonte, texto, tuple(cor), bool(antialias))
+        superficie = self._entradas.get(chave)
+        if superficie is not None:
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+        else:
+            self.falhas += 1
+            superficie = fonte.render(texto, antialias, cor)
+            self._entradas[chave] = superficie
+            while len(self._entradas) > self.tamanho_max:
+                self._entradas.popitem(last=False)
+                self.remocoes += 1
+                
+        # Textos têm alpha por pixel: set_alpha(None) desligaria a mistura, então o "opaco" é 255
+        superficie.set_alpha(alpha if alpha is not None else 255)
+        return superficie
+        
+    def limpar(self):
+        """Remove todos os textos do cache."""
+        self._entradas.clear()
+        
+    def obter_estatisticas(self):
+        """
+        Retorna as estatísticas de uso do cache.
+        
+        Returns:
+            dict: entradas, acertos, falhas, remocoes e taxa_acerto
+        """
+        total = self.acertos + self.falhas
+        return {
+            'entradas': len(self._entradas),
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'remocoes': self.remocoes,
+            'taxa_acerto': (self.acertos / total) if total else 0.0
+        }
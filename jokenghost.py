@@ -26,6 +26,27 @@ import sys
 import os
 from enum import Enum
 
+from graphics.sprite_cache import ScaledSpriteCache
+from graphics.mipmap import gerar_cadeia_mip, escolher_nivel, montar_sheet, escalar_suave
+from graphics.dirty_rects import DirtyRectTracker
+from graphics.compositor import LayerCompositor
+from graphics.text_cache import TextRenderCache
+from graphics.glyph_atlas import GlyphAtlas
+from graphics.overlays import obter_fabrica_overlays
+from graphics.nine_slice import obter_renderizador_molduras
+from ui.widgets import Widget, TooltipWidget
+from core.game_loop import FixedTimestep, RenderInterpolator, IdleWaiter
+from core.async_loader import AsyncAssetLoader
+from core.execucao import OpcoesExecucao, analisar_argumentos
+from core.perfil import ProfileCapture
+from core.log import obter_log
+from core.enemy_manager import Enemy
+from core.entity_store import EntityStore
+from core.combat_engine import CombatEngine, ResultadoCombate
+from config.enums import Escolha
+
+log = obter_log()
+
 # Inicialização do Pygame
 pygame.init()
 
@@ -34,6 +55,11 @@ LARGURA = 1000
 ALTURA = 800
 FPS = 60
 
+# Tamanhos de desenho das ilustrações (escaladas uma única vez no carregamento)
+TAMANHO_CARTA = (300, 200)
+TAMANHO_LIVRO_MONSTRUARIO = (700, 500)
+BORDA_MOLDURA_ITENS = 6  # Cantos/bordas do hud_botao.png que não são esticados (nine-slice)
+
 # Cores
 PRETO = (0, 0, 0)
 BRANCO = (255, 255, 255)
@@ -64,16 +90,33 @@ class TipoMenu(Enum):
     ATAQUES = 1
     LOJA = 2
 
-class Escolha(Enum):
-    PEDRA = 1
-    PAPEL = 2
-    TESOURA = 3
+# Botão de ataque clicado -> escolha passada ao CombatEngine
+ESCOLHAS_BOTOES = {
+    'pedra': Escolha.PEDRA,
+    'papel': Escolha.PAPEL,
+    'tesoura': Escolha.TESOURA
+}
 
 class JokenGhost:
-    def __init__(self):
-        self.tela = pygame.display.set_mode((LARGURA, ALTURA))
+    def __init__(self, opcoes=None):
+        # Janela normal ou headless (drivers dummy, tela fora da janela, relógio simulado)
+        self.opcoes = opcoes or OpcoesExecucao()
+        log.definir_nivel(self.opcoes.log_nivel)
+        self.opcoes.preparar_ambiente()
+        self.tela = self.opcoes.criar_tela((LARGURA, ALTURA))
         pygame.display.set_caption("JokenGhost - Caçada em Turnos")
-        self.relogio = pygame.time.Clock()
+        self.relogio = self.opcoes.criar_relogio()
+        self.roteiro = self.opcoes.criar_roteiro()
+        self.passo_fixo = FixedTimestep()
+        self.espera_ociosa = IdleWaiter(ativo=not self.opcoes.headless)
+        self.captura_perfil = ProfileCapture()
+        self.fator_quadro = 1.0  # Fração de um quadro de 60 FPS que o passo atual representa
+        self.dirty_rects = DirtyRectTracker(self.tela, fora_da_tela=self.opcoes.headless)
+        self.compositor = LayerCompositor(self.tela.get_size())
+        self.sprite_cache = ScaledSpriteCache()
+        self.cache_textos = TextRenderCache()
+        self.overlays = obter_fabrica_overlays()
+        self.molduras_prontas = obter_renderizador_molduras()
         
         # Configuração de fontes - tentando usar fonte Pokémon personalizada
         try:
@@ -115,6 +158,9 @@ class JokenGhost:
             print("⚠️ Usando fontes padrão")
             print("💡 DICA: Arquivos .FON não são compatíveis com Pygame. Use arquivos .TTF para fontes personalizadas.")
         
+        # Atlas de glifos para textos numéricos que mudam a todo frame (moedas, vida, dinheiro)
+        self.glifos_pequena = GlyphAtlas.de_fonte(self.fonte_pequena)
+        
         self.estado = EstadoJogo.MENU
         self.transicao_alpha = 0
         self.transicao_direcao = 1
@@ -158,13 +204,22 @@ class JokenGhost:
         self.tooltip_pos = (0, 0)
         self.tooltip_item_rect = None
         
+        # Widgets retidos do menu de seleção: redesenhados só quando as entradas mudam
+        self.painel_menu = Widget((LARGURA, 1), renderizar=self._renderizar_painel_menu)
+        self.cartoes_loja = [Widget((200, 140), (50 + i * 220, 80), self._renderizar_cartao_loja)  # Aumentado: 180->200, 120->140
+                             for i in range(len(self.itens_loja))]
+        self.tooltip_widget = TooltipWidget(self.fonte_pequena, cor_fundo=(50, 40, 30), altura_linha=20,
+                                            raio=8, sombra=2)
+        
         # === NOVO === Sistema de Monstruário e Descoberta
         self.monstruario_ativo = False
         self.mostrar_monstruario = False  # Controla se o livro está visível
         self.pagina_monstruario_atual = 0  # Página atual do monstruário
         self.monstruario_descoberto = {}  # {tipo_inimigo: {"fraquezas": [], "nome": str, etc}}
-        self.sprite_monstruario = None
-        self.carregar_sprite_monstruario()
+        self.pagina_monstruario = Widget(TAMANHO_LIVRO_MONSTRUARIO, renderizar=self._renderizar_pagina_monstruario)
+        self.retrato_fantasma = None  # Primeiro frame do fantasma, cortado na primeira vez que o livro mostra um monstro
+        self.combat_engine = CombatEngine()  # Regras de combate (compartilhadas com o jogo refatorado)
+        self.sprite_monstruario = None  # Chega com o carregamento em segundo plano
         
         # === NOVO === Sistema de Toast/Notificações
         self.toast_ativo = False
@@ -176,6 +231,7 @@ class JokenGhost:
         
         # === NOVO === Sistema para Múltiplos Inimigos
         self.inimigos = []
+        self.entidades = EntityStore()  # Vida/animação dos inimigos (colunas NumPy quando são muitos)
         self.inimigo_atual_index = 0  # Para sistema de rotação
         self.aguardando_proximo_inimigo = False
         self.tempo_espera_inimigo = 0
@@ -223,9 +279,8 @@ class JokenGhost:
         # === NOVO === Sistema de controle de turnos
         self.turno_em_andamento = False  # Bloqueia ações durante processamento
         
-        # === NOVO === Carregamento do Fundo de Batalha
+        # === NOVO === Fundo de Batalha (chega com o carregamento em segundo plano)
         self.fundo_batalha = None
-        self.carregar_fundo_batalha()
         
         # === NOVO === Carregamento da Moldura de Dinheiro
         self.moldura_dinheiro = None
@@ -239,8 +294,8 @@ class JokenGhost:
         self.botoes = {}
         self.criar_botoes()
         
-        # Sprites e animações
-        self.carregar_sprites()
+        # Sprites e animações (chegam com o carregamento em segundo plano)
+        self.sprites_personagens = {}
         self.frame_atual_jogador = 0
         self.frame_atual_inimigo = 0
         self.tempo_animacao_jogador = 0
@@ -285,6 +340,12 @@ class JokenGhost:
         
         # === NOVO === Spawn de Inimigos após todas as inicializações
         self.gerar_inimigos_aleatorios()
+        
+        # Só o menu e a intro bloqueiam a abertura da janela; a batalha chega enquanto o jogador está neles
+        self.carregador = None
+        self._imagens_prontas = {}  # {(caminho, alpha): superfície já convertida}
+        self._sprites_prontos = {}  # {caminho: sprite_data fatiado e convertido}
+        self.iniciar_carregamento_em_segundo_plano()
     
     def gerar_inimigos_aleatorios(self):
         """Gera de 1 a 3 inimigos aleatoriamente com as probabilidades especificadas"""
@@ -317,39 +378,24 @@ class JokenGhost:
             # Escolhe tipo aleatório
             tipo_escolhido = random.choice(tipos_inimigos)
             
-            inimigo = {
-                'nome': tipo_escolhido['nome'],
-                'tipo': tipo_escolhido['tipo'],  # Campo tipo para descoberta
-                'pos_x': pos_config[0],
-                'pos_y': pos_config[1], 
-                'largura': pos_config[2],
-                'altura': pos_config[3],
-                'z_order': pos_config[4],
-                'pos_original': pos_index,  # Posição original na formação
-                'pos_atual': pos_index,     # Posição atual (muda durante rotação)
-                'vida_atual': tipo_escolhido['vida'],
-                'vida_max': tipo_escolhido['vida'],
-                'vida_visual': float(tipo_escolhido['vida']),
-                'sprites': None,
-                'ativo': True,
-                'frame_atual': 0,
-                'tempo_animacao': 0,
-                'shake': {'ativo': False, 'intensidade': 0, 'tempo': 0, 'offset_x': 0, 'offset_y': 0}
-            }
+            # Posição original (índice na formação) e atual começam iguais; a atual muda na rotação
+            inimigo = Enemy(tipo_escolhido['nome'], tipo_escolhido['tipo'], tipo_escolhido['vida'],
+                            pos_config, pos_index)
             self.inimigos.append(inimigo)
         
         # Atribui sprites do ghost para todos os inimigos
         if hasattr(self, 'sprites_inimigo'):
             for inimigo in self.inimigos:
-                inimigo['sprites'] = self.sprites_inimigo
+                inimigo.sprites = self.sprites_inimigo
+        self.entidades.carregar(self.inimigos)
         
         # Define o primeiro inimigo como ativo (na frente)
         self.inimigo_atual_index = 0
         self.animacao_rotacao_ativa = False
         self.progresso_rotacao = 0.0
         
-        print(f"🎲 Spawned {num_inimigos} inimigo(s) aleatoriamente!")
-        print(f"👁️ Inimigo da frente: {self.inimigos[0]['nome'] if self.inimigos else 'Nenhum'}")
+        log.info("🎲 Spawned %s inimigo(s) aleatoriamente!", num_inimigos)
+        log.debug("👁️ Inimigo da frente: %s", self.inimigos[0]['nome'] if self.inimigos else 'Nenhum')
         return num_inimigos
     
     def iniciar_rotacao_inimigo(self):
@@ -360,7 +406,7 @@ class JokenGhost:
         self.animacao_rotacao_ativa = True
         self.tempo_espera_inimigo = pygame.time.get_ticks()
         self.progresso_rotacao = 0.0
-        print(f"🔄 Iniciando rotação de posições...")
+        log.debug("🔄 Iniciando rotação de posições...")
     
     def atualizar_rotacao_inimigo(self):
         """Atualiza a animação de rotação entre posições dos inimigos"""
@@ -431,7 +477,7 @@ class JokenGhost:
         
         inimigo_frente = self.get_inimigo_na_frente()
         nome_frente = inimigo_frente['nome'] if inimigo_frente else "Nenhum"
-        print(f"✅ Rotação finalizada. Inimigo da frente: {nome_frente}")
+        log.debug("✅ Rotação finalizada. Inimigo da frente: %s", nome_frente)
     
     def lerp(self, start, end, t):
         """Interpolação linear entre dois valores"""
@@ -454,12 +500,100 @@ class JokenGhost:
         if inimigo_frente:
             self.inimigo_atual_index = self.inimigos.index(inimigo_frente)
     
+    def iniciar_carregamento_em_segundo_plano(self):
+        """
+        Inicia o carregamento dos recursos de batalha enquanto o menu e a intro rodam.
+        
+        As imagens são decodificadas em threads (as sprite sheets também são fatiadas e
+        ganham os mipmaps lá); a conversão de cada uma é feita por atualizar_carregamento(),
+        e no fim carregar_fundo_batalha/carregar_sprite_monstruario/carregar_sprites só
+        montam tudo usando as superfícies já convertidas.
+        """
+        carregador = AsyncAssetLoader()
+        
+        def agendar(caminho, alpha):
+            def finalizar(imagem):
+                self._imagens_prontas[(caminho, alpha)] = imagem.convert_alpha() if alpha else imagem.convert()
+            carregador.adicionar(os.path.basename(caminho), lambda: pygame.image.load(caminho), finalizar)
+            
+        def agendar_sprite(caminho):
+            def finalizar(sprite_data):
+                self._sprites_prontos[caminho] = self._converter_sprite_sheet(sprite_data)
+            carregador.adicionar(os.path.basename(caminho), lambda: self._preparar_sprite_sheet(caminho), finalizar)
+            
+        for caminho, alpha in self._listar_imagens_batalha():
+            agendar(caminho, alpha)
+        for caminho in self._listar_sprite_sheets():
+            agendar_sprite(caminho)
+            
+        # Etapas finais na thread principal, depois de todas as conversões
+        carregador.adicionar("fundo de batalha", None, lambda _: self.carregar_fundo_batalha())
+        carregador.adicionar("monstruário", None, lambda _: self.carregar_sprite_monstruario())
+        carregador.adicionar("sprites", None, lambda _: self.carregar_sprites())
+        carregador.adicionar("limpeza", None, lambda _: self._limpar_prontos())
+        
+        self.carregador = carregador
+        carregador.iniciar()
+    
+    def _listar_imagens_batalha(self):
+        """Retorna (caminho, alpha) das imagens lidas por carregar_fundo_batalha e carregar_sprite_monstruario"""
+        sprites_path = os.path.join("Assests", "Sprites")
+        imagens = [
+            (os.path.join(sprites_path, "Scenes", "Caminho Encantado na Floresta.png"), False),
+            (os.path.join(sprites_path, "molders", "Monstruario.png"), True),
+        ]
+        return [(caminho, alpha) for caminho, alpha in imagens if os.path.exists(caminho)]
+    
+    def _listar_sprite_sheets(self):
+        """Retorna as sprite sheets que carregar_sprites vai ler"""
+        caminhos = []
+        sprites_path = os.path.join("Assests", "Sprites")
+        if os.path.exists(sprites_path):
+            for personagem in os.listdir(sprites_path):
+                personagem_path = os.path.join(sprites_path, personagem)
+                if not os.path.isdir(personagem_path):
+                    continue
+                for arquivo in os.listdir(personagem_path):
+                    if os.path.splitext(arquivo)[1].lower() in [".png", ".jpg", ".jpeg", ".bmp"]:
+                        caminhos.append(os.path.join(personagem_path, arquivo))
+        return caminhos
+    
+    def _limpar_prontos(self):
+        """Descarta as imagens e sprites preparadas em segundo plano (já estão em uso)"""
+        self._imagens_prontas.clear()
+        self._sprites_prontos.clear()
+    
+    def _carregar_imagem(self, caminho, alpha=True):
+        """Retorna a imagem já convertida em segundo plano, ou carrega e converte agora"""
+        imagem = self._imagens_prontas.get((caminho, alpha))
+        if imagem is not None:
+            return imagem
+        imagem = pygame.image.load(caminho)
+        return imagem.convert_alpha() if alpha else imagem.convert()
+    
+    def atualizar_carregamento(self):
+        """Avança o carregamento em segundo plano (chamar uma vez por quadro)"""
+        if self.carregador is None:
+            return
+        self.carregador.processar()
+        if self.carregador.concluido():
+            self.carregador = None
+            log.info("✅ Recursos de batalha carregados em segundo plano!")
+    
+    def garantir_recursos_batalha(self):
+        """Conclui o carregamento pendente antes de entrar na batalha"""
+        if self.carregador is None:
+            return
+        self.carregador.concluir()
+        self.carregador = None
+        log.info("✅ Recursos de batalha carregados!")
+    
     def carregar_fundo_batalha(self):
         """Carrega o fundo de batalha da pasta Scenes"""
         try:
             fundo_path = os.path.join("Assests", "Sprites", "Scenes", "Caminho Encantado na Floresta.png")
             if os.path.exists(fundo_path):
-                self.fundo_batalha = pygame.image.load(fundo_path).convert()
+                self.fundo_batalha = self._carregar_imagem(fundo_path, alpha=False)
                 # Escala para o tamanho da tela
                 self.fundo_batalha = pygame.transform.scale(self.fundo_batalha, (LARGURA, ALTURA))
                 print("✅ Fundo de batalha carregado com sucesso!")
@@ -499,7 +633,8 @@ class JokenGhost:
         try:
             monstruario_path = os.path.join("Assests", "Sprites", "molders", "Monstruario.png")
             if os.path.exists(monstruario_path):
-                self.sprite_monstruario = pygame.image.load(monstruario_path).convert_alpha()
+                original = self._carregar_imagem(monstruario_path)
+                self.sprite_monstruario = escalar_suave(original, TAMANHO_LIVRO_MONSTRUARIO)
                 print("✅ Sprite do Monstruário carregada com sucesso!")
             else:
                 print("⚠️ Sprite do Monstruário não encontrada")
@@ -511,7 +646,8 @@ class JokenGhost:
         try:
             caminho_carta = os.path.join("Assests", "Sprites", "Scenes", "card_inicial.png")
             if os.path.exists(caminho_carta):
-                self.carta_imagem = pygame.image.load(caminho_carta).convert_alpha()
+                original = pygame.image.load(caminho_carta).convert_alpha()
+                self.carta_imagem = escalar_suave(original, TAMANHO_CARTA)
                 print("✅ Carta da intro carregada com sucesso!")
             else:
                 print(f"⚠️ Carta não encontrada em: {caminho_carta}")
@@ -534,7 +670,7 @@ class JokenGhost:
         shake_data['tempo'] = pygame.time.get_ticks()
         shake_data['offset_x'] = 0
         shake_data['offset_y'] = 0
-        print(f"🎬 Shake iniciado para {'jogador' if eh_jogador else 'inimigo'} (intensidade: {intensidade})")
+        log.debug("🎬 Shake iniciado para %s (intensidade: %s)", 'jogador' if eh_jogador else 'inimigo', intensidade)
     
     def atualizar_shake(self, shake_data):
         """Atualiza o efeito de shake"""
@@ -571,7 +707,7 @@ class JokenGhost:
             'ativo': True
         }
         self.moedas_flutuantes.append(moeda)
-        print(f"💰 Criada moeda flutuante: +{valor} na posição ({x}, {y})")
+        log.debug("💰 Criada moeda flutuante: +%s na posição (%s, %s)", valor, x, y)
     
     def atualizar_moedas_flutuantes(self):
         """Atualiza a posição e transparência das moedas flutuantes"""
@@ -610,27 +746,20 @@ class JokenGhost:
             # Calcula transparência (fade-out)
             alpha = max(0, int(255 * (1 - progresso)))
             
-            # Cria texto com transparência
-            texto = self.fonte_pequena.render(f"+{moeda['valor']}", True, (255, 215, 0))  # Cor dourada
-            
-            # Aplica transparência
-            if alpha < 255:
-                texto.set_alpha(alpha)
-            
-            # Desenha o texto
-            self.tela.blit(texto, (moeda['x'], moeda['y']))
+            # Desenha o texto com transparência pelo atlas de glifos
+            self.glifos_pequena.desenhar(self.tela, f"+{moeda['valor']}", (moeda['x'], moeda['y']), (255, 215, 0), alpha)  # Cor dourada
     
     def esconder_botoes_ataque(self):
         """Inicia animação para esconder os botões de ataque"""
         self.botoes_animacao_ativa = True
         self.animacao_escondendo = True
-        print("🔽 Escondendo botões de ataque...")
+        log.debug("🔽 Escondendo botões de ataque...")
     
     def mostrar_botoes_ataque(self):
         """Inicia animação para mostrar os botões de ataque"""
         self.botoes_animacao_ativa = True
         self.animacao_escondendo = False
-        print("🔼 Mostrando botões de ataque...")
+        log.debug("🔼 Mostrando botões de ataque...")
     
     def atualizar_animacao_botoes(self):
         """Atualiza a animação dos botões de ataque"""
@@ -639,13 +768,13 @@ class JokenGhost:
         
         if hasattr(self, 'animacao_escondendo') and self.animacao_escondendo:
             # Escondendo botões - movendo para baixo
-            self.botoes_pos_y_atual += self.velocidade_animacao_botoes
+            self.botoes_pos_y_atual += self.velocidade_animacao_botoes * self.fator_quadro
             if self.botoes_pos_y_atual >= self.botoes_pos_y_escondido:
                 self.botoes_pos_y_atual = self.botoes_pos_y_escondido
                 self.botoes_animacao_ativa = False
         else:
             # Mostrando botões - movendo para cima
-            self.botoes_pos_y_atual -= self.velocidade_animacao_botoes
+            self.botoes_pos_y_atual -= self.velocidade_animacao_botoes * self.fator_quadro
             if self.botoes_pos_y_atual <= self.botoes_pos_y_original:
                 self.botoes_pos_y_atual = self.botoes_pos_y_original
                 self.botoes_animacao_ativa = False
@@ -699,13 +828,13 @@ class JokenGhost:
         self.menu_selecao_ativo = True
         self.tipo_menu_atual = tipo_menu
         self.menu_altura = 0  # Começa fechado
-        print(f"📋 Abrindo menu: {tipo_menu.name}")
+        log.debug("📋 Abrindo menu: %s", tipo_menu.name)
     
     def fechar_menu_selecao(self):
         """Fecha o menu de seleção"""
         self.menu_selecao_ativo = False
         self.menu_altura = 0
-        print("📋 Fechando menu de seleção")
+        log.debug("📋 Fechando menu de seleção")
         
     def carregar_sprites(self):
         """Carrega sprites organizadas por personagem"""
@@ -733,67 +862,8 @@ class JokenGhost:
                         if extensao.lower() in [".png", ".jpg", ".jpeg", ".bmp"]:
                             try:
                                 sprite_path = os.path.join(personagem_path, arquivo)
-                                sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-                                
-                                # === NOVO === Detecção Inteligente de Frames
-                                sheet_width = sprite_sheet.get_width()
-                                sheet_height = sprite_sheet.get_height()
-                                
-                                # Detecta se é sprite sheet horizontal, vertical ou única
-                                if sheet_width > sheet_height:
-                                    # Sprite sheet horizontal - detecta frames quadrados
-                                    if sheet_width >= sheet_height * 2:
-                                        frame_height = sheet_height
-                                        frame_width = frame_height  # Frames quadrados
-                                        total_frames = sheet_width // frame_width
-                                        print(f"    🎬 Sprite horizontal: {total_frames} frames de {frame_width}x{frame_height}")
-                                    else:
-                                        # Apenas 2 frames lado a lado
-                                        frame_width = sheet_width // 2
-                                        frame_height = sheet_height
-                                        total_frames = 2
-                                        print(f"    🎬 Sprite dupla: {total_frames} frames de {frame_width}x{frame_height}")
-                                elif sheet_height > sheet_width:
-                                    # Sprite sheet vertical
-                                    if sheet_height >= sheet_width * 2:
-                                        frame_width = sheet_width
-                                        frame_height = frame_width  # Frames quadrados
-                                        total_frames = sheet_height // frame_height
-                                        print(f"    🎬 Sprite vertical: {total_frames} frames de {frame_width}x{frame_height}")
-                                    else:
-                                        # Apenas 2 frames empilhados
-                                        frame_width = sheet_width
-                                        frame_height = sheet_height // 2
-                                        total_frames = 2
-                                        print(f"    🎬 Sprite dupla vertical: {total_frames} frames de {frame_width}x{frame_height}")
-                                else:
-                                    # Sprite única (quadrada)
-                                    frame_width = sheet_width
-                                    frame_height = sheet_height
-                                    total_frames = 1
-                                    print(f"    🎬 Sprite única: {frame_width}x{frame_height}")
-                                
-                                # === NOVO === Detecção automática baseada em proporções padrão
-                                # Se a largura é múltiplo exato da altura, pode ser múltiplos frames
-                                if total_frames == 1 and sheet_width > sheet_height:
-                                    # Tenta detectar múltiplos frames baseado em proporções comuns
-                                    proporcoes_comuns = [2, 3, 4, 5, 6, 8, 10, 12]
-                                    for frames in proporcoes_comuns:
-                                        if sheet_width % frames == 0:
-                                            test_frame_width = sheet_width // frames
-                                            if abs(test_frame_width - sheet_height) <= 5:  # Tolerância para frames quase quadrados
-                                                frame_width = test_frame_width
-                                                frame_height = sheet_height
-                                                total_frames = frames
-                                                print(f"    🎯 Auto-detectado: {total_frames} frames de {frame_width}x{frame_height}")
-                                                break
-                                
-                                sprite_data = {
-                                    'sheet': sprite_sheet,
-                                    'frame_width': frame_width,
-                                    'frame_height': frame_height,
-                                    'total_frames': total_frames
-                                }
+                                # Fatiada e com mipmaps (em segundo plano, se o carregamento já passou por ela)
+                                sprite_data = self._obter_sprite_sheet(sprite_path)
                                 
                                 # Determina o tipo de animação pelo nome
                                 nome_limpo = nome.lower().replace('_sheet', '').replace('-sheet', '')
@@ -872,37 +942,146 @@ class JokenGhost:
         print("🔄 Usando sistema legado de sprites...")
         # Código do sistema antigo aqui se necessário
     
-    def extrair_sprite(self, sprite_data, frame_index):
-        """Extrai um frame específico do sprite sheet"""
-        if not sprite_data:
-            return None
-            
-        sprite_sheet = sprite_data['sheet']
-        frame_width = sprite_data['frame_width']
-        frame_height = sprite_data['frame_height']
-        total_frames = sprite_data['total_frames']
+    def _preparar_sprite_sheet(self, caminho):
+        """Lê, fatia e gera os mipmaps de uma sprite sheet sem usar a tela (roda nas threads do carregador)"""
+        sprite_sheet = pygame.image.load(caminho)
+        if sprite_sheet.get_bitsize() != 32 or not sprite_sheet.get_flags() & pygame.SRCALPHA:
+            sprite_sheet = sprite_sheet.convert(32, pygame.SRCALPHA)
         
-        # Garante que o frame_index está dentro dos limites
-        frame_index = frame_index % total_frames
+        # === NOVO === Detecção Inteligente de Frames
+        sheet_width = sprite_sheet.get_width()
+        sheet_height = sprite_sheet.get_height()
         
-        # Calcula a posição do frame
+        # Detecta se é sprite sheet horizontal, vertical ou única
+        if sheet_width > sheet_height:
+            # Sprite sheet horizontal - detecta frames quadrados
+            if sheet_width >= sheet_height * 2:
+                frame_height = sheet_height
+                frame_width = frame_height  # Frames quadrados
+                total_frames = sheet_width // frame_width
+                print(f"    🎬 Sprite horizontal: {total_frames} frames de {frame_width}x{frame_height}")
+            else:
+                # Apenas 2 frames lado a lado
+                frame_width = sheet_width // 2
+                frame_height = sheet_height
+                total_frames = 2
+                print(f"    🎬 Sprite dupla: {total_frames} frames de {frame_width}x{frame_height}")
+        elif sheet_height > sheet_width:
+            # Sprite sheet vertical
+            if sheet_height >= sheet_width * 2:
+                frame_width = sheet_width
+                frame_height = frame_width  # Frames quadrados
+                total_frames = sheet_height // frame_height
+                print(f"    🎬 Sprite vertical: {total_frames} frames de {frame_width}x{frame_height}")
+            else:
+                # Apenas 2 frames empilhados
+                frame_width = sheet_width
+                frame_height = sheet_height // 2
+                total_frames = 2
+                print(f"    🎬 Sprite dupla vertical: {total_frames} frames de {frame_width}x{frame_height}")
+        else:
+            # Sprite única (quadrada)
+            frame_width = sheet_width
+            frame_height = sheet_height
+            total_frames = 1
+            print(f"    🎬 Sprite única: {frame_width}x{frame_height}")
+        
+        # === NOVO === Detecção automática baseada em proporções padrão
+        # Se a largura é múltiplo exato da altura, pode ser múltiplos frames
+        if total_frames == 1 and sheet_width > sheet_height:
+            # Tenta detectar múltiplos frames baseado em proporções comuns
+            proporcoes_comuns = [2, 3, 4, 5, 6, 8, 10, 12]
+            for frames in proporcoes_comuns:
+                if sheet_width % frames == 0:
+                    test_frame_width = sheet_width // frames
+                    if abs(test_frame_width - sheet_height) <= 5:  # Tolerância para frames quase quadrados
+                        frame_width = test_frame_width
+                        frame_height = sheet_height
+                        total_frames = frames
+                        print(f"    🎯 Auto-detectado: {total_frames} frames de {frame_width}x{frame_height}")
+                        break
+        
+        sprite_data = {
+            'sheet': sprite_sheet,
+            'frame_width': frame_width,
+            'frame_height': frame_height,
+            'total_frames': total_frames,
+            'tabela_frames': self.fatiar_frames(sprite_sheet, frame_width, frame_height, total_frames)
+        }
+        self.aplicar_mipmaps(sprite_data)
+        return sprite_data
+    
+    def _converter_sprite_sheet(self, sprite_data):
+        """Converte a sheet e os mipmaps para o formato da tela (thread principal); os frames voltam a ser subsurfaces"""
+        sheet = sprite_data['sheet'].convert_alpha()
+        tabela = tuple(sheet.subsurface((frame.get_abs_offset(), frame.get_size()))
+                       for frame in sprite_data['tabela_frames'])
+        sprite_data['sheet'] = sheet
+        sprite_data['tabela_frames'] = tabela
+        # O nível 0 é o próprio frame; os menores são superfícies soltas
+        sprite_data['mipmaps'] = tuple((frame,) + tuple(nivel.convert_alpha() for nivel in cadeia[1:])
+                                       for frame, cadeia in zip(tabela, sprite_data['mipmaps']))
+        return sprite_data
+    
+    def _obter_sprite_sheet(self, caminho):
+        """Retorna a sprite sheet já preparada em segundo plano, ou prepara e converte agora"""
+        sprite_data = self._sprites_prontos.get(caminho)
+        if sprite_data is not None:
+            return dict(sprite_data)
+        return self._converter_sprite_sheet(self._preparar_sprite_sheet(caminho))
+    
+    def fatiar_frames(self, sprite_sheet, frame_width, frame_height, total_frames):
+        """Fatia a sprite sheet uma única vez em uma tupla de subsurfaces (sem cópia de pixels)"""
         sheet_width = sprite_sheet.get_width()
         sheet_height = sprite_sheet.get_height()
+        frame_width = max(1, min(frame_width, sheet_width))
+        frame_height = max(1, min(frame_height, sheet_height))
         
         if sheet_width > sheet_height:
             # Sprite sheet horizontal
-            x = frame_index * frame_width
-            y = 0
+            posicoes = [(i * frame_width, 0) for i in range(min(total_frames, sheet_width // frame_width))]
         else:
             # Sprite sheet vertical ou único
-            x = 0
-            y = frame_index * frame_height
+            posicoes = [(0, i * frame_height) for i in range(min(total_frames, sheet_height // frame_height))]
+        
+        if not posicoes:
+            posicoes = [(0, 0)]
+        
+        return tuple(sprite_sheet.subsurface((x, y, frame_width, frame_height)) for x, y in posicoes)
+    
+    def aplicar_mipmaps(self, sprite_data):
+        """Gera os mipmaps dos frames e troca a sheet original pelo maior nível mantido"""
+        tabela = sprite_data['tabela_frames']
+        cadeias = [gerar_cadeia_mip(frame) for frame in tabela]
+        topo = [cadeia[0] for cadeia in cadeias]
+        
+        if topo[0].get_size() != tabela[0].get_size():
+            horizontal = sprite_data['sheet'].get_width() > sprite_data['sheet'].get_height()
+            nova_sheet, posicoes = montar_sheet(topo, horizontal)
+            frame_width, frame_height = topo[0].get_size()
+            tabela = tuple(nova_sheet.subsurface((x, y, frame_width, frame_height)) for x, y in posicoes)
+            cadeias = [(frame,) + cadeia[1:] for frame, cadeia in zip(tabela, cadeias)]
+            
+            sprite_data['sheet'] = nova_sheet
+            sprite_data['frame_width'] = frame_width
+            sprite_data['frame_height'] = frame_height
+            sprite_data['tabela_frames'] = tabela
+        
+        sprite_data['mipmaps'] = tuple(cadeias)
+    
+    def extrair_sprite(self, sprite_data, frame_index):
+        """Retorna um frame específico da tabela pré-fatiada do sprite sheet"""
+        if not sprite_data:
+            return None
         
-        # Cria uma nova superfície para o frame
-        frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-        frame_surface.blit(sprite_sheet, (0, 0), (x, y, frame_width, frame_height))
+        tabela = sprite_data.get('tabela_frames')
+        if tabela is None:
+            tabela = self.fatiar_frames(sprite_data['sheet'], sprite_data['frame_width'],
+                                        sprite_data['frame_height'], sprite_data['total_frames'])
+            sprite_data['tabela_frames'] = tabela
         
-        return frame_surface
+        # Garante que o frame_index está dentro dos limites
+        return tabela[frame_index % len(tabela)]
         
     def criar_botoes(self):
         # Botão jogar no menu
@@ -953,7 +1132,12 @@ class JokenGhost:
             'ativo': True
         }
     
-    def desenhar_botao(self, botao_key, mouse_pos):
+    def renderizar_texto(self, fonte, texto, cor, alpha=None):
+        """Renderiza um texto pelo cache de textos (a superfície é compartilhada, não desenhe nela)"""
+        return self.cache_textos.renderizar(fonte, texto, cor, True, alpha)
+    
+    def desenhar_botao(self, botao_key, mouse_pos, tela=None):
+        tela = tela or self.tela
         botao = self.botoes[botao_key]
         if not botao['ativo']:
             return
@@ -961,31 +1145,23 @@ class JokenGhost:
         # Verifica se o mouse está sobre o botão
         hover = botao['rect'].collidepoint(mouse_pos)
         
-        # Usa moldura personalizada se disponível
+        # Usa moldura personalizada se disponível, já montada com o hover e o texto (um único blit)
         if self.moldura_itens:
-            # Escala a moldura para o tamanho do botão
-            moldura_escalada = pygame.transform.scale(self.moldura_itens, (botao['rect'].width, botao['rect'].height))
+            botao_pronto = self.molduras_prontas.obter(
+                self.moldura_itens, botao['rect'].size, 'hover' if hover else 'normal',
+                BORDA_MOLDURA_ITENS, botao['texto'], self.fonte_texto, BRANCO)  # Alterado: PRETO -> BRANCO
+            tela.blit(botao_pronto, botao['rect'])
+            return
             
-            # Aplica um filtro de cor se hover
-            if hover:
-                # Cria uma superfície com transparência para o efeito hover
-                overlay = pygame.Surface((botao['rect'].width, botao['rect'].height))
-                overlay.fill((255, 255, 255))
-                overlay.set_alpha(30)  # Transparência leve
-                moldura_escalada.blit(overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-            
-            # Desenha a moldura
-            self.tela.blit(moldura_escalada, botao['rect'])
-        else:
-            # Fallback para moldura desenhada
-            cor = MARROM_LOJA_CLARO if hover else MARROM_LOJA
-            pygame.draw.rect(self.tela, cor, botao['rect'])
-            pygame.draw.rect(self.tela, PRETO, botao['rect'], 3)
+        # Fallback para moldura desenhada
+        cor = MARROM_LOJA_CLARO if hover else MARROM_LOJA
+        pygame.draw.rect(tela, cor, botao['rect'])
+        pygame.draw.rect(tela, PRETO, botao['rect'], 3)
         
         # Desenha o texto
-        texto = self.fonte_texto.render(botao['texto'], True, BRANCO)  # Alterado: PRETO -> BRANCO
+        texto = self.renderizar_texto(self.fonte_texto, botao['texto'], BRANCO)  # Alterado: PRETO -> BRANCO
         texto_rect = texto.get_rect(center=botao['rect'].center)
-        self.tela.blit(texto, texto_rect)
+        tela.blit(texto, texto_rect)
     
     def verificar_clique_botao(self, pos):
         for key, botao in self.botoes.items():
@@ -997,12 +1173,12 @@ class JokenGhost:
         self.tela.fill(AZUL)
         
         # Título
-        titulo = self.fonte_titulo.render("JOKENGHOST", True, BRANCO)
+        titulo = self.renderizar_texto(self.fonte_titulo, "JOKENGHOST", BRANCO)
         titulo_rect = titulo.get_rect(center=(LARGURA//2, ALTURA//3))
         self.tela.blit(titulo, titulo_rect)
         
         # Subtítulo
-        subtitulo = self.fonte_texto.render("Caçada em Turnos", True, BRANCO)
+        subtitulo = self.renderizar_texto(self.fonte_texto, "Caçada em Turnos", BRANCO)
         subtitulo_rect = subtitulo.get_rect(center=(LARGURA//2, ALTURA//3 + 80))
         self.tela.blit(subtitulo, subtitulo_rect)
         
@@ -1012,19 +1188,35 @@ class JokenGhost:
 
         # === NOVO === HUD Dinheiro
         self.desenhar_hud_dinheiro()
+        
+        # Recursos de batalha chegando em segundo plano
+        if self.carregador is not None:
+            self.dirty_rects.registrar('carregamento', self.desenhar_barra_carregamento(self.carregador.progresso()))
+    
+    def desenhar_barra_carregamento(self, progresso):
+        """Desenha a barra de progresso do carregamento em segundo plano e retorna sua área"""
+        largura, altura = 300, 14
+        x = (LARGURA - largura) // 2
+        y = ALTURA - 60
+        pygame.draw.rect(self.tela, PRETO, (x, y, largura, altura), border_radius=5)
+        preenchido = int((largura - 4) * max(0.0, min(1.0, progresso)))
+        if preenchido > 0:
+            pygame.draw.rect(self.tela, BRANCO, (x + 2, y + 2, preenchido, altura - 4), border_radius=4)
+        
+        texto = self.renderizar_texto(self.fonte_pequena, f"Carregando... {int(progresso * 100)}%", BRANCO)
+        texto_rect = texto.get_rect(center=(LARGURA // 2, y - 14))
+        self.tela.blit(texto, texto_rect)
+        return texto_rect.union(pygame.Rect(x, y, largura, altura))
     
     def desenhar_transicao(self):
         self.tela.fill(PRETO)
         
         # Efeito de fade
-        superficie_fade = pygame.Surface((LARGURA, ALTURA))
-        superficie_fade.fill(BRANCO)
-        superficie_fade.set_alpha(self.transicao_alpha)
-        self.tela.blit(superficie_fade, (0, 0))
+        self.overlays.desenhar(self.tela, (0, 0), (LARGURA, ALTURA), BRANCO, self.transicao_alpha)
         
         # Texto de transição
         if self.transicao_alpha > 128:
-            texto = self.fonte_titulo.render("UM GHOST APARECEU!", True, PRETO)
+            texto = self.renderizar_texto(self.fonte_titulo, "UM GHOST APARECEU!", PRETO)
             texto_rect = texto.get_rect(center=(LARGURA//2, ALTURA//2))
             self.tela.blit(texto, texto_rect)
 
@@ -1037,8 +1229,8 @@ class JokenGhost:
         
         # Desenha a carta se disponível, mas redimensionada
         if self.carta_imagem:
-            # Redimensiona a carta para um tamanho menor
-            carta_redimensionada = pygame.transform.scale(self.carta_imagem, (300, 200))
+            # Carta já escalada em carregar_carta()
+            carta_redimensionada = self.carta_imagem
             carta_rect = carta_redimensionada.get_rect()
             carta_x = (LARGURA - carta_rect.width) // 2
             carta_y = 30  # Um pouco mais próximo do topo
@@ -1055,7 +1247,7 @@ class JokenGhost:
         # Renderiza o texto da história
         for i, linha in enumerate(self.textos_intro):
             if linha:  # Se não é linha vazia
-                superficie_texto = self.fonte_pequena.render(linha, True, BRANCO)  # Fonte menor
+                superficie_texto = self.renderizar_texto(self.fonte_pequena, linha, BRANCO)  # Fonte menor
                 texto_rect = superficie_texto.get_rect()
                 texto_rect.centerx = LARGURA // 2
                 texto_rect.y = texto_y_inicio + (i * linha_altura)
@@ -1065,7 +1257,7 @@ class JokenGhost:
                     self.tela.blit(superficie_texto, texto_rect)
         
         # Seta sempre visível
-        seta_texto = self.fonte_pequena.render("▼ Pressione ESPAÇO para continuar", True, (255, 255, 0))  # Amarelo
+        seta_texto = self.renderizar_texto(self.fonte_pequena, "▼ Pressione ESPAÇO para continuar", (255, 255, 0))  # Amarelo
         seta_rect = seta_texto.get_rect(center=(LARGURA//2, ALTURA - 30))
         self.tela.blit(seta_texto, seta_rect)
     
@@ -1080,7 +1272,7 @@ class JokenGhost:
         pygame.draw.rect(self.tela, cor, (x, y, largura_vida, 20))
         
         # Texto da vida
-        texto_vida = self.fonte_pequena.render(f"{vida_atual}/{vida_maxima}", True, BRANCO)
+        texto_vida = self.renderizar_texto(self.fonte_pequena, f"{vida_atual}/{vida_maxima}", BRANCO)
         self.tela.blit(texto_vida, (x + largura//2 - texto_vida.get_width()//2, y - 25))
     
     def desenhar_personagem(self, x, y, largura, altura, cor, nome, sprites_personagem=None, animacao="idle", frame=0, espelhar=False, shake_data=None):
@@ -1094,17 +1286,16 @@ class JokenGhost:
         if sprites_personagem and animacao in sprites_personagem:
             # Usa a animação específica
             sprite_data = sprites_personagem[animacao]
-            sprite_frame = self.extrair_sprite(sprite_data, frame)
+            if sprite_data and sprite_data.get('mipmaps'):
+                # Usa o nível de mipmap mais próximo do tamanho de desenho
+                mipmaps = sprite_data['mipmaps']
+                sprite_frame = escolher_nivel(mipmaps[frame % len(mipmaps)], largura, altura)
+            else:
+                sprite_frame = self.extrair_sprite(sprite_data, frame)
             
             if sprite_frame:
-                # Escala o sprite para o tamanho desejado
-                sprite_escalado = pygame.transform.scale(sprite_frame, (largura, altura))
-                
-                # Espelha o sprite se necessário
-                if espelhar:
-                    sprite_escalado = pygame.transform.flip(sprite_escalado, True, False)
-                
-                self.tela.blit(sprite_escalado, (final_x, final_y))
+                # Escala (e espelha) usando o cache de sprites escalados
+                self.sprite_cache.desenhar(self.tela, sprite_frame, final_x, final_y, largura, altura, espelhar)
             else:
                 # Fallback para bloco se der erro
                 pygame.draw.rect(self.tela, cor, (final_x, final_y, largura, altura))
@@ -1116,22 +1307,68 @@ class JokenGhost:
         
         # Nome do personagem (se fornecido)
         if nome:
-            texto_nome = self.fonte_texto.render(nome, True, PRETO)
+            texto_nome = self.renderizar_texto(self.fonte_texto, nome, PRETO)
             nome_rect = texto_nome.get_rect(center=(final_x + largura//2, final_y + altura + 20))
             self.tela.blit(texto_nome, nome_rect)
         
         # === NOVO === Retorna as coordenadas finais para posicionamento da barra de vida
         return (final_x, final_y, largura, altura)
     
+    def desenhar_camada_estatica_batalha(self):
+        """Desenha cenário, barra de informações, botões e HUD de dinheiro (pré-compostos) em um único blit.
+
+        Enquanto os botões deslizam, eles ficam fora da camada e são desenhados por cima dela a cada frame.
+        """
+        mouse_pos = pygame.mouse.get_pos()
+        inimigos_vivos = sum(1 for inimigo in self.inimigos if inimigo['ativo'] and inimigo['vida_atual'] > 0)
+        inimigo_frente = self.get_inimigo_na_frente()
+        inimigo_frente_nome = inimigo_frente['nome'] if inimigo_frente else "Nenhum"
+        texto_info = f"Inimigo da frente: {inimigo_frente_nome} | Total: {inimigos_vivos} | Pressione R para gerar novos"
+        
+        botoes = []
+        if not self.animacao_entrada_ativa and not self.menu_selecao_ativo:
+            for botao_key in ('ataques', 'loja_menu', 'status'):
+                rect = self.botoes[botao_key]['rect']
+                botoes.append((botao_key, tuple(rect), rect.collidepoint(mouse_pos)))
+        # Botões em movimento mudariam a chave todo frame: ficam fora da camada
+        botoes_animados = botoes if self.botoes_animacao_ativa else []
+        if botoes_animados:
+            botoes = []
+        
+        # A camada só é redesenhada quando algum desses valores muda
+        chave = (id(self.fundo_batalha), texto_info, self.dinheiro, tuple(botoes))
+        
+        def desenhar(camada):
+            # === NOVO === Fundo de Batalha da pasta Scenes
+            if self.fundo_batalha:
+                camada.blit(self.fundo_batalha, (0, 0))
+            else:
+                # Fallback para fundo padrão
+                camada.fill(VERDE)
+                # Desenha o chão com perspectiva
+                pygame.draw.rect(camada, (34, 139, 34), (0, ALTURA - 150, LARGURA, 150))
+            
+            # Texto de informação sobre inimigos ativos
+            superficie_info = self.renderizar_texto(self.fonte_pequena, texto_info, BRANCO)
+            fundo_texto = pygame.Rect(10, ALTURA - 40, superficie_info.get_width() + 10, 30)
+            pygame.draw.rect(camada, MARROM_LOJA, fundo_texto, border_radius=5)
+            pygame.draw.rect(camada, PRETO, fundo_texto, 2, border_radius=5)
+            camada.blit(superficie_info, (15, ALTURA - 35))
+            
+            # === NOVO === Botões Principais (só aparecem se não está na animação de entrada e menu não está ativo)
+            for botao_key, _, _ in botoes:
+                self.desenhar_botao(botao_key, mouse_pos, camada)
+            
+            # HUD Dinheiro
+            self.desenhar_hud_dinheiro(camada)
+        
+        self.compositor.desenhar_camada(self.tela, 'batalha', chave, desenhar)
+        for botao_key, _, _ in botoes_animados:
+            self.desenhar_botao(botao_key, mouse_pos)
+    
     def desenhar_batalha(self):
-        # === NOVO === Fundo de Batalha da pasta Scenes
-        if self.fundo_batalha:
-            self.tela.blit(self.fundo_batalha, (0, 0))
-        else:
-            # Fallback para fundo padrão
-            self.tela.fill(VERDE)
-            # Desenha o chão com perspectiva
-            pygame.draw.rect(self.tela, (34, 139, 34), (0, ALTURA - 150, LARGURA, 150))
+        # === NOVO === Camada estática (cenário + HUD)
+        self.desenhar_camada_estatica_batalha()
         
         # === NOVO === Personagem Jogador
         animacao_jogador = "idle" if self.estado_animacao_jogador == EstadoAnimacao.IDLE else "ataque"
@@ -1140,20 +1377,20 @@ class JokenGhost:
                                                       frame=self.frame_atual_jogador, espelhar=False, shake_data=self.shake_jogador)
         
         # === NOVO === Todos os inimigos visíveis (ordenados por profundidade)
-        inimigos_ativos = [inimigo for inimigo in self.inimigos if inimigo['ativo']]
+        inimigos_ativos = [inimigo for inimigo in self.inimigos if inimigo.ativo]
         
         # Ordena por z_order (menor primeiro = mais atrás)
-        inimigos_ativos.sort(key=lambda x: x['z_order'])
+        inimigos_ativos.sort(key=lambda x: x.z_order)
         
         coordenadas_inimigos = []
         for inimigo in inimigos_ativos:
-            if inimigo['vida_atual'] > 0:  # Só desenha se estiver vivo
+            if inimigo.vida_atual > 0:  # Só desenha se estiver vivo
                 animacao_inimigo = "idle"
                 
                 coordenadas_inimigo = self.desenhar_personagem(
-                    inimigo['pos_x'], inimigo['pos_y'], inimigo['largura'], inimigo['altura'], 
-                    VERMELHO, "", sprites_personagem=inimigo['sprites'], 
-                    animacao=animacao_inimigo, frame=inimigo['frame_atual'], shake_data=inimigo['shake']
+                    inimigo.pos_x, inimigo.pos_y, inimigo.largura, inimigo.altura, 
+                    VERMELHO, "", sprites_personagem=inimigo.sprites, 
+                    animacao=animacao_inimigo, frame=inimigo.frame_atual, shake_data=inimigo.shake
                 )
                 
                 # Adiciona barra de vida automática
@@ -1169,8 +1406,8 @@ class JokenGhost:
             
             # === NOVO === Apenas nome para inimigos (sem números de vida)
             self.desenhar_barra_vida_automatica(sprite_x, sprite_y, sprite_largura, sprite_altura, 
-                                               inimigo['vida_visual'], inimigo['vida_max'], 
-                                               inimigo['nome'], largura_barra, 
+                                               inimigo.vida_visual, inimigo.vida_max, 
+                                               inimigo.nome, largura_barra, 
                                                mostrar_numeros=False)  # Novo parâmetro
         
         # === Barra de Vida do Jogador ===
@@ -1179,23 +1416,6 @@ class JokenGhost:
             self.desenhar_barra_vida_automatica(sprite_x, sprite_y, sprite_largura, sprite_altura, 
                                                self.vida_jogador_visual, self.vida_max_jogador, "VOCÊ")
         
-        # Texto de informação sobre inimigos ativos
-        inimigos_vivos = sum(1 for inimigo in self.inimigos if inimigo['ativo'] and inimigo['vida_atual'] > 0)
-        inimigo_frente = self.get_inimigo_na_frente()
-        inimigo_frente_nome = inimigo_frente['nome'] if inimigo_frente else "Nenhum"
-        texto_info = self.fonte_pequena.render(f"Inimigo da frente: {inimigo_frente_nome} | Total: {inimigos_vivos} | Pressione R para gerar novos", True, BRANCO)
-        fundo_texto = pygame.Rect(10, ALTURA - 40, texto_info.get_width() + 10, 30)
-        pygame.draw.rect(self.tela, MARROM_LOJA, fundo_texto, border_radius=5)
-        pygame.draw.rect(self.tela, PRETO, fundo_texto, 2, border_radius=5)
-        self.tela.blit(texto_info, (15, ALTURA - 35))
-        
-        # === NOVO === Botões Principais (só aparecem se não está na animação de entrada e menu não está ativo)
-        if not self.animacao_entrada_ativa and not self.menu_selecao_ativo:
-            mouse_pos = pygame.mouse.get_pos()
-            self.desenhar_botao('ataques', mouse_pos)
-            self.desenhar_botao('loja_menu', mouse_pos)
-            self.desenhar_botao('status', mouse_pos)
-        
         # === NOVO === Menu de Seleção Animado
         if self.menu_selecao_ativo:
             self.desenhar_menu_selecao()
@@ -1214,8 +1434,8 @@ class JokenGhost:
             pygame.draw.rect(self.tela, MARROM_LOJA, caixa_texto, border_radius=10)
             pygame.draw.rect(self.tela, PRETO, caixa_texto, 3, border_radius=10)
             
-            texto_jogador = self.fonte_texto.render(f"Você usou: {escolha_jogador_texto}", True, PRETO)
-            texto_inimigo = self.fonte_texto.render(f"{nome_inimigo} usou: {escolha_inimigo_texto}", True, PRETO)
+            texto_jogador = self.renderizar_texto(self.fonte_texto, f"Você usou: {escolha_jogador_texto}", PRETO)
+            texto_inimigo = self.renderizar_texto(self.fonte_texto, f"{nome_inimigo} usou: {escolha_inimigo_texto}", PRETO)
             
             self.tela.blit(texto_jogador, (caixa_texto.x + 10, caixa_texto.y + 10))
             self.tela.blit(texto_inimigo, (caixa_texto.x + 10, caixa_texto.y + 40))
@@ -1223,7 +1443,7 @@ class JokenGhost:
             # Resultado da batalha
             if self.resultado_batalha:
                 cor_resultado = VERDE if "Você ganhou" in self.resultado_batalha else VERMELHO if "perdeu" in self.resultado_batalha else AMARELO
-                texto_resultado = self.fonte_titulo.render(self.resultado_batalha, True, cor_resultado)
+                texto_resultado = self.renderizar_texto(self.fonte_titulo, self.resultado_batalha, cor_resultado)
                 resultado_rect = texto_resultado.get_rect(center=(LARGURA//2, ALTURA//2))
                 
                 # Fundo para o texto do resultado
@@ -1236,62 +1456,70 @@ class JokenGhost:
 
         # === NOVO === Moedas Flutuantes
         self.desenhar_moedas_flutuantes()
-
-        # HUD Dinheiro
-        self.desenhar_hud_dinheiro()
     
     def desenhar_menu_selecao(self):
         """Desenha o menu de seleção animado"""
         # Posição do menu (desliza de baixo para cima)
         menu_y = ALTURA - self.menu_altura
-        menu_rect = pygame.Rect(0, menu_y, LARGURA, self.menu_altura)
-        
-        # Fundo do menu com cor marrom
-        pygame.draw.rect(self.tela, MARROM_LOJA, menu_rect, border_radius=20)
-        pygame.draw.rect(self.tela, PRETO, menu_rect, 3, border_radius=20)
         
-        if self.menu_altura > 50:  # Só desenha conteúdo quando menu está suficientemente aberto
-            # Título do menu
-            titulo = ""
+        # Título do menu
+        titulo = ""
+        if self.tipo_menu_atual == TipoMenu.ATAQUES:
+            titulo = "ESCOLHA SEU ATAQUE"
+        elif self.tipo_menu_atual == TipoMenu.LOJA:
+            titulo = "LOJA - COMPRAR ITENS"
+        aberto = self.menu_altura > 50  # Só desenha conteúdo quando menu está suficientemente aberto
+        
+        # Fundo, título e botão fechar ficam na superfície do painel (refeita só quando a altura muda)
+        self.painel_menu.mover((0, menu_y))
+        self.painel_menu.redimensionar((LARGURA, self.menu_altura))
+        self.painel_menu.atualizar(titulo=titulo if aberto else None, aberto=aberto)
+        self.painel_menu.desenhar(self.tela)
+        
+        if aberto:
             if self.tipo_menu_atual == TipoMenu.ATAQUES:
-                titulo = "ESCOLHA SEU ATAQUE"
                 self.desenhar_menu_ataques(menu_y)
             elif self.tipo_menu_atual == TipoMenu.LOJA:
-                titulo = "LOJA - COMPRAR ITENS"
                 self.desenhar_menu_loja(menu_y)
             
-            # Desenha título
-            if titulo:
-                texto_titulo = self.fonte_bold.render(titulo, True, BRANCO)  # Usando fonte_bold para melhor proporção
-                titulo_x = (LARGURA - texto_titulo.get_width()) // 2
-                self.tela.blit(texto_titulo, (titulo_x, menu_y + 20))
-            
             # Botão fechar (X no canto superior direito) - Moldura maior
-            botao_fechar = pygame.Rect(LARGURA - 70, menu_y + 10, 50, 50)  # Aumentado: 60->70, 40->50
-            
-            # Usa moldura personalizada para o botão fechar se disponível
-            if self.moldura_itens:
-                moldura_fechar = pygame.transform.scale(self.moldura_itens, (50, 50))  # Aumentado: 40->50
-                # Aplica um filtro vermelho para indicar fechar
-                overlay = pygame.Surface((50, 50))  # Aumentado: 40->50
-                overlay.fill((255, 0, 0))
-                overlay.set_alpha(60)
-                moldura_fechar.blit(overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-                self.tela.blit(moldura_fechar, botao_fechar)
-            else:
-                # Fallback para botão desenhado
-                pygame.draw.rect(self.tela, VERMELHO, botao_fechar, border_radius=20)
-                pygame.draw.rect(self.tela, PRETO, botao_fechar, 2, border_radius=20)
-            
-            texto_x = self.fonte_titulo.render("×", True, BRANCO)
-            x_rect = texto_x.get_rect(center=botao_fechar.center)
-            self.tela.blit(texto_x, x_rect)
-            # Texto "X" no botão fechar
-            texto_x = self.fonte_texto.render("X", True, BRANCO)
-            texto_x_rect = texto_x.get_rect(center=botao_fechar.center)
-            self.tela.blit(texto_x, texto_x_rect)
-            
-            self._botao_fechar_menu = botao_fechar
+            self._botao_fechar_menu = pygame.Rect(LARGURA - 70, menu_y + 10, 50, 50)  # Aumentado: 60->70, 40->50
+    
+    def _renderizar_painel_menu(self, superficie, titulo, aberto):
+        """Desenha o fundo do menu de seleção, o título e o botão fechar."""
+        # Fundo do menu com cor marrom
+        menu_rect = superficie.get_rect()
+        pygame.draw.rect(superficie, MARROM_LOJA, menu_rect, border_radius=20)
+        pygame.draw.rect(superficie, PRETO, menu_rect, 3, border_radius=20)
+        if not aberto:
+            return
+        
+        # Desenha título
+        if titulo:
+            texto_titulo = self.fonte_bold.render(titulo, True, BRANCO)  # Usando fonte_bold para melhor proporção
+            titulo_x = (LARGURA - texto_titulo.get_width()) // 2
+            superficie.blit(texto_titulo, (titulo_x, 20))
+        
+        # Botão fechar (X no canto superior direito) - Moldura maior
+        botao_fechar = pygame.Rect(LARGURA - 70, 10, 50, 50)  # Aumentado: 60->70, 40->50
+        
+        # Usa moldura personalizada para o botão fechar se disponível
+        if self.moldura_itens:
+            # Filtro vermelho para indicar fechar, já aplicado na moldura montada
+            moldura_fechar = self.molduras_prontas.obter(
+                self.moldura_itens, (50, 50), 'fechar', BORDA_MOLDURA_ITENS,  # Aumentado: 40->50
+                filtro=((255, 0, 0), 60))
+            superficie.blit(moldura_fechar, botao_fechar)
+        else:
+            # Fallback para botão desenhado
+            pygame.draw.rect(superficie, VERMELHO, botao_fechar, border_radius=20)
+            pygame.draw.rect(superficie, PRETO, botao_fechar, 2, border_radius=20)
+        
+        texto_x = self.fonte_titulo.render("×", True, BRANCO)
+        superficie.blit(texto_x, texto_x.get_rect(center=botao_fechar.center))
+        # Texto "X" no botão fechar
+        texto_x = self.fonte_texto.render("X", True, BRANCO)
+        superficie.blit(texto_x, texto_x.get_rect(center=botao_fechar.center))
     
     def desenhar_menu_ataques(self, menu_y):
         """Desenha os botões de ataque dentro do menu"""
@@ -1306,13 +1534,13 @@ class JokenGhost:
     def desenhar_menu_loja(self, menu_y):
         """Desenha os itens da loja dentro do menu"""
         mouse_pos = pygame.mouse.get_pos()
-        base_y = menu_y + 80
+        origem = (0, menu_y)
         
         self._botoes_itens_menu = []  # Lista para cliques
         self.tooltip_ativo = False  # Reset tooltip
         
-        for i, item in enumerate(self.itens_loja):
-            item_rect = pygame.Rect(50 + i * 220, base_y, 200, 140)  # Aumentado: 180->200, 120->140
+        for item, cartao in zip(self.itens_loja, self.cartoes_loja):
+            item_rect = cartao.rect_absoluto(origem)
             hover = item_rect.collidepoint(mouse_pos)
             
             # Verifica se tem dinheiro suficiente
@@ -1332,52 +1560,10 @@ class JokenGhost:
                 self.tooltip_texto = efeito_descricoes.get(item['efeito'], "Efeito desconhecido")
                 self.tooltip_item_rect = item_rect
             
-            # Usa moldura personalizada se disponível
-            if self.moldura_itens:
-                # Escala a moldura para o tamanho do item
-                moldura_escalada = pygame.transform.scale(self.moldura_itens, (item_rect.width, item_rect.height))
-                
-                # Aplica filtros baseado no estado
-                if hover and pode_comprar:
-                    # Efeito hover (mais brilhante)
-                    overlay = pygame.Surface((item_rect.width, item_rect.height))
-                    overlay.fill((255, 255, 255))
-                    overlay.set_alpha(40)
-                    moldura_escalada.blit(overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-                elif not pode_comprar:
-                    # Efeito desabilitado (mais escuro)
-                    overlay = pygame.Surface((item_rect.width, item_rect.height))
-                    overlay.fill((0, 0, 0))
-                    overlay.set_alpha(100)
-                    moldura_escalada.blit(overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
-                
-                # Desenha a moldura
-                self.tela.blit(moldura_escalada, item_rect)
-            else:
-                # Fallback para moldura desenhada
-                cor_fundo = MARROM_LOJA_CLARO if hover and pode_comprar else MARROM_LOJA if pode_comprar else (80, 60, 45)
-                pygame.draw.rect(self.tela, cor_fundo, item_rect, border_radius=10)
-                pygame.draw.rect(self.tela, PRETO, item_rect, 3, border_radius=10)
-            
-            # Nome do item
-            nome_texto = self.fonte_bold.render(item['nome'], True, BRANCO)  # Usando fonte_bold para melhor destaque
-            nome_rect = nome_texto.get_rect(center=(item_rect.centerx, item_rect.y + 25))
-            self.tela.blit(nome_texto, nome_rect)
-            
-            # Preço - ajustando fonte para ficar mais proporcional
-            preco_texto = self.fonte_bold.render(f"${item['preco']}", True, VERDE if pode_comprar else VERMELHO)
-            preco_rect = preco_texto.get_rect(center=(item_rect.centerx, item_rect.y + 60))
-            self.tela.blit(preco_texto, preco_rect)
-            
-            # Descrição do efeito
-            efeito_map = {
-                "cura_pequena": "+30 HP",
-                "cura_grande": "+60 HP", 
-                "buff_ofensivo": "-15 HP inimigo"
-            }
-            efeito_texto = self.fonte_pequena.render(efeito_map.get(item['efeito'], "?"), True, BRANCO)  # Alterado: PRETO -> BRANCO
-            efeito_rect = efeito_texto.get_rect(center=(item_rect.centerx, item_rect.y + 90))
-            self.tela.blit(efeito_texto, efeito_rect)
+            # O cartão só é redesenhado quando o item, o dinheiro suficiente ou o hover mudam
+            cartao.atualizar(nome=item['nome'], preco=item['preco'], efeito=item['efeito'],
+                             pode_comprar=pode_comprar, hover=hover)
+            cartao.desenhar(self.tela, origem)
             
             self._botoes_itens_menu.append((item_rect, item, pode_comprar))
         
@@ -1385,25 +1571,56 @@ class JokenGhost:
         if self.tooltip_ativo:
             self.desenhar_tooltip()
     
+    def _renderizar_cartao_loja(self, superficie, nome, preco, efeito, pode_comprar, hover):
+        """Desenha um cartão da loja: moldura por estado, nome, preço e efeito."""
+        item_rect = superficie.get_rect()
+        
+        # Usa moldura personalizada se disponível
+        if self.moldura_itens:
+            # Moldura montada por estado
+            if hover and pode_comprar:
+                # Efeito hover (mais brilhante)
+                estado, filtro = 'hover', ((255, 255, 255), 40)
+            elif not pode_comprar:
+                # Efeito desabilitado (mais escuro)
+                estado, filtro = 'desabilitado', None
+            else:
+                estado, filtro = 'normal', None
+            moldura_item = self.molduras_prontas.obter(
+                self.moldura_itens, item_rect.size, estado, BORDA_MOLDURA_ITENS, filtro=filtro)
+            superficie.blit(moldura_item, (0, 0))
+        else:
+            # Fallback para moldura desenhada
+            cor_fundo = MARROM_LOJA_CLARO if hover and pode_comprar else MARROM_LOJA if pode_comprar else (80, 60, 45)
+            pygame.draw.rect(superficie, cor_fundo, item_rect, border_radius=10)
+            pygame.draw.rect(superficie, PRETO, item_rect, 3, border_radius=10)
+        
+        # Nome do item
+        nome_texto = self.fonte_bold.render(nome, True, BRANCO)  # Usando fonte_bold para melhor destaque
+        superficie.blit(nome_texto, nome_texto.get_rect(center=(item_rect.centerx, 25)))
+        
+        # Preço - ajustando fonte para ficar mais proporcional
+        preco_texto = self.fonte_bold.render(f"${preco}", True, VERDE if pode_comprar else VERMELHO)
+        superficie.blit(preco_texto, preco_texto.get_rect(center=(item_rect.centerx, 60)))
+        
+        # Descrição do efeito
+        efeito_map = {
+            "cura_pequena": "+30 HP",
+            "cura_grande": "+60 HP", 
+            "buff_ofensivo": "-15 HP inimigo"
+        }
+        efeito_texto = self.fonte_pequena.render(efeito_map.get(efeito, "?"), True, BRANCO)  # Alterado: PRETO -> BRANCO
+        superficie.blit(efeito_texto, efeito_texto.get_rect(center=(item_rect.centerx, 90)))
+    
     def desenhar_tooltip(self):
         """Desenha o tooltip com informações detalhadas do item"""
         if not self.tooltip_ativo or not self.tooltip_texto:
             return
         
-        # Quebra o texto em linhas
-        linhas = self.tooltip_texto.split('\n')
-        
-        # Calcula dimensões do tooltip
-        largura_max = 0
-        altura_linha = 20
-        altura_total = len(linhas) * altura_linha + 20  # 20px de padding
-        
-        # Encontra a largura máxima necessária
-        for linha in linhas:
-            texto_surface = self.fonte_pequena.render(linha, True, BRANCO)
-            largura_max = max(largura_max, texto_surface.get_width())
-        
-        largura_total = largura_max + 20  # 20px de padding
+        # Quebra de linhas e dimensões só são recalculadas quando o texto muda
+        self.tooltip_widget.definir_texto(self.tooltip_texto)
+        largura_total = self.tooltip_widget.rect.width - self.tooltip_widget.sombra
+        altura_total = self.tooltip_widget.rect.height - self.tooltip_widget.sombra
         
         # Ajusta posição para não sair da tela
         tooltip_x, tooltip_y = self.tooltip_pos
@@ -1413,20 +1630,8 @@ class JokenGhost:
         if tooltip_y - altura_total < 0:
             tooltip_y = altura_total + 10
         
-        # Desenha fundo do tooltip
-        tooltip_rect = pygame.Rect(tooltip_x - 10, tooltip_y - altura_total, largura_total, altura_total)
-        pygame.draw.rect(self.tela, (50, 40, 30), tooltip_rect, border_radius=8)  # Fundo marrom escuro
-        pygame.draw.rect(self.tela, BRANCO, tooltip_rect, 2, border_radius=8)     # Borda branca
-        
-        # Desenha sombra do tooltip
-        sombra_rect = pygame.Rect(tooltip_x - 8, tooltip_y - altura_total + 2, largura_total, altura_total)
-        pygame.draw.rect(self.tela, (0, 0, 0, 60), sombra_rect, border_radius=8)
-        
-        # Desenha cada linha do texto
-        for i, linha in enumerate(linhas):
-            texto_surface = self.fonte_pequena.render(linha, True, BRANCO)
-            texto_y = tooltip_y - altura_total + 10 + (i * altura_linha)
-            self.tela.blit(texto_surface, (tooltip_x, texto_y))
+        self.tooltip_widget.mover((tooltip_x - 10, tooltip_y - altura_total))
+        self.tooltip_widget.desenhar(self.tela)
     
     def descobrir_fraqueza(self, tipo_inimigo, ataque_usado):
         """Sistema de descoberta de fraquezas através do jogo"""
@@ -1460,7 +1665,7 @@ class JokenGhost:
             if tipo_inimigo not in self.monstruario_descoberto:
                 descoberta_permitida = (arma_usada == 'Estaca')
                 if not descoberta_permitida:
-                    print(f"⚠️ {tipo_inimigo.title()} só pode ser descoberto com Estaca (pedra)!")
+                    log.aviso("⚠️ %s só pode ser descoberto com Estaca (pedra)!", tipo_inimigo.title())
                     return
         
         if (tipo_inimigo in fraquezas_reais and arma_usada in fraquezas_reais[tipo_inimigo] and descoberta_permitida):
@@ -1477,18 +1682,18 @@ class JokenGhost:
             if arma_usada not in self.monstruario_descoberto[tipo_inimigo]['fraquezas']:
                 self.monstruario_descoberto[tipo_inimigo]['fraquezas'].append(arma_usada)
                 self.mostrar_toast_monstruario(tipo_inimigo, arma_usada)
-                print(f"DESCOBERTA! {tipo_inimigo.title()} é fraco contra {arma_usada}!")
+                log.info("DESCOBERTA! %s é fraco contra %s!", tipo_inimigo.title(), arma_usada)
             else:
-                print(f"ℹ️ Fraqueza já conhecida: {tipo_inimigo.title()} vs {arma_usada}")
+                log.debug("ℹ️ Fraqueza já conhecida: %s vs %s", tipo_inimigo.title(), arma_usada)
         else:
-            print(f"❌ {arma_usada} não é efetivo contra {tipo_inimigo.title()}")
+            log.debug("❌ %s não é efetivo contra %s", arma_usada, tipo_inimigo.title())
     
     def mostrar_toast_monstruario(self, tipo_inimigo, fraqueza_descoberta):
         """Mostra notificação toast quando uma nova fraqueza é descoberta"""
         self.toast_ativo = True
         self.toast_tempo_inicio = pygame.time.get_ticks()
         self.toast_texto = f"🔍 Nova descoberta!\nMonstruário atualizado!\n{tipo_inimigo.title()} é fraco contra {fraqueza_descoberta}!"
-        print(f"Toast ativado: {tipo_inimigo.title()} é vulnerável a {fraqueza_descoberta}!")
+        log.debug("Toast ativado: %s é vulnerável a %s!", tipo_inimigo.title(), fraqueza_descoberta)
     
     def desenhar_toast(self):
         """Desenha o toast de descoberta no canto superior direito"""
@@ -1514,7 +1719,7 @@ class JokenGhost:
         
         # Calcula dimensões
         for linha in linhas:
-            texto_surface = self.fonte_texto.render(linha, True, BRANCO)
+            texto_surface = self.renderizar_texto(self.fonte_texto, linha, BRANCO)
             largura_max = max(largura_max, texto_surface.get_width())
         
         largura_toast = largura_max + 30
@@ -1524,21 +1729,15 @@ class JokenGhost:
         toast_x = 20  # Canto esquerdo
         toast_y = 20
         
-        # Cria surface com alpha
-        toast_surface = pygame.Surface((largura_toast, altura_toast))
-        toast_surface.set_alpha(alpha)
-        toast_surface.fill((34, 139, 34))  # Verde escuro
-        
-        # Borda
-        pygame.draw.rect(toast_surface, DOURADO, toast_surface.get_rect(), 3, border_radius=10)
+        # Painel verde escuro com borda (cacheado), alpha aplicado a cada frame
+        self.overlays.desenhar(self.tela, (toast_x, toast_y), (largura_toast, altura_toast), (34, 139, 34), alpha,
+                               borda=3, cor_borda=DOURADO, raio_borda=10)
         
         # Texto
         for i, linha in enumerate(linhas):
-            texto_surface = self.fonte_texto.render(linha, True, BRANCO)
+            texto_surface = self.renderizar_texto(self.fonte_texto, linha, BRANCO, alpha)
             texto_y = 10 + (i * altura_linha)
-            toast_surface.blit(texto_surface, (15, texto_y))
-        
-        self.tela.blit(toast_surface, (toast_x, toast_y))
+            self.tela.blit(texto_surface, (toast_x + 15, toast_y + texto_y))
     
     def desenhar_monstruario(self):
         """Desenha a interface do Monstruário em tela cheia"""
@@ -1546,30 +1745,13 @@ class JokenGhost:
             return
         
         # Fundo semi-transparente
-        overlay = pygame.Surface((LARGURA, ALTURA))
-        overlay.set_alpha(230)
-        overlay.fill((20, 15, 10))  # Marrom muito escuro
-        self.tela.blit(overlay, (0, 0))
+        self.overlays.desenhar(self.tela, (0, 0), (LARGURA, ALTURA), (20, 15, 10), 230)  # Marrom muito escuro
         
         # Livro central
-        livro_largura = 700
-        livro_altura = 500
+        livro_largura, livro_altura = TAMANHO_LIVRO_MONSTRUARIO
         livro_x = (LARGURA - livro_largura) // 2
         livro_y = (ALTURA - livro_altura) // 2
         
-        # Sprite do monstruário como fundo do livro
-        if self.sprite_monstruario:
-            sprite_redimensionada = pygame.transform.scale(self.sprite_monstruario, (livro_largura, livro_altura))
-            self.tela.blit(sprite_redimensionada, (livro_x, livro_y))
-        else:
-            # Fallback se não houver sprite
-            pygame.draw.rect(self.tela, (101, 67, 33), (livro_x, livro_y, livro_largura, livro_altura), border_radius=15)
-            pygame.draw.rect(self.tela, DOURADO, (livro_x, livro_y, livro_largura, livro_altura), 5, border_radius=15)
-        
-        # Sistema de paginação - adiciona variáveis se não existem
-        if not hasattr(self, 'pagina_monstruario_atual'):
-            self.pagina_monstruario_atual = 0
-        
         # Lista de monstros descobertos
         tipos_descobertos = list(self.monstruario_descoberto.keys())
         total_paginas = max(1, len(tipos_descobertos))
@@ -1579,69 +1761,68 @@ class JokenGhost:
             self.pagina_monstruario_atual = 0
         
         # Título (posicionado acima do livro)
-        titulo = self.fonte_titulo.render("MONSTRUÁRIO", True, DOURADO)
+        titulo = self.renderizar_texto(self.fonte_titulo, "MONSTRUÁRIO", DOURADO)
         titulo_x = livro_x + (livro_largura - titulo.get_width()) // 2
         self.tela.blit(titulo, (titulo_x, livro_y - 50))  # 50px acima do livro
         
-        # Contador de páginas (abaixo do título)
+        # Página do livro: só é redesenhada quando a página ou o que foi descoberto nela muda
         if tipos_descobertos:
-            contador = self.fonte_pequena.render(f"Página {self.pagina_monstruario_atual + 1} de {total_paginas}", True, CINZA_CLARO)
-            contador_x = livro_x + (livro_largura - contador.get_width()) // 2
-            self.tela.blit(contador, (contador_x, livro_y + 25))  # 25px abaixo do topo do livro
+            tipo_atual = tipos_descobertos[self.pagina_monstruario_atual]
+            info = self.monstruario_descoberto[tipo_atual]
+            nome, fraquezas = info['nome'], tuple(info['fraquezas'])
+        else:
+            tipo_atual = nome = fraquezas = None
+        self.pagina_monstruario.mover((livro_x, livro_y))
+        self.pagina_monstruario.atualizar(pagina=self.pagina_monstruario_atual, total_paginas=total_paginas,
+                                          tipo=tipo_atual, nome=nome, fraquezas=fraquezas,
+                                          livro=self.sprite_monstruario is not None)
+        self.pagina_monstruario.desenhar(self.tela)
+    
+    def _renderizar_pagina_monstruario(self, superficie, pagina, total_paginas, tipo, nome, fraquezas, livro):
+        """Desenha o livro do Monstruário com a página atual (coordenadas locais do livro)."""
+        livro_largura, livro_altura = superficie.get_size()
+        
+        # Sprite do monstruário como fundo do livro (já escalada em carregar_sprite_monstruario)
+        if livro:
+            superficie.blit(self.sprite_monstruario, (0, 0))
+        else:
+            # Fallback se não houver sprite
+            pygame.draw.rect(superficie, (101, 67, 33), (0, 0, livro_largura, livro_altura), border_radius=15)
+            pygame.draw.rect(superficie, DOURADO, (0, 0, livro_largura, livro_altura), 5, border_radius=15)
+        
+        # Contador de páginas (abaixo do título)
+        if tipo is not None:
+            contador = self.renderizar_texto(self.fonte_pequena, f"Página {pagina + 1} de {total_paginas}", CINZA_CLARO)
+            superficie.blit(contador, ((livro_largura - contador.get_width()) // 2, 25))  # 25px abaixo do topo do livro
         
         # Conteúdo da página
-        if not tipos_descobertos:
+        if tipo is None:
             # Nenhum monstro descoberto
-            texto_vazio = self.fonte_texto.render("Derrote inimigos para descobrir suas fraquezas!", True, BRANCO)
-            texto_x = livro_x + (livro_largura - texto_vazio.get_width()) // 2
-            self.tela.blit(texto_vazio, (texto_x, livro_y + 200))
+            texto_vazio = self.renderizar_texto(self.fonte_texto, "Derrote inimigos para descobrir suas fraquezas!", BRANCO)
+            superficie.blit(texto_vazio, ((livro_largura - texto_vazio.get_width()) // 2, 200))
         else:
-            # Mostra o monstro da página atual
-            tipo_atual = tipos_descobertos[self.pagina_monstruario_atual]
-            info = self.monstruario_descoberto[tipo_atual]
-            
             # === LAYOUT DA PÁGINA OTIMIZADO PARA PRIMEIRA PÁGINA ===
             # Sprite posicionado à esquerda na primeira página
-            sprite_x = livro_x + 200  # À esquerda (60px da margem)
-            sprite_y = livro_y + 100  # Um pouco mais acima (100px do topo)
+            sprite_x = 200  # À esquerda
+            sprite_y = 100  # Um pouco mais acima (100px do topo)
             
-            # Desenha sprite do fantasma (cortando um frame da sprite sheet)
-            try:
-                # Carrega o sprite sheet do fantasma
-                caminho_fantasma = os.path.join("Assests", "Sprites", "Ghost", "Sprite_fantasma.idle (1).png")
-                if os.path.exists(caminho_fantasma):
-                    sprite_sheet = pygame.image.load(caminho_fantasma).convert_alpha()
-                    
-                    # Sprite sheet tem 12 frames horizontais de 640x640
-                    # Cada frame tem largura de: 640 / 12 = ~53px
-                    largura_frame = sprite_sheet.get_width() // 12
-                    altura_frame = sprite_sheet.get_height()
-                    
-                    # Corta o primeiro frame (x=0, y=0, largura=53px, altura=640px)
-                    frame_rect = pygame.Rect(0, 0, largura_frame, altura_frame)
-                    sprite_fantasma = sprite_sheet.subsurface(frame_rect)
-                    
-                    # Redimensiona para tamanho adequado no livro
-                    sprite_scaled = pygame.transform.scale(sprite_fantasma, (80, 80))
-                    self.tela.blit(sprite_scaled, (sprite_x, sprite_y))
-                else:
-                    print(f"❌ Arquivo não encontrado: {caminho_fantasma}")
-                    self.desenhar_sprite_fallback(sprite_x, sprite_y)
-            except Exception as e:
-                print(f"❌ Erro ao carregar sprite do fantasma: {e}")
-                self.desenhar_sprite_fallback(sprite_x, sprite_y)
+            # Sprite do fantasma (primeiro frame da sprite sheet, cortado uma única vez)
+            retrato = self.obter_retrato_fantasma()
+            if retrato is not None:
+                superficie.blit(retrato, (sprite_x, sprite_y))
+            else:
+                self.desenhar_sprite_fallback(superficie, sprite_x, sprite_y)
             
             # POSIÇÕES DOS TEXTOS DO MONSTRUÁRIO - MENORES E À ESQUERDA NA PRIMEIRA PÁGINA:
             
             # Nome do monstro (menor e à esquerda)
             nome_y = sprite_y + 85  # Logo abaixo do sprite
-            nome_surface = self.fonte_texto.render(info['nome'], True, CINZA)  # Fonte menor (texto ao invés de bold)
-            nome_x = livro_x + 185  # Posicionado à esquerda (50px da margem)
-            self.tela.blit(nome_surface, (nome_x, nome_y))
+            nome_surface = self.renderizar_texto(self.fonte_texto, nome, CINZA)  # Fonte menor (texto ao invés de bold)
+            superficie.blit(nome_surface, (185, nome_y))  # Posicionado à esquerda
             
             # Descrição do monstro (menor e à esquerda, quebrada em linhas se necessário)
             desc_y = nome_y + 25  # Mais próximo do nome
-            if tipo_atual == 'fantasma':
+            if tipo == 'fantasma':
                 # Descrição mais curta para caber melhor
                 descricao1 = "Espírito inquieto que"
                 descricao2 = "assombra a mansão."
@@ -1650,62 +1831,77 @@ class JokenGhost:
                 descricao2 = "das trevas."
             
             # Primeira linha da descrição
-            desc_surface1 = self.fonte_pequena.render(descricao1, True, BRANCO)  # Fonte ainda menor
-            desc_x = livro_x + 165  # À esquerda
-            self.tela.blit(desc_surface1, (desc_x, desc_y))
+            desc_surface1 = self.renderizar_texto(self.fonte_pequena, descricao1, BRANCO)  # Fonte ainda menor
+            desc_x = 165  # À esquerda
+            superficie.blit(desc_surface1, (desc_x, desc_y))
             
             # Segunda linha da descrição
-            desc_surface2 = self.fonte_pequena.render(descricao2, True, BRANCO)
-            self.tela.blit(desc_surface2, (desc_x, desc_y + 15))  # 15px abaixo da primeira linha
+            desc_surface2 = self.renderizar_texto(self.fonte_pequena, descricao2, BRANCO)
+            superficie.blit(desc_surface2, (desc_x, desc_y + 15))  # 15px abaixo da primeira linha
             
             # Fraquezas descobertas (menores e à esquerda)
             fraq_y = desc_y + 40  # Abaixo da descrição
-            if info['fraquezas']:
-                fraq_titulo = self.fonte_pequena.render("Fraquezas:", True, VERMELHO)  # Título menor
-                fraq_titulo_x = livro_x + 208  # À esquerda
-                self.tela.blit(fraq_titulo, (fraq_titulo_x, fraq_y))
+            if fraquezas:
+                fraq_titulo = self.renderizar_texto(self.fonte_pequena, "Fraquezas:", VERMELHO)  # Título menor
+                superficie.blit(fraq_titulo, (208, fraq_y))
                 
                 # Lista as fraquezas (menores e à esquerda)
                 y_fraqueza = fraq_y + 20  # Mais próximo do título
-                for i, fraqueza in enumerate(info['fraquezas']):
-                    fraq_text = f"• {fraqueza}"
-                    fraq_surface = self.fonte_pequena.render(fraq_text, True, VERDE)  # Fonte menor
-                    fraq_x = livro_x + 208  # Levemente mais à direita que o título (indentação)
-                    self.tela.blit(fraq_surface, (fraq_x, y_fraqueza))
+                for fraqueza in fraquezas:
+                    fraq_surface = self.renderizar_texto(self.fonte_pequena, f"• {fraqueza}", VERDE)  # Fonte menor
+                    superficie.blit(fraq_surface, (208, y_fraqueza))
                     y_fraqueza += 18  # Espaçamento menor entre fraquezas
             else:
                 # Mensagem quando não há fraquezas descobertas (menor e à esquerda)
-                sem_fraq = self.fonte_pequena.render("Ainda não descobertas", True, CINZA_CLARO)  # Texto menor
-                sem_fraq_x = livro_x + 50  # À esquerda
-                self.tela.blit(sem_fraq, (sem_fraq_x, fraq_y))
+                sem_fraq = self.renderizar_texto(self.fonte_pequena, "Ainda não descobertas", CINZA_CLARO)  # Texto menor
+                superficie.blit(sem_fraq, (50, fraq_y))
         
         # Navegação entre páginas (se houver mais de uma página)
         if total_paginas > 1:
-            nav_y = livro_y + livro_altura - 60
+            nav_y = livro_altura - 60
             
             # Seta esquerda
-            if self.pagina_monstruario_atual > 0:
-                seta_esq = self.fonte_bold.render("◀ Anterior", True, DOURADO)
-                self.tela.blit(seta_esq, (livro_x + 20, nav_y))
+            if pagina > 0:
+                seta_esq = self.renderizar_texto(self.fonte_bold, "◀ Anterior", DOURADO)
+                superficie.blit(seta_esq, (20, nav_y))
             
             # Seta direita
-            if self.pagina_monstruario_atual < total_paginas - 1:
-                seta_dir = self.fonte_bold.render("Próximo ▶", True, DOURADO)
-                seta_dir_x = livro_x + livro_largura - seta_dir.get_width() - 20
-                self.tela.blit(seta_dir, (seta_dir_x, nav_y))
+            if pagina < total_paginas - 1:
+                seta_dir = self.renderizar_texto(self.fonte_bold, "Próximo ▶", DOURADO)
+                superficie.blit(seta_dir, (livro_largura - seta_dir.get_width() - 20, nav_y))
         
         # Instruções de fechamento
-        instrucao = self.fonte_pequena.render("Pressione ESC ou clique fora do livro para fechar", True, CINZA_CLARO)
-        instrucao_x = livro_x + (livro_largura - instrucao.get_width()) // 2
-        self.tela.blit(instrucao, (instrucao_x, livro_y + livro_altura - 30))
+        instrucao = self.renderizar_texto(self.fonte_pequena, "Pressione ESC ou clique fora do livro para fechar", CINZA_CLARO)
+        superficie.blit(instrucao, ((livro_largura - instrucao.get_width()) // 2, livro_altura - 30))
+    
+    def obter_retrato_fantasma(self):
+        """
+        Retorna o retrato do fantasma usado no Monstruário, carregando a sprite sheet só na primeira vez.
+
+        Returns:
+            pygame.Surface (80x80) ou None se a sprite sheet não pôde ser carregada
+        """
+        if self.retrato_fantasma is None:
+            self.retrato_fantasma = False  # Não tenta de novo se falhar
+            caminho_fantasma = os.path.join("Assests", "Sprites", "Ghost", "Sprite_fantasma.idle (1).png")
+            try:
+                sprite_sheet = self._carregar_imagem(caminho_fantasma)
+                
+                # Sprite sheet tem 12 frames horizontais; corta o primeiro e reduz para o livro
+                largura_frame = sprite_sheet.get_width() // 12
+                sprite_fantasma = sprite_sheet.subsurface(pygame.Rect(0, 0, largura_frame, sprite_sheet.get_height()))
+                self.retrato_fantasma = pygame.transform.scale(sprite_fantasma, (80, 80))
+            except Exception as e:
+                log.erro("❌ Erro ao carregar sprite do fantasma (%s): %s", caminho_fantasma, e)
+        return self.retrato_fantasma or None
     
-    def desenhar_sprite_fallback(self, x, y):
+    def desenhar_sprite_fallback(self, superficie, x, y):
         """Desenha um sprite de fallback quando não há sprite disponível"""
-        pygame.draw.rect(self.tela, CINZA, (x, y, 128, 128), border_radius=10)
-        ghost_text = self.fonte_titulo.render("GHOST", True, BRANCO)
+        pygame.draw.rect(superficie, CINZA, (x, y, 128, 128), border_radius=10)
+        ghost_text = self.renderizar_texto(self.fonte_titulo, "GHOST", BRANCO)
         ghost_x = x + (128 - ghost_text.get_width()) // 2
         ghost_y = y + (128 - ghost_text.get_height()) // 2
-        self.tela.blit(ghost_text, (ghost_x, ghost_y))
+        superficie.blit(ghost_text, (ghost_x, ghost_y))
     
     def desenhar_barra_vida_automatica(self, sprite_x, sprite_y, sprite_largura, sprite_altura, vida_atual, vida_maxima, nome, largura_barra=150, mostrar_numeros=True):
         """Desenha barra de vida automaticamente posicionada 40px acima da sprite e centralizada"""
@@ -1733,7 +1929,7 @@ class JokenGhost:
         pygame.draw.rect(self.tela, PRETO, caixa, 3, border_radius=10)
         
         # Nome do personagem (fonte menor)
-        texto_nome = self.fonte_pequena.render(nome, True, PRETO)
+        texto_nome = self.renderizar_texto(self.fonte_pequena, nome, PRETO)
         self.tela.blit(texto_nome, (x + 10, y + 5))
         
         # Barra de vida
@@ -1763,11 +1959,11 @@ class JokenGhost:
         if mostrar_numeros:
             # Para o jogador, mostra apenas "VOCÊ" sem números
             if nome == "VOCÊ":
-                texto_vida = self.fonte_pequena.render("VOCÊ", True, PRETO)
+                texto_vida = "VOCÊ"
             else:
                 # Para inimigos, mantém o formato original se necessário
-                texto_vida = self.fonte_pequena.render(f"{vida_atual:.0f}/{vida_maxima}", True, PRETO)
-            self.tela.blit(texto_vida, (barra_x + barra_largura - texto_vida.get_width(), y + 5))
+                texto_vida = f"{vida_atual:.0f}/{vida_maxima}"
+            self.glifos_pequena.desenhar(self.tela, texto_vida, (barra_x + barra_largura - self.glifos_pequena.largura(texto_vida), y + 5), PRETO)
     
     def desenhar_resultado(self):
         self.tela.fill(PRETO)
@@ -1779,7 +1975,7 @@ class JokenGhost:
             texto_principal = "VOCÊ VENCEU!"
             cor_texto = VERDE
         
-        texto = self.fonte_titulo.render(texto_principal, True, cor_texto)
+        texto = self.renderizar_texto(self.fonte_titulo, texto_principal, cor_texto)
         texto_rect = texto.get_rect(center=(LARGURA//2, ALTURA//2 - 50))
         self.tela.blit(texto, texto_rect)
         
@@ -1790,43 +1986,6 @@ class JokenGhost:
         # === NOVO === HUD Dinheiro
         self.desenhar_hud_dinheiro()
     
-    def determinar_vencedor(self, jogador, inimigo):
-        if jogador == inimigo:
-            return "Empate!"
-        
-        vitorias = {
-            (Escolha.PEDRA, Escolha.TESOURA): True,
-            (Escolha.PAPEL, Escolha.PEDRA): True,
-            (Escolha.TESOURA, Escolha.PAPEL): True
-        }
-        
-        if (jogador, inimigo) in vitorias:
-            self.vida_inimigo -= 20
-            # === NOVO === Shake no inimigo quando toma dano
-            self.iniciar_shake_personagem(eh_jogador=False, intensidade=15)
-            return "Você ganhou a rodada!"
-        else:
-            self.vida_jogador -= 20
-            # === NOVO === Shake no jogador quando toma dano
-            self.iniciar_shake_personagem(eh_jogador=True, intensidade=15)
-            # Ativa animação de ataque do inimigo quando ele vence
-            self.iniciar_animacao_ataque_inimigo()
-            return "Você perdeu a rodada!"
-    
-    def calcular_recompensa(self, escolha_jogador, vitoria):
-        """Calcula recompensa baseada no tipo de ataque e se ganhou"""
-        if not vitoria:
-            return 0
-            
-        # Sistema de recompensas baseado no tipo contra o Ghost
-        recompensas = {
-            Escolha.PEDRA: 60,    # Máxima efetividade contra Ghost
-            Escolha.PAPEL: 25,    # Efetividade média
-            Escolha.TESOURA: 35   # Efetividade boa
-        }
-        
-        return recompensas.get(escolha_jogador, 30)  # Fallback
-    
     # === NOVO === Aplicar recompensas de vitória ao fim da batalha
     def pagar_recompensa_se_preciso(self):
         """Função legada - não mais utilizada com o sistema de múltiplos inimigos"""
@@ -1839,9 +1998,9 @@ class JokenGhost:
             self.animacao_ataque_inimigo_ativa = True
             self.tempo_inicio_ataque = pygame.time.get_ticks()
             self.frame_atual_inimigo = 0
-            print("🎬 Iniciando animação de ataque do inimigo!")
+            log.debug("🎬 Iniciando animação de ataque do inimigo!")
         else:
-            print("⚠️ Sprite de ataque não encontrada para o inimigo")
+            log.aviso("⚠️ Sprite de ataque não encontrada para o inimigo")
     
     def processar_turno(self, escolha_jogador):
         """Processa o turno com sistema de rotação visual de inimigos"""
@@ -1853,16 +2012,9 @@ class JokenGhost:
         
         self.escolha_jogador = escolha_jogador
         
-        # Verifica se há inimigos vivos
-        inimigos_vivos = [inimigo for inimigo in self.inimigos if inimigo['ativo'] and inimigo['vida_atual'] > 0]
-        
+        # Verifica se há inimigos vivos (a vitória total já foi paga no golpe final)
+        inimigos_vivos = [inimigo for inimigo in self.inimigos if inimigo.vivo]
         if not inimigos_vivos:
-            # Sem inimigos vivos - jogador venceu
-            recompensa = len(self.inimigos) * 60
-            self.resultado_batalha = f"Vitória total! +{recompensa} moedas!"
-            self.dinheiro += recompensa  # Corrigido: usar self.dinheiro
-            print(f"💰 Vitória total! Ganhou {recompensa} moedas! Total: {self.dinheiro}")
-            pygame.time.set_timer(pygame.USEREVENT + 1, 2000)
             return
         
         # Encontra o inimigo que está na frente (z_order = 3)
@@ -1872,69 +2024,52 @@ class JokenGhost:
             # Se não há inimigo na frente, pega o primeiro vivo
             inimigo_atual = inimigos_vivos[0]
         
-        self.escolha_inimigo = random.choice(list(Escolha))
-        
-        # Determina resultado do combate
-        if self.escolha_jogador == self.escolha_inimigo:
-            resultado = "empate"
-        else:
-            vitorias = {
-                (Escolha.PEDRA, Escolha.TESOURA): True,
-                (Escolha.PAPEL, Escolha.PEDRA): True,
-                (Escolha.TESOURA, Escolha.PAPEL): True
-            }
-            resultado = "jogador" if (self.escolha_jogador, self.escolha_inimigo) in vitorias else "inimigo"
-        
-        # Aplica dano baseado no resultado
-        if resultado == "jogador":
-            dano = 25
-            inimigo_atual['vida_atual'] -= dano
-            
-            # Sistema de descoberta de fraquezas
-            tipo_inimigo = inimigo_atual['tipo']
-            ataque_usado = self.escolha_jogador.name.lower()
-            self.descobrir_fraqueza(tipo_inimigo, ataque_usado)
-            
-            # Adiciona dinheiro por acerto - PEDRA (Aspirador) dá mais moedas vs fantasmas
-            if self.escolha_jogador == Escolha.PEDRA:
-                recompensa_acerto = 25  # Aspirador é efetivo contra fantasmas
-            else:
-                recompensa_acerto = 15  # Recompensa padrão para outras armas
-            self.dinheiro += recompensa_acerto
-            
-            # Cria moeda flutuante na posição do inimigo
-            self.criar_moeda_flutuante(recompensa_acerto, inimigo_atual['pos_x'] + 50, inimigo_atual['pos_y'] - 30)
-            
-            if inimigo_atual['vida_atual'] <= 0:
-                inimigo_atual['vida_atual'] = 0
-                inimigo_atual['ativo'] = False
-                self.resultado_batalha = f"{inimigo_atual['nome']} derrotado! +{recompensa_acerto} moedas!"
-                
-                # Verifica se há inimigos restantes e define novo atual
-                inimigos_restantes = [i for i in self.inimigos if i['ativo'] and i['vida_atual'] > 0]
-                if len(inimigos_restantes) > 0:
-                    # Define o primeiro inimigo restante como atual
-                    self.inimigo_atual_index = self.inimigos.index(inimigos_restantes[0])
-                    print(f"👁️ Novo inimigo da frente: {inimigos_restantes[0]['nome']}")
-            else:
-                self.resultado_batalha = f"Acertou {inimigo_atual['nome']}! +{recompensa_acerto} moedas!"
-            
-            # Shake no inimigo (usando função adequada)
-            self.iniciar_shake_personagem(eh_jogador=False, intensidade=12)
-            
-        elif resultado == "inimigo":
-            dano = 20
-            self.vida_jogador -= dano
-            if self.vida_jogador <= 0:
-                self.vida_jogador = 0
-            
-            # Shake no jogador (usando função adequada)
-            self.iniciar_shake_personagem(eh_jogador=True, intensidade=15)
-            
-            self.resultado_batalha = f"{inimigo_atual['nome']} te acertou!"
-        else:
+        # Regras do turno no CombatEngine (as mesmas do jogo refatorado e do simulador)
+        descobertos = {tipo: dados['fraquezas'] for tipo, dados in self.monstruario_descoberto.items()}
+        turno = self.combat_engine.resolver_turno(
+            self.inimigos, self.vida_jogador, escolha_jogador, self.inimigos.index(inimigo_atual), descobertos
+        )
+        self.escolha_inimigo = turno['escolha_inimigo']
+        for inimigo, vida in zip(self.inimigos, turno['vidas']):
+            inimigo.vida_atual = vida
+        self.vida_jogador = turno['vida_jogador']
+        self.dinheiro += turno['recompensa']
+        
+        if turno['resultado'] == ResultadoCombate.EMPATE:
             self.resultado_batalha = "Empate!"
         
+        vitoria_total = False
+        for evento in turno['eventos']:
+            tipo = evento['tipo']
+            if tipo == 'dano_inimigo' and not evento['area']:
+                # Shake no inimigo (usando função adequada)
+                self.iniciar_shake_personagem(eh_jogador=False, intensidade=12)
+            elif tipo == 'descoberta':
+                self.descobrir_fraqueza(evento['inimigo'], evento['arma'])
+            elif tipo == 'recompensa' and evento['motivo'] == 'acerto':
+                # Moeda flutuante na posição do inimigo
+                self.criar_moeda_flutuante(evento['valor'], inimigo_atual.pos_x + 50, inimigo_atual.pos_y - 30)
+                self.resultado_batalha = f"Acertou {inimigo_atual.nome}! +{turno['recompensa']} moedas!"
+            elif tipo == 'inimigo_derrotado':
+                self.inimigos[evento['indice']].ativo = False
+                if evento['indice'] == self.inimigos.index(inimigo_atual):
+                    self.resultado_batalha = f"{inimigo_atual.nome} derrotado! +{turno['recompensa']} moedas!"
+            elif tipo == 'vitoria_total':
+                vitoria_total = True
+                self.resultado_batalha = f"Vitória! +{evento['valor']} moedas!"
+                log.info("💰 Vitória! Ganhou %s moedas! Total: %s", evento['valor'], self.dinheiro)
+            elif tipo == 'dano_jogador':
+                # Shake no jogador (usando função adequada)
+                self.iniciar_shake_personagem(eh_jogador=True, intensidade=15)
+                atacante = self.inimigos[evento['indice']]
+                self.resultado_batalha = f"{atacante.nome} te acertou!"
+        
+        # Novo inimigo da frente se o atual caiu
+        inimigos_restantes = [i for i in self.inimigos if i.vivo]
+        if not inimigo_atual.vivo and inimigos_restantes:
+            self.inimigo_atual_index = self.inimigos.index(inimigos_restantes[0])
+            log.debug("👁️ Novo inimigo da frente: %s", inimigos_restantes[0].nome)
+        
         self.tempo_resultado = pygame.time.get_ticks()
         
         # Verifica condições de fim de jogo
@@ -1943,13 +2078,7 @@ class JokenGhost:
             pygame.time.set_timer(pygame.USEREVENT + 1, 2000)
             return
         
-        # Verifica se todos os inimigos morreram
-        inimigos_restantes = [i for i in self.inimigos if i['ativo'] and i['vida_atual'] > 0]
-        if len(inimigos_restantes) == 0:
-            recompensa = len(self.inimigos) * 60
-            self.resultado_batalha = f"Vitória! +{recompensa} moedas!"
-            self.dinheiro += recompensa  # Corrigido: usar self.dinheiro ao invés de self.dinheiro_jogador
-            print(f"💰 Vitória! Ganhou {recompensa} moedas! Total: {self.dinheiro}")
+        if vitoria_total:
             pygame.time.set_timer(pygame.USEREVENT + 1, 2000)
             return
         
@@ -1996,7 +2125,7 @@ class JokenGhost:
         self.mostrar_monstruario = False
         
         inimigos_count = len([i for i in self.inimigos if i['ativo']])
-        print(f"🔄 Jogo reiniciado! Novos inimigos: {inimigos_count}")
+        log.info("🔄 Jogo reiniciado! Novos inimigos: %s", inimigos_count)
         
         # Vai direto para batalha (pula intro)
         self.estado = EstadoJogo.BATALHA
@@ -2018,31 +2147,29 @@ class JokenGhost:
         self.modo_demonstracao = False
     
     # === NOVO === HUD Dinheiro com Moldura
-    def desenhar_hud_dinheiro(self):
+    def desenhar_hud_dinheiro(self, tela=None):
+        tela = tela or self.tela
         # Posição da moldura/dinheiro (canto superior direito)
         x = LARGURA - 130
         y = 10
         
         # Desenha a moldura se disponível
         if self.moldura_dinheiro:
-            self.tela.blit(self.moldura_dinheiro, (x, y))
+            tela.blit(self.molduras_prontas.obter(self.moldura_dinheiro, (120, 40)), (x, y))
         else:
             # Fallback para moldura desenhada
             caixa = pygame.Rect(x, y, 120, 40)
-            pygame.draw.rect(self.tela, MARROM_LOJA, caixa, border_radius=8)
-            pygame.draw.rect(self.tela, PRETO, caixa, 2, border_radius=8)
-        
-        # Texto apenas com o valor (sem "Dinheiro:")
-        txt = self.fonte_pequena.render(f"${self.dinheiro}", True, BRANCO)
-        # Centraliza o texto na moldura
-        text_rect = txt.get_rect(center=(x + 60, y + 20))
-        self.tela.blit(txt, text_rect)
+            pygame.draw.rect(tela, MARROM_LOJA, caixa, border_radius=8)
+            pygame.draw.rect(tela, PRETO, caixa, 2, border_radius=8)
+        
+        # Texto apenas com o valor (sem "Dinheiro:"), centralizado na moldura
+        self.glifos_pequena.desenhar(tela, f"${self.dinheiro}", (x + 60, y + 20), BRANCO, centro=True)
 
     # === NOVO === Comprar item (efeito consumível imediato)
     def comprar_item(self, item):
         if self.dinheiro < item['preco']:  # Corrigido: usar self.dinheiro
             self.mensagem_loja = "Dinheiro insuficiente!"
-            print(self.mensagem_loja)
+            log.aviso(self.mensagem_loja)
             return
         
         self.dinheiro -= item['preco']  # Corrigido: usar self.dinheiro
@@ -2063,10 +2190,11 @@ class JokenGhost:
         else:
             self.mensagem_loja = "Item usado."
             
-        print(f"Comprou: {item['nome']} | {self.mensagem_loja}")
+        log.info("Comprou: %s | %s", item['nome'], self.mensagem_loja)
 
     def processar_eventos(self):
         for evento in pygame.event.get():
+            self.dirty_rects.tratar_evento(evento)
             if evento.type == pygame.QUIT:
                 return False
             
@@ -2078,11 +2206,16 @@ class JokenGhost:
             
             # === NOVO === Eventos de Teclado
             elif evento.type == pygame.KEYDOWN:
+                # F4: captura cProfile + pilhas dos próximos quadros
+                if evento.key == pygame.K_F4:
+                    self.captura_perfil.iniciar()
+                    continue
+                
                 if evento.key == pygame.K_ESCAPE:
                     # Fecha o monstruário se estiver aberto
                     if self.mostrar_monstruario:
                         self.mostrar_monstruario = False
-                        print("📖 Monstruário fechado")
+                        log.debug("📖 Monstruário fechado")
                         continue  # Não processa outros eventos de ESC
                 
                 # Navegação no monstruário com setas
@@ -2092,20 +2225,21 @@ class JokenGhost:
                         if evento.key == pygame.K_LEFT:
                             if self.pagina_monstruario_atual > 0:
                                 self.pagina_monstruario_atual -= 1
-                                print(f"📖 Página anterior: {self.pagina_monstruario_atual + 1}")
+                                log.debug("📖 Página anterior: %s", self.pagina_monstruario_atual + 1)
                         elif evento.key == pygame.K_RIGHT:
                             if self.pagina_monstruario_atual < len(tipos_descobertos) - 1:
                                 self.pagina_monstruario_atual += 1
-                                print(f"📖 Próxima página: {self.pagina_monstruario_atual + 1}")
+                                log.debug("📖 Próxima página: %s", self.pagina_monstruario_atual + 1)
                     continue  # Não processa outros eventos quando monstruário está aberto
                 
                 if self.estado == EstadoJogo.INTRO:
                     if evento.key == pygame.K_SPACE:
                         # Vai direto para a batalha
+                        self.garantir_recursos_batalha()
                         self.estado = EstadoJogo.TRANSICAO
                         self.transicao_alpha = 0
                         self.transicao_direcao = 1
-                        print("🎬 Intro finalizada, iniciando batalha...")
+                        log.debug("🎬 Intro finalizada, iniciando batalha...")
                 
                 elif evento.key == pygame.K_r and self.estado == EstadoJogo.BATALHA:
                     # Gera novos inimigos aleatórios
@@ -2122,7 +2256,7 @@ class JokenGhost:
                         self.animacao_rotacao_ativa = False
                         self.progresso_rotacao = 0.0
                         inimigos_count = len([i for i in self.inimigos if i['ativo']])
-                        print(f"🔄 Novos inimigos gerados: {inimigos_count} inimigos!")
+                        log.debug("🔄 Novos inimigos gerados: %s inimigos!", inimigos_count)
             
             elif evento.type == pygame.MOUSEBUTTONDOWN:
                 if evento.button == 1:  # Clique esquerdo
@@ -2145,7 +2279,7 @@ class JokenGhost:
                         # Se clicou FORA da área expandida, fecha o monstruário
                         if not area_livro.collidepoint(evento.pos):
                             self.mostrar_monstruario = False
-                            print("📖 Monstruário fechado")
+                            log.debug("📖 Monstruário fechado")
                         # IMPORTANTE: sempre retorna True quando monstruário está aberto
                         # Isso impede qualquer outra interação
                         return True
@@ -2157,7 +2291,7 @@ class JokenGhost:
                         self.pagina_intro_atual = 0
                         self.texto_intro_atual = ""
                         self.char_atual = 0
-                        print("🎬 Iniciando intro do jogo...")
+                        log.debug("🎬 Iniciando intro do jogo...")
                     
                     elif self.estado == EstadoJogo.BATALHA:
                         # === NOVO === Prioridade para menus ativos
@@ -2172,12 +2306,7 @@ class JokenGhost:
                                 # Cliques nos botões de ataque
                                 if botao_clicado in ['pedra', 'papel', 'tesoura']:
                                     if not self.escolha_jogador:  # Só processa se ainda não escolheu
-                                        escolha_map = {
-                                            'pedra': Escolha.PEDRA,
-                                            'papel': Escolha.PAPEL,
-                                            'tesoura': Escolha.TESOURA
-                                        }
-                                        self.processar_turno(escolha_map[botao_clicado])
+                                        self.processar_turno(ESCOLHAS_BOTOES[botao_clicado])
                                         self.fechar_menu_selecao()
                             
                             elif self.tipo_menu_atual == TipoMenu.LOJA:
@@ -2198,26 +2327,37 @@ class JokenGhost:
                             elif botao_clicado == 'status':
                                 # Abre/fecha o Monstruário
                                 self.mostrar_monstruario = not self.mostrar_monstruario
-                                print(f"📖 Monstruário {'aberto' if self.mostrar_monstruario else 'fechado'}")
+                                log.debug("📖 Monstruário %s", 'aberto' if self.mostrar_monstruario else 'fechado')
                         elif self.turno_em_andamento:
-                            print("⏳ Aguarde o turno terminar antes de realizar outra ação!")
+                            log.debug("⏳ Aguarde o turno terminar antes de realizar outra ação!", limitar=True)
 
                     elif self.estado == EstadoJogo.RESULTADO and botao_clicado == 'reiniciar':
                         self.reiniciar_jogo()
         
         return True
     
-    def atualizar(self):
+    def atualizar(self, delta_ms=None):
+        """
+        Avança a simulação um passo.
+
+        Args:
+            delta_ms: Duração do passo em milissegundos; None equivale a um quadro de FPS
+        """
+        # Velocidades abaixo são "por quadro de 60 FPS"; o fator as converte para o passo real
+        self.fator_quadro = 1.0 if delta_ms is None else delta_ms / (1000.0 / FPS)
+        fator = self.fator_quadro
+        
         if self.estado == EstadoJogo.INTRO:
             # Não precisa atualizar nada por enquanto - texto aparece completo
             pass
         
         elif self.estado == EstadoJogo.TRANSICAO:
-            self.transicao_alpha += self.transicao_direcao * 8
+            self.transicao_alpha += self.transicao_direcao * 8 * fator
             if self.transicao_alpha >= 255:
                 self.transicao_alpha = 255
                 self.transicao_direcao = -1
             elif self.transicao_alpha <= 0 and self.transicao_direcao == -1:
+                self.transicao_alpha = 0
                 self.estado = EstadoJogo.BATALHA
                 # === NOVO === Inicia animação de entrada
                 self.iniciar_animacao_entrada()
@@ -2229,13 +2369,13 @@ class JokenGhost:
             if self.animacao_entrada_ativa:
                 # Move jogador da esquerda para posição final
                 if self.jogador_pos_x < self.jogador_pos_final:
-                    self.jogador_pos_x += self.velocidade_entrada
+                    self.jogador_pos_x += self.velocidade_entrada * fator
                     if self.jogador_pos_x > self.jogador_pos_final:
                         self.jogador_pos_x = self.jogador_pos_final
                 
                 # Move inimigo da direita para posição final
                 if self.inimigo_pos_x > self.inimigo_pos_final:
-                    self.inimigo_pos_x -= self.velocidade_entrada
+                    self.inimigo_pos_x -= self.velocidade_entrada * fator
                     if self.inimigo_pos_x < self.inimigo_pos_final:
                         self.inimigo_pos_x = self.inimigo_pos_final
                 
@@ -2243,17 +2383,17 @@ class JokenGhost:
                 if (self.jogador_pos_x >= self.jogador_pos_final and 
                     self.inimigo_pos_x <= self.inimigo_pos_final):
                     self.animacao_entrada_ativa = False
-                    print("🎬 Animação de entrada finalizada!")
+                    log.debug("🎬 Animação de entrada finalizada!")
             
             # === NOVO === Atualiza animação do menu
             if self.menu_selecao_ativo:
                 if self.menu_altura < self.menu_altura_alvo:
-                    self.menu_altura += self.velocidade_menu
+                    self.menu_altura += self.velocidade_menu * fator
                     if self.menu_altura > self.menu_altura_alvo:
                         self.menu_altura = self.menu_altura_alvo
             else:
                 if self.menu_altura > 0:
-                    self.menu_altura -= self.velocidade_menu
+                    self.menu_altura -= self.velocidade_menu * fator
                     if self.menu_altura < 0:
                         self.menu_altura = 0
             
@@ -2278,25 +2418,16 @@ class JokenGhost:
             
             # === NOVO === Atualiza animação suave das barras de vida
             if self.vida_jogador_visual > self.vida_jogador:
-                self.vida_jogador_visual -= self.velocidade_vida
+                self.vida_jogador_visual -= self.velocidade_vida * fator
                 if self.vida_jogador_visual < self.vida_jogador:
                     self.vida_jogador_visual = self.vida_jogador
             elif self.vida_jogador_visual < self.vida_jogador:
-                self.vida_jogador_visual += self.velocidade_vida
+                self.vida_jogador_visual += self.velocidade_vida * fator
                 if self.vida_jogador_visual > self.vida_jogador:
                     self.vida_jogador_visual = self.vida_jogador
             
-            # === NOVO === Atualiza vida visual dos inimigos (todos os inimigos)
-            for inimigo in self.inimigos:
-                if inimigo['ativo']:
-                    if inimigo['vida_visual'] > inimigo['vida_atual']:
-                        inimigo['vida_visual'] -= self.velocidade_vida
-                        if inimigo['vida_visual'] < inimigo['vida_atual']:
-                            inimigo['vida_visual'] = inimigo['vida_atual']
-                    elif inimigo['vida_visual'] < inimigo['vida_atual']:
-                        inimigo['vida_visual'] += self.velocidade_vida
-                        if inimigo['vida_visual'] > inimigo['vida_atual']:
-                            inimigo['vida_visual'] = inimigo['vida_atual']
+            # === NOVO === Atualiza vida visual dos inimigos (todos de uma vez no EntityStore)
+            self.entidades.suavizar_vidas(self.velocidade_vida * fator)
             
             # Gerencia animação de ataque do inimigo
             if self.animacao_ataque_inimigo_ativa:
@@ -2305,7 +2436,7 @@ class JokenGhost:
                     self.animacao_ataque_inimigo_ativa = False
                     self.estado_animacao_inimigo = EstadoAnimacao.IDLE
                     self.frame_atual_inimigo = 0
-                    print("🎬 Animação de ataque finalizada")
+                    log.debug("🎬 Animação de ataque finalizada")
             
             # Anima jogador (sempre idle por enquanto)
             if hasattr(self, 'sprites_jogador') and 'idle' in self.sprites_jogador:
@@ -2317,9 +2448,9 @@ class JokenGhost:
             
             # === NOVO === Anima todos os inimigos individuais
             for inimigo in self.inimigos:
-                if inimigo['ativo'] and inimigo['sprites']:
-                    if 'idle' in inimigo['sprites']:
-                        sprite_data = inimigo['sprites']['idle']
+                if inimigo.ativo and inimigo.sprites:
+                    if 'idle' in inimigo.sprites:
+                        sprite_data = inimigo.sprites['idle']
                         total_frames = sprite_data['total_frames']
                         
                         # Velocidade baseada no número de frames (valores menores = animação mais rápida)
@@ -2330,9 +2461,9 @@ class JokenGhost:
                         else:
                             velocidade = 100  # Aumentado FPS: era 200, agora 100
                         
-                        if tempo_atual - inimigo['tempo_animacao'] > velocidade:
-                            inimigo['frame_atual'] = (inimigo['frame_atual'] + 1) % total_frames
-                            inimigo['tempo_animacao'] = tempo_atual
+                        if tempo_atual - inimigo.tempo_animacao > velocidade:
+                            inimigo.frame_atual = (inimigo.frame_atual + 1) % total_frames
+                            inimigo.tempo_animacao = tempo_atual
             
             # Limpa escolhas após 3 segundos (só se não está na animação de entrada)
             if (not self.animacao_entrada_ativa and self.tempo_resultado > 0 and 
@@ -2345,7 +2476,7 @@ class JokenGhost:
                     if len(inimigos_restantes) > 1 and not self.animacao_rotacao_ativa:
                         self.aguardando_proximo_inimigo = True
                         self.tempo_espera_inimigo = pygame.time.get_ticks()
-                        print(f"⏳ Iniciando rotação após mensagem... ({len(inimigos_restantes)} restantes)")
+                        log.debug("⏳ Iniciando rotação após mensagem... (%s restantes)", len(inimigos_restantes))
                     
                     self.escolha_jogador = None
                     self.escolha_inimigo = None
@@ -2374,30 +2505,101 @@ class JokenGhost:
         self.desenhar_toast()
         self.desenhar_monstruario()
         
-        pygame.display.flip()
+        # Menu e resultado parados só enviam o botão; o resto da tela usa flip
+        self.dirty_rects.definir_cena(self.estado)
+        if self.estado == EstadoJogo.MENU:
+            self.dirty_rects.registrar('botao_jogar', self.botoes['jogar']['rect'])
+        elif self.estado == EstadoJogo.RESULTADO:
+            self.dirty_rects.registrar('botao_reiniciar', self.botoes['reiniciar']['rect'])
+        elif self.estado != EstadoJogo.INTRO:
+            self.dirty_rects.forcar_tela_cheia()
+        if self.toast_ativo or self.mostrar_monstruario:
+            self.dirty_rects.forcar_tela_cheia()
+        self.dirty_rects.apresentar()
+    
+    def tela_ociosa(self):
+        """
+        Verifica se a tela está parada (nada animando), para o loop poder dormir.
+
+        Returns:
+            bool: True em menu, intro, resultado ou monstruário aberto sem animações
+        """
+        if self.estado not in (EstadoJogo.MENU, EstadoJogo.INTRO, EstadoJogo.RESULTADO) and not self.mostrar_monstruario:
+            return False
+        if self.carregador is not None:
+            return False
+        if self.toast_ativo or self.moedas_flutuantes:
+            return False
+        if self.shake_jogador['ativo'] or self.shake_inimigo['ativo']:
+            return False
+        if self.estado == EstadoJogo.BATALHA:
+            # Monstruário sobre a batalha: só dorme com o turno e as animações encerrados
+            if (self.animacao_entrada_ativa or self.botoes_animacao_ativa or self.animacao_rotacao_ativa
+                    or self.aguardando_proximo_inimigo or self.animacao_ataque_inimigo_ativa
+                    or self.tempo_resultado > 0):
+                return False
+            if self.menu_altura != (self.menu_altura_alvo if self.menu_selecao_ativo else 0):
+                return False
+            if self.vida_jogador_visual != self.vida_jogador:
+                return False
+            if self.entidades.vidas_em_transicao():
+                return False
+        return True
     
     def executar(self):
+        # Simulação em passos fixos; o desenho interpola entre os dois últimos passos
+        interpolador = RenderInterpolator(self, {
+            'jogador_pos_x': self.velocidade_entrada * 2,
+            'inimigo_pos_x': self.velocidade_entrada * 2,
+            'menu_altura': self.velocidade_menu * 2,
+            'vida_jogador_visual': self.velocidade_vida * 2,
+            'transicao_alpha': 16,
+        })
         executando = True
+        quadro = 0
+        if self.opcoes.profile_frames:
+            self.captura_perfil.iniciar(self.opcoes.profile_frames)
+        self.relogio.tick(self.opcoes.fps)
         while executando:
+            if self.roteiro is not None:
+                self.roteiro.injetar(quadro)
+            quadro += 1
+            delta_ms = self.relogio.get_time()
+            if self.espera_ociosa.esperar(self.tela_ociosa()):
+                # O tempo dormindo não vira passos de simulação
+                self.relogio.tick()
+                delta_ms = self.passo_fixo.passo_ms
             executando = self.processar_eventos()
-            self.atualizar()
-            self.desenhar()
-            self.relogio.tick(FPS)
+            # Recursos de batalha chegando em segundo plano (um lote por quadro, não por passo)
+            self.atualizar_carregamento()
+            for _ in range(self.passo_fixo.avancar(delta_ms)):
+                interpolador.capturar()
+                self.atualizar(self.passo_fixo.passo_ms)
+            interpolador.aplicar(self.passo_fixo.alpha)
+            try:
+                self.desenhar()
+            finally:
+                interpolador.restaurar()
+            self.captura_perfil.quadro_concluido()
+            self.relogio.tick(self.opcoes.fps)
         
+        self.captura_perfil.finalizar()
         pygame.quit()
         sys.exit()
 
 def main():
     """Função principal para execução do jogo"""
+    opcoes = analisar_argumentos()
     try:
-        jogo = JokenGhost()
+        jogo = JokenGhost(opcoes)
         jogo.executar()
     except Exception as e:
         import traceback
         print(f"❌ Erro ao executar o jogo: {e}")
         print("\nTraceback completo:")
         traceback.print_exc()
-        input("Pressione Enter para sair...")
+        if not opcoes.headless:
+            input("Pressione Enter para sair...")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -14,7 +14,9 @@ from config.constants import *
 from config.enums import *
 from core.resource_manager import ResourceManager
 from core.enemy_manager import EnemyManager
+from core.entity_store import EntityStore
 from core.combat_system import CombatSystem
+from core.combat_engine import CombatEngine, ResultadoCombate, ESCOLHAS
 from ui.ui_manager import UIManager
 from ui.menu_renderer import MenuRenderer
 from ui.toast_system import ToastManager, NotificationSystem
@@ -24,26 +26,53 @@ from ui.result_display import ResultDisplay
 from ui.visual_effects import VisualEffectsManager, EnemyAttackAnimationManager
 from ui.ui_animations import UIAnimationManager, AnimatedWidget
 from core.economy_manager import EconomyManager
+from core.game_loop import FixedTimestep, RenderInterpolator, IdleWaiter
+from core.execucao import OpcoesExecucao, analisar_argumentos
+from core.perfil import FrameProfiler, ProfileCapture
+from core.log import obter_log
 from graphics.sprite_manager import SpriteManager, AnimationController
+from graphics.sprite_cache import ScaledSpriteCache
+from graphics.dirty_rects import DirtyRectTracker
+from graphics.compositor import LayerCompositor
 from game.loja_manager import LojaManager
 from ui.monstruario_original import MonstruarioOriginal
+from ui.widgets import TooltipWidget
 # REMOVIDO: from ui.texto_flutuante import SistemaTextoFlutuante
 
+log = obter_log()
+
 class JokenGhostGame:
     """Classe principal do jogo JokenGhost."""
     
-    def __init__(self):
-        """Inicializa o jogo e todos os sistemas."""
+    def __init__(self, opcoes=None):
+        """
+        Inicializa o jogo e todos os sistemas.
+        
+        Args:
+            opcoes: OpcoesExecucao (janela ou headless); None usa a janela normal
+        """
         print("🎮 Inicializando JokenGhost...")
+        self.opcoes = opcoes or OpcoesExecucao()
+        log.definir_nivel(self.opcoes.log_nivel)
         
-        # Inicialização do Pygame
+        # Inicialização do Pygame (drivers dummy antes de abrir vídeo e áudio no headless)
+        self.opcoes.preparar_ambiente()
         pygame.init()
         pygame.mixer.init()
         
         # Configuração da tela
-        self.tela = pygame.display.set_mode((LARGURA, ALTURA))
+        self.tela = self.opcoes.criar_tela((LARGURA, ALTURA))
         pygame.display.set_caption("JokenGhost - Caçada em Turnos")
-        self.clock = pygame.time.Clock()
+        self.clock = self.opcoes.criar_relogio()
+        self.roteiro = self.opcoes.criar_roteiro()
+        self.passo_fixo = FixedTimestep()
+        self.espera_ociosa = IdleWaiter(ativo=not self.opcoes.headless)
+        self.perfil = FrameProfiler(arquivo_csv=self.opcoes.perfil_csv)
+        self.overlay_perfil = None  # TooltipWidget criado na primeira vez que o F3 é pressionado
+        self.captura_perfil = ProfileCapture()
+        self.fator_quadro = 1.0  # Fração de um quadro de 60 FPS que o passo atual representa
+        self.dirty_rects = DirtyRectTracker(self.tela, fora_da_tela=self.opcoes.headless)
+        self.compositor = LayerCompositor(self.tela.get_size())
         
         # Estado do jogo
         self.estado_jogo = EstadoJogo.MENU
@@ -52,10 +81,13 @@ class JokenGhostGame:
         # Sistemas principais
         self.resource_manager = ResourceManager()
         self.enemy_manager = EnemyManager()
+        self.entidades = EntityStore()  # Estado por quadro dos inimigos (colunas NumPy quando são muitos)
         self.ui_manager = UIManager(self.resource_manager)
-        self.menu_renderer = MenuRenderer(self.resource_manager)
+        self.ui_animations = UIAnimationManager()
+        self.menu_renderer = MenuRenderer(self.resource_manager, self.ui_animations)
         self.sprite_manager = SpriteManager(self.resource_manager)
         self.animation_controller = AnimationController()
+        self.sprite_cache = ScaledSpriteCache()
         
         # Sistemas de notificação
         self.toast_manager = ToastManager(self.resource_manager)
@@ -66,7 +98,8 @@ class JokenGhostGame:
         self.monstruario_manager = MonstruarioOriginal(self.resource_manager)
         
         # === NOVOS SISTEMAS DE COMBATE RPG ===
-        self.combat_system = CombatSystem()
+        self.combat_engine = CombatEngine()
+        self.combat_system = CombatSystem(self.combat_engine)
         self.target_selector = TargetSelector()
         self.simple_damage = SimpleDamageDisplay(self.resource_manager)
         self.result_display = ResultDisplay()
@@ -74,7 +107,6 @@ class JokenGhostGame:
         # === NOVOS SISTEMAS VISUAIS ===
         self.visual_effects = VisualEffectsManager()
         self.enemy_attack_animations = EnemyAttackAnimationManager()
-        self.ui_animations = UIAnimationManager()
         self.economy_manager = EconomyManager()
         
         # Carregar recursos
@@ -89,13 +121,26 @@ class JokenGhostGame:
         print("✅ JokenGhost inicializado com sucesso!")
         
     def carregar_recursos(self):
-        """Carrega todos os recursos do jogo."""
+        """Carrega os recursos do menu e inicia o carregamento da batalha em segundo plano."""
         print("📦 Carregando recursos...")
         
-        # Carregar todos os recursos através do método principal
-        self.resource_manager.carregar_todos_recursos()
+        # Só o menu bloqueia a abertura da janela; o resto chega enquanto o jogador está no menu/intro
+        self.resource_manager.carregar_recursos_menu()
+        self.resource_manager.iniciar_carregamento_em_segundo_plano()
         
-        print("✅ Recursos carregados!")
+        print("✅ Recursos do menu carregados!")
+        
+    def atualizar_carregamento(self):
+        """Avança o carregamento em segundo plano e aplica as sprites quando ele termina."""
+        if self.resource_manager.processar_carregamento():
+            self.carregar_sprites_sistema_original()
+            self._carregar_entidades()  # Os frames do kastle só são conhecidos com as sprites carregadas
+            
+    def garantir_recursos_batalha(self):
+        """Conclui o carregamento pendente antes de entrar na batalha."""
+        if self.resource_manager.concluir_carregamento():
+            self.carregar_sprites_sistema_original()
+            self._carregar_entidades()
         
     def inicializar_jogador(self):
         """Inicializa o estado do jogador."""
@@ -217,16 +262,25 @@ class JokenGhostGame:
         self.inimigos = self.enemy_manager.inimigos
         self.inimigo_atual_index = self.enemy_manager.inimigo_atual_index
         
-        # CORREÇÃO: Garante que todos os inimigos tenham propriedades de animação inicializadas
+        # Enemy já nasce com os campos de animação; só faltam os sprites
         for inimigo in self.inimigos:
-            if 'frame_atual' not in inimigo:
-                inimigo['frame_atual'] = 0
-            if 'tempo_animacao' not in inimigo:
-                inimigo['tempo_animacao'] = 0.0
-            if 'sprites' not in inimigo or inimigo['sprites'] is None:
-                inimigo['sprites'] = sprites_inimigo
+            if inimigo.sprites is None:
+                inimigo.sprites = sprites_inimigo
+        self._carregar_entidades()
                 
-        print(f"🎲 Spawned {num_inimigos} inimigo(s) no modo múltiplos inimigos!")
+        log.info("🎲 Spawned %s inimigo(s) no modo múltiplos inimigos!", num_inimigos)
+        
+    def _carregar_entidades(self):
+        """Recarrega o EntityStore com a lista atual de inimigos."""
+        self.entidades.carregar(self.inimigos, [self._total_frames_inimigo(inimigo) for inimigo in self.inimigos])
+        
+    def _total_frames_inimigo(self, inimigo):
+        """Frames da animação idle pelo tipo de sprite do inimigo."""
+        if inimigo.sprite_tipo == 'kastle':
+            return self.resource_manager.obter_total_frames_inimigo()
+        if inimigo.sprite_tipo == 'ballons':
+            return 1  # Balloons são estáticos
+        return 12  # Ghost (e padrão) tem 12 frames
         
     def obter_inimigo_atual(self):
         """Retorna o inimigo atual da lista de inimigos."""
@@ -248,14 +302,7 @@ class JokenGhostGame:
     def aplicar_shake_inimigo(self, inimigo, intensidade=5, duracao=300):
         """Aplica efeito de tremor ao inimigo específico."""
         if inimigo:
-            inimigo['shake'] = {
-                'ativo': True,
-                'intensidade': intensidade,
-                'duracao': duracao,
-                'tempo_inicio': pygame.time.get_ticks(),
-                'offset_x': 0,
-                'offset_y': 0
-            }
+            inimigo.shake.iniciar(intensidade, duracao, pygame.time.get_ticks())
     
     def atualizar_shake(self):
         """Atualiza efeitos de tremor."""
@@ -271,16 +318,8 @@ class JokenGhostGame:
             else:
                 self.shake_jogador = {'ativo': False, 'intensidade': 0, 'duracao': 0, 'tempo_inicio': 0, 'offset_x': 0, 'offset_y': 0}
         
-        # Shake dos inimigos
-        for inimigo in self.inimigos:
-            if 'shake' in inimigo and inimigo['shake']['ativo']:
-                tempo_decorrido = tempo_atual - inimigo['shake']['tempo_inicio']
-                if tempo_decorrido < inimigo['shake']['duracao']:
-                    intensidade = inimigo['shake']['intensidade']
-                    inimigo['shake']['offset_x'] = random.randint(-intensidade, intensidade)
-                    inimigo['shake']['offset_y'] = random.randint(-intensidade, intensidade)
-                else:
-                    inimigo['shake'] = {'ativo': False, 'intensidade': 0, 'duracao': 0, 'tempo_inicio': 0, 'offset_x': 0, 'offset_y': 0}
+        # Shake dos inimigos (todos de uma vez no EntityStore)
+        self.entidades.atualizar_shakes(tempo_atual)
     
     def atualizar_animacao_personagem(self):
         """Atualiza animação do personagem."""
@@ -292,26 +331,26 @@ class JokenGhostGame:
     def iniciar_alternancia_inimigos(self):
         """Inicia o sistema de alternância de inimigos estilo original."""
         # Mover inimigos que estão na frente para trás
-        inimigos_ativos = [inimigo for inimigo in self.inimigos if inimigo['ativo']]
+        inimigos_ativos = [inimigo for inimigo in self.inimigos if inimigo.ativo]
         
         if len(inimigos_ativos) > 1:
             # Criar animação de slide dos inimigos
             for i, inimigo in enumerate(inimigos_ativos):
-                inimigo['pos_x_inicial'] = inimigo['pos_x']  # Salvar posição inicial
+                inimigo.pos_x_inicial = inimigo.pos_x  # Salvar posição inicial
                 
                 if i == 0:  # Primeiro inimigo (morto) sai pela direita
-                    inimigo['pos_x_destino'] = LARGURA + 200
-                    inimigo['animando_saida'] = True
+                    inimigo.pos_x_destino = LARGURA + 200
+                    inimigo.animando_saida = True
                 else:  # Outros inimigos avançam
                     # Calcular nova posição baseada na ordem
                     nova_pos_x = self.inimigo_pos_final + (i - 1) * 80
-                    inimigo['pos_x_destino'] = nova_pos_x
-                    inimigo['animando_entrada'] = True
+                    inimigo.pos_x_destino = nova_pos_x
+                    inimigo.animando_entrada = True
             
             # Marcar que uma alternância está acontecendo
             self.alternancia_ativa = True
             self.tempo_alternancia = pygame.time.get_ticks()
-            print("🔄 Iniciando alternância de inimigos!")
+            log.debug("🔄 Iniciando alternância de inimigos!")
         else:
             # Se só resta um inimigo ou menos, gerar novos
             self.gerar_novos_inimigos()
@@ -329,43 +368,43 @@ class JokenGhostGame:
             progresso = tempo_decorrido / self.velocidade_alternancia  # 0.0 a 1.0
             
             for inimigo in self.inimigos:
-                if inimigo.get('animando_saida') or inimigo.get('animando_entrada'):
-                    pos_inicial = inimigo.get('pos_x_inicial', inimigo['pos_x'])
-                    pos_destino = inimigo.get('pos_x_destino', inimigo['pos_x'])
+                if inimigo.animando_saida or inimigo.animando_entrada:
+                    pos_inicial = inimigo.pos_x if inimigo.pos_x_inicial is None else inimigo.pos_x_inicial
+                    pos_destino = inimigo.pos_x if inimigo.pos_x_destino is None else inimigo.pos_x_destino
                     
                     # Interpolação suave
-                    nova_pos = pos_inicial + (pos_destino - pos_inicial) * progresso
-                    inimigo['pos_x'] = nova_pos
+                    inimigo.pos_x = pos_inicial + (pos_destino - pos_inicial) * progresso
         else:
             # Animação completa
             for inimigo in self.inimigos:
-                if inimigo.get('pos_x_destino'):
-                    inimigo['pos_x'] = inimigo['pos_x_destino']
-                inimigo.pop('animando_saida', None)
-                inimigo.pop('animando_entrada', None)
-                inimigo.pop('pos_x_destino', None)
-                inimigo.pop('pos_x_inicial', None)
+                if inimigo.pos_x_destino:
+                    inimigo.pos_x = inimigo.pos_x_destino
+                inimigo.animando_saida = None
+                inimigo.animando_entrada = None
+                inimigo.pos_x_destino = None
+                inimigo.pos_x_inicial = None
             
             # Remover inimigos inativos que saíram da tela
             self.inimigos = [inimigo for inimigo in self.inimigos 
-                           if inimigo['ativo'] or inimigo['pos_x'] < LARGURA]
+                           if inimigo.ativo or inimigo.pos_x < LARGURA]
+            self._carregar_entidades()
             
             self.alternancia_ativa = False
-            print("✅ Alternância de inimigos completa!")
+            log.debug("✅ Alternância de inimigos completa!")
     
     def iniciar_rotacao_inimigos(self):
         """Sistema de rotação de inimigos a cada turno (como no original)."""
-        inimigos_ativos = [inimigo for inimigo in self.inimigos if inimigo['ativo']]
+        inimigos_ativos = [inimigo for inimigo in self.inimigos if inimigo.ativo]
         
         if len(inimigos_ativos) <= 1:
             return  # Não há o que rotar
         
-        print(f"🔄 Iniciando rotação de {len(inimigos_ativos)} inimigos...")
+        log.debug("🔄 Iniciando rotação de %s inimigos...", len(inimigos_ativos))
         
         # === Rotação circular: primeiro vai para trás, todos avançam uma posição ===
         # Salvar posições atuais
         for inimigo in inimigos_ativos:
-            inimigo['pos_x_inicial'] = inimigo['pos_x']
+            inimigo.pos_x_inicial = inimigo.pos_x
         
         # Reorganizar posições (rotação circular)
         for i, inimigo in enumerate(inimigos_ativos):
@@ -377,8 +416,8 @@ class JokenGhostGame:
             else:  # Vai para trás
                 nova_pos_x = self.inimigo_pos_final + nova_posicao * 80
             
-            inimigo['pos_x_destino'] = nova_pos_x
-            inimigo['animando_rotacao'] = True
+            inimigo.pos_x_destino = nova_pos_x
+            inimigo.animando_rotacao = True
         
         # Marcar rotação ativa
         self.rotacao_ativa = True
@@ -388,7 +427,7 @@ class JokenGhostGame:
         # Atualizar índice do inimigo atual
         if len(inimigos_ativos) > 1:
             self.inimigo_atual_index = (self.inimigo_atual_index + 1) % len(self.inimigos)
-            print(f"👁️ Novo inimigo da frente: {inimigos_ativos[1]['nome'] if len(inimigos_ativos) > 1 else 'Último'}")
+            log.debug("👁️ Novo inimigo da frente: %s", inimigos_ativos[1].nome if len(inimigos_ativos) > 1 else 'Último')
     
     def atualizar_rotacao_inimigos(self):
         """Atualiza a animação de rotação de inimigos."""
@@ -406,31 +445,35 @@ class JokenGhostGame:
             progresso_suave = 0.5 * (1 - math.cos(progresso * math.pi))
             
             for inimigo in self.inimigos:
-                if inimigo.get('animando_rotacao'):
-                    pos_inicial = inimigo.get('pos_x_inicial', inimigo['pos_x'])
-                    pos_destino = inimigo.get('pos_x_destino', inimigo['pos_x'])
+                if inimigo.animando_rotacao:
+                    pos_inicial = inimigo.pos_x if inimigo.pos_x_inicial is None else inimigo.pos_x_inicial
+                    pos_destino = inimigo.pos_x if inimigo.pos_x_destino is None else inimigo.pos_x_destino
                     
                     # Interpolação suave
-                    nova_pos = pos_inicial + (pos_destino - pos_inicial) * progresso_suave
-                    inimigo['pos_x'] = nova_pos
+                    inimigo.pos_x = pos_inicial + (pos_destino - pos_inicial) * progresso_suave
         else:
             # Animação completa
             for inimigo in self.inimigos:
-                if inimigo.get('pos_x_destino'):
-                    inimigo['pos_x'] = inimigo['pos_x_destino']
-                inimigo.pop('animando_rotacao', None)
-                inimigo.pop('pos_x_destino', None)
-                inimigo.pop('pos_x_inicial', None)
+                if inimigo.pos_x_destino:
+                    inimigo.pos_x = inimigo.pos_x_destino
+                inimigo.animando_rotacao = None
+                inimigo.pos_x_destino = None
+                inimigo.pos_x_inicial = None
             
             self.rotacao_ativa = False
-            print("✅ Rotação de inimigos completa!")
+            log.debug("✅ Rotação de inimigos completa!")
         
     def processar_eventos(self):
         """Processa todos os eventos do jogo."""
         for evento in pygame.event.get():
+            self.dirty_rects.tratar_evento(evento)
             if evento.type == pygame.QUIT:
                 self.rodando = False
                 
+            # F4: captura cProfile + pilhas dos próximos quadros, em qualquer tela
+            elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_F4:
+                self.captura_perfil.iniciar()
+                
             elif evento.type == pygame.KEYDOWN:
                 self.processar_tecla(evento.key)
                 
@@ -440,12 +483,18 @@ class JokenGhostGame:
                     
     def processar_tecla(self, tecla):
         """Processa entrada de teclado (IDÊNTICO AO ORIGINAL)."""
+        # F3: overlay de desempenho, disponível em qualquer tela
+        if tecla == pygame.K_F3:
+            self.perfil.alternar_overlay()
+            return
+            
         # Primeiro, verifica se o monstruário deve processar a tecla
         if self.monstruario_manager.processar_tecla(pygame.event.Event(pygame.KEYDOWN, key=tecla)):
             return
                 
         if self.estado_jogo == EstadoJogo.INTRO:
             if tecla == pygame.K_SPACE:
+                self.garantir_recursos_batalha()
                 self.estado_jogo = EstadoJogo.TRANSICAO
                 self.tempo_transicao = 0
                 self.transicao_alpha = 0
@@ -454,7 +503,7 @@ class JokenGhostGame:
             # NOVA LÓGICA: ESC para cancelar seleção de alvo
             if tecla == pygame.K_ESCAPE and self.target_selector.modo_selecao_ativo:
                 self.target_selector.desativar_modo_selecao()
-                print("❌ Seleção de alvo cancelada")
+                log.debug("❌ Seleção de alvo cancelada")
                 return
                 
             # Tecla R para gerar novos inimigos
@@ -464,7 +513,8 @@ class JokenGhostGame:
                 self.escolha_inimigo = None
                 self.resultado_combate = ""
                 self.combat_system.limpar_selecao()  # Limpa seleção de combate
-                print("🔄 Novos inimigos gerados!")
+                self.target_selector.desativar_modo_selecao()  # Alvos antigos não valem mais
+                log.debug("🔄 Novos inimigos gerados!")
                 
             # Teclas de atalho para ataques (1, 2, 3)
             if tecla == pygame.K_1:
@@ -499,7 +549,7 @@ class JokenGhostGame:
         if self.target_selector.modo_selecao_ativo:
             alvo_selecionado = self.target_selector.processar_clique(pos, self.inimigos)
             if alvo_selecionado is not None:
-                print(f"🎯 Alvo selecionado: {self.inimigos[alvo_selecionado]['nome']}")
+                log.debug("🎯 Alvo selecionado: %s", self.inimigos[alvo_selecionado].nome)
             return
             
         # Verifica se há menu aberto
@@ -527,19 +577,18 @@ class JokenGhostGame:
         mouse_x, mouse_y = pos
         
         for i, inimigo in enumerate(self.inimigos):
-            if not inimigo['ativo'] or inimigo['vida_atual'] <= 0:
+            if not inimigo.vivo:
                 continue
                 
             # Usar posição visual se disponível, senão posição normal
-            if 'pos_visual' in inimigo:
-                inimigo_x, inimigo_y = inimigo['pos_visual']
+            if inimigo.pos_visual is not None:
+                inimigo_x, inimigo_y = inimigo.pos_visual
             else:
-                inimigo_x = inimigo.get('pos_x', 400)
-                inimigo_y = inimigo.get('pos_y', 200)
+                inimigo_x, inimigo_y = inimigo.pos_x, inimigo.pos_y
                 
             # Área clicável do inimigo (baseada no tamanho)
-            largura = inimigo.get('largura', 80)
-            altura = inimigo.get('altura', 100)
+            largura = inimigo.largura
+            altura = inimigo.altura
             
             # Criar retângulo de detecção (um pouco maior para facilitar o clique)
             margem = 10
@@ -552,7 +601,7 @@ class JokenGhostGame:
             
             # Verificar se o clique está dentro do retângulo
             if inimigo_rect.collidepoint(mouse_x, mouse_y):
-                print(f"🎯 Clique detectado no inimigo {i}: {inimigo['nome']} em ({inimigo_x}, {inimigo_y})")
+                log.debug("🎯 Clique detectado no inimigo %s: %s em (%s, %s)", i, inimigo.nome, inimigo_x, inimigo_y, limitar=True)
                 return i
                 
         return None
@@ -613,7 +662,7 @@ class JokenGhostGame:
     def abrir_menu_monstruario(self):
         """Abre/fecha o monstruário (IDÊNTICO AO ORIGINAL)."""
         self.monstruario_manager.ativo = not self.monstruario_manager.ativo
-        print(f"📖 Monstruário {'aberto' if self.monstruario_manager.ativo else 'fechado'}")
+        log.debug("📖 Monstruário %s", 'aberto' if self.monstruario_manager.ativo else 'fechado')
         
     def descobrir_fraqueza(self, tipo_inimigo, ataque_usado):
         """Sistema de descoberta de fraquezas através do jogo (IDÊNTICO AO ORIGINAL)."""
@@ -644,13 +693,13 @@ class JokenGhostGame:
             if tipo_inimigo.lower() not in self.monstruario_manager.monstruario_descoberto:
                 descoberta_permitida = (arma_usada == 'Estaca')
                 if not descoberta_permitida:
-                    print(f"⚠️ {tipo_inimigo.title()} só pode ser descoberto com Estaca (pedra)!")
+                    log.aviso("⚠️ %s só pode ser descoberto com Estaca (pedra)!", tipo_inimigo.title())
                     return
         
         tipo_lower = tipo_inimigo.lower()
         if (tipo_lower in fraquezas_reais and arma_usada in fraquezas_reais[tipo_lower] and descoberta_permitida):
             self.monstruario_manager.descobrir_inimigo(tipo_lower, arma_usada)
-            print(f"🔍 Fraqueza descoberta para {tipo_inimigo}: {arma_usada}")
+            log.info("🔍 Fraqueza descoberta para %s: %s", tipo_inimigo, arma_usada)
         
     def registrar_encontro_inimigo(self, tipo_inimigo):
         """Registra encontro com inimigo."""
@@ -665,24 +714,24 @@ class JokenGhostGame:
         NOVO FLUXO: Processa clique em um inimigo para selecioná-lo como alvo.
         """
         if self.esperando_rotacao:
-            print("⏳ Aguardando rotação, ignorando seleção...")
+            log.debug("⏳ Aguardando rotação, ignorando seleção...")
             return
             
-        print(f"🎯 Inimigo {indice_inimigo} selecionado como alvo!")
+        log.debug("🎯 Inimigo %s selecionado como alvo!", indice_inimigo)
         
         # Guardar o alvo selecionado
         self.alvo_selecionado = indice_inimigo
         
         # Verificar se o inimigo é válido
-        if indice_inimigo >= len(self.inimigos) or not self.inimigos[indice_inimigo]['ativo'] or self.inimigos[indice_inimigo]['vida_atual'] <= 0:
-            print("❌ Inimigo inválido!")
+        if indice_inimigo >= len(self.inimigos) or not self.inimigos[indice_inimigo].vivo:
+            log.aviso("❌ Inimigo inválido!")
             return
             
-        nome_inimigo = self.inimigos[indice_inimigo]['nome']
-        print(f"✅ Alvo confirmado: {nome_inimigo}")
+        nome_inimigo = self.inimigos[indice_inimigo].nome
+        log.debug("✅ Alvo confirmado: %s", nome_inimigo)
         
         # Mostrar menu de ataques
-        print("📋 Abrindo menu de ataques para alvo selecionado...")
+        log.debug("📋 Abrindo menu de ataques para alvo selecionado...")
         self.ui_manager.abrir_menu_selecao(TipoMenu.ATAQUES)
         
     def processar_escolha_ataque_com_alvo(self, escolha):
@@ -690,14 +739,14 @@ class JokenGhostGame:
         NOVO FLUXO: Processa escolha de ataque quando já há um alvo selecionado.
         """
         if not hasattr(self, 'alvo_selecionado') or self.alvo_selecionado is None:
-            print("❌ Nenhum alvo selecionado!")
+            log.aviso("❌ Nenhum alvo selecionado!")
             return
             
         if self.esperando_rotacao:
-            print("⏳ Aguardando rotação, ignorando ataque...")
+            log.debug("⏳ Aguardando rotação, ignorando ataque...")
             return
             
-        print(f"⚔️ Atacando com {escolha} → Inimigo {self.alvo_selecionado}")
+        log.debug("⚔️ Atacando com %s → Inimigo %s", escolha, self.alvo_selecionado)
         
         # Fechar menu de ataques
         self.ui_manager.fechar_menu_selecao()
@@ -707,13 +756,13 @@ class JokenGhostGame:
         
         # Selecionar o alvo no sistema de combate
         if self.combat_system.selecionar_alvo(self.inimigos, self.alvo_selecionado):
-            print("✅ Alvo confirmado no sistema de combate, executando...")
+            log.debug("✅ Alvo confirmado no sistema de combate, executando...")
             self.executar_combate_rpg()
             
             # Limpar alvo após combate
             self.alvo_selecionado = None
         else:
-            print("❌ Erro ao selecionar alvo no sistema de combate!")
+            log.aviso("❌ Erro ao selecionar alvo no sistema de combate!")
             self.alvo_selecionado = None
         
     def processar_escolha_ataque(self, escolha):
@@ -727,10 +776,10 @@ class JokenGhostGame:
             return
             
         if self.esperando_rotacao:
-            print("⏳ Aguardando rotação, ignorando ataque...")
+            log.debug("⏳ Aguardando rotação, ignorando ataque...")
             return
             
-        print(f"⚔️ Processando ataque: {escolha}")
+        log.debug("⚔️ Processando ataque: %s", escolha)
         
         # Fechar menu de ataques
         self.ui_manager.fechar_menu_selecao()
@@ -741,195 +790,151 @@ class JokenGhostGame:
         # Ativar modo de seleção de alvo
         def callback_alvo_selecionado(indice_alvo):
             """Callback chamado quando alvo é selecionado."""
-            print(f"🎯 Callback alvo selecionado: {indice_alvo}")
+            log.debug("🎯 Callback alvo selecionado: %s", indice_alvo)
             if self.combat_system.selecionar_alvo(self.inimigos, indice_alvo):
-                print("✅ Alvo válido, executando combate...")
+                log.debug("✅ Alvo válido, executando combate...")
                 self.executar_combate_rpg()
             else:
-                print("❌ Alvo inválido!")
+                log.debug("❌ Alvo inválido!")
                 
         # Verificar se há inimigos vivos
         inimigos_vivos = self.combat_system.obter_inimigos_vivos(self.inimigos)
-        print(f"👹 Inimigos vivos encontrados: {inimigos_vivos}")
+        log.debug("👹 Inimigos vivos encontrados: %s", inimigos_vivos)
         
         if not inimigos_vivos:
-            print("❌ Não há inimigos para atacar!")
+            log.aviso("❌ Não há inimigos para atacar!")
             return
             
         # Se há apenas um inimigo, ataca diretamente
         if len(inimigos_vivos) == 1:
-            print(f"🎯 Apenas um inimigo, atacando diretamente: {inimigos_vivos[0]}")
+            log.debug("🎯 Apenas um inimigo, atacando diretamente: %s", inimigos_vivos[0])
             callback_alvo_selecionado(inimigos_vivos[0])
         else:
-            print(f"🎯 Múltiplos inimigos ({len(inimigos_vivos)}), ativando seleção...")
+            log.debug("🎯 Múltiplos inimigos (%s), ativando seleção...", len(inimigos_vivos))
             # Múltiplos inimigos - ativar seleção
             self.target_selector.ativar_modo_selecao(callback_alvo_selecionado)
     
     def executar_combate_rpg(self):
         """Executa o combate com o novo sistema RPG."""
-        print("🔥 EXECUTANDO COMBATE RPG!")
-        print(f"⚔️ Escolha do jogador: {self.escolha_jogador}")
+        log.debug("🔥 EXECUTANDO COMBATE RPG!")
+        log.debug("⚔️ Escolha do jogador: %s", self.escolha_jogador)
         
-        # Processar combate completo
-        resultado_combate = self.combat_system.processar_combate_completo(
-            self.inimigos, self.escolha_jogador
-        )
+        alvo = self.combat_system.alvo_selecionado
+        if alvo is None:
+            log.erro("❌ Erro no combate: %s", "Nenhum alvo selecionado")
+            return
+        self.combat_system.limpar_selecao()
+        if self.escolha_jogador not in ESCOLHAS:
+            log.aviso("❌ Combate cancelado: nenhum ataque escolhido (%s)", self.escolha_jogador)
+            return
         
-        print(f"📊 Resultado do combate: {resultado_combate.get('resultado_principal', 'ERRO')}")
+        # Regras puras: o motor devolve as vidas novas e os eventos do turno
+        descobertos = {tipo: dados['fraquezas'] for tipo, dados in self.monstruario_manager.monstruario_descoberto.items()}
+        resultado_combate = self.combat_engine.resolver_turno(
+            self.inimigos, self.stats_jogador['vida_atual'], self.escolha_jogador, alvo, descobertos
+        )
         
-        if "erro" in resultado_combate:
-            print(f"❌ Erro no combate: {resultado_combate['erro']}")
-            return
+        log.debug("📊 Resultado do combate: %s", resultado_combate['resultado'])
             
         # Aplicar resultados
-        print("🎬 Aplicando resultados do combate...")
+        log.debug("🎬 Aplicando resultados do combate...")
         self.aplicar_resultados_combate_rpg(resultado_combate)
         
         # Iniciar animações
-        print("🎭 Iniciando animações do jogador...")
+        log.debug("🎭 Iniciando animações do jogador...")
         self.sprite_manager.iniciar_ataque_jogador()
         
         # Iniciar espera para próxima rodada
-        print("⏳ Iniciando espera para próxima rodada...")
+        log.debug("⏳ Iniciando espera para próxima rodada...")
         self.iniciar_espera_rotacao()
     
     def aplicar_resultados_combate_rpg(self, resultado):
-        """Aplica os resultados do novo sistema de combate."""
-        from core.combat_system import ResultadoCombate
+        """
+        Aplica o turno resolvido pelo CombatEngine e anima cada evento.
         
-        # === NOVO: Mostrar resultado visual ===
-        escolha_inimigo = resultado.get('escolha_inimigo', None)
-        detalhes_combate = {}
+        Args:
+            resultado: Dict retornado por CombatEngine.resolver_turno
+        """
+        # === Estado: vidas e dinheiro calculados pelo motor ===
+        for inimigo, vida in zip(self.inimigos, resultado['vidas']):
+            inimigo.vida_atual = vida
+        self.stats_jogador['vida_atual'] = resultado['vida_jogador']
+        self.dinheiro += resultado['recompensa']
         
-        if resultado['resultado_principal'] == ResultadoCombate.VITORIA:
-            # === Calcular recompensa baseada em efetividade ===
-            recompensa_data = self.economy_manager.calcular_recompensa_vitoria(
-                self.escolha_jogador, 'fantasma', 25
-            )
-            
-            # Vitória - aplicar dano aos inimigos
-            alvo_principal = resultado['alvo_principal']
-            total_recompensa = 0
-            
-            if alvo_principal:
-                total_recompensa += recompensa_data['recompensa']
-                
-                print(f"💰 {recompensa_data['descricao']}! +${recompensa_data['recompensa']} moedas.")
-                print(f"👹 Inimigo {alvo_principal['nome']} - Vida antes: {alvo_principal['vida_antes']}, depois: {alvo_principal['vida_depois']}")
-                print(f"👹 Inimigo recebeu {alvo_principal['dano_real']} de dano! Vida: {alvo_principal['vida_depois']}")
-                
-                # === ADICIONAR NÚMERO DE DANO VISUAL ===
-                inimigo_dict = alvo_principal.get('inimigo_ref')
-                if inimigo_dict:
-                    # Calcular posição do inimigo
-                    indice_inimigo = next((i for i, inimigo in enumerate(self.inimigos) if inimigo == inimigo_dict), 0)
-                    inimigo_x = 480 + (indice_inimigo % 3) * 100
-                    inimigo_y = 200 + (indice_inimigo // 3) * 100
-                    # Adicionar número de dano vermelho
-                    self.simple_damage.adicionar_dano(alvo_principal['dano_real'], inimigo_x, inimigo_y, (255, 100, 100))
-                
-                # === NOVO: Shake no inimigo principal ===
-                inimigo_dict = alvo_principal.get('inimigo_ref')
-                if inimigo_dict:
-                    # Encontrar índice do inimigo
-                    for i, inimigo in enumerate(self.inimigos):
-                        if inimigo is inimigo_dict:
-                            # Shake mais suave: intensidade 6, duração 0.3s
-                            self.visual_effects.iniciar_shake_inimigo(i, 6, 0.3)
-                            break
+        detalhes_combate = {}
+        for evento in resultado['eventos']:
+            tipo = evento['tipo']
+            
+            if tipo == 'dano_inimigo':
+                # === NÚMERO DE DANO E SHAKE NO INIMIGO ===
+                indice_inimigo = evento['indice']
+                inimigo_x = 480 + (indice_inimigo % 3) * 100
+                inimigo_y = 200 + (indice_inimigo // 3) * 100
+                if evento['area']:
+                    log.debug("💥 %s foi atingido por dano secundário: %s", evento['nome'], evento['dano_real'])
+                    # Laranja e shake menor para dano secundário
+                    self.simple_damage.adicionar_dano(evento['dano_real'], inimigo_x, inimigo_y, (255, 150, 50))
+                    self.visual_effects.iniciar_shake_inimigo(indice_inimigo, 4, 0.25)
+                    detalhes_combate.setdefault('inimigos_secundarios', []).append(evento)
+                else:
+                    log.debug("👹 Inimigo %s - Vida antes: %s, depois: %s", evento['nome'], evento['vida_antes'], evento['vida_depois'])
+                    # Vermelho; shake mais suave: intensidade 6, duração 0.3s
+                    self.simple_damage.adicionar_dano(evento['dano_real'], inimigo_x, inimigo_y, (255, 100, 100))
+                    self.visual_effects.iniciar_shake_inimigo(indice_inimigo, 6, 0.3)
+                    detalhes_combate['alvo_principal'] = evento
                     
-                    # REMOVIDO: damage_display antigo - usando SimpleDamageDisplay
+            elif tipo == 'inimigo_derrotado':
+                log.info("💀 %s foi derrotado!", evento['nome'])
+                self.registrar_derrota_inimigo(evento['inimigo'] or 'ghost')
                 
-                # Verificar se morreu
-                if alvo_principal['morreu']:
-                    print(f"💀 {alvo_principal['nome']} foi derrotado!")
-                    
-            # Dano em inimigos secundários + bonus
-            bonus_area = self.economy_manager.calcular_recompensa_area_effect(
-                self.escolha_jogador, resultado['inimigos_secundarios']
-            )
-            total_recompensa += bonus_area
-            
-            for inimigo_sec in resultado['inimigos_secundarios']:
-                print(f"💥 {inimigo_sec['nome']} foi atingido por dano secundário: {inimigo_sec['dano_real']}")
+            elif tipo == 'descoberta':
+                self.monstruario_manager.descobrir_inimigo(evento['inimigo'], evento['arma'])
+                log.debug("🔍 Fraqueza descoberta para %s: %s", evento['inimigo'], evento['arma'])
                 
-                # === ADICIONAR NÚMERO DE DANO VISUAL SECUNDÁRIO ===
-                inimigo_dict = inimigo_sec.get('inimigo_ref')
-                if inimigo_dict:
-                    # Encontrar índice do inimigo
-                    indice_inimigo = next((i for i, inimigo in enumerate(self.inimigos) if inimigo == inimigo_dict), 0)
-                    inimigo_x = 480 + (indice_inimigo % 3) * 100
-                    inimigo_y = 200 + (indice_inimigo // 3) * 100
-                    # Adicionar número de dano laranja para secundário
-                    self.simple_damage.adicionar_dano(inimigo_sec['dano_real'], inimigo_x, inimigo_y, (255, 150, 50))
+            elif tipo == 'recompensa':
+                if evento['motivo'] == 'acerto':
+                    log.info("💰 %s! +$%s moedas.", evento['descricao'], evento['valor'])
+                    detalhes_combate['efetividade_texto'] = f"({evento['descricao']})"
                     
-                    # Shake nos inimigos secundários
-                    self.visual_effects.iniciar_shake_inimigo(indice_inimigo, 4, 0.25)
+            elif tipo == 'vitoria_total':
+                log.info("🏆 Vitória total! +%s moedas de bônus!", evento['valor'])
                 
-                if inimigo_sec['morreu']:
-                    print(f"💀 {inimigo_sec['nome']} foi derrotado por dano em área!")
-                    
-            # Aplicar recompensa total
-            self.dinheiro += total_recompensa
-            print(f"💰 Total ganho: ${total_recompensa}. Saldo: ${self.dinheiro}")
-            
-            # Preparar detalhes para o resultado visual
-            detalhes_combate = {
-                'alvo_principal': alvo_principal,
-                'inimigos_secundarios': resultado['inimigos_secundarios'],
-                'recompensa_dinheiro': total_recompensa,
-                'efetividade_texto': f"({recompensa_data['descricao']})"
-            }
-            
-            # === Mostrar resultado de vitória ===
-            self.result_display.mostrar_resultado(
-                self.escolha_jogador, escolha_inimigo, "vitoria", detalhes_combate
-            )
+            elif tipo == 'dano_jogador':
+                if evento['contra_ataque']:
+                    inimigo = self.inimigos[evento['indice']]
+                    log.info("💔 %s acertou! Jogador recebeu %s de dano! Vida: %s", inimigo.nome, evento['dano'], evento['vida_depois'])
+                    # Vermelho intenso para contra-ataque
+                    self.simple_damage.adicionar_dano(evento['dano'], 200, 400, (255, 50, 50))
+                    self.visual_effects.iniciar_shake_jogador(6, 0.3)
+                    self.enemy_attack_animations.iniciar_animacao_ataque(evento['indice'], inimigo)
+                else:
+                    log.info("💔 Jogador recebeu %s de dano! Vida: %s", evento['dano'], evento['vida_depois'])
+                    # Rosa para dano do jogador; shake mais suave: intensidade 8, duração 0.4s
+                    self.simple_damage.adicionar_dano(evento['dano'], 200, 400, (255, 100, 150))
+                    self.visual_effects.iniciar_shake_jogador(8, 0.4)
+                    # === Animação de ataque dos inimigos ===
+                    for i, inimigo in enumerate(self.inimigos):
+                        if inimigo.vivo:
+                            self.enemy_attack_animations.iniciar_animacao_ataque(i, inimigo)
+                    detalhes_combate['dano_ao_jogador'] = evento['dano']
                     
-        elif resultado['resultado_principal'] == ResultadoCombate.DERROTA:
-            # === Mostrar resultado de derrota ===
-            
-            # Derrota - jogador toma dano
-            dano = resultado['dano_ao_jogador']
-            self.stats_jogador['vida_atual'] = max(0, self.stats_jogador['vida_atual'] - dano)
-            print(f"💔 Jogador recebeu {dano} de dano! Vida: {self.stats_jogador['vida_atual']}")
-            
-            # === ADICIONAR NÚMERO DE DANO VISUAL NO JOGADOR ===
-            self.simple_damage.adicionar_dano(dano, 200, 400, (255, 100, 150))  # Rosa para dano do jogador
-            
-            # === NOVO: Shake no jogador ===
-            # Shake mais suave: intensidade 8, duração 0.4s
-            self.visual_effects.iniciar_shake_jogador(8, 0.4)
-            
-            # === NOVO: Animação de ataque dos inimigos ===
-            for i, inimigo in enumerate(self.inimigos):
-                if inimigo['ativo'] and inimigo['vida_atual'] > 0:
-                    self.enemy_attack_animations.iniciar_animacao_ataque(i, inimigo)
-            
-            # === Mostrar dano visual no jogador ===
-            # REMOVIDO: damage_display antigo - usando SimpleDamageDisplay
-            
-            # Preparar detalhes
-            detalhes_combate = {
-                'dano_ao_jogador': dano
-            }
-            
-            self.result_display.mostrar_resultado(
-                self.escolha_jogador, escolha_inimigo, "derrota", detalhes_combate
-            )
-            
-            # === NOVO: Contra-ataque de outros inimigos ===
-            self._processar_contra_ataques_inimigos()
-            
-        elif resultado['resultado_principal'] == ResultadoCombate.EMPATE:
-            # === Mostrar resultado de empate ===
-            self.result_display.mostrar_resultado(
-                self.escolha_jogador, escolha_inimigo, "empate", detalhes_combate
-            )
-            print("🤝 Empate! Ninguém sofreu dano.")
-            
-            # === NOVO: Contra-ataque de outros inimigos no empate também ===
-            self._processar_contra_ataques_inimigos()
+            elif tipo == 'contra_ataque':
+                log.debug("👻 %s contra-ataca com %s", evento['nome'], evento['escolha'])
+                if evento['resultado'] == ResultadoCombate.VITORIA:
+                    log.info("🛡️ Você defendeu o contra-ataque de %s!", evento['nome'])
+                elif evento['resultado'] == ResultadoCombate.EMPATE:
+                    log.info("🤝 Contra-ataque de %s foi neutro", evento['nome'])
+        
+        if resultado['resultado'] == ResultadoCombate.VITORIA:
+            detalhes_combate['recompensa_dinheiro'] = resultado['recompensa']
+            log.info("💰 Total ganho: $%s. Saldo: $%s", resultado['recompensa'], self.dinheiro)
+        elif resultado['resultado'] == ResultadoCombate.EMPATE:
+            log.info("🤝 Empate! Ninguém sofreu dano.")
+        
+        # === Mostrar resultado visual ===
+        self.result_display.mostrar_resultado(
+            self.escolha_jogador, resultado['escolha_inimigo'], resultado['resultado'].value, detalhes_combate
+        )
         
     def processar_compra_item(self, item):
         """Processa a compra de um item da loja."""
@@ -940,10 +945,10 @@ class JokenGhostGame:
             # Corrigido: usar aplicar_efeito_item em vez de aplicar_buff_item
             resultado = self.loja_manager.aplicar_efeito_item(item, self.stats_jogador)
             self.notification_system.notificar_compra(item.nome, preco)
-            print(f"✅ {resultado}")
+            log.info("✅ %s", resultado)
         else:
             self.notification_system.notificar_dinheiro_insuficiente()
-            print("❌ Dinheiro insuficiente!")
+            log.aviso("❌ Dinheiro insuficiente!")
             
     def calcular_resultado_combate(self):
         """Calcula o resultado do combate."""
@@ -988,7 +993,7 @@ class JokenGhostGame:
             return
             
         # Registra encontro com inimigo para o monstruário
-        tipo_inimigo = inimigo_atual.get('tipo', 'ghost')
+        tipo_inimigo = inimigo_atual.tipo or 'ghost'
         self.registrar_encontro_inimigo(tipo_inimigo)
         
         # === SISTEMA DE TREMOR PARA INIMIGO ===
@@ -1005,7 +1010,7 @@ class JokenGhostGame:
         
         # Aplicar dano fixo ao inimigo (idêntico ao original)
         dano = DANO_JOGADOR  # 25 de dano fixo
-        inimigo_atual['vida_atual'] -= dano
+        inimigo_atual.vida_atual -= dano
         
         # === REMOVIDO: sistema_texto_flutuante para evitar números duplicados ===
         # O damage_display já está mostrando os números adequadamente
@@ -1017,22 +1022,22 @@ class JokenGhostGame:
             recompensa_acerto = RECOMPENSA_PADRAO  # 15 - Recompensa padrão para outras armas
         
         self.dinheiro += recompensa_acerto
-        print(f"💰 Acertou! +{recompensa_acerto} moedas. Total: ${self.dinheiro}")
+        log.info("💰 Acertou! +%s moedas. Total: $%s", recompensa_acerto, self.dinheiro)
         
         # Mostrar "+$X" em cima do inimigo (COMO NO ORIGINAL)
-        inimigo_centro_x = inimigo_atual['pos_x'] + inimigo_atual['largura'] // 2
-        inimigo_centro_y = inimigo_atual['pos_y'] + 20  # Um pouco acima do inimigo
+        inimigo_centro_x = inimigo_atual.pos_x + inimigo_atual.largura // 2
+        inimigo_centro_y = inimigo_atual.pos_y + 20  # Um pouco acima do inimigo
         self.simple_damage.adicionar_dinheiro(recompensa_acerto, inimigo_centro_x, inimigo_centro_y)
         
         # === REMOVIDO: shake duplicado, agora usa apenas o visual_effects ===
         
         # Verificar se inimigo morreu
-        print(f"👹 Inimigo {inimigo_atual['nome']} - Vida antes: {inimigo_atual['vida_atual'] + dano}, depois: {inimigo_atual['vida_atual']}")
-        if inimigo_atual['vida_atual'] <= 0:
-            print(f"💀 Inimigo {inimigo_atual['nome']} foi derrotado!")
+        log.debug("👹 Inimigo %s - Vida antes: %s, depois: %s", inimigo_atual.nome, inimigo_atual.vida_atual + dano, inimigo_atual.vida_atual)
+        if inimigo_atual.vida_atual <= 0:
+            log.info("💀 Inimigo %s foi derrotado!", inimigo_atual.nome)
             self.processar_morte_inimigo()
         else:
-            print(f"👹 Inimigo recebeu {dano} de dano! Vida: {inimigo_atual['vida_atual']}")
+            log.info("👹 Inimigo recebeu %s de dano! Vida: %s", dano, inimigo_atual.vida_atual)
             
     def processar_derrota_jogador(self):
         """Processa derrota do jogador."""
@@ -1050,20 +1055,20 @@ class JokenGhostGame:
         # === REMOVIDO: sistema_texto_flutuante para evitar números duplicados ===
         # O damage_display já está mostrando os números adequadamente
         
-        print(f"💔 Jogador recebeu {dano} de dano! Vida: {self.stats_jogador['vida_atual']}")
+        log.info("💔 Jogador recebeu %s de dano! Vida: %s", dano, self.stats_jogador['vida_atual'])
         
         # Verificar game over
         if self.stats_jogador['vida_atual'] <= 0:
-            print("💀 GAME OVER DETECTADO! Mudando estado para RESULTADO")
+            log.info("💀 GAME OVER DETECTADO! Mudando estado para RESULTADO")
             self.estado_jogo = EstadoJogo.RESULTADO
             self.notification_system.notificar_derrota()
             # === LIMPEZA AGRESSIVA DE TODOS OS SISTEMAS VISUAIS ===
             self.simple_damage.limpar_todos()
             self.result_display.limpar_resultado()
             self.visual_effects.limpar_todos_shakes()
-            print(f"🏴 Estado atual do jogo: {self.estado_jogo}")
-            print(f"💔 Vida do jogador: {self.stats_jogador['vida_atual']}")
-            print("🧹 Todos os sistemas visuais foram limpos para Game Over")
+            log.debug("🏴 Estado atual do jogo: %s", self.estado_jogo)
+            log.debug("💔 Vida do jogador: %s", self.stats_jogador['vida_atual'])
+            log.debug("🧹 Todos os sistemas visuais foram limpos para Game Over")
             
     def processar_morte_inimigo(self):
         """Processa a morte de um inimigo."""
@@ -1072,7 +1077,7 @@ class JokenGhostGame:
             return
             
         # Registrar derrota do inimigo no monstruário
-        tipo_inimigo = inimigo_atual.get('tipo', 'ghost')
+        tipo_inimigo = inimigo_atual.tipo or 'ghost'
         self.registrar_derrota_inimigo(tipo_inimigo)
         
         # Sistema de recompensa idêntico ao original
@@ -1090,67 +1095,46 @@ class JokenGhostGame:
         self.aplicar_shake_inimigo(inimigo_atual, intensidade=15, duracao=800)
         
         # Marcar inimigo como inativo
-        inimigo_atual['ativo'] = False
-        inimigo_atual['vida_atual'] = 0
+        inimigo_atual.ativo = False
+        inimigo_atual.vida_atual = 0
         
         # === NOVO: Sistema de alternância de inimigos estilo original ===
         self.iniciar_alternancia_inimigos()
         
         # Verificar se há inimigos restantes
-        inimigos_restantes = [i for i in self.inimigos if i['ativo'] and i['vida_atual'] > 0]
+        inimigos_restantes = [i for i in self.inimigos if i.vivo]
         if len(inimigos_restantes) > 0:
             # Define o primeiro inimigo restante como atual
             self.inimigo_atual_index = self.inimigos.index(inimigos_restantes[0])
-            print(f"👁️ Novo inimigo da frente: {inimigos_restantes[0]['nome']}")
+            log.debug("👁️ Novo inimigo da frente: %s", inimigos_restantes[0].nome)
         else:
             # Todos inimigos derrotados - vitória total
             recompensa_vitoria = len(self.inimigos) * RECOMPENSA_VITORIA_BASE
             self.dinheiro += recompensa_vitoria
-            print(f"🏆 Vitória total! +{recompensa_vitoria} moedas de bônus!")
+            log.info("🏆 Vitória total! +%s moedas de bônus!", recompensa_vitoria)
             self.gerar_inimigos_aleatorios()  # Gerar nova batalha
         
         # Notificações
         self.notification_system.notificar_vitoria()
         self.notification_system.notificar_recompensa(recompensa_acerto)
         
-        print(f"💰 Inimigo derrotado! Recompensa: ${recompensa_acerto}")
+        log.info("💰 Inimigo derrotado! Recompensa: $%s", recompensa_acerto)
         
     def extrair_sprite(self, sprite_data, frame_index):
-        """Extrai um frame específico do sprite sheet (IDÊNTICO AO ORIGINAL)"""
+        """Retorna um frame específico da tabela pré-fatiada no ResourceManager."""
         if not sprite_data:
             return None
             
-        # CORREÇÃO: Verifica ambas as chaves possíveis
-        sprite_sheet = sprite_data.get('sheet') or sprite_data.get('sprite_sheet')
-        if not sprite_sheet:
-            print(f"❌ Erro: sprite_sheet não encontrado nas chaves: {list(sprite_data.keys())}")
-            return None
-            
-        frame_width = sprite_data['frame_width']
-        frame_height = sprite_data['frame_height']
-        total_frames = sprite_data['total_frames']
-        
-        # Garante que o frame_index está dentro dos limites
-        frame_index = frame_index % total_frames
-        
-        # Calcula a posição do frame
-        sheet_width = sprite_sheet.get_width()
-        sheet_height = sprite_sheet.get_height()
-        
-        if sheet_width > sheet_height:
-            # Sprite sheet horizontal
-            x = frame_index * frame_width
-            y = 0
-        else:
-            # Sprite sheet vertical ou único
-            x = 0
-            y = frame_index * frame_height
-        
-        # Cria uma nova superfície para o frame
-        frame_surface = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-        frame_surface.blit(sprite_sheet, (0, 0), (x, y, frame_width, frame_height))
+        frame = self.resource_manager.extrair_sprite(sprite_data, frame_index)
+        if frame is None:
+            log.erro("❌ Erro: sprite_sheet não encontrado nas chaves: %s", list(sprite_data.keys()))
+        return frame
         
-        return frame_surface
+    def extrair_sprite_mip(self, sprite_data, frame_index, largura, altura):
+        """Retorna o nível de mipmap do frame mais próximo do tamanho de desenho."""
+        if not sprite_data:
+            return None
+        return self.resource_manager.extrair_sprite_mip(sprite_data, frame_index, largura, altura)
         
     def desenhar_personagem(self, x, y, largura, altura, cor, nome, sprites_personagem=None, animacao="idle", frame=0, espelhar=False, shake_data=None):
         """Desenha um personagem com sprites (IDÊNTICO AO ORIGINAL)"""
@@ -1169,21 +1153,15 @@ class JokenGhostGame:
             if animacao in sprites_personagem:
                 # Estrutura com animações (ex: sprites_personagem['idle'])
                 sprite_data = sprites_personagem[animacao]
-                sprite_frame = self.extrair_sprite(sprite_data, frame)
+                sprite_frame = self.extrair_sprite_mip(sprite_data, frame, largura, altura)
             elif 'sheet' in sprites_personagem or 'sprite_sheet' in sprites_personagem:
                 # Sprite direta (ex: sprites_personagem já é a sprite)
                 sprite_data = sprites_personagem
-                sprite_frame = self.extrair_sprite(sprite_data, frame)
+                sprite_frame = self.extrair_sprite_mip(sprite_data, frame, largura, altura)
             
             if sprite_frame:
-                # Escala o sprite para o tamanho desejado
-                sprite_escalado = pygame.transform.scale(sprite_frame, (largura, altura))
-                
-                # Espelha o sprite se necessário
-                if espelhar:
-                    sprite_escalado = pygame.transform.flip(sprite_escalado, True, False)
-                
-                self.tela.blit(sprite_escalado, (final_x, final_y))
+                # Escala (e espelha) usando o cache de sprites escalados
+                self.sprite_cache.desenhar(self.tela, sprite_frame, final_x, final_y, largura, altura, espelhar)
             else:
                 # Fallback para bloco se der erro
                 pygame.draw.rect(self.tela, cor, (final_x, final_y, largura, altura))
@@ -1195,7 +1173,7 @@ class JokenGhostGame:
         
         # Nome do personagem (se fornecido)
         if nome:
-            texto_nome = self.fonte_texto.render(nome, True, PRETO)
+            texto_nome = self.resource_manager.renderizar_texto(self.fonte_texto, nome, PRETO)
             nome_rect = texto_nome.get_rect(center=(final_x + largura//2, final_y + altura + 20))
             self.tela.blit(texto_nome, nome_rect)
         
@@ -1217,14 +1195,14 @@ class JokenGhostGame:
         
         # Atualizar sprites nos inimigos para usar o sistema original
         for inimigo in self.inimigos:
-            inimigo['sprites'] = self.sprites_inimigo
+            inimigo.sprites = self.sprites_inimigo
             
         print("✅ Sprites carregados no sistema original!")
         
     def get_inimigo_na_frente(self):
         """Retorna o inimigo que está na frente (z_order = 3)"""
         for inimigo in self.inimigos:
-            if inimigo['ativo'] and inimigo['vida_atual'] > 0 and inimigo['z_order'] == 3:
+            if inimigo.vivo and inimigo.z_order == 3:
                 return inimigo
         return None
         
@@ -1245,7 +1223,7 @@ class JokenGhostGame:
         pygame.draw.rect(self.tela, PRETO, caixa, 3, border_radius=10)
         
         # Nome do personagem (fonte menor)
-        texto_nome = self.resource_manager.obter_fonte('pequena').render(nome, True, PRETO)
+        texto_nome = self.resource_manager.renderizar_texto('pequena', nome, PRETO)
         self.tela.blit(texto_nome, (x + 10, y + 5))
         
         # Barra de vida
@@ -1275,11 +1253,9 @@ class JokenGhostGame:
         # Números de vida (se solicitado)
         if mostrar_numeros:
             vida_texto = f"{int(vida_atual)}/{int(vida_maxima)}"
-            texto_vida = self.resource_manager.obter_fonte('pequena').render(vida_texto, True, PRETO)
-            # Centraliza o texto na barra
-            texto_x = barra_x + (barra_largura - texto_vida.get_width()) // 2
-            texto_y = barra_y + (barra_altura - texto_vida.get_height()) // 2
-            self.tela.blit(texto_vida, (texto_x, texto_y))
+            # Centraliza o texto na barra (atlas de glifos: o valor muda durante a animação de dano)
+            glifos = self.resource_manager.obter_atlas_glifos('pequena')
+            glifos.desenhar(self.tela, vida_texto, (barra_x + barra_largura // 2, barra_y + barra_altura // 2), PRETO, centro=True)
         
     def iniciar_espera_rotacao(self):
         """Inicia período de espera para próxima ação."""
@@ -1287,17 +1263,29 @@ class JokenGhostGame:
         self.tempo_espera_rotacao = 0
         self.ui_manager.esconder_botoes_ataque()
         
-    def atualizar(self):
-        """Atualiza o estado do jogo."""
-        delta_time = self.clock.get_time()
+    def atualizar(self, delta_time=None):
+        """
+        Atualiza o estado do jogo.
+
+        Args:
+            delta_time: Duração do passo em milissegundos; None usa o tempo do último quadro
+        """
+        # Velocidades "por quadro" (menu, botões, entrada) são convertidas pelo fator do passo
+        self.fator_quadro = 1.0 if delta_time is None else delta_time / (1000.0 / FPS)
+        if delta_time is None:
+            delta_time = self.clock.get_time()
         delta_time_seconds = delta_time / 1000.0
         
+        self.perfil.partida()
+        
         # Atualizar sistemas
         self.sprite_manager.atualizar_animacoes(delta_time_seconds)
         self.animation_controller.atualizar_animacoes(delta_time_seconds)
-        self.ui_manager.atualizar_animacao_menu()
-        self.ui_manager.atualizar_animacao_botoes()
+        self.ui_manager.atualizar_animacao_menu(self.fator_quadro)
+        self.ui_manager.atualizar_animacao_botoes(self.fator_quadro)
+        self.perfil.marcar('atualizar.animacoes')
         self.toast_manager.atualizar_toasts(delta_time)  # Mantém milissegundos para toast_manager
+        self.perfil.marcar('atualizar.toasts')
         # REMOVIDO: sistema antigo texto flutuante
         
         # === NOVOS SISTEMAS RPG ===
@@ -1309,37 +1297,43 @@ class JokenGhostGame:
             # Parar todos os shakes quando resultado termina
             self.visual_effects.limpar_todos_shakes()
             self.result_display.limpar_resultado()  # Limpa completamente
-            print("🛑 Resultado terminou - todos os shakes foram parados")
+            log.debug("🛑 Resultado terminou - todos os shakes foram parados")
+        self.perfil.marcar('atualizar.dano')
         
         # === NOVOS SISTEMAS VISUAIS ===
         self.visual_effects.atualizar(delta_time_seconds)
         self.enemy_attack_animations.atualizar(delta_time_seconds)
-        self.ui_animations.atualizar(delta_time_seconds)
+        self.ui_animations.atualizar(delta_time)  # Espera milissegundos
         
         # === NOVO: Atualizar posições com shake e animações ===
         self._atualizar_posicoes_com_shake()
+        self.perfil.marcar('atualizar.efeitos')
         
         # === NOVO: Atualizar sistemas de turno ===
         self.atualizar_shake()
         self.atualizar_animacao_personagem()
         self.atualizar_alternancia_inimigos()
         self.atualizar_rotacao_inimigos()
+        self.perfil.marcar('atualizar.animacoes')
         
         # === NOVO: Atualizar sistema de seleção de alvos ===
         if self.target_selector.modo_selecao_ativo:
             mouse_pos = pygame.mouse.get_pos()
             # Passar inimigos atuais para o target_selector
             self.target_selector.definir_inimigos_referencia(self.inimigos)
-            self.target_selector.atualizar_highlight(mouse_pos, self.inimigos)
+            self.target_selector.atualizar_highlight(mouse_pos, self.inimigos, delta_time)
+        self.perfil.marcar('atualizar.alvo')
         
         # Atualizar animação dos inimigos
         self.atualizar_animacao_inimigos(delta_time_seconds)
+        self.perfil.marcar('atualizar.animacoes')
         
         # Atualizar estados específicos
         if self.estado_jogo == EstadoJogo.TRANSICAO:
             self.atualizar_transicao(delta_time)
         elif self.estado_jogo == EstadoJogo.BATALHA:
             self.atualizar_jogo(delta_time)
+        self.perfil.marcar('atualizar.estado')
             
     def _atualizar_posicoes_com_shake(self):
         """Aplica os efeitos de shake nas posições dos elementos."""
@@ -1359,141 +1353,27 @@ class JokenGhostGame:
             # Offset de animação de ataque
             offset_ataque = self.enemy_attack_animations.obter_offset_animacao(i)
             
-            # Posição base - usar sempre pos_x e pos_y do inimigo
-            pos_base_x = inimigo.get('pos_x', 400)
-            pos_base_y = inimigo.get('pos_y', 200)
-            
-            # Aplicar todos os offsets e salvar em pos_visual
-            inimigo['pos_visual'] = (
-                pos_base_x + shake_inimigo[0] + offset_ataque[0],
-                pos_base_y + shake_inimigo[1] + offset_ataque[1]
-            )
-            
-            # Garantir que a posição original esteja salva
-            if 'pos_original' not in inimigo:
-                inimigo['pos_original'] = (pos_base_x, pos_base_y)
-                
-    def _processar_contra_ataques_inimigos(self):
-        """
-        Processa contra-ataques de outros inimigos baseado no ataque do jogador.
-        """
-        if not hasattr(self, 'escolha_jogador') or not self.escolha_jogador:
-            return
-            
-        print(f"🎯 Processando contra-ataques baseados na escolha do jogador: {self.escolha_jogador}")
-        
-        # Obter inimigos vivos (exceto o alvo principal se ainda existir)
-        inimigos_para_contra_ataque = []
-        for i, inimigo in enumerate(self.inimigos):
-            if inimigo['ativo'] and inimigo['vida_atual'] > 0:
-                # Se não é o alvo selecionado, pode contra-atacar
-                if not hasattr(self, 'alvo_selecionado') or i != self.alvo_selecionado:
-                    inimigos_para_contra_ataque.append((i, inimigo))
-        
-        if not inimigos_para_contra_ataque:
-            print("👻 Nenhum inimigo disponível para contra-ataque")
-            return
-            
-        # Simular ataque dos inimigos contra o jogador
-        for i, inimigo in inimigos_para_contra_ataque:
-            # Inimigos fantasmas sempre usam uma escolha aleatória
-            escolhas_inimigo = [Escolha.PEDRA, Escolha.PAPEL, Escolha.TESOURA]
-            escolha_inimigo = random.choice(escolhas_inimigo)
-            
-            print(f"👻 {inimigo['nome']} contra-ataca com {escolha_inimigo}")
-            
-            # Determinar resultado do contra-ataque
-            resultado_contra_ataque = self._determinar_resultado_contra_ataque(
-                self.escolha_jogador, escolha_inimigo
+            # Aplicar todos os offsets (posição base: pos_x/pos_y) e salvar em pos_visual
+            inimigo.pos_visual = (
+                inimigo.pos_x + shake_inimigo[0] + offset_ataque[0],
+                inimigo.pos_y + shake_inimigo[1] + offset_ataque[1]
             )
-            
-            if resultado_contra_ataque == "inimigo_vence":
-                # Inimigo acerta o jogador
-                dano_contra_ataque = random.randint(8, 15)
-                self.stats_jogador['vida_atual'] = max(0, self.stats_jogador['vida_atual'] - dano_contra_ataque)
-                
-                print(f"💔 {inimigo['nome']} acertou! Jogador recebeu {dano_contra_ataque} de dano! Vida: {self.stats_jogador['vida_atual']}")
-                
-                # === ADICIONAR NÚMERO DE DANO VISUAL NO JOGADOR (contra-ataque) ===
-                self.simple_damage.adicionar_dano(dano_contra_ataque, 200, 400, (255, 50, 50))  # Vermelho intenso para contra-ataque
-                
-                # Efeitos visuais do contra-ataque
-                self.visual_effects.iniciar_shake_jogador(6, 0.3)
-                self.enemy_attack_animations.iniciar_animacao_ataque(i, inimigo)
-                # REMOVIDO: damage_display antigo - usando SimpleDamageDisplay
-                
-            elif resultado_contra_ataque == "jogador_vence":
-                # Jogador "defende" o contra-ataque
-                print(f"🛡️ Você defendeu o contra-ataque de {inimigo['nome']}!")
-                
-            else:
-                # Empate no contra-ataque
-                print(f"🤝 Contra-ataque de {inimigo['nome']} foi neutro")
-    
-    def _determinar_resultado_contra_ataque(self, escolha_jogador, escolha_inimigo):
-        """
-        Determina o resultado de um contra-ataque.
-        
-        Args:
-            escolha_jogador: Escolha que o jogador fez
-            escolha_inimigo: Escolha do inimigo no contra-ataque
-            
-        Returns:
-            str: "jogador_vence", "inimigo_vence", ou "empate"
-        """
-        if escolha_jogador == escolha_inimigo:
-            return "empate"
-        elif (
-            (escolha_jogador == Escolha.PEDRA and escolha_inimigo == Escolha.TESOURA) or
-            (escolha_jogador == Escolha.PAPEL and escolha_inimigo == Escolha.PEDRA) or
-            (escolha_jogador == Escolha.TESOURA and escolha_inimigo == Escolha.PAPEL)
-        ):
-            return "jogador_vence"
-        else:
-            return "inimigo_vence"
+
+            # DEBUG: informações de shake quando ativo (todo passo: com limite; some com python -O)
+            if __debug__:
+                if shake_inimigo != (0, 0):
+                    log.debug("💥 Inimigo %s com shake: %s | Pos final: %s", i, shake_inimigo, inimigo.pos_visual, limitar=True)
+                if offset_ataque != (0, 0):
+                    log.debug("⚔️ Inimigo %s com animação ataque: %s", i, offset_ataque, limitar=True)
                 
-            # DEBUG: Imprimir informações de shake quando ativo
-            if shake_inimigo != (0, 0):
-                print(f"💥 Inimigo {i} com shake: {shake_inimigo} | Pos final: {inimigo['pos_visual']}")
-            if offset_ataque != (0, 0):
-                print(f"⚔️ Inimigo {i} com animação ataque: {offset_ataque}")
-            
     def atualizar_animacao_inimigos(self, delta_time):
-        """Atualiza animação dos sprites dos inimigos."""
-        for inimigo in self.inimigos:
-            if not inimigo.get('ativo', True):
-                continue
-                
-            # CORREÇÃO: Garante que as propriedades de animação existam
-            if 'tempo_animacao' not in inimigo:
-                inimigo['tempo_animacao'] = 0.0
-            if 'frame_atual' not in inimigo:
-                inimigo['frame_atual'] = 0
-                
-            # Atualiza tempo de animação
-            inimigo['tempo_animacao'] += delta_time
-            
-            # Troca frame a cada 0.1 segundos (10 FPS - mais fluido)
-            if inimigo['tempo_animacao'] >= 0.1:
-                inimigo['tempo_animacao'] = 0
-                
-                # CORREÇÃO: Usa sprite específico do inimigo baseado no tipo
-                total_frames = 12  # Default para Ghost
-                
-                if inimigo.get('sprite_tipo') == 'ghost':
-                    total_frames = 12  # Ghost tem 12 frames
-                elif inimigo.get('sprite_tipo') == 'kastle':
-                    total_frames = self.resource_manager.obter_total_frames_inimigo()
-                elif inimigo.get('sprite_tipo') == 'ballons':
-                    total_frames = 1  # Balloons são estáticos
-                
-                if total_frames > 1:
-                    inimigo['frame_atual'] = (inimigo['frame_atual'] + 1) % total_frames
+        """Atualiza animação dos sprites dos inimigos (troca de frame a cada 0.1s, 10 FPS)."""
+        self.entidades.avancar_animacoes(delta_time)
                     
     def atualizar_transicao(self, delta_time):
         """Atualiza a tela de transição (IDÊNTICO AO ORIGINAL)."""
         # Usa sistema de frames como o original
-        self.transicao_alpha += self.transicao_direcao * 8
+        self.transicao_alpha += self.transicao_direcao * 8 * self.fator_quadro
         if self.transicao_alpha >= 255:
             self.transicao_alpha = 255
             self.transicao_direcao = -1
@@ -1517,7 +1397,7 @@ class JokenGhostGame:
               self.inimigo_pos_final = INIMIGO_FRENTE_X # Usa a constante
     
               self.velocidade_entrada = 15 # Aumentei a velocidade um pouco
-              print("🎬 Iniciando animação de entrada com posições responsivas!")
+              log.debug("🎬 Iniciando animação de entrada com posições responsivas!")
                 
     def atualizar_jogo(self, delta_time):
               """Atualiza o estado do jogo principal."""
@@ -1525,13 +1405,13 @@ class JokenGhostGame:
               if self.animacao_entrada_ativa:
                        # Move jogador da esquerda para posição final
                        if self.jogador_pos_x < self.jogador_pos_final: # Usa self.jogador_pos_final
-                            self.jogador_pos_x += self.velocidade_entrada
+                            self.jogador_pos_x += self.velocidade_entrada * self.fator_quadro
                             if self.jogador_pos_x > self.jogador_pos_final: # Usa self.jogador_pos_final
                                      self.jogador_pos_x = self.jogador_pos_final # Usa self.jogador_pos_final
                 
                        # Move inimigo da direita para posição final
                        if self.inimigo_pos_x > self.inimigo_pos_final: # Usa self.inimigo_pos_final
-                            self.inimigo_pos_x -= self.velocidade_entrada
+                            self.inimigo_pos_x -= self.velocidade_entrada * self.fator_quadro
                             if self.inimigo_pos_x < self.inimigo_pos_final: # Usa self.inimigo_pos_final
                                      self.inimigo_pos_x = self.inimigo_pos_final # Usa self.inimigo_pos_final
                 
@@ -1539,7 +1419,7 @@ class JokenGhostGame:
                        if (self.jogador_pos_x >= self.jogador_pos_final and # Usa self.jogador_pos_final
                             self.inimigo_pos_x <= self.inimigo_pos_final): # Usa self.inimigo_pos_final
                             self.animacao_entrada_ativa = False
-                            print("🎬 Animação de entrada finalizada!")
+                            log.debug("🎬 Animação de entrada finalizada!")
     
               # Atualizar espera de rotação (Seu código aqui estava bom)
               if self.esperando_rotacao:
@@ -1550,6 +1430,7 @@ class JokenGhostGame:
 
     def iniciar_jogo(self):
         """Inicia o jogo principal."""
+        self.garantir_recursos_batalha()
         self.estado_jogo = EstadoJogo.BATALHA
         # Verificar se já temos inimigos ou gerar novos
         if not self.inimigos:
@@ -1559,7 +1440,7 @@ class JokenGhostGame:
         self.animacao_entrada_ativa = True
         self.jogador_pos_x = -200
         self.inimigo_pos_x = LARGURA + 200
-        print("🎬 Iniciando animação de entrada!")
+        log.debug("🎬 Iniciando animação de entrada!")
         
     def reiniciar_jogo(self):
         """Reinicia o jogo."""
@@ -1575,13 +1456,14 @@ class JokenGhostGame:
         self.visual_effects_manager.limpar_todos_shakes()
         
         self.estado_jogo = EstadoJogo.MENU
-        print("🔄 Jogo reiniciado!")
-        print("🧹 Todos os sistemas de dano e efeitos visuais foram limpos")
+        log.info("🔄 Jogo reiniciado!")
+        log.debug("🧹 Todos os sistemas de dano e efeitos visuais foram limpos")
         
     def renderizar(self):
         """Renderiza todos os elementos na tela."""
         # Aplicar shake se ativo
         shake_offset = self.sprite_manager.obter_offset_shake()
+        self.perfil.partida()
         
         if self.estado_jogo == EstadoJogo.MENU:
             self.renderizar_menu_principal()
@@ -1593,14 +1475,20 @@ class JokenGhostGame:
             self.renderizar_jogo(shake_offset)
         elif self.estado_jogo == EstadoJogo.RESULTADO:
             self.renderizar_resultado()
+        # Telas sem batalha contam inteiras como fundo; na batalha a última etapa é a interface
+        self.perfil.marcar('desenhar.interface' if self.estado_jogo == EstadoJogo.BATALHA else 'desenhar.fundo')
             
         # Renderizar toasts sempre por último
-        self.toast_manager.desenhar_toasts(self.tela)
+        for i, rect in enumerate(self.toast_manager.desenhar_toasts(self.tela)):
+            self.dirty_rects.registrar(('toast', i), rect)
+        self.perfil.marcar('desenhar.toasts')
         
         # Renderizar monstruário se ativo (sempre por último)
         if self.monstruario_manager.ativo:
             mouse_pos = pygame.mouse.get_pos()
             self.monstruario_manager.desenhar_monstruario(self.tela)
+            self.dirty_rects.forcar_tela_cheia()
+        self.perfil.marcar('desenhar.monstruario')
         
         # Renderizar target selector se ativo (sempre por último)
         if hasattr(self, 'target_selector') and self.target_selector.modo_selecao_ativo:
@@ -1608,13 +1496,40 @@ class JokenGhostGame:
             # Garante que os inimigos estão atualizados no target_selector
             self.target_selector.definir_inimigos_referencia(self.inimigos)
             self.target_selector.desenhar_indicadores(self.tela, mouse_pos)
-        
-        pygame.display.flip()
+            self.dirty_rects.forcar_tela_cheia()
+        self.perfil.marcar('desenhar.interface')
+        
+        # Overlay de desempenho (F3) não entra na medição
+        if self.perfil.overlay_visivel:
+            self.desenhar_overlay_perfil()
+            self.dirty_rects.forcar_tela_cheia()
+        
+        # Telas animadas por inteiro (fade, batalha, tremor) usam flip; menu, intro e resultado só enviam o que mudou
+        self.dirty_rects.definir_cena(self.estado_jogo)
+        if self.estado_jogo in (EstadoJogo.TRANSICAO, EstadoJogo.BATALHA) or self.sprite_manager.shake_intensidade > 0:
+            self.dirty_rects.forcar_tela_cheia()
+        self.perfil.partida()
+        self.dirty_rects.apresentar()
+        self.perfil.marcar('desenhar.apresentar')
+        
+    def desenhar_overlay_perfil(self):
+        """Desenha o overlay com p50/p95/p99 (ms) de cada etapa do quadro."""
+        if self.overlay_perfil is None:
+            fonte = pygame.font.SysFont("dejavusansmono,couriernew,monospace", 14)
+            self.overlay_perfil = TooltipWidget(fonte, cor_fundo=(0, 0, 0, 190), cor_borda=CINZA,
+                                                cor_texto=VERDE, padding=8, raio=6)
+        # Percentis recalculados a cada PERFIL_OVERLAY_INTERVALO quadros; o widget só redesenha se o texto mudar
+        if self.perfil.quadro % PERFIL_OVERLAY_INTERVALO == 0 or not self.overlay_perfil.linhas:
+            self.overlay_perfil.definir_texto("\n".join(self.perfil.resumo()))
+        self.overlay_perfil.mover((10, 10))
+        self.overlay_perfil.desenhar(self.tela)
         
     def renderizar_menu_principal(self):
         """Renderiza o menu principal."""
         mouse_pos = pygame.mouse.get_pos()
-        self.ui_manager.desenhar_menu_principal(self.tela)
+        progresso = self.resource_manager.progresso_carregamento() if self.resource_manager.carregando() else None
+        self.dirty_rects.registrar('carregamento', self.ui_manager.desenhar_menu_principal(self.tela, progresso))
+        self.dirty_rects.registrar('botao_jogar', self.ui_manager.botoes['jogar']['rect'])
         
     def renderizar_introducao(self):
         """Renderiza a tela de introdução."""
@@ -1624,18 +1539,63 @@ class JokenGhostGame:
         """Renderiza a tela de transição."""
         self.ui_manager.desenhar_transicao(self.tela, self.transicao_alpha)
         
+    def desenhar_camada_estatica_batalha(self, mouse_pos):
+        """
+        Desenha a camada estática da batalha pelo compositor.
+        
+        A camada só é redesenhada quando algo que ela mostra muda: texto de
+        informações, dinheiro, visibilidade/posição/hover dos botões ou o cenário.
+        Enquanto os botões deslizam, eles ficam fora da camada e são desenhados
+        por cima dela a cada frame.
+        """
+        fundo_batalha = self.resource_manager.obter_imagem('cenario')
+        inimigos_vivos = sum(1 for inimigo in self.inimigos if inimigo.vivo)
+        inimigo_frente = self.get_inimigo_na_frente()
+        inimigo_frente_nome = inimigo_frente.nome if inimigo_frente else "Nenhum"
+        texto_info = f"Inimigo da frente: {inimigo_frente_nome} | Total: {inimigos_vivos} | Pressione R para gerar novos"
+        
+        botoes = []
+        if not self.animacao_entrada_ativa and not self.ui_manager.menu_selecao_ativo:
+            for botao_key in ('ataques', 'loja_menu', 'status'):
+                rect = self.ui_manager.botoes[botao_key]['rect']
+                botoes.append((botao_key, tuple(rect), rect.collidepoint(mouse_pos)))
+        # Botões em movimento mudariam a chave todo frame: ficam fora da camada
+        botoes_animados = botoes if self.ui_manager.botoes_animacao_ativa else []
+        if botoes_animados:
+            botoes = []
+                
+        chave = (id(fundo_batalha), texto_info, self.dinheiro, tuple(botoes))
+        
+        def desenhar(camada):
+            if fundo_batalha:
+                camada.blit(fundo_batalha, (0, 0))
+            else:
+                # Fallback para fundo padrão
+                camada.fill(VERDE)
+                pygame.draw.rect(camada, (34, 139, 34), (0, ALTURA - 150, LARGURA, 150))
+                
+            superficie_info = self.resource_manager.renderizar_texto('pequena', texto_info, BRANCO)
+            fundo_texto = pygame.Rect(10, ALTURA - 40, superficie_info.get_width() + 10, 30)
+            pygame.draw.rect(camada, MARROM_LOJA, fundo_texto, border_radius=5)
+            pygame.draw.rect(camada, PRETO, fundo_texto, 2, border_radius=5)
+            camada.blit(superficie_info, (15, ALTURA - 35))
+            
+            for botao_key, _, _ in botoes:
+                self.ui_manager.desenhar_botao(camada, botao_key, mouse_pos)
+                
+            self.ui_manager.desenhar_hud_dinheiro(camada, self.dinheiro)
+            
+        self.compositor.desenhar_camada(self.tela, 'batalha', chave, desenhar)
+        for botao_key, _, _ in botoes_animados:
+            self.ui_manager.desenhar_botao(self.tela, botao_key, mouse_pos)
+        
     def renderizar_jogo(self, shake_offset):
               """Renderiza o jogo principal usando constantes responsivas."""
               mouse_pos = pygame.mouse.get_pos()
     
-              # Fundo de Batalha da pasta Scenes
-              fundo_batalha = self.resource_manager.obter_imagem('cenario')
-              if fundo_batalha:
-                       self.tela.blit(fundo_batalha, (0, 0))
-              else:
-                       # Fallback para fundo padrão
-                       self.tela.fill(VERDE)
-                       pygame.draw.rect(self.tela, (34, 139, 34), (0, ALTURA - 150, LARGURA, 150))
+              # Camada estática: cenário, barra de informações, botões e HUD de dinheiro em um único blit
+              self.desenhar_camada_estatica_batalha(mouse_pos)
+              self.perfil.marcar('desenhar.fundo')
     
               # --- POSIÇÃO E TAMANHO DO JOGADOR (CORRIGIDO) ---
               # Posição final vem das constantes
@@ -1667,72 +1627,61 @@ class JokenGhostGame:
               )
     
               # --- DESENHO DOS INIMIGOS (Seu código aqui estava bom) ---
-              inimigos_ativos = [inimigo for inimigo in self.inimigos if inimigo['ativo']]
-              inimigos_ativos.sort(key=lambda x: x['z_order'])
+              inimigos_ativos = [inimigo for inimigo in self.inimigos if inimigo.ativo]
+              inimigos_ativos.sort(key=lambda x: x.z_order)
     
               coordenadas_inimigos = []
               for inimigo in inimigos_ativos:
-                       if inimigo['vida_atual'] > 0:  
+                       if inimigo.vida_atual > 0:  
                             animacao_inimigo = "idle"
                             sprites_inimigo = None
-                            if 'sprite_tipo' in inimigo:
-                                     sprites_inimigo = self.resource_manager.sprites.get(inimigo['sprite_tipo'])
+                            if inimigo.sprite_tipo is not None:
+                                     sprites_inimigo = self.resource_manager.sprites.get(inimigo.sprite_tipo)
                             else: # Fallback
-                                     nome_sprite = inimigo['nome'].lower()
+                                     nome_sprite = inimigo.nome.lower()
                                      if nome_sprite == 'ghost': sprites_inimigo = self.resource_manager.sprites.get('ghost')
                                      elif nome_sprite == 'kastle': sprites_inimigo = self.resource_manager.sprites.get('kastle')
                                      elif nome_sprite.startswith('balloon'): sprites_inimigo = self.resource_manager.sprites.get('ballons')
                                      else: sprites_inimigo = self.resource_manager.sprites.get('ghost')
                           
                             # Usa posição visual (com shake e animação de ataque) se disponível
-                            pos_x_inimigo, pos_y_inimigo = inimigo.get('pos_visual', (inimigo['pos_x'], inimigo['pos_y']))
+                            if inimigo.pos_visual is not None:
+                                     pos_x_inimigo, pos_y_inimigo = inimigo.pos_visual
+                            else:
+                                     pos_x_inimigo, pos_y_inimigo = inimigo.pos_x, inimigo.pos_y
 
                             # Durante animação de entrada, usa posição animada APENAS para o inimigo da frente
-                            if self.animacao_entrada_ativa and inimigo.get('z_order') == 3: # Apenas o da frente
+                            if self.animacao_entrada_ativa and inimigo.z_order == 3: # Apenas o da frente
                                      pos_x_inimigo = self.inimigo_pos_x # Usa a posição X animada
-                                     pos_y_inimigo = inimigo['pos_y'] # Mantém o Y original
+                                     pos_y_inimigo = inimigo.pos_y # Mantém o Y original
                           
                             coordenadas_inimigo = self.desenhar_personagem(
-                                     pos_x_inimigo, pos_y_inimigo, inimigo['largura'], inimigo['altura'],  
+                                     pos_x_inimigo, pos_y_inimigo, inimigo.largura, inimigo.altura,  
                                      VERMELHO, "", sprites_personagem=sprites_inimigo, 
-                                     animacao=animacao_inimigo, frame=inimigo['frame_atual'], 
-                                     shake_data=inimigo.get('shake', {'ativo': False, 'offset_x': 0, 'offset_y': 0}) # Usa shake do inimigo
+                                     animacao=animacao_inimigo, frame=inimigo.frame_atual, 
+                                     shake_data=inimigo.shake # Usa shake do inimigo
                             )
                           
                             if coordenadas_inimigo:
                                      coordenadas_inimigos.append((inimigo, coordenadas_inimigo))
+              self.perfil.marcar('desenhar.personagens')
     
               # --- DESENHO DAS BARRAS DE VIDA (Seu código aqui estava bom) ---
               for inimigo, coords in coordenadas_inimigos:
                        sprite_x, sprite_y, sprite_largura, sprite_altura = coords
                        largura_barra = max(80, int(sprite_largura * 0.8))
                        self.desenhar_barra_vida_automatica(sprite_x, sprite_y, sprite_largura, sprite_altura,    
-                                                                                  inimigo['vida_atual'], inimigo['vida_max'], 
-                                                                                  inimigo['nome'], largura_barra, mostrar_numeros=False)
+                                                                                  inimigo.vida_atual, inimigo.vida_max, 
+                                                                                  inimigo.nome, largura_barra, mostrar_numeros=False)
     
               # Barra de vida do Jogador
               if coordenadas_jogador:
                        sprite_x, sprite_y, sprite_largura, sprite_altura = coordenadas_jogador
                        self.desenhar_barra_vida_automatica(sprite_x, sprite_y, sprite_largura, sprite_altura,    
                                                                                   self.stats_jogador['vida_atual'], self.stats_jogador['vida_maxima'], "VOCÊ")
+              self.perfil.marcar('desenhar.barras_vida')
     
               # --- RESTO DO RENDERIZAR_JOGO (Seu código aqui estava bom) ---
-              inimigos_vivos = sum(1 for inimigo in self.inimigos if inimigo['ativo'] and inimigo['vida_atual'] > 0)
-              inimigo_frente = self.get_inimigo_na_frente()
-              inimigo_frente_nome = inimigo_frente['nome'] if inimigo_frente else "Nenhum"
-              texto_info = self.resource_manager.obter_fonte('pequena').render(f"Inimigo da frente: {inimigo_frente_nome} | Total: {inimigos_vivos} | Pressione R para gerar novos", True, BRANCO)
-              fundo_texto = pygame.Rect(10, ALTURA - 40, texto_info.get_width() + 10, 30)
-              pygame.draw.rect(self.tela, MARROM_LOJA, fundo_texto, border_radius=5)
-              pygame.draw.rect(self.tela, PRETO, fundo_texto, 2, border_radius=5)
-              self.tela.blit(texto_info, (15, ALTURA - 35))
-    
-              if not self.animacao_entrada_ativa and not self.ui_manager.menu_selecao_ativo:
-                       self.ui_manager.desenhar_botao(self.tela, 'ataques', mouse_pos)
-                       self.ui_manager.desenhar_botao(self.tela, 'loja_menu', mouse_pos)
-                       self.ui_manager.desenhar_botao(self.tela, 'status', mouse_pos)
-    
-              self.ui_manager.desenhar_hud_dinheiro(self.tela, self.dinheiro)
-    
               self.simple_damage.desenhar(self.tela)
               self.result_display.desenhar(self.tela)
     
@@ -1749,7 +1698,7 @@ class JokenGhostGame:
                             self.menu_renderer.desenhar_menu_monstruario(self.tela, self.ui_manager, mouse_pos, self.monstruario_manager)
     
               if hasattr(self, 'resultado_combate') and self.resultado_combate:
-                       resultado_surface = self.resource_manager.obter_fonte('titulo').render(self.resultado_combate, True, getattr(self, 'cor_resultado', BRANCO))
+                       resultado_surface = self.resource_manager.renderizar_texto('titulo', self.resultado_combate, getattr(self, 'cor_resultado', BRANCO))
                        resultado_rect = resultado_surface.get_rect(center=(LARGURA//2, 100))
                        self.tela.blit(resultado_surface, resultado_rect)
     
@@ -1757,11 +1706,11 @@ class JokenGhostGame:
                        tempo_atual = pygame.time.get_ticks()
                        if tempo_atual - self.tempo_resultado_turno < 4000:
                             if hasattr(self, 'mensagem_turno') and self.mensagem_turno:
-                                     turno_surface = self.resource_manager.obter_fonte('normal').render(self.mensagem_turno, True, BRANCO)
+                                     turno_surface = self.resource_manager.renderizar_texto('normal', self.mensagem_turno, BRANCO)
                                      turno_rect = turno_surface.get_rect(center=(LARGURA//2, 150))
                                      self.tela.blit(turno_surface, turno_rect)
                             if hasattr(self, 'mensagem_resultado') and self.mensagem_resultado:
-                                     resultado_surface = self.resource_manager.obter_fonte('normal').render(self.mensagem_resultado, True, getattr(self, 'cor_resultado', BRANCO))
+                                     resultado_surface = self.resource_manager.renderizar_texto('normal', self.mensagem_resultado, getattr(self, 'cor_resultado', BRANCO))
                                      resultado_rect = resultado_surface.get_rect(center=(LARGURA//2, 180))
                                      self.tela.blit(resultado_surface, resultado_rect)
                        else:
@@ -1776,18 +1725,17 @@ class JokenGhostGame:
             return
             
         inimigo = self.inimigos[self.alvo_selecionado]
-        if not inimigo['ativo'] or inimigo['vida_atual'] <= 0:
+        if not inimigo.vivo:
             return
             
         # Obter posição do inimigo
-        if 'pos_visual' in inimigo:
-            inimigo_x, inimigo_y = inimigo['pos_visual']
+        if inimigo.pos_visual is not None:
+            inimigo_x, inimigo_y = inimigo.pos_visual
         else:
-            inimigo_x = inimigo.get('pos_x', 400)
-            inimigo_y = inimigo.get('pos_y', 200)
+            inimigo_x, inimigo_y = inimigo.pos_x, inimigo.pos_y
             
-        largura = inimigo.get('largura', 80)
-        altura = inimigo.get('altura', 100)
+        largura = inimigo.largura
+        altura = inimigo.altura
         
         # Desenhar contorno animado pulsante
         tempo_atual = pygame.time.get_ticks()
@@ -1824,7 +1772,7 @@ class JokenGhostGame:
         
         # Texto "ALVO SELECIONADO"
         fonte_pequena = self.resource_manager.obter_fonte('pequena')
-        texto_alvo = fonte_pequena.render("ALVO SELECIONADO", True, (255, 255, 0))
+        texto_alvo = self.resource_manager.renderizar_texto(fonte_pequena, "ALVO SELECIONADO", (255, 255, 0))
         texto_rect = texto_alvo.get_rect(center=(seta_x, seta_y - 25))
         self.tela.blit(texto_alvo, texto_rect)
         
@@ -1837,7 +1785,7 @@ class JokenGhostGame:
             return
             
         inimigo = self.inimigos[self.alvo_selecionado]
-        if not inimigo['ativo'] or inimigo['vida_atual'] <= 0:
+        if not inimigo.vivo:
             return
             
         # Posição do texto (acima do menu de ataques)
@@ -1845,23 +1793,20 @@ class JokenGhostGame:
         texto_y = 50
         
         # Informações do alvo
-        nome = inimigo['nome']
-        vida_atual = inimigo['vida_atual']
-        vida_max = inimigo['vida_max']
+        nome = inimigo.nome
+        vida_atual = inimigo.vida_atual
+        vida_max = inimigo.vida_max
         
         fonte_normal = self.resource_manager.obter_fonte('normal')
         
         # Texto principal
         texto_principal = f"Atacando: {nome} ({vida_atual}/{vida_max} HP)"
-        surface_principal = fonte_normal.render(texto_principal, True, (255, 255, 0))
+        surface_principal = self.resource_manager.renderizar_texto(fonte_normal, texto_principal, (255, 255, 0))
         rect_principal = surface_principal.get_rect(center=(texto_x, texto_y))
         
         # Fundo semi-transparente
         fundo_rect = rect_principal.inflate(20, 10)
-        fundo_surface = pygame.Surface((fundo_rect.width, fundo_rect.height))
-        fundo_surface.set_alpha(180)
-        fundo_surface.fill((0, 0, 0))
-        self.tela.blit(fundo_surface, fundo_rect.topleft)
+        self.resource_manager.overlays.desenhar(self.tela, fundo_rect.topleft, fundo_rect.size, (0, 0, 0), 180)
         
         # Texto
         self.tela.blit(surface_principal, rect_principal)
@@ -1869,7 +1814,7 @@ class JokenGhostGame:
         # Dica
         fonte_pequena = self.resource_manager.obter_fonte('pequena')
         texto_dica = "Escolha seu ataque para este inimigo"
-        surface_dica = fonte_pequena.render(texto_dica, True, (200, 200, 200))
+        surface_dica = self.resource_manager.renderizar_texto(fonte_pequena, texto_dica, (200, 200, 200))
         rect_dica = surface_dica.get_rect(center=(texto_x, texto_y + 25))
         self.tela.blit(surface_dica, rect_dica)
         
@@ -1880,6 +1825,7 @@ class JokenGhostGame:
             self.menu_renderer.desenhar_game_over(self.tela, self.ui_manager, mouse_pos)
         else:
             self.menu_renderer.desenhar_vitoria(self.tela, self.ui_manager, mouse_pos, self.pontos, self.inimigos_derrotados)
+        self.dirty_rects.registrar('botao_reiniciar', self.ui_manager.botoes['reiniciar']['rect'])
         
     def renderizar_game_over(self):
         """Renderiza a tela de game over."""
@@ -1891,17 +1837,87 @@ class JokenGhostGame:
         mouse_pos = pygame.mouse.get_pos()
         self.menu_renderer.desenhar_vitoria(self.tela, self.ui_manager, mouse_pos, self.pontos, self.inimigos_derrotados)
         
+    def tela_ociosa(self):
+        """
+        Verifica se a tela está parada (nada animando), para o loop poder dormir.
+
+        Returns:
+            bool: True em menu, intro, resultado ou monstruário aberto sem animações
+        """
+        if (self.estado_jogo not in (EstadoJogo.MENU, EstadoJogo.INTRO, EstadoJogo.RESULTADO)
+                and not self.monstruario_manager.ativo):
+            return False
+        # Carregamento em segundo plano precisa dos quadros para finalizar as superfícies
+        if self.resource_manager.carregando():
+            return False
+        if (self.toast_manager.tem_toasts_ativos() or self.simple_damage.tem_numeros_ativos()
+                or self.result_display.esta_ativo()):
+            return False
+        if (self.visual_effects.tem_shakes_ativos() or self.sprite_manager.shake_intensidade > 0
+                or self.shake_jogador['ativo']):
+            return False
+        if self.ui_animations.tem_animacoes_ativas() or self.enemy_attack_animations.tem_animacoes_ativas():
+            return False
+        if self.estado_jogo == EstadoJogo.BATALHA:
+            # Monstruário sobre a batalha: só dorme com o turno e as animações encerrados
+            if (self.animacao_entrada_ativa or self.rotacao_ativa or self.alternancia_ativa
+                    or self.esperando_rotacao or self.ui_manager.botoes_animacao_ativa):
+                return False
+            menu_alvo = self.ui_manager.menu_altura_alvo if self.ui_manager.menu_selecao_ativo else 0
+            if self.ui_manager.menu_altura != menu_alvo:
+                return False
+            if self.entidades.algum_shake_ativo():
+                return False
+        return True
+        
     def executar(self):
         """Loop principal do jogo."""
         print("🚀 Iniciando loop principal do jogo...")
         
+        # Simulação em passos fixos; o desenho interpola entre os dois últimos passos
+        interpoladores = [
+            RenderInterpolator(self, {
+                'jogador_pos_x': VELOCIDADE_ENTRADA * 4,
+                'inimigo_pos_x': VELOCIDADE_ENTRADA * 4,
+                'transicao_alpha': 16,
+            }),
+            RenderInterpolator(self.ui_manager, {'menu_altura': VELOCIDADE_MENU * 2}),
+        ]
+        quadro = 0
+        if self.opcoes.profile_frames:
+            self.captura_perfil.iniciar(self.opcoes.profile_frames)
+        self.clock.tick(self.opcoes.fps)
         while self.rodando:
+            if self.roteiro is not None:
+                self.roteiro.injetar(quadro)
+            quadro += 1
+            delta_time = self.clock.get_time()
+            self.perfil.iniciar_quadro()
+            if self.espera_ociosa.esperar(self.tela_ociosa()):
+                # O tempo dormindo não vira passos de simulação
+                self.clock.tick()
+                delta_time = self.passo_fixo.passo_ms
             self.processar_eventos()
-            self.atualizar()
-            self.renderizar()
-            self.clock.tick(FPS)
+            # Recursos de batalha chegando em segundo plano (um lote por quadro, não por passo)
+            self.atualizar_carregamento()
+            for _ in range(self.passo_fixo.avancar(delta_time)):
+                for interpolador in interpoladores:
+                    interpolador.capturar()
+                self.atualizar(self.passo_fixo.passo_ms)
+            for interpolador in interpoladores:
+                interpolador.aplicar(self.passo_fixo.alpha)
+            try:
+                self.renderizar()
+            finally:
+                for interpolador in interpoladores:
+                    interpolador.restaurar()
+            self.perfil.finalizar_quadro()
+            self.captura_perfil.quadro_concluido()
+            self.clock.tick(self.opcoes.fps)
             
         # Cleanup
+        self.captura_perfil.finalizar()
+        self.perfil.fechar()
         pygame.quit()
         print("👋 JokenGhost encerrado!")
 
@@ -1909,7 +1925,7 @@ class JokenGhostGame:
 def main():
     """Função principal."""
     try:
-        jogo = JokenGhostGame()
+        jogo = JokenGhostGame(analisar_argumentos())
         jogo.executar()
     except Exception as e:
         print(f"❌ Erro fatal: {e}")
@@ -34,6 +34,9 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "simulacao": ["numpy"],  # simular_batalhas.py, varrer_parametros.py e EntityStore com muitos inimigos
+    },
     entry_points={
         "console_scripts": [
             "jokenghost=jokenghost:main",
@@ -0,0 +1,58 @@
+"""
+Simulador de batalhas do JokenGhost (ferramenta de balanceamento).
+===================================================================
+
+Roda milhares (ou milhões) de batalhas com as regras do CombatEngine, sem
+abrir o jogo, e mostra taxa de vitória, turnos até vencer, ouro por turno
+e a distribuição da vida final.
+
+Uso:
+    python simular_batalhas.py [--batalhas 1000000] [--seed 1] [--escolha papel]
+                               [--dano-jogador 25] [--dano-inimigo 20] [--limiar-compra 50]
+"""
+
+import json
+import argparse
+
+from config.enums import Escolha
+from core.simulacao import BattleSimulator, formatar_relatorio
+
+ESCOLHAS_CLI = {'pedra': Escolha.PEDRA, 'papel': Escolha.PAPEL, 'tesoura': Escolha.TESOURA}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simula batalhas do JokenGhost para balanceamento")
+    parser.add_argument("--batalhas", type=int, default=100000, help="quantidade de batalhas")
+    parser.add_argument("--seed", type=int, default=None, help="semente do sorteio (resultados repetíveis)")
+    parser.add_argument("--escolha", choices=list(ESCOLHAS_CLI), default=None,
+                        help="escolha fixa do jogador (padrão: sorteada a cada turno)")
+    parser.add_argument("--dano-jogador", type=int, default=None, help="dano do jogador ao vencer o duelo")
+    parser.add_argument("--dano-inimigo", type=int, default=None, help="dano do inimigo ao vencer o duelo")
+    parser.add_argument("--max-turnos", type=int, default=None, help="turnos antes de contar como inacabada")
+    parser.add_argument("--limiar-compra", type=int, default=None,
+                        help="compra a maior cura da loja quando a vida fica abaixo deste valor")
+    parser.add_argument("--json", action="store_true", help="imprime o relatório em JSON")
+    args = parser.parse_args()
+    if args.batalhas < 1:
+        parser.error("--batalhas deve ser pelo menos 1")
+
+    regras = {}
+    if args.dano_jogador is not None:
+        regras['dano_jogador'] = args.dano_jogador
+    if args.dano_inimigo is not None:
+        regras['dano_inimigo'] = args.dano_inimigo
+    if args.max_turnos is not None:
+        regras['max_turnos'] = args.max_turnos
+    if args.limiar_compra is not None:
+        regras['limiar_compra'] = args.limiar_compra
+
+    simulador = BattleSimulator(regras, seed=args.seed)
+    relatorio = simulador.relatorio(args.batalhas, ESCOLHAS_CLI.get(args.escolha))
+    if args.json:
+        print(json.dumps(relatorio, indent=2))
+    else:
+        print("\n".join(formatar_relatorio(relatorio)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Testes do CombatEngine: turnos com semente fixa e paridade com o BattleSimulator.
+"""
+
+import random
+
+import pytest
+
+from config.constants import DANO_JOGADOR, DANO_INIMIGO, RECOMPENSA_VITORIA_BASE, VIDA_INICIAL_JOGADOR
+from config.enums import Escolha
+from core.combat_engine import CombatEngine, ResultadoCombate, ESCOLHAS
+
+
+def criar_inimigos(*vidas, tipo='fantasma'):
+    """Inimigos mínimos (dicts) com as vidas dadas."""
+    return [{'nome': f'Inimigo {i}', 'tipo': tipo, 'vida_atual': vida, 'ativo': True}
+            for i, vida in enumerate(vidas)]
+
+
+def eventos_do_tipo(turno, tipo):
+    return [evento for evento in turno['eventos'] if evento['tipo'] == tipo]
+
+
+def test_vitoria_fere_alvo_e_paga_recompensa():
+    motor = CombatEngine(random.Random(1), {'area_base': 0.0, 'area_max': 0.0})
+    inimigos = criar_inimigos(100, 100)
+
+    turno = motor.resolver_turno(inimigos, 100, Escolha.PEDRA, 0, escolha_inimigo=Escolha.TESOURA)
+
+    assert turno['resultado'] == ResultadoCombate.VITORIA
+    assert turno['vidas'] == [100 - DANO_JOGADOR, 100]
+    assert turno['vida_jogador'] == 100
+    assert inimigos[0]['vida_atual'] == 100  # Entrada não é alterada
+    [dano] = eventos_do_tipo(turno, 'dano_inimigo')
+    assert (dano['indice'], dano['dano_real'], dano['area']) == (0, DANO_JOGADOR, False)
+    [recompensa] = eventos_do_tipo(turno, 'recompensa')
+    assert recompensa['motivo'] == 'acerto'
+    assert turno['recompensa'] == recompensa['valor'] > 0
+
+
+def test_dano_em_area_atinge_os_outros_vivos():
+    motor = CombatEngine(random.Random(2), {'area_base': 1.0, 'area_max': 1.0})
+    inimigos = criar_inimigos(100, 100, 0, 100)
+    inimigos[2]['ativo'] = False
+
+    turno = motor.resolver_turno(inimigos, 100, Escolha.PAPEL, 0, escolha_inimigo=Escolha.PEDRA)
+
+    area = eventos_do_tipo(turno, 'dano_inimigo')[1:]
+    assert [evento['indice'] for evento in area] == [1, 3]
+    assert all(evento['area'] and 1 <= evento['dano_real'] < DANO_JOGADOR for evento in area)
+    assert turno['vidas'][2] == 0
+    motivos = [evento['motivo'] for evento in eventos_do_tipo(turno, 'recompensa')]
+    assert motivos == ['acerto', 'area']
+    assert turno['recompensa'] == sum(evento['valor'] for evento in eventos_do_tipo(turno, 'recompensa'))
+
+
+def test_derrota_tem_contra_ataques_dos_outros_vivos():
+    motor = CombatEngine(random.Random(3), {'dano_contra_ataque': (10, 10)})
+    inimigos = criar_inimigos(100, 100, 100)
+
+    turno = motor.resolver_turno(inimigos, 100, Escolha.TESOURA, 1, escolha_inimigo=Escolha.PEDRA)
+
+    assert turno['resultado'] == ResultadoCombate.DERROTA
+    assert turno['vidas'] == [100, 100, 100]
+    contra = eventos_do_tipo(turno, 'contra_ataque')
+    assert [evento['indice'] for evento in contra] == [0, 2]
+    acertos = sum(evento['resultado'] == ResultadoCombate.DERROTA for evento in contra)
+    assert turno['vida_jogador'] == 100 - DANO_INIMIGO - 10 * acertos
+    danos = eventos_do_tipo(turno, 'dano_jogador')
+    assert [evento['contra_ataque'] for evento in danos] == [False] + [True] * acertos
+    assert turno['recompensa'] == 0
+
+
+def test_empate_so_tem_contra_ataques():
+    motor = CombatEngine(random.Random(4))
+    turno = motor.resolver_turno(criar_inimigos(100), 100, Escolha.PEDRA, 0, escolha_inimigo=Escolha.PEDRA)
+
+    assert turno['resultado'] == ResultadoCombate.EMPATE
+    assert turno['vida_jogador'] == 100
+    assert turno['eventos'] == []
+
+
+def test_jogador_derrotado():
+    motor = CombatEngine(random.Random(5))
+    turno = motor.resolver_turno(criar_inimigos(100), DANO_INIMIGO, Escolha.PEDRA, 0,
+                                 escolha_inimigo=Escolha.PAPEL)
+
+    assert turno['vida_jogador'] == 0
+    assert turno['eventos'][-1] == {'tipo': 'jogador_derrotado'}
+
+
+def test_descoberta_do_monstruario():
+    motor = CombatEngine(random.Random(6))
+    inimigos = criar_inimigos(100, tipo='Fantasma')
+
+    # Fantasma só é descoberto pela primeira vez com a Estaca
+    turno = motor.resolver_turno(inimigos, 100, Escolha.PAPEL, 0, descobertos={}, escolha_inimigo=Escolha.PEDRA)
+    assert eventos_do_tipo(turno, 'descoberta') == []
+
+    turno = motor.resolver_turno(inimigos, 100, Escolha.PEDRA, 0, descobertos={}, escolha_inimigo=Escolha.TESOURA)
+    [descoberta] = eventos_do_tipo(turno, 'descoberta')
+    assert (descoberta['inimigo'], descoberta['arma']) == ('fantasma', 'Estaca')
+
+    descobertos = {'fantasma': ['Estaca']}
+    turno = motor.resolver_turno(inimigos, 100, Escolha.PAPEL, 0, descobertos=descobertos,
+                                 escolha_inimigo=Escolha.PEDRA)
+    assert [evento['arma'] for evento in eventos_do_tipo(turno, 'descoberta')] == ['aspirador']
+
+    turno = motor.resolver_turno(inimigos, 100, Escolha.PEDRA, 0, descobertos=descobertos,
+                                 escolha_inimigo=Escolha.TESOURA)
+    assert eventos_do_tipo(turno, 'descoberta') == []
+
+    # Sem monstruário não há descobertas
+    turno = motor.resolver_turno(inimigos, 100, Escolha.PEDRA, 0, escolha_inimigo=Escolha.TESOURA)
+    assert eventos_do_tipo(turno, 'descoberta') == []
+
+
+def test_vitoria_total_paga_bonus_por_inimigo():
+    motor = CombatEngine(random.Random(7), {'area_base': 1.0, 'area_max': 1.0})
+    inimigos = criar_inimigos(DANO_JOGADOR, 1, 50)
+    inimigos[2]['ativo'] = False  # Já derrotado antes: ainda conta no bônus
+
+    turno = motor.resolver_turno(inimigos, 100, Escolha.PEDRA, 0, escolha_inimigo=Escolha.TESOURA)
+
+    assert turno['vidas'][:2] == [0, 0]
+    derrotados = eventos_do_tipo(turno, 'inimigo_derrotado')
+    assert [evento['indice'] for evento in derrotados] == [0, 1]
+    [vitoria] = eventos_do_tipo(turno, 'vitoria_total')
+    assert vitoria['valor'] == 3 * RECOMPENSA_VITORIA_BASE
+    assert turno['eventos'][-1] is vitoria
+
+
+def test_mesma_semente_mesmo_turno():
+    def jogar(seed):
+        motor = CombatEngine(random.Random(seed))
+        return [motor.resolver_turno(criar_inimigos(100, 100, 100), 100, escolha, 0)
+                for escolha in ESCOLHAS * 5]
+
+    assert jogar(42) == jogar(42)
+
+
+@pytest.mark.parametrize('escolha', [None, 'pedra', 'lagarto'])
+def test_escolha_invalida(escolha):
+    motor = CombatEngine(random.Random(8))
+    with pytest.raises(ValueError):
+        motor.resolver_turno(criar_inimigos(100), 100, escolha, 0)
+
+
+def batalha_com_motor(motor, rng, regras):
+    """Uma batalha completa pelo CombatEngine, com a mesma geração e alvo do BattleSimulator."""
+    quantidade = rng.choices((1, 2, 3), weights=regras['distribuicao_inimigos'])[0]
+    inimigos = criar_inimigos(*(rng.choice(regras['vidas_inimigos']) for _ in range(quantidade)))
+    vida_jogador = VIDA_INICIAL_JOGADOR
+
+    for _ in range(regras['max_turnos']):
+        vivos = [i for i, inimigo in enumerate(inimigos) if inimigo['vida_atual'] > 0]
+        if not vivos or vida_jogador <= 0:
+            break
+        turno = motor.resolver_turno(inimigos, vida_jogador, rng.choice(ESCOLHAS), vivos[0])
+        for inimigo, vida in zip(inimigos, turno['vidas']):
+            inimigo['vida_atual'] = vida
+        vida_jogador = turno['vida_jogador']
+
+    return all(inimigo['vida_atual'] == 0 for inimigo in inimigos)
+
+
+def test_taxa_de_vitoria_igual_ao_simulador():
+    simulacao = pytest.importorskip("core.simulacao")
+    rng = random.Random(2024)
+    motor = CombatEngine(rng)
+    batalhas = 4000
+    taxa_motor = sum(batalha_com_motor(motor, rng, simulacao.SIMULACAO_PADRAO) for _ in range(batalhas)) / batalhas
+
+    taxa_simulador = simulacao.BattleSimulator(seed=2024).relatorio(200_000)['taxa_vitoria']
+
+    # Erro padrão do motor ~0.007 com 4000 batalhas
+    assert taxa_motor == pytest.approx(taxa_simulador, abs=0.03)
@@ -0,0 +1,116 @@
+"""
+Testes do EntityStore: o laço escalar e as colunas NumPy produzem o mesmo estado.
+"""
+
+import importlib.util
+
+import pytest
+
+from core.enemy_manager import Enemy, Shake
+from core.entity_store import EntityStore, CAMPOS_INIMIGO, CAMPOS_SHAKE
+
+requer_numpy = pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="caminho vetorizado usa NumPy")
+
+
+def criar_inimigos(quantidade):
+    """Inimigos com vidas e tremores variados."""
+    inimigos = []
+    for i in range(quantidade):
+        inimigo = Enemy('GHOST', 'fantasma', 100, [i * 10, 0, 80, 100, 1])
+        inimigo.vida_atual = 100 - (i % 4) * 15
+        inimigo.ativo = i % 5 != 4
+        if i % 2:
+            inimigo.shake.iniciar(6, 100 + i * 10, 0)
+        inimigos.append(inimigo)
+    return inimigos
+
+
+def estado(inimigos):
+    return [(inimigo.vida_visual, inimigo.frame_atual, round(inimigo.tempo_animacao, 6),
+             inimigo.shake.ativo, abs(inimigo.shake.offset_x) <= inimigo.shake.intensidade)
+            for inimigo in inimigos]
+
+
+def simular(limiar, quantidade=10):
+    inimigos = criar_inimigos(quantidade)
+    store = EntityStore(seed=1, limiar_vetorizacao=limiar)
+    store.carregar(inimigos, [(i % 3) + 1 for i in range(quantidade)], intervalo_frame=0.05)
+    historico = []
+    for passo in range(40):
+        store.atualizar(1 / 60, passo * 10, passo_vida=2)
+        historico.append((estado(inimigos), store.algum_shake_ativo(), store.vidas_em_transicao()))
+    store.liberar()
+    return store, inimigos, historico
+
+
+@requer_numpy
+def test_caminho_escalar_e_vetorizado_iguais():
+    store_escalar, _, escalar = simular(limiar=10**6)
+    store_vetorizado, _, vetorizado = simular(limiar=0)
+
+    assert not store_escalar.vetorizado and store_vetorizado.colunas == {}
+    assert escalar == vetorizado
+
+
+@requer_numpy
+def test_escolhe_caminho_pelo_limiar():
+    store = EntityStore(limiar_vetorizacao=4)
+    inimigos = criar_inimigos(3)
+    store.carregar(inimigos)
+    assert not store.vetorizado and inimigos[0]._store is None
+
+    inimigos = criar_inimigos(4)
+    store.carregar(inimigos)
+    assert store.vetorizado and inimigos[0]._store is store
+
+
+@requer_numpy
+def test_liberar_devolve_valores_aos_slots():
+    inimigos = criar_inimigos(3)
+    store = EntityStore(limiar_vetorizacao=0)
+    store.carregar(inimigos)
+    inimigos[1].receber_dano(30)
+    store.suavizar_vidas(100)
+    store.liberar()
+
+    assert inimigos[1]._store is None and type(inimigos[1]) is Enemy and type(inimigos[1].shake) is Shake
+    assert inimigos[1].vida_atual == inimigos[1].vida_visual == 55
+
+
+def test_recarregar_atualiza_total_frames():
+    inimigos = criar_inimigos(2)
+    for inimigo in inimigos:
+        inimigo.ativo = True
+    store = EntityStore()
+    store.carregar(inimigos, [1, 1], intervalo_frame=0.1)
+    store.avancar_animacoes(0.1)
+    assert [inimigo.frame_atual for inimigo in inimigos] == [0, 0]
+
+    # Sprites chegaram depois: recarregar passa a animar com os frames novos
+    store.carregar(inimigos, [4, 4], intervalo_frame=0.1)
+    store.avancar_animacoes(0.1)
+    assert [inimigo.frame_atual for inimigo in inimigos] == [1, 1]
+
+
+def test_campos_fora_do_store_sao_slots_simples():
+    # Leitura por frame sem descritor Python no caminho: o slot é o próprio atributo da classe
+    for campo in CAMPOS_INIMIGO:
+        assert type(Enemy.__dict__[campo]).__name__ == 'member_descriptor', campo
+    for campo in CAMPOS_SHAKE:
+        assert type(Shake.__dict__[campo]).__name__ == 'member_descriptor', campo
+
+    inimigos = criar_inimigos(3)
+    EntityStore().carregar(inimigos)
+    assert all(type(inimigo) is Enemy and type(inimigo.shake) is Shake for inimigo in inimigos)
+
+
+@requer_numpy
+def test_vinculado_le_e_escreve_nas_colunas():
+    inimigos = criar_inimigos(2)
+    store = EntityStore(limiar_vetorizacao=0)
+    store.carregar(inimigos)
+
+    inimigos[0].pos_x = 42
+    inimigos[1].shake['offset_x'] = 3
+    assert store.colunas['pos_x'][0] == 42 and store.colunas['shake_offset_x'][1] == 3
+    assert isinstance(inimigos[0], Enemy) and inimigos[0]['pos_x'] == 42
@@ -0,0 +1,67 @@
+"""
+Testes do passo fixo e da interpolação de desenho.
+"""
+
+import pytest
+
+from core.game_loop import FixedTimestep, RenderInterpolator
+
+
+def test_passos_independem_da_taxa_de_quadros():
+    rapido, lento = FixedTimestep(hz=120), FixedTimestep(hz=120)
+
+    passos_rapido = sum(rapido.avancar(1000 / 240) for _ in range(240))
+    passos_lento = sum(lento.avancar(1000 / 30) for _ in range(30))
+
+    assert passos_rapido == passos_lento == 120
+
+
+def test_acumula_resto_e_alpha():
+    passo = FixedTimestep(hz=100)  # 10 ms
+
+    assert passo.avancar(4) == 0
+    assert passo.alpha == pytest.approx(0.4)
+    assert passo.avancar(7) == 1
+    assert passo.alpha == pytest.approx(0.1)
+    assert passo.avancar(-5) == 0  # Relógio voltando não desfaz tempo
+
+
+def test_quadro_lento_descarta_excesso():
+    passo = FixedTimestep(hz=100, max_passos=5)
+
+    assert passo.avancar(1000) == 5
+    assert passo.tempo_descartado == pytest.approx(950)
+    assert passo.passos_totais == 5
+    passo.reiniciar()
+    assert passo.alpha == 0
+
+
+class Alvo:
+    def __init__(self):
+        self.x = 0
+        self.alpha = 0.0
+
+
+def test_interpolacao_e_restauracao():
+    alvo = Alvo()
+    interpolador = RenderInterpolator(alvo, {'x': 50, 'alpha': 1.0})
+    interpolador.capturar()
+    alvo.x, alvo.alpha = 10, 0.8
+
+    interpolador.aplicar(0.25)
+    assert (alvo.x, alvo.alpha) == (round(2.5), pytest.approx(0.2))
+    assert isinstance(alvo.x, int)
+    interpolador.restaurar()
+    assert (alvo.x, alvo.alpha) == (10, 0.8)
+
+
+def test_salto_grande_nao_interpola():
+    alvo = Alvo()
+    interpolador = RenderInterpolator(alvo, {'x': 50})
+    interpolador.capturar()
+    alvo.x = 500  # Teletransporte
+
+    interpolador.aplicar(0.5)
+    assert alvo.x == 500
+    interpolador.restaurar()
+    assert alvo.x == 500
@@ -0,0 +1,45 @@
+"""
+Testes do turno do jogo original (jokenghost.py) passando pelo CombatEngine.
+"""
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from config.enums import Escolha
+from core.execucao import OpcoesExecucao
+
+
+@pytest.fixture
+def jogo():
+    """JokenGhost headless com os recursos de batalha carregados."""
+    import jokenghost
+    jogo = jokenghost.JokenGhost(OpcoesExecucao(headless=True))
+    jogo.garantir_recursos_batalha()
+    jogo.estado = jokenghost.EstadoJogo.BATALHA
+    yield jogo
+    pygame.time.set_timer(pygame.USEREVENT + 1, 0)
+
+
+def test_botoes_usam_escolhas_do_combat_engine():
+    import jokenghost
+
+    assert jokenghost.Escolha is Escolha
+    assert set(jokenghost.ESCOLHAS_BOTOES.values()) == set(Escolha)
+
+
+@pytest.mark.parametrize("botao", ['pedra', 'papel', 'tesoura'])
+def test_processar_turno_com_botao_de_ataque(jogo, botao):
+    import jokenghost
+    jogo.combat_engine.rng.seed(3)
+    vidas_antes = [inimigo.vida_atual for inimigo in jogo.inimigos]
+    vida_jogador_antes = jogo.vida_jogador
+
+    jogo.processar_turno(jokenghost.ESCOLHAS_BOTOES[botao])
+
+    assert jogo.escolha_jogador is jokenghost.ESCOLHAS_BOTOES[botao]
+    assert jogo.escolha_inimigo in Escolha
+    vidas_depois = [inimigo.vida_atual for inimigo in jogo.inimigos]
+    # Cada turno termina em acerto, dano recebido ou empate
+    assert (vidas_depois != vidas_antes or jogo.vida_jogador < vida_jogador_antes
+            or jogo.resultado_batalha == "Empate!")
@@ -0,0 +1,21 @@
+"""
+Testes da captura de perfil.
+"""
+
+import os
+
+from core.perfil import ProfileCapture
+
+
+def test_capturas_seguidas_nao_sobrescrevem(tmp_path):
+    captura = ProfileCapture(pasta=str(tmp_path), intervalo=0.001)
+    bases = []
+    for _ in range(3):
+        captura.iniciar(quadros=100)
+        captura.quadro_concluido()
+        bases.append(captura.finalizar())
+        assert not captura.capturando
+
+    assert len(set(bases)) == 3
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(base) + extensao
+                                                  for base in bases for extensao in ('.pstats', '.collapsed'))
@@ -0,0 +1,65 @@
+"""
+Testes do carregamento em segundo plano do ResourceManager: fatiamento e
+mipmaps nas threads, só a conversão e a montagem na thread principal.
+"""
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from core.execucao import OpcoesExecucao
+from core.resource_manager import ResourceManager
+
+
+@pytest.fixture
+def tela():
+    """Janela headless mínima, para convert_alpha() ter um formato de pixel."""
+    opcoes = OpcoesExecucao(headless=True)
+    opcoes.preparar_ambiente()
+    return opcoes.criar_tela((64, 64))
+
+
+def assinatura(sprite_data):
+    """Tamanho dos frames e pixels de todos os níveis de mipmap."""
+    return (sprite_data['frame_width'], sprite_data['frame_height'], sprite_data['total_frames'],
+            [[(nivel.get_size(), pygame.image.tobytes(nivel, 'RGBA')) for nivel in cadeia]
+             for cadeia in sprite_data['mipmaps']])
+
+
+def test_preparar_e_converter_igual_ao_fatiamento_da_sheet_convertida(tela, tmp_path):
+    # 4 frames de 400x400: maiores que MIPMAP_LADO_MAX, então a sheet é remontada
+    sheet = pygame.Surface((1600, 400), pygame.SRCALPHA)
+    for i, cor in enumerate([(255, 0, 0, 255), (0, 255, 0, 128), (0, 0, 255, 64), (255, 255, 0, 0)]):
+        sheet.fill(cor, (i * 400 + 50, 50, 300, 300))
+    caminho = str(tmp_path / "teste-sheet.png")
+    pygame.image.save(sheet, caminho)
+    recursos = ResourceManager()
+
+    referencia = {'sheet': pygame.image.load(caminho).convert_alpha(),
+                  'frame_width': 400, 'frame_height': 400, 'total_frames': 4}
+    referencia['tabela_frames'] = recursos.fatiar_frames(referencia['sheet'], 400, 400, 4)
+    recursos.aplicar_mipmaps(referencia)
+
+    sprite_data = recursos._converter_sprite_sheet(recursos._preparar_sprite_sheet(caminho))
+
+    assert assinatura(sprite_data) == assinatura(referencia)
+    assert all(frame.get_parent() is sprite_data['sheet'] for frame in sprite_data['tabela_frames'])
+
+
+def test_thread_principal_so_converte_e_monta(tela, monkeypatch):
+    recursos = ResourceManager()
+    recursos.iniciar_carregamento_em_segundo_plano()
+    for _, futuro, _ in recursos.carregador.pendentes:
+        if futuro is not None:
+            futuro.result()
+
+    def proibido(*args, **kwargs):
+        raise AssertionError("fatiamento/mipmaps na thread principal")
+    monkeypatch.setattr(recursos, 'fatiar_frames', proibido)
+    monkeypatch.setattr(recursos, 'aplicar_mipmaps', proibido)
+    while recursos.carregando():
+        recursos.processar_carregamento()
+
+    assert recursos.sprites_personagens
+    assert recursos.sprites['ghost']['mipmaps']
+    assert recursos._sprites_prontos == {}
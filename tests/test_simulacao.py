@@ -0,0 +1,51 @@
+"""
+Testes do BattleSimulator.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from config.enums import Escolha
+from core.simulacao import BattleSimulator
+
+
+def test_mesma_semente_mesmo_relatorio():
+    a = BattleSimulator(seed=7).simular(2000)
+    b = BattleSimulator(seed=7).simular(2000)
+
+    assert all((a[chave] == b[chave]).all() for chave in a)
+
+
+def test_relatorio_consistente():
+    relatorio = BattleSimulator(seed=3).relatorio(5000)
+
+    total = relatorio['taxa_vitoria'] + relatorio['taxa_derrota'] + relatorio['taxa_inacabada']
+    assert total == pytest.approx(1.0)
+    assert 0 < relatorio['taxa_vitoria'] < 1
+    assert set(relatorio['taxa_vitoria_por_inimigos']) == {1, 2, 3}
+
+
+def test_dano_alto_sempre_vence():
+    r = BattleSimulator({'dano_jogador': 500, 'dano_inimigo': 0, 'dano_contra_ataque': (0, 0)}, seed=1).simular(500)
+
+    assert r['vitoria'].all()
+    assert (r['vida_inimigos'] == 0).all()
+
+
+def test_compra_cura_com_pouca_vida():
+    sem_loja = BattleSimulator(seed=5).relatorio(5000)
+    com_loja = BattleSimulator({'limiar_compra': 60}, seed=5).relatorio(5000)
+
+    assert sem_loja['itens_media'] == 0
+    assert com_loja['itens_media'] > 0
+    assert com_loja['taxa_vitoria'] > sem_loja['taxa_vitoria']
+
+
+@pytest.mark.parametrize('batalhas', [0, -5])
+def test_batalhas_invalidas(batalhas):
+    simulador = BattleSimulator(seed=1)
+    with pytest.raises(ValueError):
+        simulador.simular(batalhas)
+    with pytest.raises(ValueError):
+        simulador.relatorio(batalhas, Escolha.PEDRA)
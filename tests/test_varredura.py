@@ -0,0 +1,80 @@
+"""
+Testes da varredura de parâmetros: leitura da grade, validação e retomada.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from core.varredura import ParameterSweep, ler_parametro, regras_do_ponto, ler_resultados, NOMES_ESCOLHAS
+
+
+def sem_tempo(resultados):
+    """Resultados sem o tempo de execução (único campo que muda entre rodadas)."""
+    return {indice: {**r, 'relatorio': {k: v for k, v in r['relatorio'].items() if k != 'tempo_s'}}
+            for indice, r in resultados.items()}
+
+
+def test_ler_parametro():
+    assert ler_parametro("dano_jogador=20,25") == ('dano_jogador', [20, 25])
+    assert ler_parametro("vidas_inimigos=80/100,90/110") == ('vidas_inimigos', [(80, 100), (90, 110)])
+    assert ler_parametro("preco_cura_grande=50") == ('preco_cura_grande', [50])
+
+
+@pytest.mark.parametrize('texto', ["dano_jogador", "xyz=1", "preco_buff_ofensivo=10", "preco_nada=10", "bonus_lagarto=1"])
+def test_ler_parametro_invalido(texto):
+    with pytest.raises(ValueError):
+        ler_parametro(texto)
+
+
+def test_regras_do_ponto():
+    regras = regras_do_ponto({'bonus_papel': 40.0, 'preco_cura_pequena': 5, 'limiar_compra': 50})
+
+    assert regras['limiar_compra'] == 50
+    assert {item['efeito']: item['preco'] for item in regras['loja']}['cura_pequena'] == 5
+    assert regras['efetividade'][NOMES_ESCOLHAS['papel']]['bonus_base'] == 40.0
+    with pytest.raises(ValueError):
+        regras_do_ponto({'preco_buff_ofensivo': 10})
+
+
+def test_preco_sem_limiar_compra():
+    with pytest.raises(ValueError):
+        ParameterSweep([('preco_cura_pequena', [10, 20])], batalhas=10)
+    ParameterSweep([('preco_cura_pequena', [10, 20]), ('limiar_compra', [40])], batalhas=10)
+
+
+def test_batalhas_invalidas():
+    with pytest.raises(ValueError):
+        ParameterSweep([('dano_jogador', [20])], batalhas=0)
+
+
+def test_retoma_varredura_interrompida(tmp_path):
+    caminho = tmp_path / "varredura.jsonl"
+    parametros = [('dano_jogador', [20, 25, 30]), ('vidas_inimigos', [(80, 100, 120), (100,)])]
+
+    completos = ParameterSweep(parametros, batalhas=200, seed=3, processos=1, lote=2).executar(str(caminho))
+    assert sorted(completos) == list(range(6))
+
+    # Simula uma interrupção: duas linhas inteiras e uma cortada no meio
+    linhas = caminho.read_text(encoding="utf-8").splitlines()
+    caminho.write_text("\n".join(linhas[:2]) + "\n" + linhas[2][:15], encoding="utf-8")
+    assert len(ler_resultados(str(caminho))) == 2
+
+    chamadas = []
+    retomados = ParameterSweep(parametros, batalhas=200, seed=3, processos=1, lote=2).executar(
+        str(caminho), progresso=lambda feitos, total: chamadas.append(feitos))
+    assert chamadas[-1] == 6
+    assert sem_tempo(retomados) == sem_tempo(completos)
+    assert len(ler_resultados(str(caminho))) == 6
+
+    # Outro seed no mesmo arquivo é outra varredura
+    with pytest.raises(ValueError):
+        ParameterSweep(parametros, batalhas=200, seed=4, processos=1).executar(str(caminho))
+
+
+def test_resultado_nao_depende_do_lote(tmp_path):
+    parametros = [('dano_jogador', [20, 30]), ('area_base', [0.1, 0.5])]
+    um = ParameterSweep(parametros, batalhas=200, seed=1, processos=1, lote=1).executar(str(tmp_path / "a.jsonl"))
+    quatro = ParameterSweep(parametros, batalhas=200, seed=1, processos=1, lote=4).executar(str(tmp_path / "b.jsonl"))
+
+    assert sem_tempo(um) == sem_tempo(quatro)
@@ -6,11 +6,12 @@ Responsável por mostrar números de dano flutuantes na tela.
 import pygame
 import math
 from config.constants import *
+from core.enemy_manager import Enemy
 
 class DamageText:
     """Representa um texto de dano flutuante."""
     
-    def __init__(self, x, y, dano, tipo_dano="normal", fonte=None):
+    def __init__(self, x, y, dano, tipo_dano="normal", fonte=None, resource_manager=None):
         """
         Inicializa um texto de dano.
         
@@ -19,7 +20,9 @@ class DamageText:
             dano: Valor do dano
             tipo_dano: "normal", "critico", "cura", "miss"
             fonte: Fonte pygame para renderizar
+            resource_manager: Se informado, usa o cache de textos compartilhado
         """
+        self.resource_manager = resource_manager
         self.x_inicial = x
         self.y_inicial = y
         self.x = x
@@ -100,37 +103,45 @@ class DamageText:
         else:
             texto = str(self.dano)
         
-        # Renderiza com alpha
-        surface_texto = self.fonte.render(texto, True, self.cor)
-        
-        # Aplica transparência
-        if self.alpha < 255:
-            surface_texto.set_alpha(self.alpha)
-        
         # Calcula posição com escala
-        rect = surface_texto.get_rect()
+        rect = pygame.Rect((0, 0), self.fonte.size(texto))
         rect.centerx = int(self.x)
         rect.centery = int(self.y)
         
         # Desenha sombra
-        surface_sombra = self.fonte.render(texto, True, (0, 0, 0))
-        if self.alpha < 255:
-            surface_sombra.set_alpha(self.alpha // 2)
+        alpha_sombra = self.alpha // 2 if self.alpha < 255 else None
+        surface_sombra = self._renderizar(texto, (0, 0, 0), alpha_sombra)
         
         rect_sombra = rect.copy()
         rect_sombra.x += 2
         rect_sombra.y += 2
         tela.blit(surface_sombra, rect_sombra)
         
-        # Desenha texto principal
+        # Desenha texto principal (com alpha)
+        surface_texto = self._renderizar(texto, self.cor, self.alpha)
         tela.blit(surface_texto, rect)
+        
+    def _renderizar(self, texto, cor, alpha):
+        """Renderiza pelo cache de textos quando disponível."""
+        if self.resource_manager:
+            return self.resource_manager.renderizar_texto(self.fonte, texto, cor, alpha=alpha)
+        superficie = self.fonte.render(texto, True, cor)
+        if alpha is not None and alpha < 255:
+            superficie.set_alpha(alpha)
+        return superficie
 
 
 class DamageDisplayManager:
     """Gerenciador de todos os textos de dano na tela."""
     
-    def __init__(self):
-        """Inicializa o gerenciador."""
+    def __init__(self, resource_manager=None):
+        """
+        Inicializa o gerenciador.
+        
+        Args:
+            resource_manager: Se informado, os textos usam o cache de textos compartilhado
+        """
+        self.resource_manager = resource_manager
         self.textos_dano = []
         
         # Carrega fontes
@@ -161,7 +172,8 @@ class DamageDisplayManager:
             y + offset_y, 
             dano, 
             tipo_dano, 
-            fonte
+            fonte,
+            self.resource_manager
         )
         
         self.textos_dano.append(texto_dano)
@@ -175,13 +187,13 @@ class DamageDisplayManager:
         Adiciona dano recebido por um inimigo.
         
         Args:
-            inimigo: Dicionário do inimigo
+            inimigo: Enemy que recebeu o dano
             dano: Valor do dano
             tipo_dano: Tipo do dano
         """
-        if isinstance(inimigo, dict):
-            x = inimigo.get('pos_x', 0) + inimigo.get('largura', 0) // 2
-            y = inimigo.get('pos_y', 0)
+        if isinstance(inimigo, Enemy):
+            x = inimigo.pos_x + inimigo.largura // 2
+            y = inimigo.pos_y
             self.adicionar_dano(x, y, dano, tipo_dano)
     
     def adicionar_miss(self, x, y):
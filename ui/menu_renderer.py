@@ -5,14 +5,90 @@ Responsável por desenhar menus de ataques, loja e monstruário.
 
 import pygame
 from config.constants import *
+from graphics.overlays import obter_fabrica_overlays
+from ui.widgets import Widget, PainelWidget, TooltipWidget
 from config.enums import *
 
 class MenuRenderer:
     """Renderizador de menus específicos."""
     
-    def __init__(self, resource_manager):
-        """Inicializa o renderizador de menus."""
+    def __init__(self, resource_manager, animation_manager=None):
+        """
+        Inicializa o renderizador de menus.
+        
+        Args:
+            resource_manager: Gerenciador de recursos
+            animation_manager: UIAnimationManager opcional para animar os widgets
+        """
         self.resource_manager = resource_manager
+        self.animation_manager = animation_manager
+        
+        # Widgets retidos: criados uma vez e redesenhados só quando as entradas mudam
+        self.painel_ataques = PainelWidget((LARGURA, 1), cor_borda=PRETO, renderizar=self._desenhar_fechar_circulo)
+        self.painel_loja = PainelWidget((700, 1), cor_borda=BRANCO, renderizar=self._desenhar_fechar_circulo)
+        self.cartoes_loja = [self.painel_loja.adicionar(Widget((140, 120), (50 + i * 150, 80), self._desenhar_cartao_item))
+                             for i in range(4)]
+        self.painel_monstruario = PainelWidget((650, 1), cor_fundo=ROXO_ESCURO, cor_borda=ROXO,
+                                               renderizar=self._desenhar_conteudo_monstruario)
+        self.tooltip = None  # Criado no primeiro uso (depende da fonte carregada)
+        
+    def _desenhar_fechar_circulo(self, superficie, fechar_pos=None, **entradas):
+        """Desenha o botão fechar (círculo vermelho com X de 50px) no painel."""
+        if fechar_pos is None:
+            return
+        centro = (fechar_pos[0] + 25, fechar_pos[1] + 25)
+        pygame.draw.circle(superficie, VERMELHO, centro, 25)
+        pygame.draw.circle(superficie, BRANCO, centro, 25, 3)
+        texto_x = self.resource_manager.obter_fonte('titulo').render("×", True, BRANCO)
+        superficie.blit(texto_x, texto_x.get_rect(center=centro))
+        
+    def _desenhar_cartao_item(self, superficie, nome, preco, descricao, pode_comprar, estado, filtro):
+        """Desenha um cartão da loja (moldura, fundo do texto, nome, preço e descrição)."""
+        largura, altura = superficie.get_size()
+        
+        # Usar a mesma moldura dos botões de ataque (hud_botao.png), já montada com o filtro
+        moldura_item = self.resource_manager.obter_moldura_pronta('itens', (largura, altura), estado, filtro=filtro)
+        if moldura_item:
+            superficie.blit(moldura_item, (0, 0))
+        else:
+            # Fallback: desenhar retângulo similar aos botões de ataque
+            pygame.draw.rect(superficie, VERMELHO, superficie.get_rect(), border_radius=10)
+            pygame.draw.rect(superficie, BRANCO, superficie.get_rect(), 3, border_radius=10)
+            if filtro:
+                superficie.blit(obter_fabrica_overlays().obter((largura, altura), *filtro), (0, 0))
+        
+        # Fundo escuro para contraste do texto (largura um pouco menor que o cartão)
+        text_bg_y = 40
+        superficie.blit(obter_fabrica_overlays().obter((120, 60), PRETO, 150), ((largura - 120) // 2, text_bg_y))
+        
+        fonte_texto = self.resource_manager.obter_fonte('texto')
+        fonte_pequena = self.resource_manager.obter_fonte('pequena')
+        
+        # Nome do item (centralizado)
+        nome_texto = fonte_pequena.render(nome, True, BRANCO)
+        superficie.blit(nome_texto, nome_texto.get_rect(center=(largura // 2, text_bg_y + 15)))
+        
+        # Preço com cor baseada no dinheiro disponível
+        preco_texto = fonte_texto.render(f"${preco}", True, VERDE if pode_comprar else VERMELHO)
+        superficie.blit(preco_texto, preco_texto.get_rect(center=(largura // 2, text_bg_y + 45)))
+        
+        # Efeito do item (se houver)
+        if descricao:
+            desc_texto = fonte_pequena.render(descricao[:15] + "...", True, CINZA_CLARO)
+            superficie.blit(desc_texto, desc_texto.get_rect(center=(largura // 2, 60)))
+            
+    def _desenhar_conteudo_monstruario(self, superficie, fechar_x=None, mostrar_info=False, **entradas):
+        """Desenha o botão fechar quadrado e o texto explicativo do painel do monstruário."""
+        if fechar_x is not None:
+            botao_fechar = pygame.Rect(fechar_x, 10, 50, 50)
+            pygame.draw.rect(superficie, VERMELHO, botao_fechar, border_radius=20)
+            pygame.draw.rect(superficie, PRETO, botao_fechar, 2, border_radius=20)
+            texto_x = self.resource_manager.obter_fonte('titulo').render("×", True, BRANCO)
+            superficie.blit(texto_x, texto_x.get_rect(center=botao_fechar.center))
+        if mostrar_info:
+            texto_info = "Derrote inimigos para descobrir suas fraquezas!"
+            info_render = self.resource_manager.obter_fonte('texto').render(texto_info, True, BRANCO)
+            superficie.blit(info_render, info_render.get_rect(center=(superficie.get_width() // 2, 120)))
         
     def desenhar_menu_ataques(self, tela, ui_manager, mouse_pos):
         """Desenha o menu de seleção de ataques (IDÊNTICO AO ORIGINAL)."""
@@ -20,41 +96,24 @@ class MenuRenderer:
             return
             
         # Menu ocupa toda a largura da tela como no original
-        menu_largura = LARGURA
         menu_altura = ui_manager.menu_altura
-        menu_x = 0
         menu_y = ALTURA - menu_altura
+        aberto = menu_altura > 50  # Só desenha conteúdo quando menu está aberto
         
-        # Apenas fundo marrom (sem azul)
-        menu_rect = pygame.Rect(menu_x, menu_y, menu_largura, menu_altura)
-        pygame.draw.rect(tela, MARROM_LOJA, menu_rect, border_radius=20)
-        pygame.draw.rect(tela, PRETO, menu_rect, 3, border_radius=20)
+        # Fundo marrom, título e botão fechar (X) - círculo vermelho como no original
+        botao_size = 50
+        botao_x = LARGURA - botao_size - 20
+        painel = self.painel_ataques
+        painel.mover((0, menu_y))
+        painel.redimensionar((LARGURA, menu_altura))
+        painel.atualizar(titulo="ESCOLHA SEU ATAQUE" if aberto else None,
+                         fonte=self.resource_manager.obter_fonte('titulo'),
+                         fechar_pos=(botao_x, 15) if aberto else None)
+        painel.desenhar(tela)
         
-        if menu_altura > 50:  # Só desenha conteúdo quando menu está aberto
-            # Título centralizado
-            fonte_titulo = self.resource_manager.obter_fonte('titulo')
-            titulo = fonte_titulo.render("ESCOLHA SEU ATAQUE", True, BRANCO)
-            titulo_rect = titulo.get_rect(center=(LARGURA//2, menu_y + 40))
-            tela.blit(titulo, titulo_rect)
-            
-            # Botão fechar (X) - círculo vermelho como no original
-            botao_size = 50
-            botao_x = LARGURA - botao_size - 20
-            botao_y = menu_y + 15
-            botao_center = (botao_x + botao_size//2, botao_y + botao_size//2)
-            
-            # Círculo vermelho com borda branca
-            pygame.draw.circle(tela, VERMELHO, botao_center, botao_size//2)
-            pygame.draw.circle(tela, BRANCO, botao_center, botao_size//2, 3)
-            
-            # X branco no centro
-            fonte_x = self.resource_manager.obter_fonte('titulo')
-            texto_x = fonte_x.render("×", True, BRANCO)
-            x_rect = texto_x.get_rect(center=botao_center)
-            tela.blit(texto_x, x_rect)
-            
+        if aberto:
             # Salvar área do botão para cliques
-            ui_manager._botao_fechar_rect = pygame.Rect(botao_x, botao_y, botao_size, botao_size)
+            ui_manager._botao_fechar_rect = pygame.Rect(botao_x, menu_y + 15, botao_size, botao_size)
             
             # Botões de ataque - AGORA CENTRALIZADOS
             if menu_altura >= 150:
@@ -81,117 +140,57 @@ class MenuRenderer:
         menu_altura = ui_manager.menu_altura
         menu_x = (LARGURA - menu_largura) // 2
         menu_y = ALTURA - menu_altura - 50
+        aberto = menu_altura > 50
         
-        # Fundo marrom como no original
-        menu_rect = pygame.Rect(menu_x, menu_y, menu_largura, menu_altura)
-        pygame.draw.rect(tela, MARROM_LOJA, menu_rect, border_radius=20)
-        pygame.draw.rect(tela, BRANCO, menu_rect, 3, border_radius=20)  # Borda branca (não dourada)
+        # Fundo marrom com borda branca, título branco e botão fechar (X) no canto superior direito
+        painel = self.painel_loja
+        painel.mover((menu_x, menu_y))
+        painel.redimensionar((menu_largura, menu_altura))
+        painel.atualizar(titulo="LOJA DO CAÇADOR" if aberto else None,
+                         fonte=self.resource_manager.obter_fonte('titulo'),
+                         fechar_pos=(menu_largura - 60, 10) if aberto else None)
         
-        if menu_altura > 50:
-            # Título branco (não dourado)
-            fonte_titulo = self.resource_manager.obter_fonte('titulo')
-            titulo = fonte_titulo.render("LOJA DO CAÇADOR", True, BRANCO)
-            titulo_rect = titulo.get_rect(center=(menu_x + menu_largura//2, menu_y + 40))
-            tela.blit(titulo, titulo_rect)
+        # Itens da loja com molduras iguais aos botões de ataque
+        itens_loja = loja_manager.obter_itens_disponiveis()[:4] if menu_altura >= 200 else []
+        ui_manager._itens_loja_rects = []
+        for i, cartao in enumerate(self.cartoes_loja):
+            cartao.visivel = i < len(itens_loja)
+            if not cartao.visivel:
+                continue
+            item = itens_loja[i]
+            item_rect = cartao.rect_absoluto(painel.rect.topleft)
             
-            # Botão fechar (X) no canto superior direito
-            botao_fechar = pygame.Rect(menu_x + menu_largura - 60, menu_y + 10, 50, 50)
-            pygame.draw.circle(tela, VERMELHO, botao_fechar.center, 25)
-            pygame.draw.circle(tela, BRANCO, botao_fechar.center, 25, 3)
+            # Verifica se tem dinheiro suficiente para o item
+            pode_comprar = dinheiro_jogador >= item.preco
             
-            fonte_x = self.resource_manager.obter_fonte('titulo')
-            texto_x = fonte_x.render("×", True, BRANCO)
-            x_rect = texto_x.get_rect(center=botao_fechar.center)
-            tela.blit(texto_x, x_rect)
+            # Salvar retângulo do item para detecção de clique
+            ui_manager._itens_loja_rects.append({
+                'rect': item_rect,
+                'item': item,
+                'pode_comprar': pode_comprar,
+                'indice': i
+            })
             
-            # Salvar área do botão para cliques
-            ui_manager._botao_fechar_rect = botao_fechar
-            
-            # Itens da loja com molduras iguais aos botões de ataque
-            if menu_altura >= 200:
-                fonte_texto = self.resource_manager.obter_fonte('texto')
-                fonte_pequena = self.resource_manager.obter_fonte('pequena')
-                
-                itens_y = menu_y + 80
-                itens_loja = loja_manager.obter_itens_disponiveis()
+            # Efeito visual de hover/clique
+            hover = item_rect.collidepoint(mouse_pos)
+            if hover and pode_comprar:
+                # Sobreposição verde quando pode comprar e está hovering
+                estado, filtro = 'hover', (VERDE, 30)
+            elif not pode_comprar:
+                # Sobreposição vermelha quando não pode comprar
+                estado, filtro = 'desabilitado', (VERMELHO, 60)
+            else:
+                estado, filtro = 'normal', None
                 
-                # Limpar retângulos anteriores
-                ui_manager._itens_loja_rects = []
-                
-                for i, item in enumerate(itens_loja[:4]):  # Máximo 4 itens por linha
-                    item_x = menu_x + 50 + (i * 150)
-                    item_rect = pygame.Rect(item_x, itens_y, 140, 120)
-                    
-                    # Verifica se tem dinheiro suficiente para o item
-                    pode_comprar = dinheiro_jogador >= item.preco
-                    
-                    # Salvar retângulo do item para detecção de clique
-                    ui_manager._itens_loja_rects.append({
-                        'rect': item_rect,
-                        'item': item,
-                        'pode_comprar': pode_comprar,
-                        'indice': i
-                    })
-                    
-                    # Usar a mesma moldura dos botões de ataque (hud_botao.png)
-                    moldura_item = self.resource_manager.obter_moldura('itens')
-                    if moldura_item:
-                        # Redimensiona a moldura para o tamanho do item
-                        moldura_redimensionada = pygame.transform.scale(moldura_item, (140, 120))
-                        tela.blit(moldura_redimensionada, (item_x, itens_y))
-                    else:
-                        # Fallback: desenhar retângulo similar aos botões de ataque
-                        pygame.draw.rect(tela, VERMELHO, item_rect, border_radius=10)
-                        pygame.draw.rect(tela, BRANCO, item_rect, 3, border_radius=10)
-                    
-                    # Efeito visual de hover/clique
-                    hover = item_rect.collidepoint(mouse_pos)
-                    if hover and pode_comprar:
-                        # Sobreposição verde quando pode comprar e está hovering
-                        overlay = pygame.Surface((140, 120))
-                        overlay.set_alpha(30)
-                        overlay.fill(VERDE)
-                        tela.blit(overlay, (item_x, itens_y))
-                    elif not pode_comprar:
-                        # Sobreposição vermelha quando não pode comprar
-                        overlay = pygame.Surface((140, 120))
-                        overlay.set_alpha(60)
-                        overlay.fill(VERMELHO)
-                        tela.blit(overlay, (item_x, itens_y))
-                    
-                    # === NOVO: Adiciona fundo escuro para contraste do texto ===
-                    text_bg_height = 60 # Altura da área de texto (ajuste conforme necessário)
-                    text_bg_y = itens_y + 40 # Posição Y da área de texto (ajuste)
-                    
-                    # Cria a superfície semi-transparente
-                    text_bg_surface = pygame.Surface((120, text_bg_height)) # Largura um pouco menor que o cartão
-                    text_bg_surface.set_alpha(150) # Ajuste a transparência (0-255)
-                    text_bg_surface.fill(PRETO) # Cor preta
-                    
-                    # Calcula a posição X para centralizar o fundo do texto
-                    text_bg_x = item_x + (item_rect.width - 120) // 2 
-                    
-                    # Desenha o fundo do texto na tela
-                    tela.blit(text_bg_surface, (text_bg_x, text_bg_y))
-                    # === FIM DO NOVO CÓDIGO ===
-
-                    # Nome do item (centralizado) 
-                    # (O código para desenhar nome, preço e descrição continua aqui)
-                    nome_texto = fonte_pequena.render(item.nome, True, BRANCO)
-                    nome_rect = nome_texto.get_rect(center=(item_x + 70, text_bg_y + 15)) # Ajuste Y para ficar sobre o fundo
-                    tela.blit(nome_texto, nome_rect)
-                    
-                    # Preço com cor baseada no dinheiro disponível
-                    cor_preco = VERDE if pode_comprar else VERMELHO
-                    preco_texto = fonte_texto.render(f"${item.preco}", True, cor_preco)
-                    preco_rect = preco_texto.get_rect(center=(item_x + 70, text_bg_y + 45)) # Ajuste Y
-                    tela.blit(preco_texto, preco_rect)
-
-                    # Efeito do item (se houver)
-                    if hasattr(item, 'descricao') and item.descricao:
-                        desc_texto = fonte_pequena.render(item.descricao[:15] + "...", True, CINZA_CLARO)
-                        desc_rect = desc_texto.get_rect(center=(item_x + 70, itens_y + 60))
-                        tela.blit(desc_texto, desc_rect)
+            # O cartão só é redesenhado quando o item, o dinheiro suficiente ou o hover mudam
+            cartao.atualizar(nome=item.nome, preco=item.preco, descricao=getattr(item, 'descricao', None),
+                             pode_comprar=pode_comprar, estado=estado, filtro=filtro)
+            
+        painel.desenhar(tela)
+        
+        if aberto:
+            # Salvar área do botão para cliques
+            ui_manager._botao_fechar_rect = pygame.Rect(menu_x + menu_largura - 60, menu_y + 10, 50, 50)
             
     def desenhar_menu_monstruario(self, tela, ui_manager, mouse_pos, monstruario_manager):
         """Desenha o menu do monstruário (IDÊNTICO AO ORIGINAL)."""
@@ -203,41 +202,21 @@ class MenuRenderer:
         menu_altura = ui_manager.menu_altura
         menu_x = (LARGURA - menu_largura) // 2
         menu_y = ALTURA - menu_altura - 50
+        aberto = menu_altura > 50
         
-        # Fundo roxo como no original
-        menu_rect = pygame.Rect(menu_x, menu_y, menu_largura, menu_altura)
-        pygame.draw.rect(tela, ROXO_ESCURO, menu_rect, border_radius=20)
-        pygame.draw.rect(tela, ROXO, menu_rect, 3, border_radius=20)  # Borda roxa
+        # Fundo roxo, título, botão fechar e texto explicativo
+        painel = self.painel_monstruario
+        painel.mover((menu_x, menu_y))
+        painel.redimensionar((menu_largura, menu_altura))
+        painel.atualizar(titulo="MONSTRUÁRIO" if aberto else None,
+                         fonte=self.resource_manager.obter_fonte('titulo'), cor_titulo=AMARELO,
+                         fechar_x=menu_largura - 60 if aberto else None,
+                         mostrar_info=menu_altura >= 200)
+        painel.desenhar(tela)
         
-        if menu_altura > 50:
-            # Título
-            fonte_titulo = self.resource_manager.obter_fonte('titulo')
-            titulo = fonte_titulo.render("MONSTRUÁRIO", True, AMARELO)
-            titulo_rect = titulo.get_rect(center=(menu_x + menu_largura//2, menu_y + 40))
-            tela.blit(titulo, titulo_rect)
-            
-            # Botão fechar (X) no canto superior direito
-            botao_fechar = pygame.Rect(menu_x + menu_largura - 60, menu_y + 10, 50, 50)
-            pygame.draw.rect(tela, VERMELHO, botao_fechar, border_radius=20)
-            pygame.draw.rect(tela, PRETO, botao_fechar, 2, border_radius=20)
-            
-            texto_x = fonte_titulo.render("×", True, BRANCO)
-            x_rect = texto_x.get_rect(center=botao_fechar.center)
-            tela.blit(texto_x, x_rect)
-            
-            # Conteúdo do monstruário
-            if menu_altura >= 200:
-                fonte_texto = self.resource_manager.obter_fonte('texto')
-                
-                # Texto explicativo
-                texto_info = "Derrote inimigos para descobrir suas fraquezas!"
-                info_render = fonte_texto.render(texto_info, True, BRANCO)
-                info_rect = info_render.get_rect(center=(menu_x + menu_largura//2, menu_y + 120))
-                tela.blit(info_render, info_rect)
-                
-                # Aqui seria onde o monstruario_manager desenha o conteúdo
-                if hasattr(monstruario_manager, 'desenhar_conteudo'):
-                    monstruario_manager.desenhar_conteudo(tela, menu_x + 50, menu_y + 150, mouse_pos)
+        # Aqui seria onde o monstruario_manager desenha o conteúdo
+        if menu_altura >= 200 and hasattr(monstruario_manager, 'desenhar_conteudo'):
+            monstruario_manager.desenhar_conteudo(tela, menu_x + 50, menu_y + 150, mouse_pos)
             
     def desenhar_game_over(self, tela, ui_manager, mouse_pos):
         """Desenha a tela de game over."""
@@ -285,34 +264,21 @@ class MenuRenderer:
             tela.blit(resultado_surface, resultado_rect)
             
     def desenhar_tooltip(self, tela, ui_manager):
-        """Desenha tooltip quando ativo."""
+        """Desenha tooltip quando ativo (a caixa só é refeita quando o texto muda)."""
         if not ui_manager.tooltip_ativo:
             return
             
-        fonte_pequena = self.resource_manager.obter_fonte('pequena')
-        texto_surface = fonte_pequena.render(ui_manager.tooltip_texto, True, BRANCO)
-        
-        # Fundo do tooltip
-        padding = 10
-        tooltip_rect = pygame.Rect(
-            ui_manager.tooltip_pos[0] - padding,
-            ui_manager.tooltip_pos[1] - texto_surface.get_height() - padding,
-            texto_surface.get_width() + padding * 2,
-            texto_surface.get_height() + padding * 2
-        )
-        
-        # Ajusta posição se sair da tela
-        if tooltip_rect.right > LARGURA:
-            tooltip_rect.x = LARGURA - tooltip_rect.width
-        if tooltip_rect.top < 0:
-            tooltip_rect.y = ui_manager.tooltip_pos[1] + 20
-            
-        pygame.draw.rect(tela, PRETO, tooltip_rect)
-        pygame.draw.rect(tela, BRANCO, tooltip_rect, 2)
+        if self.tooltip is None:
+            self.tooltip = TooltipWidget(self.resource_manager.obter_fonte('pequena'), widget_id='tooltip',
+                                         animation_manager=self.animation_manager)
+        padding = self.tooltip.padding
+        if self.tooltip.definir_texto(ui_manager.tooltip_texto):
+            # Texto novo: a caixa em cache aparece com fade, sem ser redesenhada a cada frame
+            self.tooltip.mostrar_com_animacao('fade_in')
         
-        # Desenha o texto
-        texto_pos = (tooltip_rect.x + padding, tooltip_rect.y + padding)
-        tela.blit(texto_surface, texto_pos)
+        # Acima da posição pedida, ajustando se sair da tela
+        self.tooltip.posicionar((ui_manager.tooltip_pos[0] - padding, ui_manager.tooltip_pos[1] + padding))
+        self.tooltip.desenhar(tela)
         
     def mostrar_tooltip(self, ui_manager, texto, pos):
         """Mostra um tooltip na posição especificada."""
@@ -5,10 +5,17 @@ Monstruário original do JokenGhost - Sistema idêntico ao jogo de 2000 linhas
 import pygame
 import os
 from config.constants import *
+from graphics.overlays import obter_fabrica_overlays
+from ui.widgets import Widget
 
 class MonstruarioOriginal:
     """Monstruário idêntico ao jogo original."""
     
+    LIVRO_LARGURA = 700
+    LIVRO_ALTURA = 500
+    MARGEM_TITULO = 50  # Espaço acima do livro para o título
+    MARGEM_RODAPE = 50  # Espaço abaixo do livro para as instruções
+    
     def __init__(self, resource_manager):
         """Inicializa o monstruário original."""
         self.resource_manager = resource_manager
@@ -16,19 +23,25 @@ class MonstruarioOriginal:
         self.pagina_atual = 0
         self.monstruario_descoberto = {}  # {tipo_inimigo: {"fraquezas": [], "nome": str, etc}}
         self.sprite_monstruario = None
-        self.carregar_sprite_monstruario()
-        
-    def carregar_sprite_monstruario(self):
-        """Carrega a sprite do monstruário."""
-        try:
-            monstruario_path = os.path.join("Assests", "Sprites", "molders", "Monstruario.png")
-            if os.path.exists(monstruario_path):
-                self.sprite_monstruario = pygame.image.load(monstruario_path).convert_alpha()
-                print("✅ Sprite do monstruário carregada!")
-            else:
-                print("⚠️ Sprite do monstruário não encontrada")
-        except Exception as e:
-            print(f"❌ Erro ao carregar sprite do monstruário: {e}")
+        self._sprite_fantasma_pagina = None  # None = ainda não carregado, False = indisponível
+        
+        # Página inteira (livro, título, textos e instruções) como um widget retido
+        livro_x = (LARGURA - self.LIVRO_LARGURA) // 2
+        livro_y = (ALTURA - self.LIVRO_ALTURA) // 2
+        self.widget_livro = Widget(
+            (self.LIVRO_LARGURA, self.MARGEM_TITULO + self.LIVRO_ALTURA + self.MARGEM_RODAPE),
+            (livro_x, livro_y - self.MARGEM_TITULO), self._renderizar_livro)
+        
+    def carregar_sprite_monstruario(self, tamanho):
+        """
+        Obtém a sprite do monstruário já escalada pelo ResourceManager.
+        
+        Args:
+            tamanho: (largura, altura) do livro
+        """
+        if self.sprite_monstruario is None or self.sprite_monstruario.get_size() != tuple(tamanho):
+            self.sprite_monstruario = self.resource_manager.obter_imagem_escalada('monstruario', tamanho)
+        return self.sprite_monstruario
     
     def abrir(self):
         """Abre o monstruário."""
@@ -72,25 +85,7 @@ class MonstruarioOriginal:
             return
         
         # Fundo semi-transparente
-        overlay = pygame.Surface((LARGURA, ALTURA))
-        overlay.set_alpha(230)
-        overlay.fill((20, 15, 10))  # Marrom muito escuro
-        tela.blit(overlay, (0, 0))
-        
-        # Livro central
-        livro_largura = 700
-        livro_altura = 500
-        livro_x = (LARGURA - livro_largura) // 2
-        livro_y = (ALTURA - livro_altura) // 2
-        
-        # Sprite do monstruário como fundo do livro
-        if self.sprite_monstruario:
-            sprite_redimensionada = pygame.transform.scale(self.sprite_monstruario, (livro_largura, livro_altura))
-            tela.blit(sprite_redimensionada, (livro_x, livro_y))
-        else:
-            # Fallback se não houver sprite
-            pygame.draw.rect(tela, (101, 67, 33), (livro_x, livro_y, livro_largura, livro_altura), border_radius=15)
-            pygame.draw.rect(tela, DOURADO, (livro_x, livro_y, livro_largura, livro_altura), 5, border_radius=15)
+        obter_fabrica_overlays().desenhar(tela, (0, 0), (LARGURA, ALTURA), (20, 15, 10), 230)  # Marrom muito escuro
         
         # Lista de monstros descobertos
         tipos_descobertos = list(self.monstruario_descoberto.keys())
@@ -99,115 +94,136 @@ class MonstruarioOriginal:
         # Garante que a página atual está dentro dos limites
         if self.pagina_atual >= total_paginas:
             self.pagina_atual = 0
+            
+        # A página só é redesenhada quando o índice ou os dados do monstro mudam
+        info = None
+        if tipos_descobertos:
+            dados = self.monstruario_descoberto[tipos_descobertos[self.pagina_atual]]
+            info = (dados['nome'], dados['descricao'], tuple(dados['fraquezas']), dados['encontros'], dados['derrotas'])
+        sprite_livro = self.carregar_sprite_monstruario((self.LIVRO_LARGURA, self.LIVRO_ALTURA))
+        self.widget_livro.atualizar(sprite_livro=sprite_livro, pagina=self.pagina_atual,
+                                    total_paginas=len(tipos_descobertos), info=info)
+        self.widget_livro.desenhar(tela)
+        
+    def _renderizar_livro(self, superficie, sprite_livro, pagina, total_paginas, info):
+        """
+        Desenha o livro com o título acima, a página atual e as instruções abaixo.
+        
+        Args:
+            superficie: Superfície do widget (o topo do livro fica em y=MARGEM_TITULO)
+            sprite_livro: Fundo do livro já escalado, ou None para o fallback desenhado
+            pagina: Índice da página atual
+            total_paginas: Quantidade de monstros descobertos
+            info: (nome, descricao, fraquezas, encontros, derrotas) do monstro da página, ou None
+        """
+        livro_largura = self.LIVRO_LARGURA
+        livro_altura = self.LIVRO_ALTURA
+        livro_x = 0
+        livro_y = self.MARGEM_TITULO
+        
+        # Sprite do monstruário como fundo do livro
+        if sprite_livro:
+            superficie.blit(sprite_livro, (livro_x, livro_y))
+        else:
+            # Fallback se não houver sprite
+            pygame.draw.rect(superficie, (101, 67, 33), (livro_x, livro_y, livro_largura, livro_altura), border_radius=15)
+            pygame.draw.rect(superficie, DOURADO, (livro_x, livro_y, livro_largura, livro_altura), 5, border_radius=15)
         
         # Título (posicionado acima do livro)
         fonte_titulo = self.resource_manager.obter_fonte('titulo')
         titulo = fonte_titulo.render("MONSTRUÁRIO", True, DOURADO)
         titulo_x = livro_x + (livro_largura - titulo.get_width()) // 2
-        tela.blit(titulo, (titulo_x, livro_y - 50))  # 50px acima do livro
+        superficie.blit(titulo, (titulo_x, livro_y - 50))  # 50px acima do livro
+        
+        fonte_texto = self.resource_manager.obter_fonte('texto')
+        fonte_pequena = self.resource_manager.obter_fonte('pequena')
         
         # Contador de páginas (abaixo do título)
-        if tipos_descobertos:
-            fonte_pequena = self.resource_manager.obter_fonte('pequena')
-            contador = fonte_pequena.render(f"Página {self.pagina_atual + 1} de {total_paginas}", True, CINZA_CLARO)
+        if total_paginas:
+            contador = fonte_pequena.render(f"Página {pagina + 1} de {total_paginas}", True, CINZA_CLARO)
             contador_x = livro_x + (livro_largura - contador.get_width()) // 2
-            tela.blit(contador, (contador_x, livro_y + 25))  # 25px abaixo do topo do livro
+            superficie.blit(contador, (contador_x, livro_y + 25))  # 25px abaixo do topo do livro
         
         # Conteúdo da página
-        if not tipos_descobertos:
+        if info is None:
             # Nenhum monstro descoberto
-            fonte_texto = self.resource_manager.obter_fonte('texto')
             texto_vazio = fonte_texto.render("Derrote inimigos para descobrir suas fraquezas!", True, BRANCO)
             texto_x = livro_x + (livro_largura - texto_vazio.get_width()) // 2
-            tela.blit(texto_vazio, (texto_x, livro_y + 200))
+            superficie.blit(texto_vazio, (texto_x, livro_y + 200))
         else:
-            # Mostra o monstro da página atual
-            tipo_atual = tipos_descobertos[self.pagina_atual]
-            info = self.monstruario_descoberto[tipo_atual]
+            nome, descricao, fraquezas, encontros, derrotas = info
             
             # Sprite posicionado à esquerda
             sprite_x = livro_x + 200  # À esquerda
             sprite_y = livro_y + 100  # Um pouco mais acima
             
-            # Desenha sprite do fantasma (cortando um frame da sprite sheet)
-            try:
-                # Carrega o sprite sheet do fantasma
-                caminho_fantasma = os.path.join("Assests", "Sprites", "Ghost", "Sprite_fantasma.idle (1).png")
-                if os.path.exists(caminho_fantasma):
-                    sprite_sheet = pygame.image.load(caminho_fantasma).convert_alpha()
-                    
-                    # Sprite sheet tem 12 frames horizontais de 640x640
-                    largura_frame = sprite_sheet.get_width() // 12
-                    altura_frame = sprite_sheet.get_height()
-                    
-                    # Corta o primeiro frame
-                    frame_rect = pygame.Rect(0, 0, largura_frame, altura_frame)
-                    sprite_fantasma = sprite_sheet.subsurface(frame_rect)
-                    
-                    # Redimensiona para tamanho adequado no livro
-                    sprite_scaled = pygame.transform.scale(sprite_fantasma, (80, 80))
-                    tela.blit(sprite_scaled, (sprite_x, sprite_y))
-                else:
-                    # Fallback sprite
-                    self.desenhar_sprite_fallback(tela, sprite_x, sprite_y)
-            except Exception as e:
+            # Desenha sprite do fantasma (primeiro frame da sprite sheet, carregado uma vez)
+            sprite_fantasma = self.carregar_sprite_fantasma()
+            if sprite_fantasma:
+                superficie.blit(sprite_fantasma, (sprite_x, sprite_y))
+            else:
                 # Fallback sprite
-                self.desenhar_sprite_fallback(tela, sprite_x, sprite_y)
-            
-            # Textos do monstruário
-            fonte_texto = self.resource_manager.obter_fonte('texto')
-            fonte_pequena = self.resource_manager.obter_fonte('pequena')
+                self.desenhar_sprite_fallback(superficie, sprite_x, sprite_y)
             
             # Nome do monstro (menor e à esquerda)
             nome_y = sprite_y + 85  # Logo abaixo do sprite
-            nome_surface = fonte_texto.render(info['nome'], True, CINZA)
-            nome_x = livro_x + 185  # Posicionado à esquerda
-            tela.blit(nome_surface, (nome_x, nome_y))
+            superficie.blit(fonte_texto.render(nome, True, CINZA), (livro_x + 185, nome_y))
             
             # Descrição do monstro
             desc_y = nome_y + 25
-            desc_surface = fonte_pequena.render(info['descricao'][:50] + "...", True, BRANCO)
-            desc_x = livro_x + 185
-            tela.blit(desc_surface, (desc_x, desc_y))
+            superficie.blit(fonte_pequena.render(descricao[:50] + "...", True, BRANCO), (livro_x + 185, desc_y))
             
             # Fraquezas descobertas
             fraq_y = desc_y + 35
-            if info['fraquezas']:
-                fraquezas_text = "Fraquezas: " + ", ".join(info['fraquezas'])
-                fraq_surface = fonte_pequena.render(fraquezas_text, True, VERDE)
-                tela.blit(fraq_surface, (livro_x + 185, fraq_y))
+            if fraquezas:
+                fraq_surface = fonte_pequena.render("Fraquezas: " + ", ".join(fraquezas), True, VERDE)
             else:
                 fraq_surface = fonte_pequena.render("Fraquezas: Desconhecidas", True, VERMELHO)
-                tela.blit(fraq_surface, (livro_x + 185, fraq_y))
+            superficie.blit(fraq_surface, (livro_x + 185, fraq_y))
             
             # Estatísticas de encontros
             stats_y = fraq_y + 30
-            encontros_text = f"Encontros: {info['encontros']}"
-            stats_surface = fonte_pequena.render(encontros_text, True, BRANCO)
-            tela.blit(stats_surface, (livro_x + 185, stats_y))
+            superficie.blit(fonte_pequena.render(f"Encontros: {encontros}", True, BRANCO), (livro_x + 185, stats_y))
             
             derrotas_y = stats_y + 15
-            derrotas_text = f"Derrotas: {info['derrotas']}"
-            derrotas_surface = fonte_pequena.render(derrotas_text, True, BRANCO)
-            tela.blit(derrotas_surface, (livro_x + 185, derrotas_y))
+            superficie.blit(fonte_pequena.render(f"Derrotas: {derrotas}", True, BRANCO), (livro_x + 185, derrotas_y))
             
             # Taxa de vitória
-            if info['encontros'] > 0:
-                taxa_vitoria = (info['derrotas'] / info['encontros']) * 100
-                taxa_y = derrotas_y + 15
-                taxa_text = f"Taxa de Vitória: {taxa_vitoria:.1f}%"
-                taxa_surface = fonte_pequena.render(taxa_text, True, AMARELO)
-                tela.blit(taxa_surface, (livro_x + 185, taxa_y))
+            if encontros > 0:
+                taxa_vitoria = (derrotas / encontros) * 100
+                taxa_surface = fonte_pequena.render(f"Taxa de Vitória: {taxa_vitoria:.1f}%", True, AMARELO)
+                superficie.blit(taxa_surface, (livro_x + 185, derrotas_y + 15))
         
         # Instruções de navegação na parte inferior
-        fonte_pequena = self.resource_manager.obter_fonte('pequena')
-        if len(tipos_descobertos) > 1:
+        if total_paginas > 1:
             nav_text = "Use SETAS para navegar | ESC para fechar"
         else:
             nav_text = "ESC para fechar"
         nav_surface = fonte_pequena.render(nav_text, True, CINZA_CLARO)
         nav_x = livro_x + (livro_largura - nav_surface.get_width()) // 2
-        tela.blit(nav_surface, (nav_x, livro_y + livro_altura + 20))
+        superficie.blit(nav_surface, (nav_x, livro_y + livro_altura + 20))
+        
+    def carregar_sprite_fantasma(self):
+        """Carrega (uma única vez) o primeiro frame do fantasma, já em 80x80, para as páginas."""
+        if self._sprite_fantasma_pagina is None:
+            try:
+                # Carrega o sprite sheet do fantasma
+                caminho_fantasma = os.path.join("Assests", "Sprites", "Ghost", "Sprite_fantasma.idle (1).png")
+                if os.path.exists(caminho_fantasma):
+                    sprite_sheet = pygame.image.load(caminho_fantasma).convert_alpha()
+                    
+                    # Sprite sheet tem 12 frames horizontais de 640x640
+                    largura_frame = sprite_sheet.get_width() // 12
+                    frame_rect = pygame.Rect(0, 0, largura_frame, sprite_sheet.get_height())
+                    
+                    # Redimensiona para tamanho adequado no livro
+                    self._sprite_fantasma_pagina = pygame.transform.scale(sprite_sheet.subsurface(frame_rect), (80, 80))
+                else:
+                    self._sprite_fantasma_pagina = False
+            except Exception as e:
+                print(f"⚠️ Erro ao carregar sprite do fantasma do monstruário: {e}")
+                self._sprite_fantasma_pagina = False
+        return self._sprite_fantasma_pagina
     
     def desenhar_sprite_fallback(self, tela, x, y):
         """Desenha sprite fallback quando não consegue carregar o original."""
@@ -6,7 +6,9 @@ Responsável por mostrar quem venceu cada turno e resultados de batalha.
 import pygame
 import math
 from config.constants import *
+from graphics.overlays import obter_fabrica_overlays
 from config.enums import Escolha
+from ui.widgets import Widget
 
 class ResultDisplay:
     """Exibe resultados de combate de forma visual."""
@@ -37,6 +39,13 @@ class ResultDisplay:
             self.fonte_titulo = pygame.font.Font(None, 36)
             self.fonte_escolhas = pygame.font.Font(None, 24)
             self.fonte_resultado = pygame.font.Font(None, 28)
+            
+        # Widgets retidos: montados uma vez por resultado e apenas reposicionados/esmaecidos
+        centro_y = ALTURA // 3
+        self.widget_escolhas = Widget((LARGURA, 40), (0, centro_y - 80), self._renderizar_escolhas)
+        self.widget_resultado = Widget((1, 1), renderizar=self._renderizar_resultado)
+        self.widget_dica = Widget((LARGURA, 30), (0, centro_y + 35), self._renderizar_dica)
+        self.widget_detalhes = Widget((LARGURA, 1), (0, centro_y + 80 - 15), self._renderizar_detalhes)
     
     def mostrar_resultado(self, escolha_jogador, escolha_inimigo, resultado, detalhes_combate=None):
         """
@@ -70,6 +79,64 @@ class ResultDisplay:
         # Reset animação
         self.escala_animacao = 1.5  # Começa maior
         self.alpha_animacao = 255
+        
+        self._montar_widgets()
+        
+    def _montar_widgets(self):
+        """Informa aos widgets os textos do resultado atual (só redesenham o que mudou)."""
+        # Conversão de enum para emoji
+        emoji_map = {
+            Escolha.PEDRA: "🗿",
+            Escolha.PAPEL: "📄", 
+            Escolha.TESOURA: "✂️"
+        }
+        if self.escolha_jogador and self.escolha_inimigo:
+            self.widget_escolhas.visivel = True
+            self.widget_escolhas.atualizar(
+                texto_jogador=f"Você: {emoji_map.get(self.escolha_jogador, '❓')}",
+                texto_inimigo=f"Inimigo: {emoji_map.get(self.escolha_inimigo, '❓')}")
+        else:
+            self.widget_escolhas.visivel = False
+            
+        largura, altura = self.fonte_resultado.size(self.resultado_texto)
+        self.widget_resultado.redimensionar((largura + 3, altura + 3))  # +3 da sombra
+        self.widget_resultado.atualizar(texto=self.resultado_texto, cor=self.cor_resultado)
+        
+        linhas = self._linhas_detalhes()
+        self.widget_detalhes.redimensionar((LARGURA, max(1, 25 * len(linhas) + 5)))
+        self.widget_detalhes.atualizar(linhas=tuple(linhas))
+        
+    def _linhas_detalhes(self):
+        """Retorna [(texto, cor)] dos inimigos afetados, dano sofrido e recompensa."""
+        detalhes = self.detalhes_combate
+        linhas = []
+        
+        # Inimigo principal
+        if 'alvo_principal' in detalhes and detalhes['alvo_principal']:
+            alvo = detalhes['alvo_principal']
+            texto = f"🎯 {alvo['nome']}: -{alvo['dano_real']} HP"
+            if alvo['morreu']:
+                texto += " 💀"
+            linhas.append((texto, (255, 255, 150)))
+        
+        # Inimigos secundários (dano em área)
+        if 'inimigos_secundarios' in detalhes:
+            for inimigo_sec in detalhes['inimigos_secundarios']:
+                texto = f"💥 {inimigo_sec['nome']}: -{inimigo_sec['dano_real']} HP"
+                if inimigo_sec['morreu']:
+                    texto += " 💀"
+                linhas.append((texto, (255, 200, 100)))
+        
+        # Dano ao jogador
+        if 'dano_ao_jogador' in detalhes and detalhes['dano_ao_jogador'] > 0:
+            linhas.append((f"💔 Você: -{detalhes['dano_ao_jogador']} HP", (255, 150, 150)))
+        
+        # Recompensa em dinheiro
+        if 'recompensa_dinheiro' in detalhes and detalhes['recompensa_dinheiro'] > 0:
+            recompensa = detalhes['recompensa_dinheiro']
+            efetividade = detalhes.get('efetividade_texto', '')
+            linhas.append((f"💰 +${recompensa} {efetividade}", (100, 255, 100)))
+        return linhas
     
     def atualizar(self, delta_time):
         """Atualiza a animação do resultado."""
@@ -112,191 +179,72 @@ class ResultDisplay:
             
         centro_x = LARGURA // 2
         centro_y = ALTURA // 3
+        alpha = self.alpha_animacao
         
         # === Fundo semitransparente ===
-        overlay = pygame.Surface((LARGURA, 200))
-        overlay.set_alpha(120)
-        overlay.fill((0, 0, 0))
-        tela.blit(overlay, (0, centro_y - 100))
+        obter_fabrica_overlays().desenhar(tela, (0, centro_y - 100), (LARGURA, 200), (0, 0, 0), 120)
         
         # === Desenha escolhas dos combatentes ===
-        self._desenhar_escolhas(tela, centro_x, centro_y - 60)
+        self.widget_escolhas.desenhar(tela, alpha=alpha)
         
         # === Desenha resultado principal ===
         self._desenhar_resultado_principal(tela, centro_x, centro_y)
         
         # === Desenha dicas visuais ===
-        self._desenhar_dicas(tela, centro_x, centro_y + 50)
+        # Só mostra após 1 segundo, com efeito de piscar
+        if self.tempo_resultado >= 1000 and int(self.tempo_resultado / 300) % 2 == 0:
+            self.widget_dica.desenhar(tela, alpha=alpha)
         
         # === NOVO: Desenha detalhes dos inimigos afetados ===
-        self._desenhar_detalhes_inimigos(tela, centro_x, centro_y + 80)
+        if self.widget_detalhes.entradas.get('linhas'):
+            self.widget_detalhes.desenhar(tela, alpha=alpha)
     
-    def _desenhar_escolhas(self, tela, centro_x, y):
-        """Desenha as escolhas de ambos os combatentes."""
-        if not self.escolha_jogador or not self.escolha_inimigo:
-            return
-            
-        # Conversão de enum para emoji
-        emoji_map = {
-            Escolha.PEDRA: "🗿",
-            Escolha.PAPEL: "📄", 
-            Escolha.TESOURA: "✂️"
-        }
-        
-        jogador_emoji = emoji_map.get(self.escolha_jogador, "❓")
-        inimigo_emoji = emoji_map.get(self.escolha_inimigo, "❓")
-        
-        # Texto das escolhas
-        texto_jogador = f"Você: {jogador_emoji}"
-        texto_inimigo = f"Inimigo: {inimigo_emoji}"
-        
-        # Renderiza
+    def _renderizar_escolhas(self, superficie, texto_jogador, texto_inimigo):
+        """Desenha as escolhas de ambos os combatentes e o VS no centro."""
+        centro_x = superficie.get_width() // 2
+        y = superficie.get_height() // 2
         surface_jogador = self.fonte_escolhas.render(texto_jogador, True, BRANCO)
         surface_inimigo = self.fonte_escolhas.render(texto_inimigo, True, BRANCO)
-        
-        # Aplica transparência
-        if self.alpha_animacao < 255:
-            surface_jogador.set_alpha(self.alpha_animacao)
-            surface_inimigo.set_alpha(self.alpha_animacao)
-        
-        # Posiciona
-        rect_jogador = surface_jogador.get_rect()
-        rect_jogador.centerx = centro_x - 100
-        rect_jogador.centery = y
-        
-        rect_inimigo = surface_inimigo.get_rect()
-        rect_inimigo.centerx = centro_x + 100
-        rect_inimigo.centery = y
-        
-        tela.blit(surface_jogador, rect_jogador)
-        tela.blit(surface_inimigo, rect_inimigo)
-        
-        # VS no centro
         surface_vs = self.fonte_escolhas.render("VS", True, (255, 255, 0))
-        if self.alpha_animacao < 255:
-            surface_vs.set_alpha(self.alpha_animacao)
-        rect_vs = surface_vs.get_rect(center=(centro_x, y))
-        tela.blit(surface_vs, rect_vs)
+        superficie.blit(surface_jogador, surface_jogador.get_rect(center=(centro_x - 100, y)))
+        superficie.blit(surface_inimigo, surface_inimigo.get_rect(center=(centro_x + 100, y)))
+        superficie.blit(surface_vs, surface_vs.get_rect(center=(centro_x, y)))
+    
+    def _renderizar_resultado(self, superficie, texto, cor):
+        """Desenha o texto do resultado com sombra deslocada 3px."""
+        superficie.blit(self.fonte_resultado.render(texto, True, (0, 0, 0)), (3, 3))
+        superficie.blit(self.fonte_resultado.render(texto, True, cor), (0, 0))
+    
+    def _renderizar_dica(self, superficie):
+        """Desenha a dica de jogo centralizada."""
+        surface_dica = self.fonte_escolhas.render("Pressione qualquer tecla para continuar...", True, (200, 200, 200))
+        superficie.blit(surface_dica, surface_dica.get_rect(center=(superficie.get_width() // 2, 15)))
+    
+    def _renderizar_detalhes(self, superficie, linhas):
+        """Desenha uma linha centralizada por detalhe, a cada 25px."""
+        centro_x = superficie.get_width() // 2
+        for i, (texto, cor) in enumerate(linhas):
+            surface = self.fonte_escolhas.render(texto, True, cor)
+            superficie.blit(surface, surface.get_rect(center=(centro_x, 15 + i * 25)))
     
     def _desenhar_resultado_principal(self, tela, centro_x, y):
-        """Desenha o resultado principal com animação."""
-        surface_resultado = self.fonte_resultado.render(
-            self.resultado_texto, True, self.cor_resultado
-        )
+        """Desenha o resultado principal com animação (escala apenas a superfície em cache)."""
+        surface_resultado = self.widget_resultado.obter_superficie()
         
         # Aplica escala
         if self.escala_animacao != 1.0:
-            largura_original = surface_resultado.get_width()
-            altura_original = surface_resultado.get_height()
-            nova_largura = int(largura_original * self.escala_animacao)
-            nova_altura = int(altura_original * self.escala_animacao)
-            surface_resultado = pygame.transform.scale(
-                surface_resultado, (nova_largura, nova_altura)
-            )
+            nova_largura = int(surface_resultado.get_width() * self.escala_animacao)
+            nova_altura = int(surface_resultado.get_height() * self.escala_animacao)
+            surface_resultado = pygame.transform.scale(surface_resultado, (nova_largura, nova_altura))
         
         # Aplica transparência
-        if self.alpha_animacao < 255:
-            surface_resultado.set_alpha(self.alpha_animacao)
-        
-        # Posiciona
-        rect_resultado = surface_resultado.get_rect(center=(centro_x, y))
+        surface_resultado.set_alpha(self.alpha_animacao)
         
-        # Desenha sombra
-        surface_sombra = self.fonte_resultado.render(
-            self.resultado_texto, True, (0, 0, 0)
-        )
-        if self.escala_animacao != 1.0:
-            largura_original = surface_sombra.get_width()
-            altura_original = surface_sombra.get_height()
-            nova_largura = int(largura_original * self.escala_animacao)
-            nova_altura = int(altura_original * self.escala_animacao)
-            surface_sombra = pygame.transform.scale(
-                surface_sombra, (nova_largura, nova_altura)
-            )
-        
-        if self.alpha_animacao < 255:
-            surface_sombra.set_alpha(self.alpha_animacao // 2)
-        
-        rect_sombra = rect_resultado.copy()
-        rect_sombra.x += 3
-        rect_sombra.y += 3
-        tela.blit(surface_sombra, rect_sombra)
-        
-        # Desenha resultado
+        # Posiciona pelo centro do texto (sem contar a sombra)
+        sombra = int(3 * self.escala_animacao)
+        rect_resultado = surface_resultado.get_rect(center=(centro_x + sombra // 2, y + sombra // 2))
         tela.blit(surface_resultado, rect_resultado)
     
-    def _desenhar_dicas(self, tela, centro_x, y):
-        """Desenha dicas de jogo."""
-        if self.tempo_resultado < 1000:  # Só mostra após 1 segundo
-            return
-            
-        dica = "Pressione qualquer tecla para continuar..."
-        surface_dica = self.fonte_escolhas.render(dica, True, (200, 200, 200))
-        
-        # Efeito de piscar
-        if int(self.tempo_resultado / 300) % 2 == 0:
-            if self.alpha_animacao < 255:
-                surface_dica.set_alpha(self.alpha_animacao)
-            rect_dica = surface_dica.get_rect(center=(centro_x, y))
-            tela.blit(surface_dica, rect_dica)
-    
-    def _desenhar_detalhes_inimigos(self, tela, centro_x, y_inicial):
-        """Desenha detalhes dos inimigos afetados no combate."""
-        if not hasattr(self, 'detalhes_combate') or not self.detalhes_combate:
-            return
-            
-        detalhes = self.detalhes_combate
-        y_atual = y_inicial
-        
-        # Inimigo principal
-        if 'alvo_principal' in detalhes and detalhes['alvo_principal']:
-            alvo = detalhes['alvo_principal']
-            texto = f"🎯 {alvo['nome']}: -{alvo['dano_real']} HP"
-            if alvo['morreu']:
-                texto += " 💀"
-            
-            surface = self.fonte_escolhas.render(texto, True, (255, 255, 150))
-            if self.alpha_animacao < 255:
-                surface.set_alpha(self.alpha_animacao)
-            rect = surface.get_rect(center=(centro_x, y_atual))
-            tela.blit(surface, rect)
-            y_atual += 25
-        
-        # Inimigos secundários (dano em área)
-        if 'inimigos_secundarios' in detalhes:
-            for inimigo_sec in detalhes['inimigos_secundarios']:
-                texto = f"💥 {inimigo_sec['nome']}: -{inimigo_sec['dano_real']} HP"
-                if inimigo_sec['morreu']:
-                    texto += " 💀"
-                
-                surface = self.fonte_escolhas.render(texto, True, (255, 200, 100))
-                if self.alpha_animacao < 255:
-                    surface.set_alpha(self.alpha_animacao)
-                rect = surface.get_rect(center=(centro_x, y_atual))
-                tela.blit(surface, rect)
-                y_atual += 25
-        
-        # Dano ao jogador
-        if 'dano_ao_jogador' in detalhes and detalhes['dano_ao_jogador'] > 0:
-            texto = f"💔 Você: -{detalhes['dano_ao_jogador']} HP"
-            surface = self.fonte_escolhas.render(texto, True, (255, 150, 150))
-            if self.alpha_animacao < 255:
-                surface.set_alpha(self.alpha_animacao)
-            rect = surface.get_rect(center=(centro_x, y_atual))
-            tela.blit(surface, rect)
-            y_atual += 25
-        
-        # Recompensa em dinheiro
-        if 'recompensa_dinheiro' in detalhes and detalhes['recompensa_dinheiro'] > 0:
-            recompensa = detalhes['recompensa_dinheiro']
-            efetividade = detalhes.get('efetividade_texto', '')
-            texto = f"💰 +${recompensa} {efetividade}"
-            surface = self.fonte_escolhas.render(texto, True, (100, 255, 100))
-            if self.alpha_animacao < 255:
-                surface.set_alpha(self.alpha_animacao)
-            rect = surface.get_rect(center=(centro_x, y_atual))
-            tela.blit(surface, rect)
-    
     def esta_ativo(self):
         """Verifica se está mostrando resultado."""
         return self.resultado_ativo
@@ -5,6 +5,9 @@ Substitui tanto damage_display quanto sistema_texto_flutuante.
 
 import pygame
 from config.constants import *
+from core.log import obter_log
+
+log = obter_log()
 
 class SimpleDamageDisplay:
     """Sistema simples para mostrar números de dano que desaparecem automaticamente."""
@@ -33,7 +36,7 @@ class SimpleDamageDisplay:
             'alpha': 255
         }
         self.numeros_ativos.append(numero)
-        print(f"💰 DINHEIRO ADICIONADO: +${valor} em ({x}, {y})")
+        log.debug("💰 DINHEIRO ADICIONADO: +$%s em (%s, %s)", valor, x, y)
         
     def adicionar_dano(self, valor, x, y, cor=(255, 100, 100)):
         """
@@ -55,7 +58,7 @@ class SimpleDamageDisplay:
             'alpha': 255
         }
         self.numeros_ativos.append(numero)
-        print(f"➕ DANO ADICIONADO: {valor} em ({x}, {y})")
+        log.debug("➕ DANO ADICIONADO: %s em (%s, %s)", valor, x, y)
         
     def atualizar(self, delta_time):
         """Atualiza todos os números de dano."""
@@ -79,7 +82,7 @@ class SimpleDamageDisplay:
             # Marcar para remoção se tempo acabou
             if numero['tempo_vida'] >= numero['duracao_total']:
                 numeros_para_remover.append(numero)
-                print(f"🗑️ DANO REMOVIDO: {numero['valor']} após {numero['tempo_vida']:.1f}s")
+                log.debug("🗑️ DANO REMOVIDO: %s após %.1fs", numero['valor'], numero['tempo_vida'], limitar=True)
         
         # Remover números expirados
         for numero in numeros_para_remover:
@@ -90,7 +93,8 @@ class SimpleDamageDisplay:
         if not self.numeros_ativos:
             return
             
-        fonte = self.resource_manager.obter_fonte('normal')
+        # Atlas de glifos: os valores mudam sempre, então não passam pelo FreeType
+        glifos = self.resource_manager.obter_atlas_glifos('normal')
         
         for numero in self.numeros_ativos:
             # Renderizar texto (dinheiro já tem + no valor, dano precisa de -)
@@ -99,23 +103,17 @@ class SimpleDamageDisplay:
             else:
                 texto = f"-{numero['valor']}"  # Dano: "-25"
                 
-            surface = fonte.render(texto, True, numero['cor'])
-            
-            # Aplicar alpha
-            if numero['alpha'] < 255:
-                surface.set_alpha(numero['alpha'])
-            
-            # Desenhar na posição atual
-            pos_x = int(numero['x'] - surface.get_width() // 2)
+            # Desenhar na posição atual, com alpha aplicado
+            pos_x = int(numero['x'] - glifos.largura(texto) // 2)
             pos_y = int(numero['y'])
-            tela.blit(surface, (pos_x, pos_y))
+            glifos.desenhar(tela, texto, (pos_x, pos_y), numero['cor'], numero['alpha'])
     
     def limpar_todos(self):
         """Remove todos os números de dano da tela imediatamente."""
         count = len(self.numeros_ativos)
         self.numeros_ativos.clear()
         if count > 0:
-            print(f"🧹 LIMPEZA FORÇADA: {count} números removidos")
+            log.debug("🧹 LIMPEZA FORÇADA: %s números removidos", count)
     
     def tem_numeros_ativos(self):
         """Retorna True se há números sendo exibidos."""
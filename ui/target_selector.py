@@ -6,7 +6,12 @@ Gerencia a interface para seleção de inimigos
 import pygame
 import math
 from config.constants import *
+from graphics.overlays import obter_fabrica_overlays
 from config.enums import *
+from core.log import obter_log
+from core.enemy_manager import Enemy
+
+log = obter_log()
 
 class TargetSelector:
     """Gerencia a seleção visual de alvos na tela."""
@@ -30,7 +35,7 @@ class TargetSelector:
         self.callback_selecao = callback_selecao
         self.alvo_destacado = None
         self.inimigos_referencia = []
-        print("🎯 Modo de seleção ativo - Clique em um inimigo!")
+        log.debug("🎯 Modo de seleção ativo - Clique em um inimigo!")
         
     def definir_inimigos_referencia(self, inimigos):
         """Define a lista de inimigos para desenho."""
@@ -46,7 +51,7 @@ class TargetSelector:
         self.modo_selecao_ativo = True
         self.callback_selecao = callback_funcao
         self.alvo_destacado = None
-        print("🎯 Modo de seleção ativo - Clique em um inimigo!")
+        log.debug("🎯 Modo de seleção ativo - Clique em um inimigo!")
         
     def desativar_modo_selecao(self):
         """Desativa o modo de seleção."""
@@ -69,18 +74,16 @@ class TargetSelector:
             return None
             
         for i, inimigo in enumerate(inimigos):
-            # Verifica se o inimigo é um dicionário válido
-            if not isinstance(inimigo, dict):
-                continue
-            if not inimigo.get('ativo', False) or inimigo.get('vida_atual', 0) <= 0:
+            # Ignora entradas que não são inimigos e inimigos mortos
+            if not isinstance(inimigo, Enemy) or not inimigo.vivo:
                 continue
                 
             # Verifica se o clique está dentro da área do inimigo
             rect_inimigo = pygame.Rect(
-                inimigo['pos_x'], 
-                inimigo['pos_y'], 
-                inimigo['largura'], 
-                inimigo['altura']
+                inimigo.pos_x, 
+                inimigo.pos_y, 
+                inimigo.largura, 
+                inimigo.altura
             )
             
             if rect_inimigo.collidepoint(mouse_pos):
@@ -92,32 +95,34 @@ class TargetSelector:
                 
         return None
     
-    def atualizar_highlight(self, mouse_pos, inimigos):
+    def atualizar_highlight(self, mouse_pos, inimigos, delta_time=16):
         """
         Atualiza o destaque visual do inimigo sob o mouse.
         
         Args:
             mouse_pos: Posição atual do mouse
             inimigos: Lista de inimigos
+            delta_time: Tempo desde a última atualização (ms), usado no pulso do destaque
         """
         if not self.modo_selecao_ativo:
             self.alvo_destacado = None
             return
+        
+        # O pulso avança com o tempo de simulação, não com a quantidade de desenhos
+        self.tempo_highlight += delta_time
             
         self.alvo_destacado = None
         
         for i, inimigo in enumerate(inimigos):
-            # Verifica se o inimigo é um dicionário válido
-            if not isinstance(inimigo, dict):
-                continue
-            if not inimigo.get('ativo', False) or inimigo.get('vida_atual', 0) <= 0:
+            # Ignora entradas que não são inimigos e inimigos mortos
+            if not isinstance(inimigo, Enemy) or not inimigo.vivo:
                 continue
                 
             rect_inimigo = pygame.Rect(
-                inimigo['pos_x'], 
-                inimigo['pos_y'], 
-                inimigo['largura'], 
-                inimigo['altura']
+                inimigo.pos_x, 
+                inimigo.pos_y, 
+                inimigo.largura, 
+                inimigo.altura
             )
             
             if rect_inimigo.collidepoint(mouse_pos):
@@ -135,9 +140,6 @@ class TargetSelector:
         if not self.modo_selecao_ativo:
             return
             
-        # Atualiza tempo para animação
-        self.tempo_highlight += 16  # ~60 FPS
-        
         # Cores melhoradas
         intensidade = abs(math.sin(self.tempo_highlight * 0.008)) * 80 + 175
         cor_pulsante = (intensidade, intensidade, 0)  # Amarelo pulsante
@@ -145,44 +147,42 @@ class TargetSelector:
         
         # === NOVO: Desenha hitbox de todos os inimigos válidos ===
         for i, inimigo in enumerate(inimigos):
-            if not isinstance(inimigo, dict):
-                continue
-            if not inimigo.get('ativo', False) or inimigo.get('vida_atual', 0) <= 0:
+            if not isinstance(inimigo, Enemy) or not inimigo.vivo:
                 continue
                 
             # Hitbox sutil para todos os inimigos
             if i == self.alvo_destacado:
                 # Hitbox destacada para hover
                 pygame.draw.rect(tela, (0, 255, 150, 120), 
-                               (inimigo['pos_x'] - 3, 
-                                inimigo['pos_y'] - 3, 
-                                inimigo['largura'] + 6, 
-                                inimigo['altura'] + 6), 0)
+                               (inimigo.pos_x - 3, 
+                                inimigo.pos_y - 3, 
+                                inimigo.largura + 6, 
+                                inimigo.altura + 6), 0)
             else:
                 # Hitbox sutil para os outros
                 pygame.draw.rect(tela, (100, 100, 100), 
-                               (inimigo['pos_x'] - 1, 
-                                inimigo['pos_y'] - 1, 
-                                inimigo['largura'] + 2, 
-                                inimigo['altura'] + 2), 1)
+                               (inimigo.pos_x - 1, 
+                                inimigo.pos_y - 1, 
+                                inimigo.largura + 2, 
+                                inimigo.altura + 2), 1)
         
         # Desenha borda destacada no inimigo sob o mouse
         if (self.alvo_destacado is not None and 
             self.alvo_destacado < len(inimigos) and 
-            isinstance(inimigos[self.alvo_destacado], dict)):
+            isinstance(inimigos[self.alvo_destacado], Enemy)):
             
             inimigo = inimigos[self.alvo_destacado]
             
             # Borda pulsante maior e mais visível
             pygame.draw.rect(tela, cor_pulsante, 
-                           (inimigo['pos_x'] - 5, 
-                            inimigo['pos_y'] - 5, 
-                            inimigo['largura'] + 10, 
-                            inimigo['altura'] + 10), 4)
+                           (inimigo.pos_x - 5, 
+                            inimigo.pos_y - 5, 
+                            inimigo.largura + 10, 
+                            inimigo.altura + 10), 4)
             
             # Indicador de mira (cruz)
-            centro_x = inimigo['pos_x'] + inimigo['largura'] // 2
-            centro_y = inimigo['pos_y'] + inimigo['altura'] // 2
+            centro_x = inimigo.pos_x + inimigo.largura // 2
+            centro_y = inimigo.pos_y + inimigo.altura // 2
             
             # Cruz de mira maior
             pygame.draw.line(tela, cor_pulsante, 
@@ -208,10 +208,7 @@ class TargetSelector:
         
         # Fundo semi-transparente
         rect_fundo = pygame.Rect(10, 10, surface_texto.get_width() + 20, surface_texto.get_height() + 10)
-        fundo = pygame.Surface((rect_fundo.width, rect_fundo.height))
-        fundo.fill(PRETO)
-        fundo.set_alpha(180)
-        tela.blit(fundo, rect_fundo)
+        obter_fabrica_overlays().desenhar(tela, rect_fundo, rect_fundo.size, PRETO, 180)
         
         # Texto
         tela.blit(surface_texto, (20, 15))
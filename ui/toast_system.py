@@ -5,6 +5,10 @@ Responsável por exibir mensagens temporárias na tela.
 
 import pygame
 from config.constants import *
+from graphics.overlays import obter_fabrica_overlays
+from core.log import obter_log
+
+log = obter_log()
 
 class ToastManager:
     """Gerenciador de notificações toast."""
@@ -26,7 +30,7 @@ class ToastManager:
             'target_y': len(self.toasts_ativos) * 40
         }
         self.toasts_ativos.append(toast)
-        print(f"🍞 Toast adicionado: {mensagem}")
+        log.debug("🍞 Toast adicionado: %s", mensagem)
         
     def atualizar_toasts(self, delta_time_ms):
         """Atualiza todos os toasts ativos."""
@@ -56,15 +60,21 @@ class ToastManager:
             self.toasts_ativos.remove(toast)
             
     def desenhar_toasts(self, tela):
-        """Desenha todos os toasts ativos na tela."""
+        """
+        Desenha todos os toasts ativos na tela.
+        
+        Returns:
+            list: Retângulos ocupados pelos toasts desenhados
+        """
         base_x = 20
         base_y = 100
+        retangulos = []
         
         for toast in self.toasts_ativos:
             if toast['alpha'] > 0:
                 # Cria superfície para o toast
-                fonte_pequena = self.resource_manager.obter_fonte('pequena')
-                texto_surface = fonte_pequena.render(toast['mensagem'], True, toast['cor'])
+                texto_surface = self.resource_manager.renderizar_texto('pequena', toast['mensagem'], toast['cor'],
+                                                                       alpha=toast['alpha'])
                 
                 # Calcula posição
                 y_pos = base_y + toast['y_offset']
@@ -78,21 +88,18 @@ class ToastManager:
                     texto_surface.get_height() + padding * 2
                 )
                 
-                # Cria superfície com alpha
-                bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-                bg_surface.set_alpha(min(200, toast['alpha']))
-                bg_surface.fill(PRETO)
-                
-                # Desenha fundo
-                tela.blit(bg_surface, bg_rect)
+                # Desenha fundo (superfície compartilhada, alpha aplicado a cada frame)
+                obter_fabrica_overlays().desenhar(tela, bg_rect, bg_rect.size, PRETO, min(200, toast['alpha']))
                 
                 # Borda
                 if toast['alpha'] > 100:
                     pygame.draw.rect(tela, toast['cor'], bg_rect, 2)
                 
                 # Desenha texto
-                texto_surface.set_alpha(toast['alpha'])
                 tela.blit(texto_surface, (base_x, y_pos))
+                retangulos.append(bg_rect)
+                
+        return retangulos
                 
     def limpar_toasts(self):
         """Remove todos os toasts ativos."""
@@ -169,6 +169,10 @@ class UIAnimationManager:
         return (elemento_id in self.animacoes_ativas and 
                 self.animacoes_ativas[elemento_id]['ativo'])
                 
+    def tem_animacoes_ativas(self):
+        """Verifica se algum elemento está sendo animado."""
+        return any(animacao['ativo'] for animacao in self.animacoes_ativas.values())
+                
     def animacao_completada(self, elemento_id):
         """Verifica se uma animação foi completada."""
         return (elemento_id in self.animacoes_ativas and 
@@ -215,11 +219,14 @@ class AnimatedWidget:
         """
         Desenha o widget com transformações.
         
+        A surface pode ser a superfície em cache do widget: o alpha é reaplicado
+        a cada chamada e ela nunca é redesenhada aqui.
+        
         Args:
             tela: Surface do pygame
             surface_widget: Surface do widget renderizado
         """
-        if not self.visivel or not self.rect_original:
+        if not self.rect_original or (not self.visivel and not self.esta_animando()):
             return
             
         # Obter transformações
@@ -227,9 +234,8 @@ class AnimatedWidget:
             self.widget_id, self.rect_original
         )
         
-        # Aplicar alpha
-        if transformacao['alpha'] < 255:
-            surface_widget.set_alpha(transformacao['alpha'])
+        # Aplicar alpha (255 restaura opaco sem desligar o alpha por pixel)
+        surface_widget.set_alpha(transformacao['alpha'])
             
         # Calcular posição final
         pos_x = self.rect_original.x + transformacao['offset_x']
@@ -5,7 +5,11 @@ Responsável por desenhar e gerenciar todos os elementos de UI do jogo.
 
 import pygame
 from config.constants import *
+from graphics.overlays import obter_fabrica_overlays
 from config.enums import *
+from core.log import obter_log
+
+log = obter_log()
 
 class UIManager:
     """Gerenciador de interface do usuário."""
@@ -156,30 +160,21 @@ class UIManager:
         # Verifica se o mouse está sobre o botão
         hover = botao['rect'].collidepoint(mouse_pos)
         
-        # Usa moldura personalizada se disponível
-        moldura_itens = self.resource_manager.obter_moldura('itens')
-        if moldura_itens:
-            # Escala a moldura para o tamanho do botão
-            moldura_escalada = pygame.transform.scale(moldura_itens, (botao['rect'].width, botao['rect'].height))
-            
-            # Aplica um filtro de cor se hover
-            if hover:
-                overlay = pygame.Surface((botao['rect'].width, botao['rect'].height))
-                overlay.fill((255, 255, 255))
-                overlay.set_alpha(30)
-                moldura_escalada.blit(overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        # Moldura personalizada já montada com o filtro de hover e o texto (um único blit)
+        botao_pronto = self.resource_manager.obter_moldura_pronta(
+            'itens', botao['rect'].size, 'hover' if hover else 'normal', botao['texto'])
+        if botao_pronto:
+            tela.blit(botao_pronto, botao['rect'])
+            return
             
-            # Desenha a moldura
-            tela.blit(moldura_escalada, botao['rect'])
-        else:
-            # Fallback para moldura desenhada
-            cor = MARROM_LOJA_CLARO if hover else MARROM_LOJA
-            pygame.draw.rect(tela, cor, botao['rect'])
-            pygame.draw.rect(tela, PRETO, botao['rect'], 3)
+        # Fallback para moldura desenhada
+        cor = MARROM_LOJA_CLARO if hover else MARROM_LOJA
+        pygame.draw.rect(tela, cor, botao['rect'])
+        pygame.draw.rect(tela, PRETO, botao['rect'], 3)
         
         # Desenha o texto
         fonte_texto = self.resource_manager.obter_fonte('texto')
-        texto = fonte_texto.render(botao['texto'], True, BRANCO)
+        texto = self.resource_manager.renderizar_texto(fonte_texto, botao['texto'], BRANCO)
         texto_rect = texto.get_rect(center=botao['rect'].center)
         tela.blit(texto, texto_rect)
         
@@ -190,26 +185,35 @@ class UIManager:
                 return key
         return None
         
-    def desenhar_menu_principal(self, tela):
-        """Desenha o menu principal."""
-        fundo_menu = self.resource_manager.obter_imagem('menu_background')
+    def desenhar_menu_principal(self, tela, progresso_carregamento=None):
+        """
+        Desenha o menu principal.
+        
+        Args:
+            tela: Superfície de destino
+            progresso_carregamento: Fração (0.0 a 1.0) dos recursos de batalha já
+                carregados, ou None para não mostrar a barra
+                
+        Returns:
+            pygame.Rect: Área da barra de carregamento, ou None se não foi desenhada
+        """
+        fundo_menu = self.resource_manager.obter_imagem_escalada('menu_background', (LARGURA, ALTURA))
         if fundo_menu:
-                       # Redimensiona a imagem para preencher a tela
-            fundo_redimensionado = pygame.transform.scale(fundo_menu, (LARGURA, ALTURA))
-            tela.blit(fundo_redimensionado, (0, 0))
+                       # Cópia já escalada para preencher a tela
+            tela.blit(fundo_menu, (0, 0))
         else:
                        # Fallback se a imagem não carregar (volta para o azul)
             tela.fill(AZUL)
         
         # Título
         fonte_titulo = self.resource_manager.obter_fonte('titulo')
-        titulo = fonte_titulo.render("JOKENGHOST", True, BRANCO)
+        titulo = self.resource_manager.renderizar_texto(fonte_titulo, "JOKENGHOST", BRANCO)
         titulo_rect = titulo.get_rect(center=(LARGURA//2, ALTURA//3))
         tela.blit(titulo, titulo_rect)
         
         # Subtítulo
         fonte_texto = self.resource_manager.obter_fonte('texto')
-        subtitulo = fonte_texto.render("Caçada em Turnos", True, BRANCO)
+        subtitulo = self.resource_manager.renderizar_texto(fonte_texto, "Caçada em Turnos", BRANCO)
         subtitulo_rect = subtitulo.get_rect(center=(LARGURA//2, ALTURA//3 + 80))
         tela.blit(subtitulo, subtitulo_rect)
         
@@ -217,20 +221,37 @@ class UIManager:
         mouse_pos = pygame.mouse.get_pos()
         self.desenhar_botao(tela, 'jogar', mouse_pos)
         
+        if progresso_carregamento is not None:
+            return self.desenhar_barra_carregamento(tela, progresso_carregamento)
+        return None
+            
+    def desenhar_barra_carregamento(self, tela, progresso):
+        """Desenha a barra de progresso do carregamento em segundo plano e retorna sua área."""
+        largura, altura = 300, 14
+        x = (LARGURA - largura) // 2
+        y = ALTURA - 60
+        pygame.draw.rect(tela, PRETO, (x, y, largura, altura), border_radius=5)
+        preenchido = int((largura - 4) * max(0.0, min(1.0, progresso)))
+        if preenchido > 0:
+            pygame.draw.rect(tela, BRANCO, (x + 2, y + 2, preenchido, altura - 4), border_radius=4)
+        
+        fonte = self.resource_manager.obter_fonte('muito_pequena')
+        texto = self.resource_manager.renderizar_texto(fonte, f"Carregando... {int(progresso * 100)}%", BRANCO)
+        texto_rect = texto.get_rect(center=(LARGURA // 2, y - 14))
+        tela.blit(texto, texto_rect)
+        return texto_rect.union(pygame.Rect(x, y, largura, altura))
+        
     def desenhar_transicao(self, tela, transicao_alpha):
         """Desenha a tela de transição."""
         tela.fill(PRETO)
         
         # Efeito de fade
-        superficie_fade = pygame.Surface((LARGURA, ALTURA))
-        superficie_fade.fill(BRANCO)
-        superficie_fade.set_alpha(transicao_alpha)
-        tela.blit(superficie_fade, (0, 0))
+        obter_fabrica_overlays().desenhar(tela, (0, 0), (LARGURA, ALTURA), BRANCO, transicao_alpha)
         
         # Texto de transição
         if transicao_alpha > 128:
             fonte_titulo = self.resource_manager.obter_fonte('titulo')
-            texto = fonte_titulo.render("UM GHOST APARECEU!", True, PRETO)
+            texto = self.resource_manager.renderizar_texto(fonte_titulo, "UM GHOST APARECEU!", PRETO)
             texto_rect = texto.get_rect(center=(LARGURA//2, ALTURA//2))
             tela.blit(texto, texto_rect)
             
@@ -239,9 +260,8 @@ class UIManager:
         tela.fill(PRETO)
         
         # Desenha a carta se disponível
-        carta_imagem = self.resource_manager.obter_imagem('carta_intro')
-        if carta_imagem:
-            carta_redimensionada = pygame.transform.scale(carta_imagem, (300, 200))
+        carta_redimensionada = self.resource_manager.obter_imagem_escalada('carta_intro', (300, 200))
+        if carta_redimensionada:
             carta_rect = carta_redimensionada.get_rect()
             carta_x = (LARGURA - carta_rect.width) // 2
             carta_y = 30
@@ -256,7 +276,7 @@ class UIManager:
         # Renderiza o texto da história
         for i, linha in enumerate(textos_intro):
             if linha:
-                superficie_texto = fonte_pequena.render(linha, True, BRANCO)
+                superficie_texto = self.resource_manager.renderizar_texto(fonte_pequena, linha, BRANCO)
                 texto_rect = superficie_texto.get_rect()
                 texto_rect.centerx = LARGURA // 2
                 texto_rect.y = texto_y_inicio + (i * linha_altura)
@@ -265,7 +285,7 @@ class UIManager:
                     tela.blit(superficie_texto, texto_rect)
         
         # Seta de continuação
-        seta_texto = fonte_pequena.render("▼ Pressione ESPAÇO para continuar", True, AMARELO)
+        seta_texto = self.resource_manager.renderizar_texto(fonte_pequena, "▼ Pressione ESPAÇO para continuar", AMARELO)
         seta_rect = seta_texto.get_rect(center=(LARGURA//2, ALTURA - 30))
         tela.blit(seta_texto, seta_rect)
         
@@ -280,10 +300,10 @@ class UIManager:
         largura_vida = int(largura * vida_porcentagem)
         pygame.draw.rect(tela, cor, (x, y, largura_vida, 20))
         
-        # Texto da vida
-        fonte_pequena = self.resource_manager.obter_fonte('pequena')
-        texto_vida = fonte_pequena.render(f"{vida_atual}/{vida_maxima}", True, BRANCO)
-        tela.blit(texto_vida, (x + largura//2 - texto_vida.get_width()//2, y - 25))
+        # Texto da vida (atlas de glifos: o valor muda a todo momento)
+        glifos = self.resource_manager.obter_atlas_glifos('pequena')
+        texto_vida = f"{vida_atual}/{vida_maxima}"
+        glifos.desenhar(tela, texto_vida, (x + largura//2 - glifos.largura(texto_vida)//2, y - 25), BRANCO)
         
     def desenhar_barra_vida_automatica(self, tela, sprite_x, sprite_y, sprite_largura, sprite_altura, 
                                       vida_atual, vida_max, nome, largura_barra=120, mostrar_numeros=True):
@@ -298,9 +318,9 @@ class UIManager:
         # Desenha o nome do personagem
         fonte_pequena = self.resource_manager.obter_fonte('pequena')
         if mostrar_numeros:
-            texto_nome = fonte_pequena.render(f"{nome} ({int(vida_atual)}/{vida_max})", True, BRANCO)
+            texto_nome = self.resource_manager.renderizar_texto(fonte_pequena, f"{nome} ({int(vida_atual)}/{vida_max})", BRANCO)
         else:
-            texto_nome = fonte_pequena.render(nome, True, BRANCO)
+            texto_nome = self.resource_manager.renderizar_texto(fonte_pequena, nome, BRANCO)
         nome_x = sprite_x + (sprite_largura - texto_nome.get_width()) // 2
         tela.blit(texto_nome, (nome_x, barra_y - 20))
         
@@ -311,7 +331,7 @@ class UIManager:
         y = 10
         
         # Desenha a moldura se disponível
-        moldura_dinheiro = self.resource_manager.obter_moldura('dinheiro')
+        moldura_dinheiro = self.resource_manager.obter_moldura_pronta('dinheiro', (120, 40))
         if moldura_dinheiro:
             tela.blit(moldura_dinheiro, (x, y))
         else:
@@ -320,34 +340,36 @@ class UIManager:
             pygame.draw.rect(tela, MARROM_LOJA, caixa, border_radius=8)
             pygame.draw.rect(tela, PRETO, caixa, 2, border_radius=8)
         
-        # Texto apenas com o valor (sem "Dinheiro:")
-        fonte_pequena = self.resource_manager.obter_fonte('pequena')
-        txt = fonte_pequena.render(f"${dinheiro}", True, BRANCO)
-        # Centraliza o texto na moldura
-        text_rect = txt.get_rect(center=(x + 60, y + 20))
-        tela.blit(txt, text_rect)
+        # Texto apenas com o valor (sem "Dinheiro:"), centralizado na moldura
+        glifos = self.resource_manager.obter_atlas_glifos('pequena')
+        glifos.desenhar(tela, f"${dinheiro}", (x + 60, y + 20), BRANCO, centro=True)
             
     def abrir_menu_selecao(self, tipo_menu):
         """Abre o menu de seleção com animação."""
         self.menu_selecao_ativo = True
         self.tipo_menu_atual = tipo_menu
         self.menu_altura = 0
-        print(f"📋 Abrindo menu: {tipo_menu.name}")
+        log.debug("📋 Abrindo menu: %s", tipo_menu.name)
         
     def fechar_menu_selecao(self):
         """Fecha o menu de seleção."""
         self.menu_selecao_ativo = False
         self.menu_altura = 0
-        print("📋 Fechando menu de seleção")
+        log.debug("📋 Fechando menu de seleção")
         
-    def atualizar_animacao_menu(self):
-        """Atualiza a animação do menu de seleção."""
+    def atualizar_animacao_menu(self, fator=1.0):
+        """
+        Atualiza a animação do menu de seleção.
+
+        Args:
+            fator: Fração de um quadro de FPS que este passo representa
+        """
         if self.menu_selecao_ativo and self.menu_altura < self.menu_altura_alvo:
-            self.menu_altura += VELOCIDADE_MENU
+            self.menu_altura += VELOCIDADE_MENU * fator
             if self.menu_altura > self.menu_altura_alvo:
                 self.menu_altura = self.menu_altura_alvo
         elif not self.menu_selecao_ativo and self.menu_altura > 0:
-            self.menu_altura -= VELOCIDADE_MENU
+            self.menu_altura -= VELOCIDADE_MENU * fator
             if self.menu_altura < 0:
                 self.menu_altura = 0
                 
@@ -355,28 +377,33 @@ class UIManager:
         """Inicia animação para esconder os botões de ataque."""
         self.botoes_animacao_ativa = True
         self.animacao_escondendo = True
-        print("🔽 Escondendo botões de ataque...")
+        log.debug("🔽 Escondendo botões de ataque...")
         
     def mostrar_botoes_ataque(self):
         """Inicia animação para mostrar os botões de ataque."""
         self.botoes_animacao_ativa = True
         self.animacao_escondendo = False
-        print("🔼 Mostrando botões de ataque...")
+        log.debug("🔼 Mostrando botões de ataque...")
         
-    def atualizar_animacao_botoes(self):
-        """Atualiza a animação dos botões de ataque."""
+    def atualizar_animacao_botoes(self, fator=1.0):
+        """
+        Atualiza a animação dos botões de ataque.
+
+        Args:
+            fator: Fração de um quadro de FPS que este passo representa
+        """
         if not self.botoes_animacao_ativa:
             return
             
         if self.animacao_escondendo:
             # Escondendo botões
-            self.botoes_pos_y_atual += VELOCIDADE_ANIMACAO_BOTOES
+            self.botoes_pos_y_atual += VELOCIDADE_ANIMACAO_BOTOES * fator
             if self.botoes_pos_y_atual >= self.botoes_pos_y_escondido:
                 self.botoes_pos_y_atual = self.botoes_pos_y_escondido
                 self.botoes_animacao_ativa = False
         else:
             # Mostrando botões
-            self.botoes_pos_y_atual -= VELOCIDADE_ANIMACAO_BOTOES
+            self.botoes_pos_y_atual -= VELOCIDADE_ANIMACAO_BOTOES * fator
             if self.botoes_pos_y_atual <= self.botoes_pos_y_original:
                 self.botoes_pos_y_atual = self.botoes_pos_y_original
                 self.botoes_animacao_ativa = False
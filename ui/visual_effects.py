@@ -7,6 +7,9 @@ import pygame
 import random
 import math
 from config.constants import *
+from core.log import obter_log
+
+log = obter_log()
 
 class VisualEffectsManager:
     """Gerencia efeitos visuais como shake, tremidas e animações."""
@@ -53,7 +56,7 @@ class VisualEffectsManager:
             'offset_x': 0,
             'offset_y': 0
         }
-        print(f"💥 Shake do jogador iniciado: {intensidade} por {duracao}s")
+        log.debug("💥 Shake do jogador iniciado: %s por %ss", intensidade, duracao)
         
     def iniciar_shake_inimigo(self, indice_inimigo, intensidade=8, duracao=0.3):
         """
@@ -71,7 +74,7 @@ class VisualEffectsManager:
             'offset_x': 0,
             'offset_y': 0
         }
-        print(f"💥 Shake do inimigo {indice_inimigo} iniciado: {intensidade} por {duracao}s")
+        log.debug("💥 Shake do inimigo %s iniciado: %s por %ss", indice_inimigo, intensidade, duracao)
         
     def atualizar(self, delta_time):
         """
@@ -224,7 +227,12 @@ class VisualEffectsManager:
             shake_data['offset_y'] = 0
         self.shakes_inimigos.clear()
         
-        print("🛑 Todos os shakes foram limpos e parados")
+        log.debug("🛑 Todos os shakes foram limpos e parados")
+        
+    def tem_shakes_ativos(self):
+        """Verifica se há algum shake (tela, jogador ou inimigo) em andamento."""
+        return (self.shake_ativo or self.shake_jogador['ativo'] or
+                any(shake_data['ativo'] for shake_data in self.shakes_inimigos.values()))
 
 
 class EnemyAttackAnimationManager:
@@ -240,18 +248,18 @@ class EnemyAttackAnimationManager:
         
         Args:
             indice_inimigo: Índice do inimigo
-            inimigo_data: Dados do inimigo (para posição original)
+            inimigo_data: Enemy que ataca (para posição original)
         """
         self.animacoes_ativas[indice_inimigo] = {
             'ativo': True,
             'tempo_total': 1.0,  # 1 segundo total
             'tempo_restante': 1.0,
-            'pos_original_x': inimigo_data['pos_x'],
-            'pos_original_y': inimigo_data['pos_y'],
+            'pos_original_x': inimigo_data.pos_x,
+            'pos_original_y': inimigo_data.pos_y,
             'fase': 'avanco',  # 'avanco' ou 'retorno'
             'distancia_movimento': 80  # Pixels para se mover
         }
-        print(f"⚔️ Animação de ataque iniciada para inimigo {indice_inimigo}")
+        log.debug("⚔️ Animação de ataque iniciada para inimigo %s", indice_inimigo)
         
     def atualizar(self, delta_time):
         """
@@ -319,11 +327,15 @@ class EnemyAttackAnimationManager:
     def limpar_todas_animacoes(self):
         """Limpa todas as animações de ataque."""
         self.animacoes_ativas.clear()
-        print("🗑️ Todas as animações de ataque foram limpas")
+        log.debug("🗑️ Todas as animações de ataque foram limpas")
     def esta_atacando(self, indice_inimigo):
         """Verifica se um inimigo está em animação de ataque."""
         return (indice_inimigo in self.animacoes_ativas and 
                 self.animacoes_ativas[indice_inimigo]['ativo'])
+        
+    def tem_animacoes_ativas(self):
+        """Verifica se algum inimigo está em animação de ataque."""
+        return any(animacao['ativo'] for animacao in self.animacoes_ativas.values())
                 
     def limpar_todas_animacoes(self):
         """Limpa todas as animações de ataque."""
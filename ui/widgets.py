@@ -0,0 +1,257 @@
+"""
+Camada de interface retida (retained-mode) do JokenGhost.
+Cada widget guarda a própria superfície e o próprio retângulo e só é
+redesenhado quando suas entradas mudam (dinheiro, hover, página...). O
+layout dos filhos é calculado uma vez, em coordenadas relativas ao pai, então
+mover um painel (menu deslizando) não exige redesenhar nada.
+"""
+
+import pygame
+from config.constants import *
+from ui.ui_animations import AnimatedWidget
+
+class Widget:
+    """Elemento de interface com superfície em cache e invalidação por entradas."""
+
+    def __init__(self, tamanho, posicao=(0, 0), renderizar=None, widget_id=None, animation_manager=None):
+        """
+        Inicializa o widget.
+
+        Args:
+            tamanho: (largura, altura) da superfície
+            posicao: Posição relativa ao pai (ou à tela, se não tiver pai)
+            renderizar: Função (superficie, **entradas) que desenha o conteúdo;
+                subclasses podem sobrescrever renderizar() em vez disso
+            widget_id: ID usado pelo UIAnimationManager
+            animation_manager: UIAnimationManager para animar a superfície em cache
+        """
+        self.rect = pygame.Rect(posicao, tamanho)
+        self.visivel = True
+        self.filhos = []
+        self.entradas = {}
+        self.renderizacoes = 0  # Quantas vezes a superfície foi refeita
+        self._funcao_renderizar = renderizar
+        self._superficie = None
+        self.animacao = None
+        if animation_manager is not None and widget_id is not None:
+            self.animacao = AnimatedWidget(widget_id, animation_manager)
+
+    @property
+    def sujo(self):
+        """True se a superfície precisa ser refeita no próximo desenho."""
+        return self._superficie is None
+
+    def adicionar(self, filho):
+        """Adiciona um widget filho (posição relativa a este) e o retorna."""
+        self.filhos.append(filho)
+        return filho
+
+    def atualizar(self, **entradas):
+        """
+        Informa as entradas atuais do widget; invalida a superfície se mudaram.
+
+        Returns:
+            bool: True se alguma entrada mudou
+        """
+        if entradas == self.entradas:
+            return False
+        self.entradas = entradas
+        self._superficie = None
+        return True
+
+    def invalidar(self):
+        """Força o widget a se redesenhar no próximo frame."""
+        self._superficie = None
+
+    def redimensionar(self, tamanho):
+        """Muda o tamanho do widget (invalida apenas se mudou)."""
+        tamanho = (int(tamanho[0]), int(tamanho[1]))
+        if self.rect.size != tamanho:
+            self.rect.size = tamanho
+            self._superficie = None
+
+    def mover(self, posicao):
+        """Muda a posição do widget sem redesenhá-lo."""
+        self.rect.topleft = posicao
+
+    def rect_absoluto(self, origem=(0, 0)):
+        """Retorna o retângulo do widget em coordenadas de tela."""
+        return self.rect.move(origem)
+
+    def obter_superficie(self):
+        """Retorna a superfície em cache, redesenhando-a se estiver suja."""
+        if self._superficie is None:
+            superficie = pygame.Surface((max(1, self.rect.width), max(1, self.rect.height)), pygame.SRCALPHA)
+            self.renderizar(superficie, **self.entradas)
+            self._superficie = superficie
+            self.renderizacoes += 1
+        return self._superficie
+
+    def renderizar(self, superficie, **entradas):
+        """Desenha o conteúdo do widget na superfície (coordenadas locais)."""
+        if self._funcao_renderizar is not None:
+            self._funcao_renderizar(superficie, **entradas)
+
+    def desenhar(self, tela, origem=(0, 0), alpha=None):
+        """
+        Desenha o widget e seus filhos.
+
+        Args:
+            tela: Superfície de destino
+            origem: Posição de tela do pai
+            alpha: Transparência (0-255) ou None para opaco
+        """
+        if not self.visivel and not (self.animacao and self.animacao.esta_animando()):
+            return
+        rect = self.rect_absoluto(origem)
+        superficie = self.obter_superficie()
+
+        if self.animacao is not None and self.animacao.esta_animando():
+            self.animacao.rect_original = rect
+            self.animacao.desenhar(tela, superficie)
+        else:
+            superficie.set_alpha(alpha if alpha is not None else 255)
+            tela.blit(superficie, rect)
+
+        for filho in self.filhos:
+            filho.desenhar(tela, rect.topleft, alpha)
+
+    def mostrar_com_animacao(self, tipo_animacao='slide_down'):
+        """Mostra o widget animando a superfície em cache."""
+        self.visivel = True
+        if self.animacao is not None:
+            self.animacao.mostrar_com_animacao(self.rect.copy(), tipo_animacao)
+
+    def esconder_com_animacao(self, tipo_animacao='slide_up'):
+        """Esconde o widget animando a superfície em cache."""
+        self.visivel = False
+        if self.animacao is not None:
+            self.animacao.esconder_com_animacao(tipo_animacao)
+
+
+class PainelWidget(Widget):
+    """Painel com fundo arredondado, borda e título opcional."""
+
+    def __init__(self, tamanho, posicao=(0, 0), cor_fundo=MARROM_LOJA, cor_borda=PRETO,
+                 raio=20, borda=3, **opcoes):
+        """
+        Inicializa o painel.
+
+        Args:
+            tamanho: (largura, altura)
+            posicao: Posição relativa ao pai
+            cor_fundo: Cor de preenchimento
+            cor_borda: Cor da borda
+            raio: Raio dos cantos
+            borda: Espessura da borda
+        """
+        super().__init__(tamanho, posicao, **opcoes)
+        self.cor_fundo = cor_fundo
+        self.cor_borda = cor_borda
+        self.raio = raio
+        self.borda = borda
+
+    def renderizar(self, superficie, titulo=None, fonte=None, cor_titulo=BRANCO, titulo_y=40, **entradas):
+        """Desenha fundo, borda e título centralizado."""
+        rect = superficie.get_rect()
+        pygame.draw.rect(superficie, self.cor_fundo, rect, border_radius=self.raio)
+        pygame.draw.rect(superficie, self.cor_borda, rect, self.borda, border_radius=self.raio)
+        if titulo and fonte is not None and rect.height > 50:
+            texto = fonte.render(titulo, True, cor_titulo)
+            superficie.blit(texto, texto.get_rect(center=(rect.width // 2, titulo_y)))
+        super().renderizar(superficie, **entradas)
+
+
+class TooltipWidget(Widget):
+    """Caixa de texto de várias linhas; a quebra e o tamanho são calculados só quando o texto muda."""
+
+    def __init__(self, fonte, cor_fundo=PRETO, cor_borda=BRANCO, cor_texto=BRANCO,
+                 padding=10, altura_linha=None, raio=0, largura_max=None, sombra=0, **opcoes):
+        """
+        Inicializa o tooltip.
+
+        Args:
+            fonte: pygame.font.Font do texto
+            cor_fundo: Cor de preenchimento
+            cor_borda: Cor da borda
+            cor_texto: Cor do texto
+            padding: Espaço interno (px)
+            altura_linha: Distância entre linhas, ou None para a altura da fonte
+            raio: Raio dos cantos
+            largura_max: Largura máxima do texto antes de quebrar palavras, ou None
+            sombra: Deslocamento (px) da sombra translúcida; 0 desenha sem sombra
+            **opcoes: widget_id e animation_manager (ver Widget)
+        """
+        super().__init__((1, 1), **opcoes)
+        self.fonte = fonte
+        self.cor_fundo = cor_fundo
+        self.cor_borda = cor_borda
+        self.cor_texto = cor_texto
+        self.padding = padding
+        self.altura_linha = altura_linha or fonte.get_linesize()
+        self.raio = raio
+        self.largura_max = largura_max
+        self.sombra = sombra
+        self.linhas = []
+
+    def definir_texto(self, texto):
+        """
+        Define o texto; refaz a quebra de linhas e o tamanho apenas se mudou.
+        
+        Returns:
+            bool: True se o texto mudou
+        """
+        if not self.atualizar(texto=texto):
+            return False
+        self.linhas = self.quebrar_linhas(texto)
+        largura = max((self.fonte.size(linha)[0] for linha in self.linhas), default=0)
+        altura = len(self.linhas) * self.altura_linha
+        self.redimensionar((largura + self.padding * 2 + self.sombra, altura + self.padding * 2 + self.sombra))
+        return True
+
+    def quebrar_linhas(self, texto):
+        """Quebra o texto em '\\n' e, se houver largura_max, entre palavras."""
+        linhas = []
+        for paragrafo in texto.split('\n'):
+            if self.largura_max is None:
+                linhas.append(paragrafo)
+                continue
+            atual = ""
+            for palavra in paragrafo.split(' '):
+                tentativa = f"{atual} {palavra}" if atual else palavra
+                if atual and self.fonte.size(tentativa)[0] > self.largura_max:
+                    linhas.append(atual)
+                    atual = palavra
+                else:
+                    atual = tentativa
+            linhas.append(atual)
+        return linhas
+
+    def renderizar(self, superficie, **entradas):
+        """Desenha sombra, fundo, borda e linhas."""
+        rect = superficie.get_rect()
+        if self.sombra:
+            rect.size = (rect.width - self.sombra, rect.height - self.sombra)
+            pygame.draw.rect(superficie, (0, 0, 0, 60), rect.move(self.sombra, self.sombra), border_radius=self.raio)
+        pygame.draw.rect(superficie, self.cor_fundo, rect, border_radius=self.raio)
+        pygame.draw.rect(superficie, self.cor_borda, rect, 2, border_radius=self.raio)
+        for i, linha in enumerate(self.linhas):
+            texto = self.fonte.render(linha, True, self.cor_texto)
+            superficie.blit(texto, (self.padding, self.padding + i * self.altura_linha))
+
+    def posicionar(self, ancora, deslocamento_acima=True, largura_tela=LARGURA):
+        """
+        Posiciona o tooltip acima da âncora, mantendo-o dentro da tela.
+
+        Args:
+            ancora: (x, y) de referência (normalmente o mouse)
+            deslocamento_acima: True desenha acima da âncora
+            largura_tela: Largura da tela usada para o ajuste horizontal
+        """
+        x, y = ancora
+        y = y - self.rect.height if deslocamento_acima else y
+        if x + self.rect.width > largura_tela:
+            x = largura_tela - self.rect.width
+        if y < 0:
+            y = ancora[1] + 20
+        self.mover((x, y))
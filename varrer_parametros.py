@@ -0,0 +1,81 @@
+"""
+Varredura de parâmetros de balanceamento do JokenGhost (ferramenta).
+=====================================================================
+
+Simula um lote de batalhas para cada combinação dos valores pedidos, usando
+todos os núcleos, e grava um resultado por linha (JSONL). Interrompida, a
+varredura continua de onde parou ao rodar o mesmo comando de novo.
+
+Uso:
+    python varrer_parametros.py --param dano_jogador=20,25,30 \\
+                                --param bonus_papel=15,25,35 \\
+                                --param preco_cura_pequena=20,30,40 \\
+                                --param vidas_inimigos=80/100/120,100/120/150 \\
+                                --param limiar_compra=40 \\
+                                [--batalhas 20000] [--seed 0] [--saida varredura.jsonl]
+
+Parâmetros: dano_jogador, dano_inimigo, area_base, area_bonus, area_max,
+bonus_<arma>, efetividade_<arma> (arma: pedra, papel, tesoura),
+preco_<efeito> (cura_pequena, cura_grande; exige limiar_compra), vidas_inimigos,
+limiar_compra e recompensa_vitoria_base.
+"""
+
+import sys
+import time
+import argparse
+
+from core.varredura import ParameterSweep, ler_parametro, melhores, NOMES_ESCOLHAS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Varre parâmetros de balanceamento do JokenGhost")
+    parser.add_argument("--param", action="append", default=[], metavar="NOME=V1,V2",
+                        help="parâmetro e valores a varrer (repita para cada parâmetro)")
+    parser.add_argument("--batalhas", type=int, default=20000, help="batalhas simuladas por ponto")
+    parser.add_argument("--seed", type=int, default=0, help="semente da varredura")
+    parser.add_argument("--escolha", choices=list(NOMES_ESCOLHAS), default=None,
+                        help="escolha fixa do jogador (padrão: sorteada a cada turno)")
+    parser.add_argument("--processos", type=int, default=None, help="processos (padrão: um por núcleo)")
+    parser.add_argument("--lote", type=int, default=4, help="pontos por tarefa enviada a um processo")
+    parser.add_argument("--saida", default="varredura.jsonl", help="arquivo JSONL de resultados (retomável)")
+    parser.add_argument("--ordenar", default="taxa_vitoria", help="métrica usada no resumo final")
+    parser.add_argument("--alvo", type=float, default=None,
+                        help="mostra os pontos com a métrica mais próxima deste valor")
+    parser.add_argument("--mostrar", type=int, default=10, help="pontos exibidos no resumo final")
+    args = parser.parse_args()
+
+    try:
+        parametros = [ler_parametro(texto) for texto in args.param]
+    except ValueError as e:
+        parser.error(str(e))
+    if not parametros:
+        parser.error("informe ao menos um --param")
+
+    try:
+        varredura = ParameterSweep(parametros, args.batalhas, args.seed, args.escolha, args.processos, args.lote)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"🧮 {len(varredura.pontos)} pontos x {args.batalhas} batalhas em {varredura.processos} processos -> {args.saida}")
+
+    inicio = time.perf_counter()
+
+    def progresso(feitos, total):
+        print(f"\r⏳ {feitos}/{total} pontos ({time.perf_counter() - inicio:.1f}s)", end="", flush=True)
+
+    try:
+        resultados = varredura.executar(args.saida, progresso)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print()
+
+    print(f"🏁 Melhores por {args.ordenar}" + (f" (alvo {args.alvo})" if args.alvo is not None else "") + ":")
+    for resultado in melhores(resultados, args.ordenar, args.alvo, args.mostrar):
+        relatorio = resultado['relatorio']
+        valores = ", ".join(f"{nome}={valor}" for nome, valor in resultado['parametros'].items())
+        print(f"  {relatorio[args.ordenar]:.4f} | vitória {relatorio['taxa_vitoria']:.1%} | "
+              f"ouro/turno {relatorio['ouro_por_turno']:.2f} | {valores}")
+
+
+if __name__ == "__main__":
+    main()